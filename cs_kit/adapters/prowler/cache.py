@@ -0,0 +1,190 @@
+"""Content-addressed cache of prowler output.
+
+Each prowler run is one cache entry, addressed by a digest of everything that
+determines its output: provider, account, regions, compliance selection and
+prowler version. Entries live below ``artifacts_dir`` and are reused while
+younger than a maximum age, so re-running the same scan shortly after a
+previous one doesn't execute prowler again.
+"""
+
+import hashlib
+import os
+import re
+import shutil
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from cs_kit.normalizer import codec
+
+# Directory below artifacts_dir holding cache entries
+CACHE_DIRECTORY = ".scan-cache"
+
+# Metadata file of each cache entry
+_ENTRY_FILE = "entry.json"
+
+_DURATION_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([smhd]?)\s*$")
+_DURATION_UNITS = {"": 1, "s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def parse_duration(value: str | float) -> float:
+    """Parse a duration such as ``90``, ``30m``, ``12h`` or ``7d``.
+
+    Args:
+        value: Seconds, or a number with an ``s``, ``m``, ``h`` or ``d`` suffix
+
+    Returns:
+        Duration in seconds
+
+    Raises:
+        ValueError: If the value is not a valid duration
+    """
+    if isinstance(value, int | float):
+        return float(value)
+    match = _DURATION_RE.match(value.lower())
+    if not match:
+        raise ValueError(f"Invalid duration {value!r}; use e.g. 90, 30m, 12h or 7d")
+    return float(match[1]) * _DURATION_UNITS[match[2]]
+
+
+@dataclass(frozen=True, slots=True)
+class ScanCacheKey:
+    """Inputs that determine the output of one prowler run."""
+
+    provider: str
+    account: str | None
+    regions: tuple[str, ...]
+    compliance: tuple[str, ...]
+    prowler_version: str
+    checks: tuple[str, ...] = ()
+
+    @property
+    def name(self) -> str:
+        """Readable identifier of the run, for reports."""
+        regions = ",".join(self.regions) or "all"
+        compliance = "+".join(self.compliance) or "all"
+        selection = f"checks={len(self.checks)}" if self.checks else f"compliance={compliance}"
+        return f"account={self.account or 'default'}/region={regions}/{selection}"
+
+    @property
+    def digest(self) -> str:
+        """Content address of the run's cache entry."""
+        data = codec.dumps([
+            self.provider,
+            self.account,
+            self.regions,
+            self.compliance,
+            self.prowler_version,
+            self.checks,
+        ])
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class ScanCache:
+    """Prowler output cache below an artifacts directory.
+
+    Hits and misses are recorded so a run can report which of its prowler
+    runs were served from the cache.
+    """
+
+    directory: Path
+    max_age: float
+    hits: list[ScanCacheKey] = field(default_factory=list)
+    misses: list[ScanCacheKey] = field(default_factory=list)
+
+    @classmethod
+    def for_artifacts(cls, artifacts_dir: Path, max_age: float) -> "ScanCache":
+        """Create the cache of an artifacts directory.
+
+        Args:
+            artifacts_dir: Directory holding scan runs
+            max_age: Maximum age in seconds of entries that are reused
+
+        Returns:
+            The cache
+        """
+        return cls(artifacts_dir / CACHE_DIRECTORY, max_age)
+
+    def lookup(self, key: ScanCacheKey, out_dir: Path) -> list[Path] | None:
+        """Copy a fresh cache entry's files into an output directory.
+
+        Args:
+            key: Run to look up
+            out_dir: Directory receiving the cached files
+
+        Returns:
+            The copied files, or None if there is no entry younger than
+            ``max_age``
+        """
+        entry_dir = self.directory / key.digest
+        try:
+            entry = codec.load(entry_dir / _ENTRY_FILE)
+        except (OSError, ValueError):
+            self._miss(key)
+            return None
+
+        if time.time() - entry["created_at"] > self.max_age:
+            self._miss(key)
+            return None
+
+        files = []
+        try:
+            for name in entry["files"]:
+                target = out_dir / name
+                _link_or_copy(entry_dir / name, target)
+                files.append(target)
+        except OSError:
+            # The entry was replaced or pruned while being read
+            for path in files:
+                path.unlink(missing_ok=True)
+            self._miss(key)
+            return None
+        self.hits.append(key)
+        return files
+
+    def _miss(self, key: ScanCacheKey) -> None:
+        """Record a miss once, however often a failing run is retried."""
+        if key not in self.misses:
+            self.misses.append(key)
+
+    def store(self, key: ScanCacheKey, files: list[Path]) -> None:
+        """Add a run's output files to the cache, replacing any older entry.
+
+        The entry is written to a temporary directory and renamed into place,
+        so concurrent runs never see a partial entry.
+
+        Args:
+            key: Run that produced the files
+            files: Output files of the run
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        entry_dir = self.directory / key.digest
+        staging = Path(tempfile.mkdtemp(dir=self.directory, prefix=f".{key.digest}."))
+        try:
+            for path in files:
+                _link_or_copy(path, staging / path.name)
+            entry = {
+                "key": key.name,
+                "prowler_version": key.prowler_version,
+                "created_at": time.time(),
+                "files": [path.name for path in files],
+            }
+            codec.dump(entry, staging / _ENTRY_FILE)
+
+            if entry_dir.exists():
+                shutil.rmtree(entry_dir, ignore_errors=True)
+            os.replace(staging, entry_dir)
+        except OSError:
+            # Another run may have stored the same entry first; either copy is valid
+            shutil.rmtree(staging, ignore_errors=True)
+
+
+def _link_or_copy(source: Path, target: Path) -> None:
+    """Hard link a file, copying it where links aren't supported."""
+    target.unlink(missing_ok=True)
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copy2(source, target)
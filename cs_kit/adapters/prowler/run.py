@@ -1,14 +1,61 @@
 """Prowler security scanner adapter."""
 
 import asyncio
+import codecs
+import logging
 import os
+import re
 import shutil
 import subprocess
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Literal
 
+from cs_kit.adapters.prowler.cache import ScanCache, ScanCacheKey
 from cs_kit.adapters.prowler.exceptions import ProwlerError, ProwlerNotFoundError
 
+logger = logging.getLogger(__name__)
+
+# Prowler processes run at once by default, one per compliance framework
+DEFAULT_MAX_CONCURRENCY = 4
+
+# Lines of stdout and stderr kept from each prowler scan for error context
+OUTPUT_TAIL_LINES = 200
+
+# Bytes read from a prowler pipe at a time
+_READ_CHUNK_SIZE = 64 * 1024
+
+# Prowler announces "Executing 310 checks, please wait..." before scanning,
+# then redraws a progress bar ending in "45/310 [14%]"
+_TOTAL_CHECKS_RE = re.compile(r"Executing (\d+) checks")
+_CHECK_COUNTER_RE = re.compile(r"(\d+)/(\d+) \[\s*\d+%\]")
+_LINE_SEPARATOR_RE = re.compile(r"\r\n|\r|\n")
+
+# Commands printing the account, principal or subscription the provider's
+# credentials resolve to, keying cached output to what prowler actually scans
+_IDENTITY_COMMANDS = {
+    "aws": ["aws", "sts", "get-caller-identity", "--query", "Account", "--output", "text"],
+    "gcp": ["gcloud", "config", "get-value", "account"],
+    "azure": ["az", "account", "show", "--query", "id", "--output", "tsv"],
+}
+
+
+@dataclass(frozen=True, slots=True)
+class ProwlerProgress:
+    """Check progress of one prowler run."""
+
+    label: str
+    completed: int
+    total: int | None = None
+
+
+ProgressCallback = Callable[[ProwlerProgress], None]
+
+# Receives the output files of each prowler run as soon as the run finishes
+OutputCallback = Callable[[list[Path]], None]
+
 
 async def run_prowler(
     provider: Literal["aws", "gcp", "azure"],
@@ -16,20 +63,46 @@ async def run_prowler(
     regions: list[str],
     env: dict[str, str],
     out_dir: Path,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    role_arn: str | None = None,
+    combine_frameworks: bool = False,
+    progress: ProgressCallback | None = None,
+    on_output: OutputCallback | None = None,
+    cache: ScanCache | None = None,
+    checks: list[str] | None = None,
 ) -> list[Path]:
     """Run prowler for the given provider.
 
     Produces one or more JSON files in OCSF-like format in out_dir and returns their paths.
 
+    By default one process is started per compliance framework, up to
+    ``max_concurrency`` at a time, and each run writes to its own
+    ``compliance=<framework>`` subdirectory. With ``combine_frameworks`` a
+    single run covers the union of the frameworks' checks, so checks shared
+    by several frameworks run once; per-framework views are then derived
+    from the compliance mappings.
+
+    With ``checks``, a single run executes exactly those checks instead, in
+    a ``checks`` subdirectory, and ``frameworks`` only serve the mappings.
+
     Args:
         provider: Cloud provider to scan
         frameworks: Compliance frameworks to apply
         regions: Regions to scan (provider-specific)
         env: Environment variables for the prowler process
         out_dir: Output directory for results
+        max_concurrency: Maximum number of prowler processes running at once
+        role_arn: AWS IAM role for prowler to assume, to scan another account
+        combine_frameworks: Run all frameworks in one prowler process
+        progress: Called with the check counters prowler prints as each run
+            advances, labelled with the run's compliance selection
+        on_output: Called with each run's output files when the run
+            finishes, while other runs may still be going
+        cache: Serve runs from, and store them in, this output cache
+        checks: Run only these prowler checks, ignoring the frameworks
 
     Returns:
-        List of paths to generated JSON files
+        List of paths to generated JSON files, in framework order
 
     Raises:
         ProwlerNotFoundError: If prowler is not found on PATH
@@ -45,33 +118,44 @@ async def run_prowler(
     provider_out_dir = out_dir / "scanner=prowler" / f"provider={provider}"
     provider_out_dir.mkdir(parents=True, exist_ok=True)
 
-    # Build list of compliance IDs to run (prowler only accepts one at a time)
-    compliance_ids = frameworks if frameworks else [None]
-    json_files: list[Path] = []
-    existing_files = {path.resolve() for path in provider_out_dir.glob("*.json")}
-
-    for compliance in compliance_ids:
-        cmd = _build_prowler_command(provider, compliance, regions, provider_out_dir)
+    # Build list of compliance selections to run
+    compliance_ids: list[str | list[str] | None]
+    if not frameworks or checks:
+        compliance_ids = [None]
+    elif combine_frameworks:
+        compliance_ids = [frameworks]
+    else:
+        compliance_ids = list(frameworks)
+    semaphore = asyncio.Semaphore(max_concurrency)
+    prowler_version = await _prowler_version() if cache else ""
+    account = await _caller_account(provider, env, role_arn) if cache else None
+    if account is None:
+        if cache:
+            logger.warning(
+                "Could not resolve the %s account of the scan credentials; "
+                "prowler output will not be cached", provider,
+            )
+        # Output cached for one account must never be served for another
+        cache = None
 
-        try:
-            result = await _run_prowler_subprocess(cmd, env)
-            # Exit code 3 is normal for Prowler when findings are detected (not an error)
-            if result.returncode != 0 and result.returncode != 3:
-                raise ProwlerError(
-                    f"Prowler execution failed with return code {result.returncode}: "
-                    f"{result.stderr}"
+    # A failed run cancels the others; its error is raised as is rather than
+    # wrapped in an ExceptionGroup
+    try:
+        async with asyncio.TaskGroup() as group:
+            tasks = [
+                group.create_task(
+                    _run_compliance(
+                        provider, compliance, regions, env, provider_out_dir, semaphore,
+                        role_arn, progress, on_output, cache, prowler_version, account,
+                        checks,
+                    )
                 )
-        except FileNotFoundError as e:
-            raise ProwlerNotFoundError(f"Failed to execute prowler: {e}") from e
-
-        new_files = [
-            path
-            for path in provider_out_dir.glob("*.json")
-            if path.resolve() not in existing_files
-        ]
-        json_files.extend(new_files)
-        existing_files.update(path.resolve() for path in new_files)
+                for compliance in compliance_ids
+            ]
+    except ExceptionGroup as e:
+        raise e.exceptions[0] from None
 
+    json_files = [path for task in tasks for path in task.result()]
     if not json_files:
         raise ProwlerError(
             f"No JSON output files found in {provider_out_dir}. "
@@ -81,19 +165,173 @@ async def run_prowler(
     return json_files
 
 
+async def _run_compliance(
+    provider: Literal["aws", "gcp", "azure"],
+    compliance: str | list[str] | None,
+    regions: list[str],
+    env: dict[str, str],
+    provider_out_dir: Path,
+    semaphore: asyncio.Semaphore,
+    role_arn: str | None = None,
+    progress: ProgressCallback | None = None,
+    on_output: OutputCallback | None = None,
+    cache: ScanCache | None = None,
+    prowler_version: str = "",
+    account: str | None = None,
+    checks: list[str] | None = None,
+) -> list[Path]:
+    """Run prowler for one compliance framework in its own output directory.
+
+    Args:
+        provider: Cloud provider to scan
+        compliance: Compliance framework or frameworks, or None for all checks
+        regions: Regions to scan
+        env: Environment variables for the prowler process
+        provider_out_dir: Provider output directory
+        semaphore: Limits the number of concurrent prowler processes
+        role_arn: AWS IAM role for prowler to assume
+        progress: Called as prowler reports checks completed
+        on_output: Called with the run's JSON files once it succeeds
+        cache: Cache to serve the run from and store it in
+        prowler_version: Installed prowler version, part of the cache key
+        account: Account the credentials resolve to, part of the cache key
+        checks: Run only these checks rather than a compliance selection
+
+    Returns:
+        JSON files written by this run
+
+    Raises:
+        ProwlerNotFoundError: If prowler cannot be executed
+        ProwlerError: If prowler execution fails
+    """
+    if checks:
+        label = "checks"
+        run_out_dir = provider_out_dir / "checks"
+    else:
+        label = "+".join(compliance) if isinstance(compliance, list) else compliance or "all"
+        run_out_dir = provider_out_dir / f"compliance={label}"
+    run_out_dir.mkdir(parents=True, exist_ok=True)
+    existing_files = set(run_out_dir.glob("*.json"))
+
+    cache_key = None
+    if cache:
+        cache_key = _cache_key(provider, compliance, regions, account, prowler_version, checks)
+        cached_files = cache.lookup(cache_key, run_out_dir)
+        if cached_files is not None:
+            if on_output and cached_files:
+                on_output(cached_files)
+            return cached_files
+
+    cmd = _build_prowler_command(provider, compliance, regions, run_out_dir, role_arn, checks)
+
+    async with semaphore:
+        try:
+            result = await _run_prowler_subprocess(
+                cmd, env, on_line=_ProgressParser(label, progress) if progress else None
+            )
+        except FileNotFoundError as e:
+            raise ProwlerNotFoundError(f"Failed to execute prowler: {e}") from e
+
+    # Exit code 3 is normal for Prowler when findings are detected (not an error)
+    if result.returncode != 0 and result.returncode != 3:
+        raise ProwlerError(
+            f"Prowler execution failed with return code {result.returncode}: "
+            f"{result.stderr}"
+        )
+
+    files = sorted(path for path in run_out_dir.glob("*.json") if path not in existing_files)
+    if cache and cache_key and files:
+        cache.store(cache_key, files)
+    if on_output and files:
+        on_output(files)
+    return files
+
+
+def _cache_key(
+    provider: Literal["aws", "gcp", "azure"],
+    compliance: str | list[str] | None,
+    regions: list[str],
+    account: str | None,
+    prowler_version: str,
+    checks: list[str] | None = None,
+) -> ScanCacheKey:
+    """Build the cache key of one prowler run."""
+    if compliance is None:
+        frameworks: tuple[str, ...] = ()
+    elif isinstance(compliance, str):
+        frameworks = (compliance,)
+    else:
+        frameworks = tuple(compliance)
+    return ScanCacheKey(
+        provider,
+        account,
+        tuple(sorted(regions)),
+        frameworks,
+        prowler_version,
+        tuple(sorted(checks or ())),
+    )
+
+
+async def _caller_account(
+    provider: Literal["aws", "gcp", "azure"], env: dict[str, str], role_arn: str | None
+) -> str | None:
+    """Resolve the account a prowler run scans.
+
+    Profile names and access key IDs don't identify an account reliably, so
+    the provider CLI is asked who the credentials belong to.
+
+    Args:
+        provider: Cloud provider
+        env: Environment variables prowler runs with
+        role_arn: AWS IAM role prowler assumes, which names the account
+
+    Returns:
+        AWS account ID, GCP principal or Azure subscription ID, or None if
+        it can't be determined
+    """
+    if role_arn:
+        # arn:aws:iam::<account>:role/<name>
+        parts = role_arn.split(":")
+        return parts[4] if len(parts) > 5 and parts[4] else None
+
+    try:
+        result = await _run_prowler_subprocess(
+            _IDENTITY_COMMANDS[provider], env, tail_lines=None
+        )
+    except OSError:
+        return None
+    account = result.stdout.strip()
+    return account if result.returncode == 0 and account else None
+
+
+async def _prowler_version() -> str:
+    """Get the installed prowler version, or "unknown"."""
+    try:
+        result = await _run_prowler_subprocess(
+            ["prowler", "--version"], {}, tail_lines=None
+        )
+    except OSError:
+        return "unknown"
+    return result.stdout.strip() or "unknown"
+
+
 def _build_prowler_command(
     provider: Literal["aws", "gcp", "azure"],
-    compliance: str | None,
+    compliance: str | list[str] | None,
     regions: list[str],
     out_dir: Path,
+    role_arn: str | None = None,
+    checks: list[str] | None = None,
 ) -> list[str]:
     """Build prowler command based on provider and parameters.
 
     Args:
         provider: Cloud provider
-        frameworks: Compliance frameworks
+        compliance: Compliance framework or frameworks, or None for all checks
         regions: Regions to scan
         out_dir: Output directory
+        role_arn: AWS IAM role to assume
+        checks: Checks to run; prowler doesn't combine them with --compliance
 
     Returns:
         Command list for subprocess
@@ -111,28 +349,110 @@ def _build_prowler_command(
         if regions:
             cmd.extend(["-f", ",".join(regions)])
         if compliance:
-            cmd.extend(["--compliance", compliance])
+            cmd.extend(_compliance_args(compliance))
+        if role_arn:
+            cmd.extend(["--role", role_arn])
     elif provider == "gcp":
         if compliance:
-            cmd.extend(["--compliance", compliance])
+            cmd.extend(_compliance_args(compliance))
     elif provider == "azure":
         if compliance:
-            cmd.extend(["--compliance", compliance])
+            cmd.extend(_compliance_args(compliance))
+
+    if checks:
+        cmd.extend(["--checks", *checks])
 
     return cmd
 
 
+def _compliance_args(compliance: str | list[str]) -> list[str]:
+    """Build the ``--compliance`` arguments for one or more frameworks."""
+    if isinstance(compliance, str):
+        return ["--compliance", compliance]
+    return ["--compliance", *compliance]
+
+
+class _ProgressParser:
+    """Turn prowler console lines into progress callbacks."""
+
+    def __init__(self, label: str, callback: ProgressCallback) -> None:
+        self.label = label
+        self.callback = callback
+        self.completed = 0
+        self.total: int | None = None
+
+    def __call__(self, line: str) -> None:
+        """Parse one output line, reporting progress if it changed."""
+        completed, total = self.completed, self.total
+        if match := _CHECK_COUNTER_RE.search(line):
+            completed, total = int(match[1]), int(match[2])
+        elif match := _TOTAL_CHECKS_RE.search(line):
+            total = int(match[1])
+        else:
+            return
+
+        if (completed, total) != (self.completed, self.total):
+            self.completed, self.total = completed, total
+            self.callback(ProwlerProgress(self.label, completed, total))
+
+
+async def _read_lines(
+    stream: asyncio.StreamReader,
+    tail: deque[str],
+    on_line: Callable[[str], None] | None = None,
+) -> None:
+    """Read a pipe line by line, keeping only the last lines.
+
+    Carriage returns also end a line, so progress bars that redraw in place
+    are seen update by update instead of as one unbounded line.
+
+    Args:
+        stream: Pipe to read until EOF
+        tail: Bounded buffer receiving each non-empty line
+        on_line: Called with each non-empty line
+    """
+    # Incremental decoding, as a chunk may end inside a multi-byte character
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    pending = ""
+    while chunk := await stream.read(_READ_CHUNK_SIZE):
+        *lines, pending = _LINE_SEPARATOR_RE.split(pending + decoder.decode(chunk))
+        for line in lines:
+            if line:
+                tail.append(line)
+                if on_line:
+                    on_line(line)
+        # A line without any separator is cut rather than buffered forever
+        if len(pending) > _READ_CHUNK_SIZE:
+            tail.append(pending)
+            pending = ""
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        tail.append(pending)
+        if on_line:
+            on_line(pending)
+
+
 async def _run_prowler_subprocess(
-    cmd: list[str], env: dict[str, str]
+    cmd: list[str],
+    env: dict[str, str],
+    on_line: Callable[[str], None] | None = None,
+    tail_lines: int | None = OUTPUT_TAIL_LINES,
 ) -> subprocess.CompletedProcess[str]:
     """Run prowler subprocess asynchronously.
 
+    Output is streamed rather than buffered until exit; by default only the
+    last ``OUTPUT_TAIL_LINES`` lines of stdout and stderr are returned, which
+    bounds the memory of long scans.
+
     Args:
         cmd: Command to execute
         env: Environment variables
+        on_line: Called with each line prowler writes to stdout or stderr
+        tail_lines: Lines of stdout and stderr to return, or None for all of
+            them, for short commands whose output is parsed
 
     Returns:
-        Completed process result
+        Completed process result with the tail of the output
     """
     # Merge provided env with current environment
     full_env = {**os.environ, **env}
@@ -145,13 +465,27 @@ async def _run_prowler_subprocess(
         stderr=asyncio.subprocess.PIPE,
     )
 
-    stdout, stderr = await process.communicate()
+    stdout: deque[str] = deque(maxlen=tail_lines)
+    stderr: deque[str] = deque(maxlen=tail_lines)
+
+    try:
+        await asyncio.gather(
+            _read_lines(process.stdout, stdout, on_line),  # type: ignore[arg-type]
+            _read_lines(process.stderr, stderr, on_line),  # type: ignore[arg-type]
+        )
+        await process.wait()
+    except asyncio.CancelledError:
+        # Don't leave prowler running when the scan is abandoned
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+        raise
 
     return subprocess.CompletedProcess(
         args=cmd,
         returncode=process.returncode or 0,
-        stdout=stdout.decode() if stdout else "",
-        stderr=stderr.decode() if stderr else "",
+        stdout="\n".join(stdout),
+        stderr="\n".join(stderr),
     )
 
 
@@ -173,7 +507,7 @@ async def list_supported_frameworks() -> list[str]:
     cmd = ["prowler", "--list-compliance"]
 
     try:
-        result = await _run_prowler_subprocess(cmd, {})
+        result = await _run_prowler_subprocess(cmd, {}, tail_lines=None)
         if result.returncode != 0:
             raise ProwlerError(
                 f"Failed to list compliance frameworks: {result.stderr}"
@@ -227,7 +561,9 @@ async def validate_prowler_installation() -> dict[str, str]:
 
     try:
         # Get version info
-        result = await _run_prowler_subprocess(["prowler", "--version"], {})
+        result = await _run_prowler_subprocess(
+            ["prowler", "--version"], {}, tail_lines=None
+        )
         version = result.stdout.strip() if result.stdout else "unknown"
 
         # Get installation path
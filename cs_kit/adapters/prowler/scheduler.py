@@ -0,0 +1,272 @@
+"""Sharded scheduling of prowler scans.
+
+A large estate is scanned as many small (account, region, framework) shards
+instead of one sweep. Shards run concurrently up to a limit, failed shards are
+retried with backoff, and the output files of every successful shard are
+returned together so they can be normalized into one result.
+"""
+
+import asyncio
+import itertools
+from collections.abc import Sequence
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Literal
+
+from cs_kit.adapters.prowler.cache import ScanCache
+from cs_kit.adapters.prowler.exceptions import ProwlerError, ProwlerNotFoundError
+from cs_kit.adapters.prowler.run import (
+    DEFAULT_MAX_CONCURRENCY,
+    OutputCallback,
+    ProgressCallback,
+    ProwlerProgress,
+    run_prowler,
+)
+
+# Attempts per shard, including the first
+DEFAULT_MAX_ATTEMPTS = 3
+
+# Delay before the first retry, doubled for each further retry
+DEFAULT_RETRY_DELAY = 5.0
+
+
+@dataclass(frozen=True, slots=True)
+class ScanShard:
+    """One unit of scan work.
+
+    ``None`` means the dimension is not split: the default credentials, every
+    configured region, or prowler's default checks. A tuple of frameworks is
+    scanned by one prowler run covering all of them.
+    """
+
+    account: str | None = None
+    region: str | None = None
+    framework: str | tuple[str, ...] | None = None
+
+    @property
+    def frameworks(self) -> list[str]:
+        """Frameworks the shard scans; empty for prowler's default checks."""
+        if isinstance(self.framework, tuple):
+            return list(self.framework)
+        return [self.framework] if self.framework else []
+
+    @property
+    def name(self) -> str:
+        """Readable identifier, also used as the shard's output directory."""
+        return (
+            f"account={self.account or 'default'}/"
+            f"region={self.region or 'all'}/"
+            f"compliance={'+'.join(self.frameworks) or 'all'}"
+        )
+
+
+@dataclass(slots=True)
+class ShardResult:
+    """Outcome of running one shard."""
+
+    shard: ScanShard
+    files: list[Path] = field(default_factory=list)
+    attempts: int = 0
+    error: str | None = None
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether the shard produced output."""
+        return self.error is None
+
+
+@dataclass(slots=True)
+class ScheduleResult:
+    """Outcome of a sharded scan."""
+
+    results: list[ShardResult]
+
+    @property
+    def files(self) -> list[Path]:
+        """Output files of the successful shards, in shard order."""
+        return [path for result in self.results for path in result.files]
+
+    @property
+    def failed(self) -> list[ShardResult]:
+        """Shards that failed every attempt."""
+        return [result for result in self.results if not result.succeeded]
+
+
+def plan_shards(
+    provider: Literal["aws", "gcp", "azure"],
+    accounts: Sequence[str],
+    regions: Sequence[str],
+    frameworks: Sequence[str],
+    shard_regions: bool = True,
+    combine_frameworks: bool = False,
+) -> list[ScanShard]:
+    """Split a scan into shards.
+
+    Args:
+        provider: Cloud provider to scan
+        accounts: AWS accounts to scan; empty for the default credentials
+        regions: Regions to scan; empty for all regions
+        frameworks: Compliance frameworks; empty for prowler's default checks
+        shard_regions: Give each region its own shard rather than scanning all
+            regions in each shard
+        combine_frameworks: Scan all frameworks in one prowler run per shard,
+            so checks shared by several frameworks run once, rather than
+            giving each framework its own shard
+
+    Returns:
+        Shards in account, region, framework order
+
+    Raises:
+        ValueError: If accounts are given for a provider other than AWS
+    """
+    if accounts and provider != "aws":
+        raise ValueError("Account sharding is only supported for AWS")
+
+    # Only prowler's AWS provider takes a region filter
+    split_regions = shard_regions and provider == "aws" and regions
+    shard_frameworks: Sequence[str | tuple[str, ...] | None] = frameworks or [None]
+    if combine_frameworks and len(frameworks) > 1:
+        shard_frameworks = [tuple(frameworks)]
+    return [
+        ScanShard(account, region, framework)
+        for account, region, framework in itertools.product(
+            accounts or [None],
+            regions if split_regions else [None],
+            shard_frameworks,
+        )
+    ]
+
+
+async def run_sharded_scan(
+    provider: Literal["aws", "gcp", "azure"],
+    shards: Sequence[ScanShard],
+    regions: list[str],
+    env: dict[str, str],
+    out_dir: Path,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    retry_delay: float = DEFAULT_RETRY_DELAY,
+    role_name: str | None = None,
+    progress: ProgressCallback | None = None,
+    on_output: OutputCallback | None = None,
+    cache: ScanCache | None = None,
+    checks: list[str] | None = None,
+) -> ScheduleResult:
+    """Run shards concurrently, retrying failures.
+
+    Args:
+        provider: Cloud provider to scan
+        shards: Shards to run, usually from :func:`plan_shards`
+        regions: Regions scanned by shards that don't name one
+        env: Environment variables for the prowler processes
+        out_dir: Output directory; each shard writes below its own subdirectory
+        max_concurrency: Maximum number of shards running at once
+        max_attempts: Attempts per shard, including the first
+        retry_delay: Seconds before the first retry, doubled for each retry
+        role_name: IAM role to assume in each account. Without it, shard
+            accounts are used as AWS profile names.
+        progress: Called as each shard's prowler run reports checks
+            completed, labelled with the shard name
+        on_output: Called with each shard's output files once it succeeds
+        cache: Serve shards from, and store them in, this output cache
+        checks: Run only these checks in every shard
+
+    Returns:
+        Result of every shard, in shard order
+
+    Raises:
+        ProwlerNotFoundError: If prowler is not installed
+        ValueError: If max_concurrency or max_attempts is less than 1
+    """
+    if max_concurrency < 1 or max_attempts < 1:
+        raise ValueError("max_concurrency and max_attempts must be at least 1")
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+    try:
+        async with asyncio.TaskGroup() as group:
+            tasks = [
+                group.create_task(
+                    _run_shard(
+                        provider, shard, regions, env, out_dir, semaphore,
+                        max_attempts, retry_delay, role_name, progress, on_output,
+                        cache, checks,
+                    )
+                )
+                for shard in shards
+            ]
+    except ExceptionGroup as e:
+        raise e.exceptions[0] from None
+
+    return ScheduleResult([task.result() for task in tasks])
+
+
+async def _run_shard(
+    provider: Literal["aws", "gcp", "azure"],
+    shard: ScanShard,
+    regions: list[str],
+    env: dict[str, str],
+    out_dir: Path,
+    semaphore: asyncio.Semaphore,
+    max_attempts: int,
+    retry_delay: float,
+    role_name: str | None,
+    progress: ProgressCallback | None = None,
+    on_output: OutputCallback | None = None,
+    cache: ScanCache | None = None,
+    checks: list[str] | None = None,
+) -> ShardResult:
+    """Run one shard with retries.
+
+    Returns:
+        Shard result; failures are recorded rather than raised
+
+    Raises:
+        ProwlerNotFoundError: If prowler is not installed, which no retry fixes
+    """
+    shard_env = dict(env)
+    role_arn = None
+    if shard.account:
+        if role_name:
+            role_arn = f"arn:aws:iam::{shard.account}:role/{role_name}"
+        else:
+            shard_env["AWS_PROFILE"] = shard.account
+
+    shard_progress = None
+    if progress:
+        def shard_progress(update: ProwlerProgress) -> None:
+            progress(replace(update, label=shard.name))
+
+    result = ShardResult(shard)
+    for attempt in range(1, max_attempts + 1):
+        result.attempts = attempt
+        # Hold the slot only while prowler runs, not while backing off
+        async with semaphore:
+            try:
+                result.files = await run_prowler(
+                    provider=provider,
+                    frameworks=shard.frameworks,
+                    regions=[shard.region] if shard.region else regions,
+                    env=shard_env,
+                    out_dir=out_dir / shard.name,
+                    max_concurrency=1,
+                    role_arn=role_arn,
+                    combine_frameworks=isinstance(shard.framework, tuple),
+                    progress=shard_progress,
+                    cache=cache,
+                    checks=checks,
+                )
+                result.error = None
+                # Only a successful attempt's files are handed on, so a
+                # failed attempt is never normalized
+                if on_output and result.files:
+                    on_output(result.files)
+                return result
+            except ProwlerNotFoundError:
+                raise
+            except ProwlerError as e:
+                result.error = str(e)
+
+        if attempt < max_attempts:
+            await asyncio.sleep(retry_delay * 2 ** (attempt - 1))
+
+    return result
@@ -2,7 +2,17 @@
 
 from typing import Literal
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from cs_kit.adapters.prowler.cache import parse_duration
+from cs_kit.adapters.prowler.run import DEFAULT_MAX_CONCURRENCY
+from cs_kit.adapters.prowler.scheduler import DEFAULT_MAX_ATTEMPTS
+from cs_kit.normalizer.artifacts import ArtifactFormat
+from cs_kit.normalizer.cardinality import (
+    DEFAULT_PRECISION,
+    MAX_PRECISION,
+    MIN_PRECISION,
+)
 
 
 class RunConfig(BaseModel):
@@ -27,9 +37,83 @@ class RunConfig(BaseModel):
     redact_ids: bool = Field(
         default=True, description="Redact sensitive IDs in reports"
     )
+    parse_workers: int = Field(
+        default=1, ge=1, description="Worker processes for parsing scan output"
+    )
+    accounts: list[str] = Field(
+        default_factory=list,
+        description="AWS accounts to scan: profile names, or account IDs with aws_role_name",
+    )
+    aws_role_name: str | None = Field(
+        default=None, description="IAM role to assume in each account"
+    )
+    shard_regions: bool = Field(
+        default=False, description="Scan each region as a separate shard"
+    )
+    shard_attempts: int = Field(
+        default=DEFAULT_MAX_ATTEMPTS, ge=1, description="Attempts per scan shard"
+    )
+    combine_frameworks: bool = Field(
+        default=False,
+        description="Run all frameworks' checks in a single prowler run",
+    )
+    pipelined: bool = Field(
+        default=False,
+        description="Normalize each prowler run's output while other runs continue",
+    )
+    prowler_concurrency: int = Field(
+        default=DEFAULT_MAX_CONCURRENCY,
+        ge=1,
+        description="Prowler processes to run at once, one per compliance framework",
+    )
+    scan_max_age: float | None = Field(
+        default=None,
+        ge=0,
+        description="Reuse cached prowler output up to this many seconds old",
+    )
+    since_run: str | None = Field(
+        default=None,
+        description="Previous run to build on, re-running only failed or changed checks",
+    )
+    changed_resource_types: list[str] = Field(
+        default_factory=list,
+        description="Resource types with recent changes, whose checks are re-run",
+    )
+    artifact_format: ArtifactFormat = Field(
+        default="json",
+        description="Format of normalized findings: json, ndjson, zstd-compressed ndjson.zst or parquet",
+    )
+    warehouse: str | None = Field(
+        default=None,
+        description="Findings warehouse database to ingest the run into",
+    )
+    cardinality: Literal["exact", "hll"] = Field(
+        default="exact",
+        description="Count unique resources exactly or estimate them with HyperLogLog",
+    )
+    hll_precision: int = Field(
+        default=DEFAULT_PRECISION,
+        ge=MIN_PRECISION,
+        le=MAX_PRECISION,
+        description="HyperLogLog precision used when cardinality is 'hll'",
+    )
+    findings_batch_size: int | None = Field(
+        default=None,
+        ge=1,
+        description="Findings laid out per part of a chunked report; the whole report is laid out at once when unset",
+    )
+    render_workers: int = Field(
+        default=1, ge=1, description="Processes laying out parts of a chunked report"
+    )
 
     model_config = ConfigDict(extra="forbid", validate_assignment=True)
 
+    @field_validator("scan_max_age", mode="before")
+    @classmethod
+    def _parse_max_age(cls, value: str | float | None) -> float | None:
+        """Accept durations such as "30m" or "12h" as well as seconds."""
+        return None if value is None else parse_duration(value)
+
 
 class RendererConfig(BaseModel):
     """Configuration for report rendering."""
@@ -46,5 +130,13 @@ class RendererConfig(BaseModel):
     include_raw_data: bool = Field(
         default=False, description="Include raw scanner data in appendix"
     )
+    findings_batch_size: int | None = Field(
+        default=None,
+        ge=1,
+        description="Findings laid out per part of a chunked report; the whole report is laid out at once when unset",
+    )
+    render_workers: int = Field(
+        default=1, ge=1, description="Processes laying out parts of a chunked report"
+    )
 
     model_config = ConfigDict(extra="forbid", validate_assignment=True)
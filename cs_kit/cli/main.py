@@ -1,24 +1,63 @@
 """Main CLI interface for CS Kit."""
 
 import asyncio
-import json
 import os
 import uuid
+from collections.abc import Iterator
+from contextlib import ExitStack
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import Any
 
 import typer
 from rich.console import Console
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.progress import Progress, SpinnerColumn, TaskID, TextColumn
 from rich.table import Table
 
-from cs_kit.adapters.prowler.run import list_supported_frameworks, run_prowler
+from cs_kit.adapters.prowler.cache import ScanCache
+from cs_kit.adapters.prowler.exceptions import ProwlerError
+from cs_kit.adapters.prowler.run import (
+    DEFAULT_MAX_CONCURRENCY,
+    OutputCallback,
+    ProgressCallback,
+    ProwlerProgress,
+    list_supported_frameworks,
+    run_prowler,
+)
+from cs_kit.adapters.prowler.scheduler import (
+    DEFAULT_MAX_ATTEMPTS,
+    ScanShard,
+    plan_shards,
+    run_sharded_scan,
+)
 from cs_kit.cli.config import RendererConfig, RunConfig
 from cs_kit.cli.tool_registry import get_all_supported_providers, select_scanners
-from cs_kit.normalizer.mapping import apply_mapping, list_available_mappings
-from cs_kit.normalizer.parser import parse_ocsf
-from cs_kit.normalizer.summarize import generate_finding_summary
+from cs_kit.normalizer import codec
+from cs_kit.normalizer.artifacts import (
+    PARTIAL_SUMMARY_FILE,
+    iter_finding_dicts,
+    iter_findings,
+    rollup_partial_summaries,
+    write_findings,
+    write_partial_summary,
+)
+from cs_kit.normalizer.cardinality import DEFAULT_PRECISION
+from cs_kit.normalizer.dedupe import FindingDeduplicator
+from cs_kit.normalizer.diff import DiffSummary, diff_runs
+from cs_kit.normalizer.incremental import load_incremental_plan
+from cs_kit.normalizer.mapping import (
+    iter_apply_mapping,
+    list_available_mappings,
+    load_mapping_index,
+)
+from cs_kit.normalizer.ndjson import NDJSONReader
+from cs_kit.normalizer.ocsf_models import OCSFEnrichedFinding
+from cs_kit.normalizer.parquet import DEFAULT_ROW_GROUP_SIZE, write_findings_parquet
+from cs_kit.normalizer.parser import iter_ocsf_many, iter_raw_findings
+from cs_kit.normalizer.pipeline import NormalizationPipeline
+from cs_kit.normalizer.summarize import SummaryAccumulator, generate_finding_summary
+from cs_kit.normalizer.warehouse import WAREHOUSE_FILE, Warehouse
 from cs_kit.render.pdf import generate_report
 
 # Initialize Typer app and Rich console
@@ -97,6 +136,23 @@ def run(
     output: str | None = None,
     company_name: str = "Security Assessment",
     redact_ids: bool = True,
+    parse_workers: int = 1,
+    prowler_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    accounts: str | None = None,
+    role_name: str | None = None,
+    shard_regions: bool = False,
+    shard_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    combine_frameworks: bool = False,
+    pipeline: bool = False,
+    max_age: str | None = None,
+    since_run: str | None = None,
+    changed_resource_types: str | None = None,
+    artifact_format: str = "json",
+    cardinality: str = "exact",
+    hll_precision: int = DEFAULT_PRECISION,
+    warehouse: str | None = None,
+    findings_batch_size: int | None = None,
+    render_workers: int = 1,
 ) -> None:
     """Run security scan and generate report."""
 
@@ -114,6 +170,23 @@ def run(
         regions=regions_list,
         artifacts_dir=artifacts_dir,
         redact_ids=redact_ids,
+        parse_workers=parse_workers,
+        prowler_concurrency=prowler_concurrency,
+        accounts=accounts.split(",") if accounts else [],
+        aws_role_name=role_name,
+        shard_regions=shard_regions,
+        shard_attempts=shard_attempts,
+        combine_frameworks=combine_frameworks,
+        pipelined=pipeline,
+        scan_max_age=max_age,  # type: ignore
+        since_run=since_run,
+        changed_resource_types=changed_resource_types.split(",") if changed_resource_types else [],
+        artifact_format=artifact_format,  # type: ignore
+        cardinality=cardinality,  # type: ignore
+        hll_precision=hll_precision,
+        warehouse=warehouse,
+        findings_batch_size=findings_batch_size,
+        render_workers=render_workers,
     )
 
     console.print(Panel(
@@ -145,6 +218,8 @@ def render(
     logo_path: str | None = None,
     template_dir: str | None = None,
     include_raw_data: bool = False,
+    batch_size: int | None = None,
+    render_workers: int = 1,
 ) -> None:
     """Generate PDF report from existing normalized findings."""
 
@@ -158,40 +233,17 @@ def render(
     console.print(f"[blue]Generating report from {input_file}...[/blue]")
 
     try:
-        # Load normalized findings
-        with open(input_path) as f:
-            data = json.load(f)
-
-        findings = []
-        if isinstance(data, list):
-            # Direct list of findings
-            findings = data
-        elif isinstance(data, dict) and 'findings' in data:
-            # Wrapped in a container
-            findings = data['findings']
-        else:
-            console.print("[red]Invalid input file format[/red]")
-            raise typer.Exit(1)
-
         # Create renderer config
         renderer_config = RendererConfig(
             template_dir=template_dir,
             logo_path=logo_path,
             company_name=company_name,
             include_raw_data=include_raw_data,
+            findings_batch_size=batch_size,
+            render_workers=render_workers,
         )
 
-        # Generate summary
-        summary = generate_finding_summary(findings)
-
-        # Generate report
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            progress.add_task("Generating PDF report...", total=None)
-            generate_report(findings, summary, output_path, renderer_config)
+        _render_from_file(input_path, output_path, renderer_config)
 
         console.print(f"[green]Report generated successfully: {output_path}[/green]")
 
@@ -212,8 +264,7 @@ def validate(
         raise typer.Exit(1)
 
     try:
-        with open(config_path) as f:
-            config_data = json.load(f)
+        config_data = codec.load(config_path)
 
         # Validate configuration
         config = RunConfig(**config_data)
@@ -232,6 +283,93 @@ def validate(
         raise typer.Exit(1) from e
 
 
+@app.command()
+def rollup(
+    inputs: list[str],
+    output: str = "org_summary.json",
+    partial_output: str | None = None,
+) -> None:
+    """Combine the partial summaries of several runs into one summary.
+
+    Partial summaries of runs scanned with the default exact cardinality list
+    every resource and grow with the estate; scan with --cardinality hll to
+    keep them small. Runs without a partial summary, and normalized findings
+    files, are summarized from their findings.
+    """
+
+    try:
+        _rollup_summaries(inputs, Path(output), Path(partial_output) if partial_output else None)
+    except Exception as e:
+        console.print(f"[red]Failed to roll up summaries: {e}[/red]")
+        raise typer.Exit(1) from e
+
+
+@app.command()
+def diff(
+    run_a: str,
+    run_b: str,
+    artifacts_dir: str = "./artifacts",
+    output: str | None = None,
+) -> None:
+    """Compare two runs: added, removed and changed findings."""
+
+    try:
+        _diff_runs(run_a, run_b, Path(artifacts_dir), Path(output) if output else None)
+    except Exception as e:
+        console.print(f"[red]Failed to compare runs: {e}[/red]")
+        raise typer.Exit(1) from e
+
+
+@app.command()
+def export(
+    run: str,
+    output: str,
+    artifacts_dir: str = "./artifacts",
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+) -> None:
+    """Export a run's normalized findings to Parquet."""
+
+    try:
+        _export_run(run, Path(output), Path(artifacts_dir), row_group_size)
+    except Exception as e:
+        console.print(f"[red]Failed to export findings: {e}[/red]")
+        raise typer.Exit(1) from e
+
+
+@app.command()
+def ingest(
+    runs: list[str],
+    artifacts_dir: str = "./artifacts",
+    warehouse: str | None = None,
+) -> None:
+    """Ingest runs into the findings warehouse."""
+
+    try:
+        _ingest_runs(runs, Path(artifacts_dir), Path(warehouse) if warehouse else None)
+    except Exception as e:
+        console.print(f"[red]Failed to ingest runs: {e}[/red]")
+        raise typer.Exit(1) from e
+
+
+@app.command()
+def query(
+    sql: str,
+    artifacts_dir: str = "./artifacts",
+    warehouse: str | None = None,
+    output: str | None = None,
+) -> None:
+    """Run a read-only SQL query against the findings warehouse."""
+
+    try:
+        _query_warehouse(
+            sql, Path(artifacts_dir), Path(warehouse) if warehouse else None,
+            Path(output) if output else None,
+        )
+    except Exception as e:
+        console.print(f"[red]Query failed: {e}[/red]")
+        raise typer.Exit(1) from e
+
+
 @app.command()
 def version() -> None:
     """Show version information."""
@@ -253,12 +391,17 @@ async def _run_scan(config: RunConfig, run_id: str, output_path: str | None, com
     reports_dir = Path("reports")
     reports_dir.mkdir(exist_ok=True)
 
-    report_metadata: dict[str, str | None] = {
+    report_metadata: dict[str, Any] = {
         "report_path": None,
         "report_error": None,
     }
 
-    with Progress(
+    # Prowler output of recent identical runs is reused when --max-age is set
+    scan_cache = None
+    if config.scan_max_age is not None:
+        scan_cache = ScanCache.for_artifacts(artifacts_dir, config.scan_max_age)
+
+    with ExitStack() as cleanup, Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         console=console,
@@ -273,85 +416,175 @@ async def _run_scan(config: RunConfig, run_id: str, output_path: str | None, com
 
         console.print(f"[green]Selected scanners: {', '.join(selected_scanners)}[/green]")
 
+        # Incremental scans re-run only the checks worth repeating and carry
+        # the previous run's findings of every other check over
+        incremental = None
+        if config.since_run:
+            incremental = load_incremental_plan(
+                artifacts_dir,
+                config.since_run,
+                config.provider,
+                changed_resource_types=config.changed_resource_types,
+            )
+            report_metadata["since_run"] = config.since_run
+            report_metadata["rerun_checks"] = incremental.rerun_checks
+            console.print(
+                f"[blue]Incremental scan since {config.since_run}: re-running "
+                f"{len(incremental.rerun_checks)} checks, carrying over "
+                f"{incremental.carried_count} findings[/blue]"
+            )
+        checks = incremental.rerun_checks if incremental else None
+
+        # In pipelined mode each prowler run's output is normalized as soon
+        # as the run finishes, while the other runs keep going, and written
+        # to the artifact as it is normalized
+        # Only several prowler runs can report the same finding twice
+        dedupe = _runs_overlap(config, checks)
+        pipeline = None
+        if config.pipelined:
+            pipeline = cleanup.enter_context(
+                _start_pipeline(config, run_artifacts_dir, dedupe)
+            )
+
         # Step 2: Run scanners
         all_scan_files = []
 
         for scanner in selected_scanners:
             if scanner == "prowler":
                 task = progress.add_task(f"Running {scanner} scan...", total=None)
+                run_tasks: dict[str, TaskID] = {}
+                on_progress = _prowler_progress(progress, run_tasks)
 
                 # Set up environment variables (user should set these)
                 env_vars = dict(os.environ)
 
-                # Run prowler
-                scan_files = await run_prowler(
-                    provider=config.provider,
-                    frameworks=config.frameworks,
-                    regions=config.regions,
-                    env=env_vars,
-                    out_dir=run_artifacts_dir,
-                )
+                # Run prowler, split into shards for multi-account or
+                # per-region scans
+                if checks == []:
+                    # Nothing failed or changed since the previous run
+                    scan_files = []
+                elif config.accounts or config.shard_regions:
+                    scan_files = await _run_sharded_prowler(
+                        config, env_vars, run_artifacts_dir, on_progress,
+                        pipeline.submit if pipeline else None, scan_cache, checks,
+                    )
+                else:
+                    scan_files = await run_prowler(
+                        provider=config.provider,
+                        frameworks=config.frameworks,
+                        regions=config.regions,
+                        env=env_vars,
+                        out_dir=run_artifacts_dir,
+                        max_concurrency=config.prowler_concurrency,
+                        combine_frameworks=config.combine_frameworks,
+                        progress=on_progress,
+                        on_output=pipeline.submit if pipeline else None,
+                        cache=scan_cache,
+                        checks=checks,
+                    )
 
                 all_scan_files.extend(scan_files)
+                for run_task in run_tasks.values():
+                    progress.remove_task(run_task)
                 progress.remove_task(task)
                 console.print(f"[green]✓ {scanner} scan completed: {len(scan_files)} files[/green]")
 
-        # Step 3: Parse and normalize findings
-        task = progress.add_task("Parsing and normalizing findings...", total=None)
-
-        all_findings = []
-        for scan_file in all_scan_files:
-            findings = parse_ocsf(scan_file, config.provider, "prowler")
-            all_findings.extend(findings)
-
-        progress.remove_task(task)
-        console.print(f"[green]✓ Parsed {len(all_findings)} findings[/green]")
-
-        # Step 4: Apply compliance mappings
-        if config.frameworks:
-            task = progress.add_task("Applying compliance mappings...", total=None)
-
-            try:
-                enriched_findings = apply_mapping(all_findings, config.frameworks)
-                progress.remove_task(task)
-                console.print(f"[green]✓ Applied {len(config.frameworks)} framework mappings[/green]")
-            except Exception as e:
-                progress.remove_task(task)
-                console.print(f"[yellow]Warning: Could not apply some mappings: {e}[/yellow]")
-                enriched_findings = all_findings
+        if scan_cache:
+            report_metadata["cached_shards"] = [key.name for key in scan_cache.hits]
+            report_metadata["scanned_shards"] = [key.name for key in scan_cache.misses]
+            _display_scan_cache(scan_cache)
+
+        # Step 3: Parse and normalize findings, streaming each file so only
+        # the normalized findings (never the decoded documents) are held.
+        # Compact records are used internally; Pydantic models are only
+        # built when artifacts are loaded back at the API boundary.
+        # Runs for several frameworks or shards repeat the same checks, so
+        # their duplicates are dropped before mapping
+        if pipeline:
+            # Steps 3-6 have run alongside the scans; wait for the output
+            # of the last runs
+            task = progress.add_task("Finishing normalization...", total=None)
+            if incremental:
+                pipeline.submit_findings(incremental.iter_carried())
+            normalized_file = await pipeline.finish()
+            deduplicator = pipeline.deduplicator
+            accumulator = pipeline.accumulator
+            progress.remove_task(task)
+            console.print(f"[green]✓ Parsed {accumulator.total} findings[/green]")
         else:
-            enriched_findings = all_findings
+            deduplicator = FindingDeduplicator() if dedupe else None
+            parsed_stream = iter_ocsf_many(
+                all_scan_files,
+                config.provider,
+                "prowler",
+                workers=config.parse_workers,
+                as_records=True,
+            )
+            if incremental:
+                parsed_stream = incremental.merge(parsed_stream)
+            findings_stream = parsed_stream
+            if deduplicator is not None:
+                findings_stream = deduplicator.filter(parsed_stream)
+
+            # Step 4: Apply compliance mappings as findings are parsed
+            enriched_stream = findings_stream
+            if config.frameworks:
+                try:
+                    enriched_stream = iter_apply_mapping(findings_stream, config.frameworks)
+                    console.print(f"[green]✓ Loaded {len(config.frameworks)} framework mappings[/green]")
+                except Exception as e:
+                    console.print(f"[yellow]Warning: Could not apply some mappings: {e}[/yellow]")
+
+            # Steps 5-6: Summarize the findings as they are written out, so
+            # they are never all held in memory
+            task = progress.add_task("Parsing and normalizing findings...", total=None)
+            accumulator = SummaryAccumulator(config.cardinality, config.hll_precision)
+            normalized_file = write_findings(
+                accumulator.observe(enriched_stream), run_artifacts_dir, config.artifact_format
+            )
+            progress.remove_task(task)
+            console.print(f"[green]✓ Parsed {accumulator.total} findings[/green]")
 
-        # Step 5: Generate summary
-        task = progress.add_task("Generating summary statistics...", total=None)
-        summary = generate_finding_summary(enriched_findings)
-        progress.remove_task(task)
+        if deduplicator is not None and deduplicator.duplicates:
+            console.print(
+                f"[green]✓ Removed {deduplicator.duplicates} duplicate findings[/green]"
+            )
+        summary = generate_finding_summary(accumulator)
 
-        # Step 6: Save normalized data
+        # Step 6: Save the summary next to the normalized data
         task = progress.add_task("Saving normalized data...", total=None)
 
-        normalized_file = run_artifacts_dir / "normalized.json"
-        with open(normalized_file, 'w') as f:
-            json.dump([finding.model_dump() for finding in enriched_findings], f, indent=2, default=str)
-
         summary_file = run_artifacts_dir / "summary.json"
-        with open(summary_file, 'w') as f:
-            json.dump(summary.model_dump(), f, indent=2, default=str)
+        codec.dump(summary.model_dump(), summary_file, indent=True)
+        write_partial_summary(accumulator, run_artifacts_dir / PARTIAL_SUMMARY_FILE)
 
         progress.remove_task(task)
         console.print(f"[green]✓ Saved normalized data to {normalized_file}[/green]")
 
+        if config.warehouse:
+            task = progress.add_task("Ingesting into findings warehouse...", total=None)
+            Warehouse(Path(config.warehouse)).ingest_run(run_artifacts_dir, run_id)
+            progress.remove_task(task)
+            console.print(f"[green]✓ Ingested run into {config.warehouse}[/green]")
+
         # Step 7: Generate PDF report
         if output_path is None:
             output_path = str(reports_dir / f"{run_id}.pdf")
 
         task = progress.add_task("Generating PDF report...", total=None)
 
-        renderer_config = RendererConfig(company_name=company_name)
+        renderer_config = RendererConfig(
+            company_name=company_name,
+            findings_batch_size=config.findings_batch_size,
+            render_workers=config.render_workers,
+        )
         report_metadata["report_path"] = output_path
 
         try:
-            generate_report(enriched_findings, summary, Path(output_path), renderer_config)
+            # The report streams the findings back from the saved artifact
+            generate_report(
+                iter_findings(normalized_file), summary, Path(output_path), renderer_config
+            )
         except Exception as exc:  # pylint: disable=broad-except
             progress.remove_task(task)
             report_metadata["report_error"] = str(exc)
@@ -364,14 +597,399 @@ async def _run_scan(config: RunConfig, run_id: str, output_path: str | None, com
             console.print(f"[green]✓ Generated PDF report: {output_path}[/green]")
 
     # Display summary
-    _display_scan_summary(summary, enriched_findings)
+    _display_scan_summary(summary)
 
     metadata_file = run_artifacts_dir / "metadata.json"
-    with metadata_file.open("w", encoding="utf-8") as metadata_handle:
-        json.dump(report_metadata, metadata_handle, indent=2)
+    codec.dump(report_metadata, metadata_file, indent=True)
+
+
+def _load_normalized_findings(input_path: Path) -> Iterator[OCSFEnrichedFinding]:
+    """Stream findings from a normalized findings artifact.
+
+    Findings are read and validated as the iterator is consumed, so the
+    artifact is never held in memory; only the legacy JSON object with a
+    ``findings`` key is decoded in one go.
+
+    Args:
+        input_path: Path to a ``normalized.json`` file, either a list of
+            findings or an object with a ``findings`` key, to a
+            ``normalized.ndjson`` or ``normalized.ndjson.zst`` file, or to a
+            ``normalized.parquet`` file
+
+    Returns:
+        Iterator of validated enriched findings
+
+    Raises:
+        ValueError: If the file is not in a supported format, raised when
+            the iterator reaches the invalid content
+    """
+    if input_path.suffix in (".ndjson", ".zst"):
+        items: Iterator[Any] = NDJSONReader(input_path).iter_dicts()
+    elif input_path.suffix == ".parquet":
+        items = iter_finding_dicts(input_path)
+    else:
+        items = _iter_json_items(input_path)
+    return (OCSFEnrichedFinding.model_validate(item) for item in items)
+
+
+def _iter_json_items(input_path: Path) -> Iterator[Any]:
+    """Stream the finding dictionaries of a normalized JSON file."""
+    try:
+        for item in iter_raw_findings(input_path):
+            if isinstance(item, dict) and "findings" in item:
+                # Wrapped in a container
+                yield from item["findings"]
+            elif isinstance(item, dict):
+                yield item
+            else:
+                raise ValueError(f"Expected a finding, got {type(item).__name__}")
+    except ValueError as e:
+        raise ValueError("Invalid input file format") from e
+
+
+def _render_from_file(
+    input_path: Path, output_path: Path, renderer_config: RendererConfig
+) -> None:
+    """Generate a PDF report from a normalized findings file.
+
+    The file is streamed twice, once for the summary and once for the
+    report, rather than loaded.
+    """
+    summary = generate_finding_summary(
+        SummaryAccumulator.from_findings(_load_normalized_findings(input_path))
+    )
+
+    # Generate report
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+    ) as progress:
+        progress.add_task("Generating PDF report...", total=None)
+        generate_report(
+            _load_normalized_findings(input_path), summary, output_path, renderer_config
+        )
+
+
+def _prowler_progress(progress: Progress, tasks: dict[str, TaskID]) -> ProgressCallback:
+    """Show the check counters of each prowler run as a progress task.
+
+    Args:
+        progress: Progress display of the scan
+        tasks: Task of each run by label, filled in as runs report progress
+
+    Returns:
+        Callback for run_prowler and run_sharded_scan
+    """
+
+    def on_progress(update: ProwlerProgress) -> None:
+        total = f"/{update.total}" if update.total is not None else ""
+        description = f"prowler {update.label}: {update.completed}{total} checks"
+        if update.label not in tasks:
+            tasks[update.label] = progress.add_task(description, total=update.total)
+        progress.update(
+            tasks[update.label],
+            description=description,
+            completed=update.completed,
+            total=update.total,
+        )
+
+    return on_progress
+
+
+def _start_pipeline(
+    config: RunConfig, run_dir: Path, dedupe: bool = True
+) -> NormalizationPipeline:
+    """Create the pipeline normalizing prowler output during a scan.
+
+    Mappings that fail to load are reported and left out, as in the
+    sequential mode.
+
+    Args:
+        config: Scan configuration
+        run_dir: Run artifacts directory the normalized findings are written to
+        dedupe: Drop findings repeated by overlapping prowler runs
+
+    Returns:
+        Pipeline for the scan's findings, finishing with the path of the
+        normalized findings artifact
+    """
+    map_ids = config.frameworks
+    if map_ids:
+        try:
+            load_mapping_index(map_ids)
+            console.print(f"[green]✓ Loaded {len(map_ids)} framework mappings[/green]")
+        except Exception as e:
+            console.print(f"[yellow]Warning: Could not apply some mappings: {e}[/yellow]")
+            map_ids = []
+
+    return NormalizationPipeline(
+        config.provider,
+        "prowler",
+        map_ids,
+        parse_workers=config.parse_workers,
+        cardinality=config.cardinality,
+        precision=config.hll_precision,
+        sink=lambda findings: write_findings(findings, run_dir, config.artifact_format),
+        dedupe=dedupe,
+    )
+
+
+def _runs_overlap(config: RunConfig, checks: list[str] | None = None) -> bool:
+    """Whether a scan's prowler runs can report the same finding more than once.
+
+    That is the case when it is split into several shards, or when its
+    frameworks run separately; a single run reports each finding once.
+
+    Args:
+        config: Scan configuration
+        checks: Checks an incremental scan re-runs, in a single selection
+
+    Returns:
+        Whether the findings need deduplicating
+    """
+    if config.accounts or config.shard_regions:
+        return len(_plan_shards(config, checks)) > 1
+    return len(config.frameworks) > 1 and not config.combine_frameworks and not checks
+
+
+def _plan_shards(config: RunConfig, checks: list[str] | None = None) -> list[ScanShard]:
+    """Split a scan into the shards :func:`_run_sharded_prowler` runs."""
+    return plan_shards(
+        config.provider,
+        config.accounts,
+        config.regions,
+        [] if checks else config.frameworks,
+        shard_regions=config.shard_regions,
+        combine_frameworks=config.combine_frameworks,
+    )
+
+
+async def _run_sharded_prowler(
+    config: RunConfig,
+    env: dict[str, str],
+    out_dir: Path,
+    progress: ProgressCallback | None = None,
+    on_output: OutputCallback | None = None,
+    cache: ScanCache | None = None,
+    checks: list[str] | None = None,
+) -> list[Path]:
+    """Run prowler as (account, region, framework) shards.
+
+    Args:
+        config: Scan configuration
+        env: Environment variables for the prowler processes
+        out_dir: Run artifacts directory
+        progress: Called as shards report checks completed
+        on_output: Called with each successful shard's output files
+        cache: Cache of prowler output to serve shards from
+        checks: Run only these checks, in (account, region) shards
+
+    Returns:
+        Output files of the successful shards
+
+    Raises:
+        ProwlerError: If no shard succeeded
+    """
+    shards = _plan_shards(config, checks)
+    console.print(f"[blue]Running {len(shards)} scan shards[/blue]")
+
+    schedule = await run_sharded_scan(
+        provider=config.provider,
+        shards=shards,
+        regions=config.regions,
+        env=env,
+        out_dir=out_dir,
+        max_concurrency=config.prowler_concurrency,
+        max_attempts=config.shard_attempts,
+        role_name=config.aws_role_name,
+        progress=progress,
+        on_output=on_output,
+        cache=cache,
+        checks=checks,
+    )
+
+    for failed in schedule.failed:
+        console.print(
+            f"[yellow]Warning: shard {failed.shard.name} failed after "
+            f"{failed.attempts} attempts: {failed.error}[/yellow]"
+        )
+    if not schedule.files:
+        raise ProwlerError(f"All {len(shards)} scan shards failed")
+
+    return schedule.files
+
+
+def _display_scan_cache(cache: ScanCache) -> None:
+    """Show which prowler runs were served from the scan cache."""
+    table = Table(title="Scan Cache", show_header=True, header_style="bold magenta")
+    table.add_column("Shard", style="cyan")
+    table.add_column("Source")
+
+    for key in cache.hits:
+        table.add_row(key.name, "[green]cached[/green]")
+    for key in cache.misses:
+        table.add_row(key.name, "scanned")
+
+    console.print(table)
+
+
+def _rollup_summaries(
+    inputs: list[str], output_path: Path, partial_output_path: Path | None
+) -> None:
+    """Merge partial summaries and write the combined summary.
+
+    Args:
+        inputs: Partial summary files, normalized findings files or run
+            artifacts directories
+        output_path: Path for the combined ``FindingSummary`` JSON
+        partial_output_path: Optional path for the combined partial summary,
+            so rollups can themselves be merged
+    """
+    accumulator = rollup_partial_summaries(Path(path) for path in inputs)
+    summary = generate_finding_summary(accumulator)
+
+    codec.dump(summary.model_dump(), output_path, indent=True)
+    if partial_output_path is not None:
+        write_partial_summary(accumulator, partial_output_path)
+
+    _display_scan_summary(summary)
+    console.print(f"[green]✓ Rolled up {len(inputs)} summaries into {output_path}[/green]")
+
+
+def _diff_runs(
+    run_a: str, run_b: str, artifacts_dir: Path, output_dir: Path | None
+) -> DiffSummary:
+    """Compare two runs and write their differences.
+
+    Args:
+        run_a: Run ID under ``artifacts_dir``, artifacts directory or
+            normalized findings file of the earlier run
+        run_b: The same for the later run
+        artifacts_dir: Directory holding scan runs
+        output_dir: Directory for the differences; defaults to
+            ``<artifacts_dir>/diff_<run_a>_<run_b>``
+
+    Returns:
+        Summary of the differences
+    """
+    before = _resolve_run(run_a, artifacts_dir)
+    after = _resolve_run(run_b, artifacts_dir)
+    if output_dir is None:
+        output_dir = artifacts_dir / f"diff_{_run_name(before)}_{_run_name(after)}"
+
+    summary = diff_runs(before, after, output_dir)
+
+    console.print("\n[bold blue]Run Comparison[/bold blue]")
+    table = Table(show_header=True, header_style="bold magenta")
+    table.add_column("Metric", style="cyan")
+    table.add_column("Count", justify="right", style="green")
+    table.add_row("Added", str(summary.added))
+    table.add_row("Removed", str(summary.removed))
+    table.add_row("Changed", str(summary.changed))
+    table.add_row("Unchanged", str(summary.unchanged))
+    table.add_row("New Failures", str(summary.new_failures))
+    table.add_row("Resolved", str(summary.resolved))
+    for transition, count in summary.severity_changes.most_common():
+        table.add_row(f"Severity {transition}", str(count))
+    console.print(table)
+
+    console.print(f"[green]✓ Differences written to {output_dir}[/green]")
+    return summary
+
+
+def _export_run(run: str, output_path: Path, artifacts_dir: Path, row_group_size: int) -> int:
+    """Export a run's normalized findings, in any artifact format, to Parquet.
+
+    Args:
+        run: Run ID under ``artifacts_dir``, artifacts directory or
+            normalized findings file
+        output_path: Parquet file to write
+        artifacts_dir: Directory holding scan runs
+        row_group_size: Maximum findings per row group
+
+    Returns:
+        Number of exported findings
+    """
+    count = write_findings_parquet(
+        iter_findings(_resolve_run(run, artifacts_dir)), output_path, row_group_size
+    )
+    console.print(f"[green]✓ Exported {count} findings to {output_path}[/green]")
+    return count
+
+
+def _ingest_runs(runs: list[str], artifacts_dir: Path, warehouse_path: Path | None) -> int:
+    """Insert or replace runs in the findings warehouse.
+
+    Args:
+        runs: Run IDs under ``artifacts_dir`` or run artifacts directories
+        artifacts_dir: Directory holding scan runs
+        warehouse_path: Warehouse database; defaults to
+            ``<artifacts_dir>/warehouse.db``
+
+    Returns:
+        Number of ingested findings
+    """
+    warehouse = Warehouse(warehouse_path) if warehouse_path else Warehouse.for_artifacts(artifacts_dir)
+    total = 0
+    for run in runs:
+        run_dir = _resolve_run(run, artifacts_dir)
+        count = warehouse.ingest_run(run_dir, _run_name(run_dir))
+        console.print(f"[green]✓ Ingested {count} findings of {_run_name(run_dir)}[/green]")
+        total += count
+    return total
+
+
+def _query_warehouse(
+    sql: str, artifacts_dir: Path, warehouse_path: Path | None, output_path: Path | None
+) -> list[dict[str, Any]]:
+    """Query the findings warehouse and show or save the result.
+
+    Args:
+        sql: Read-only SQL statement
+        artifacts_dir: Directory holding scan runs
+        warehouse_path: Warehouse database; defaults to
+            ``<artifacts_dir>/warehouse.db``
+        output_path: Optional JSON file for the result rows, instead of
+            showing them as a table
+
+    Returns:
+        Result rows
+    """
+    path = warehouse_path or artifacts_dir / WAREHOUSE_FILE
+    if not path.exists():
+        raise FileNotFoundError(f"Findings warehouse not found: {path}")
+    rows = Warehouse(path).query(sql)
+
+    if output_path is not None:
+        codec.dump(rows, output_path, indent=True)
+        console.print(f"[green]✓ Wrote {len(rows)} rows to {output_path}[/green]")
+        return rows
+
+    table = Table(show_header=True, header_style="bold magenta")
+    for column in rows[0] if rows else ():
+        table.add_column(column)
+    for row in rows:
+        table.add_row(*("" if value is None else str(value) for value in row.values()))
+    console.print(table)
+    console.print(f"{len(rows)} rows")
+    return rows
+
+
+def _resolve_run(run: str, artifacts_dir: Path) -> Path:
+    """Get the path of a run given as a path or as a run ID."""
+    path = Path(run)
+    if path.exists() or not (artifacts_dir / run).exists():
+        return path
+    return artifacts_dir / run
+
+
+def _run_name(path: Path) -> str:
+    """Get the run ID of a run artifacts directory or findings file."""
+    return path.name if path.is_dir() else path.parent.name
 
 
-def _display_scan_summary(summary, findings) -> None:
+def _display_scan_summary(summary) -> None:
     """Display scan summary in a nice table."""
 
     console.print("\n[bold blue]Scan Summary[/bold blue]")
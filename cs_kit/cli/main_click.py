@@ -1,8 +1,6 @@
 """Main CLI interface for CS Kit using Click."""
 
 import asyncio
-import json
-import os
 import uuid
 from datetime import UTC, datetime
 from pathlib import Path
@@ -10,16 +8,32 @@ from pathlib import Path
 import click
 from rich.console import Console
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
-from cs_kit.adapters.prowler.run import list_supported_frameworks, run_prowler
+from cs_kit.adapters.prowler.run import (
+    DEFAULT_MAX_CONCURRENCY,
+    list_supported_frameworks,
+)
+from cs_kit.adapters.prowler.scheduler import DEFAULT_MAX_ATTEMPTS
 from cs_kit.cli.config import RendererConfig, RunConfig
+from cs_kit.cli.main import (
+    _diff_runs,
+    _export_run,
+    _ingest_runs,
+    _query_warehouse,
+    _render_from_file,
+    _rollup_summaries,
+    _run_scan,
+)
 from cs_kit.cli.tool_registry import get_all_supported_providers, select_scanners
-from cs_kit.normalizer.mapping import apply_mapping, list_available_mappings
-from cs_kit.normalizer.parser import parse_ocsf
-from cs_kit.normalizer.summarize import generate_finding_summary
-from cs_kit.render.pdf import generate_report
+from cs_kit.normalizer import codec
+from cs_kit.normalizer.cardinality import (
+    DEFAULT_PRECISION,
+    MAX_PRECISION,
+    MIN_PRECISION,
+)
+from cs_kit.normalizer.mapping import list_available_mappings
+from cs_kit.normalizer.parquet import DEFAULT_ROW_GROUP_SIZE
 
 # Initialize Rich console
 console = Console()
@@ -98,7 +112,24 @@ def list_providers():
 @click.option("--output", help="Output PDF file path")
 @click.option("--company-name", default="Security Assessment", help="Company name for reports")
 @click.option("--redact-ids/--no-redact-ids", default=True, help="Redact sensitive IDs in reports")
-def run_scan(provider, frameworks, regions, artifacts_dir, output, company_name, redact_ids):
+@click.option("--parse-workers", default=1, type=click.IntRange(min=1), help="Worker processes for parsing scan output")
+@click.option("--prowler-concurrency", default=DEFAULT_MAX_CONCURRENCY, type=click.IntRange(min=1), help="Prowler processes to run at once, one per framework")
+@click.option("--accounts", help="Comma-separated AWS accounts to scan (profile names, or account IDs with --role-name)")
+@click.option("--role-name", help="IAM role to assume in each account")
+@click.option("--shard-regions/--no-shard-regions", default=False, help="Scan each region as a separate shard")
+@click.option("--shard-attempts", default=DEFAULT_MAX_ATTEMPTS, type=click.IntRange(min=1), help="Attempts per scan shard")
+@click.option("--combine-frameworks/--no-combine-frameworks", default=False, help="Run all frameworks' checks in a single prowler run")
+@click.option("--pipeline/--no-pipeline", "pipelined", default=False, help="Normalize each prowler run's output while other runs continue")
+@click.option("--max-age", help="Reuse cached prowler output up to this old, e.g. 30m, 12h or 7d")
+@click.option("--since-run", help="Re-run only checks that failed in this previous run, carrying over the rest")
+@click.option("--changed-resource-types", help="Comma-separated resource types with recent changes, re-run with --since-run")
+@click.option("--artifact-format", default="json", type=click.Choice(["json", "ndjson", "ndjson.zst", "parquet"]), help="Format of normalized findings; ndjson.zst needs the zstandard package, parquet needs pyarrow")
+@click.option("--cardinality", default="exact", type=click.Choice(["exact", "hll"]), help="Count unique resources exactly or estimate them with HyperLogLog, which keeps partial summaries small for large estates")
+@click.option("--hll-precision", default=DEFAULT_PRECISION, type=click.IntRange(MIN_PRECISION, MAX_PRECISION), help="HyperLogLog precision for --cardinality hll")
+@click.option("--warehouse", help="Findings warehouse database to ingest the run into")
+@click.option("--findings-batch-size", type=click.IntRange(min=1), help="Lay out report findings in parts of this many rows and merge them; needs pypdf")
+@click.option("--render-workers", default=1, type=click.IntRange(min=1), help="Processes laying out report parts with --findings-batch-size")
+def run_scan(provider, frameworks, regions, artifacts_dir, output, company_name, redact_ids, parse_workers, prowler_concurrency, accounts, role_name, shard_regions, shard_attempts, combine_frameworks, pipelined, max_age, since_run, changed_resource_types, artifact_format, cardinality, hll_precision, warehouse, findings_batch_size, render_workers):
     """Run security scan and generate report."""
 
     # Parse input parameters
@@ -116,6 +147,25 @@ def run_scan(provider, frameworks, regions, artifacts_dir, output, company_name,
             regions=regions_list,
             artifacts_dir=artifacts_dir,
             redact_ids=redact_ids,
+            parse_workers=parse_workers,
+            prowler_concurrency=prowler_concurrency,
+            accounts=accounts.split(",") if accounts else [],
+            aws_role_name=role_name,
+            shard_regions=shard_regions,
+            shard_attempts=shard_attempts,
+            combine_frameworks=combine_frameworks,
+            pipelined=pipelined,
+            scan_max_age=max_age,
+            since_run=since_run,
+            changed_resource_types=(
+                changed_resource_types.split(",") if changed_resource_types else []
+            ),
+            artifact_format=artifact_format,
+            cardinality=cardinality,
+            hll_precision=hll_precision,
+            warehouse=warehouse,
+            findings_batch_size=findings_batch_size,
+            render_workers=render_workers,
         )
     except Exception as e:
         console.print(f"[red]Configuration error: {e}[/red]")
@@ -149,7 +199,9 @@ def run_scan(provider, frameworks, regions, artifacts_dir, output, company_name,
 @click.option("--logo-path", help="Path to company logo")
 @click.option("--template-dir", help="Custom template directory")
 @click.option("--include-raw-data/--no-include-raw-data", default=False, help="Include raw data in appendix")
-def render_report(input_file, output, company_name, logo_path, template_dir, include_raw_data):
+@click.option("--batch-size", type=click.IntRange(min=1), help="Lay out findings in parts of this many rows and merge them; needs pypdf")
+@click.option("--render-workers", default=1, type=click.IntRange(min=1), help="Processes laying out report parts with --batch-size")
+def render_report(input_file, output, company_name, logo_path, template_dir, include_raw_data, batch_size, render_workers):
     """Generate PDF report from existing normalized findings."""
 
     input_path = Path(input_file)
@@ -162,40 +214,17 @@ def render_report(input_file, output, company_name, logo_path, template_dir, inc
     console.print(f"[blue]Generating report from {input_file}...[/blue]")
 
     try:
-        # Load normalized findings
-        with open(input_path) as f:
-            data = json.load(f)
-
-        findings = []
-        if isinstance(data, list):
-            # Direct list of findings
-            findings = data
-        elif isinstance(data, dict) and 'findings' in data:
-            # Wrapped in a container
-            findings = data['findings']
-        else:
-            console.print("[red]Invalid input file format[/red]")
-            raise click.Abort()
-
         # Create renderer config
         renderer_config = RendererConfig(
             template_dir=template_dir,
             logo_path=logo_path,
             company_name=company_name,
             include_raw_data=include_raw_data,
+            findings_batch_size=batch_size,
+            render_workers=render_workers,
         )
 
-        # Generate summary
-        summary = generate_finding_summary(findings)
-
-        # Generate report
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            progress.add_task("Generating PDF report...", total=None)
-            generate_report(findings, summary, output_path, renderer_config)
+        _render_from_file(input_path, output_path, renderer_config)
 
         console.print(f"[green]Report generated successfully: {output_path}[/green]")
 
@@ -204,6 +233,88 @@ def render_report(input_file, output, company_name, logo_path, template_dir, inc
         raise click.Abort() from e
 
 
+@cli.command("rollup")
+@click.argument("inputs", nargs=-1, required=True)
+@click.option("--output", default="org_summary.json", help="Output summary JSON file path")
+@click.option("--partial-output", help="Also write the merged partial summary to this path")
+def rollup_summaries(inputs, output, partial_output):
+    """Combine the partial summaries of several runs into one summary.
+
+    Partial summaries of runs scanned with the default exact cardinality list
+    every resource and grow with the estate; scan with --cardinality hll to
+    keep them small. Runs without a partial summary, and normalized findings
+    files, are summarized from their findings.
+    """
+
+    try:
+        _rollup_summaries(list(inputs), Path(output), Path(partial_output) if partial_output else None)
+    except Exception as e:
+        console.print(f"[red]Failed to roll up summaries: {e}[/red]")
+        raise click.Abort() from e
+
+
+@cli.command("diff")
+@click.argument("run_a")
+@click.argument("run_b")
+@click.option("--artifacts-dir", default="./artifacts", help="Directory holding scan runs")
+@click.option("--output", help="Output directory for the differences")
+def diff_runs(run_a, run_b, artifacts_dir, output):
+    """Compare two runs: added, removed and changed findings."""
+
+    try:
+        _diff_runs(run_a, run_b, Path(artifacts_dir), Path(output) if output else None)
+    except Exception as e:
+        console.print(f"[red]Failed to compare runs: {e}[/red]")
+        raise click.Abort() from e
+
+
+@cli.command("export")
+@click.argument("run")
+@click.argument("output")
+@click.option("--artifacts-dir", default="./artifacts", help="Directory holding scan runs")
+@click.option("--row-group-size", default=DEFAULT_ROW_GROUP_SIZE, type=click.IntRange(min=1), help="Maximum findings per row group")
+def export_run(run, output, artifacts_dir, row_group_size):
+    """Export a run's normalized findings to Parquet."""
+
+    try:
+        _export_run(run, Path(output), Path(artifacts_dir), row_group_size)
+    except Exception as e:
+        console.print(f"[red]Failed to export findings: {e}[/red]")
+        raise click.Abort() from e
+
+
+@cli.command("ingest")
+@click.argument("runs", nargs=-1, required=True)
+@click.option("--artifacts-dir", default="./artifacts", help="Directory holding scan runs")
+@click.option("--warehouse", help="Warehouse database (default: <artifacts-dir>/warehouse.db)")
+def ingest_runs(runs, artifacts_dir, warehouse):
+    """Ingest runs into the findings warehouse."""
+
+    try:
+        _ingest_runs(list(runs), Path(artifacts_dir), Path(warehouse) if warehouse else None)
+    except Exception as e:
+        console.print(f"[red]Failed to ingest runs: {e}[/red]")
+        raise click.Abort() from e
+
+
+@cli.command("query")
+@click.argument("sql")
+@click.option("--artifacts-dir", default="./artifacts", help="Directory holding scan runs")
+@click.option("--warehouse", help="Warehouse database (default: <artifacts-dir>/warehouse.db)")
+@click.option("--output", help="JSON file for the result rows instead of a table")
+def query_warehouse(sql, artifacts_dir, warehouse, output):
+    """Run a read-only SQL query against the findings warehouse."""
+
+    try:
+        _query_warehouse(
+            sql, Path(artifacts_dir), Path(warehouse) if warehouse else None,
+            Path(output) if output else None,
+        )
+    except Exception as e:
+        console.print(f"[red]Query failed: {e}[/red]")
+        raise click.Abort() from e
+
+
 @cli.command("validate")
 @click.argument("config_file")
 def validate_config(config_file):
@@ -215,8 +326,7 @@ def validate_config(config_file):
         raise click.Abort()
 
     try:
-        with open(config_path) as f:
-            config_data = json.load(f)
+        config_data = codec.load(config_path)
 
         # Validate configuration
         config = RunConfig(**config_data)
@@ -235,156 +345,5 @@ def validate_config(config_file):
         raise click.Abort() from e
 
 
-async def _run_scan(config: RunConfig, run_id: str, output_path: str | None, company_name: str) -> None:
-    """Internal function to run the complete scan process."""
-
-    # Create output directories
-    artifacts_dir = Path(config.artifacts_dir)
-    run_artifacts_dir = artifacts_dir / run_id
-    run_artifacts_dir.mkdir(parents=True, exist_ok=True)
-
-    reports_dir = Path("reports")
-    reports_dir.mkdir(exist_ok=True)
-
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-
-        # Step 1: Select and validate scanners
-        progress.add_task("Validating scanner configuration...", total=None)
-        selected_scanners = select_scanners(config)
-
-        if not selected_scanners:
-            raise ValueError("No scanners selected or available for this provider")
-
-        console.print(f"[green]Selected scanners: {', '.join(selected_scanners)}[/green]")
-
-        # Step 2: Run scanners
-        all_scan_files = []
-
-        for scanner in selected_scanners:
-            if scanner == "prowler":
-                task = progress.add_task(f"Running {scanner} scan...", total=None)
-
-                # Set up environment variables (user should set these)
-                env_vars = dict(os.environ)
-
-                # Run prowler
-                scan_files = await run_prowler(
-                    provider=config.provider,
-                    frameworks=config.frameworks,
-                    regions=config.regions,
-                    env=env_vars,
-                    out_dir=run_artifacts_dir,
-                )
-
-                all_scan_files.extend(scan_files)
-                progress.remove_task(task)
-                console.print(f"[green]✓ {scanner} scan completed: {len(scan_files)} files[/green]")
-
-        # Step 3: Parse and normalize findings
-        task = progress.add_task("Parsing and normalizing findings...", total=None)
-
-        all_findings = []
-        for scan_file in all_scan_files:
-            findings = parse_ocsf(scan_file, config.provider, "prowler")
-            all_findings.extend(findings)
-
-        progress.remove_task(task)
-        console.print(f"[green]✓ Parsed {len(all_findings)} findings[/green]")
-
-        # Step 4: Apply compliance mappings
-        if config.frameworks:
-            task = progress.add_task("Applying compliance mappings...", total=None)
-
-            try:
-                enriched_findings = apply_mapping(all_findings, config.frameworks)
-                progress.remove_task(task)
-                console.print(f"[green]✓ Applied {len(config.frameworks)} framework mappings[/green]")
-            except Exception as e:
-                progress.remove_task(task)
-                console.print(f"[yellow]Warning: Could not apply some mappings: {e}[/yellow]")
-                enriched_findings = all_findings
-        else:
-            enriched_findings = all_findings
-
-        # Step 5: Generate summary
-        task = progress.add_task("Generating summary statistics...", total=None)
-        summary = generate_finding_summary(enriched_findings)
-        progress.remove_task(task)
-
-        # Step 6: Save normalized data
-        task = progress.add_task("Saving normalized data...", total=None)
-
-        normalized_file = run_artifacts_dir / "normalized.json"
-        with open(normalized_file, 'w') as f:
-            json.dump([finding.model_dump() for finding in enriched_findings], f, indent=2, default=str)
-
-        summary_file = run_artifacts_dir / "summary.json"
-        with open(summary_file, 'w') as f:
-            json.dump(summary.model_dump(), f, indent=2, default=str)
-
-        progress.remove_task(task)
-        console.print(f"[green]✓ Saved normalized data to {normalized_file}[/green]")
-
-        # Step 7: Generate PDF report
-        if output_path is None:
-            output_path = str(reports_dir / f"{run_id}.pdf")
-
-        task = progress.add_task("Generating PDF report...", total=None)
-
-        renderer_config = RendererConfig(company_name=company_name)
-        generate_report(enriched_findings, summary, Path(output_path), renderer_config)
-
-        progress.remove_task(task)
-        console.print(f"[green]✓ Generated PDF report: {output_path}[/green]")
-
-    # Display summary
-    _display_scan_summary(summary, enriched_findings)
-
-
-def _display_scan_summary(summary, findings) -> None:
-    """Display scan summary in a nice table."""
-
-    console.print("\n[bold blue]Scan Summary[/bold blue]")
-
-    # Overall statistics
-    table = Table(show_header=True, header_style="bold magenta")
-    table.add_column("Metric", style="cyan")
-    table.add_column("Count", justify="right", style="green")
-
-    table.add_row("Total Findings", str(summary.total_findings))
-    table.add_row("Unique Resources", str(summary.unique_resources))
-    table.add_row("Unique Accounts", str(summary.unique_accounts))
-
-    console.print(table)
-
-    # Severity breakdown
-    if summary.by_severity:
-        console.print("\n[bold yellow]Findings by Severity[/bold yellow]")
-        severity_table = Table(show_header=True, header_style="bold magenta")
-        severity_table.add_column("Severity", style="cyan")
-        severity_table.add_column("Count", justify="right", style="green")
-
-        for severity, count in summary.by_severity.items():
-            severity_table.add_row(severity.title(), str(count))
-
-        console.print(severity_table)
-
-    # Status breakdown
-    if summary.by_status:
-        console.print("\n[bold yellow]Findings by Status[/bold yellow]")
-        status_table = Table(show_header=True, header_style="bold magenta")
-        status_table.add_column("Status", style="cyan")
-        status_table.add_column("Count", justify="right", style="green")
-
-        for status, count in summary.by_status.items():
-            status_table.add_row(status.title(), str(count))
-
-        console.print(status_table)
-
-
 if __name__ == "__main__":
     cli()
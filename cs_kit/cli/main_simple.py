@@ -240,6 +240,7 @@ async def _run_scan(config: RunConfig, run_id: str, output_path: str | None, com
                 regions=config.regions,
                 env=env_vars,
                 out_dir=run_artifacts_dir,
+                max_concurrency=config.prowler_concurrency,
             )
 
             all_scan_files.extend(scan_files)
@@ -0,0 +1,300 @@
+"""Reading and writing of normalized scan artifacts."""
+
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any, Literal
+
+from pydantic import BaseModel
+
+from cs_kit.normalizer import codec
+from cs_kit.normalizer.cardinality import DEFAULT_PRECISION
+from cs_kit.normalizer.ndjson import (
+    NDJSONReader,
+    iter_ndjson_dicts,
+    write_findings_ndjson,
+)
+from cs_kit.normalizer.parquet import (
+    iter_parquet_dicts,
+    parquet_row_count,
+    write_findings_parquet,
+)
+from cs_kit.normalizer.parser import iter_raw_findings
+from cs_kit.normalizer.records import FindingRecord
+from cs_kit.normalizer.summarize import SummaryAccumulator
+from cs_kit.normalizer.table import FindingsTable
+
+# Name of the mergeable partial summary written next to summary.json
+PARTIAL_SUMMARY_FILE = "summary.partial.json"
+
+# Name of the normalized findings written to each run's artifacts directory,
+# per artifact format
+NORMALIZED_FILE = "normalized.json"
+NORMALIZED_NDJSON_FILE = "normalized.ndjson"
+NORMALIZED_NDJSON_ZSTD_FILE = "normalized.ndjson.zst"
+NORMALIZED_PARQUET_FILE = "normalized.parquet"
+
+ArtifactFormat = Literal["json", "ndjson", "ndjson.zst", "parquet"]
+
+_ARTIFACT_FILES: dict[str, str] = {
+    "json": NORMALIZED_FILE,
+    "ndjson": NORMALIZED_NDJSON_FILE,
+    "ndjson.zst": NORMALIZED_NDJSON_ZSTD_FILE,
+    "parquet": NORMALIZED_PARQUET_FILE,
+}
+
+
+def write_findings_json(
+    findings: Iterable[BaseModel | FindingRecord], path: Path
+) -> int:
+    """Write findings to a JSON array file one finding at a time.
+
+    The output is the same document ``json.dump([...], f, indent=2, default=str)``
+    would write, encoded with the active :mod:`~cs_kit.normalizer.codec`
+    backend, but the list of dumped findings is never materialized.
+
+    Args:
+        findings: Findings to serialize
+        path: Output file path
+
+    Returns:
+        Number of findings written
+    """
+    count = 0
+    with open(path, "w", encoding="utf-8") as f:
+        for finding in findings:
+            encoded = codec.dumps(_finding_dict(finding), indent=True)
+            f.write("[\n  " if count == 0 else ",\n  ")
+            f.write(encoded.replace("\n", "\n  "))
+            count += 1
+
+        f.write("\n]" if count else "[]")
+
+    return count
+
+
+def _finding_dict(finding: BaseModel | FindingRecord) -> dict[str, Any]:
+    """Dump a finding model or record to a dictionary."""
+    if isinstance(finding, FindingRecord):
+        return finding.to_dict()
+    return finding.model_dump()
+
+
+def write_findings(
+    findings: Iterable[BaseModel | FindingRecord],
+    run_dir: Path,
+    artifact_format: ArtifactFormat = "json",
+) -> Path:
+    """Write a run's normalized findings in an artifact format.
+
+    ``json`` writes a pretty-printed array; ``ndjson`` and ``ndjson.zst``
+    write one finding per line, uncompressed or in zstd-compressed blocks,
+    with an offset index for random and parallel access; ``parquet`` writes
+    columns for analytics, grouped by provider and account.
+
+    Args:
+        findings: Findings to serialize
+        run_dir: Run artifacts directory
+        artifact_format: Artifact format
+
+    Returns:
+        Path of the written findings file
+    """
+    path = run_dir / _ARTIFACT_FILES[artifact_format]
+    if artifact_format == "json":
+        write_findings_json(findings, path)
+    elif artifact_format == "parquet":
+        write_findings_parquet(findings, path)
+    else:
+        write_findings_ndjson(
+            findings, path, compression="zstd" if artifact_format == "ndjson.zst" else None
+        )
+    return path
+
+
+def normalized_file(path: Path) -> Path:
+    """Find the normalized findings file of a run.
+
+    Args:
+        path: Run artifacts directory, or a normalized findings file
+
+    Returns:
+        The findings file, in whichever artifact format the run was written
+
+    Raises:
+        FileNotFoundError: If there is no normalized findings file
+    """
+    if path.is_dir():
+        for name in _ARTIFACT_FILES.values():
+            if (path / name).exists():
+                return path / name
+        path = path / NORMALIZED_FILE
+    if not path.exists():
+        raise FileNotFoundError(f"Normalized findings not found: {path}")
+    return path
+
+
+def count_findings(path: Path) -> int | None:
+    """Count a run's normalized findings without reading them.
+
+    Args:
+        path: Normalized findings file, or a run artifacts directory
+            containing one
+
+    Returns:
+        Number of findings, from the offset index of NDJSON files or the
+        metadata of Parquet files; None for JSON files, which record no count
+
+    Raises:
+        FileNotFoundError: If there is no normalized findings file
+    """
+    path = normalized_file(path)
+    if path.suffix in (".ndjson", ".zst"):
+        return len(NDJSONReader(path))
+    if path.suffix == ".parquet":
+        return parquet_row_count(path)
+    return None
+
+
+def iter_finding_dicts(path: Path) -> Iterator[dict[str, Any]]:
+    """Stream a run's normalized findings as dictionaries, in any format.
+
+    Args:
+        path: Normalized findings file, or a run artifacts directory
+            containing one
+
+    Yields:
+        Finding dictionaries, in file order
+
+    Raises:
+        FileNotFoundError: If there is no normalized findings file
+        ValueError: If a JSON file is not a list of findings
+    """
+    path = normalized_file(path)
+    if path.suffix in (".ndjson", ".zst"):
+        yield from iter_ndjson_dicts(path)
+        return
+    if path.suffix == ".parquet":
+        yield from iter_parquet_dicts(path)
+        return
+
+    for item in iter_raw_findings(path):
+        if not isinstance(item, dict):
+            raise ValueError(f"Expected a list of findings in {path}")
+        yield item
+
+
+def iter_findings(path: Path) -> Iterator[FindingRecord]:
+    """Stream a run's normalized findings as records, in any format.
+
+    Args:
+        path: Normalized findings file, or a run artifacts directory
+            containing one
+
+    Yields:
+        Finding records, in file order
+
+    Raises:
+        FileNotFoundError: If there is no normalized findings file
+        ValueError: If a JSON file is not a list of findings
+    """
+    for data in iter_finding_dicts(path):
+        yield FindingRecord.from_dict(data)
+
+
+def write_partial_summary(accumulator: SummaryAccumulator, path: Path) -> None:
+    """Write a mergeable partial summary.
+
+    Args:
+        accumulator: Accumulated statistics of a run or shard
+        path: Output file path, usually ``PARTIAL_SUMMARY_FILE`` in the run's
+            artifacts directory
+    """
+    codec.dump(accumulator.to_dict(), path)
+
+
+def read_partial_summary(path: Path) -> SummaryAccumulator:
+    """Read a partial summary written by :func:`write_partial_summary`.
+
+    Args:
+        path: Partial summary file, or a run artifacts directory containing one
+
+    Returns:
+        Accumulator holding the statistics
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        ValueError: If the file is not a supported partial summary
+    """
+    if path.is_dir():
+        path = path / PARTIAL_SUMMARY_FILE
+    if not path.exists():
+        raise FileNotFoundError(f"Partial summary not found: {path}")
+
+    return SummaryAccumulator.from_dict(codec.load(path))
+
+
+def summarize_findings(
+    path: Path,
+    cardinality: Literal["exact", "hll"] = "exact",
+    precision: int = DEFAULT_PRECISION,
+) -> SummaryAccumulator:
+    """Summarize a run's normalized findings, for runs without a partial summary.
+
+    The finding dictionaries are read straight into the columns of a
+    ``FindingsTable`` and counted from there, so no finding records are
+    created.
+
+    Args:
+        path: Normalized findings file, or a run artifacts directory
+            containing one
+        cardinality: How to count unique resources and accounts
+        precision: HyperLogLog precision when ``cardinality`` is ``"hll"``
+
+    Returns:
+        Accumulator holding the statistics
+
+    Raises:
+        FileNotFoundError: If there is no normalized findings file
+        ValueError: If a JSON file is not a list of findings
+    """
+    accumulator = SummaryAccumulator(cardinality, precision)
+    accumulator.update_table(FindingsTable.from_dicts(iter_finding_dicts(path)))
+    return accumulator
+
+
+def rollup_partial_summaries(paths: Iterable[Path]) -> SummaryAccumulator:
+    """Merge the partial summaries of several runs or shards.
+
+    Runs written without a partial summary, and normalized findings files,
+    are summarized from their findings with :func:`summarize_findings`, in
+    the cardinality mode of the rollup so far.
+
+    Args:
+        paths: Partial summary files, normalized findings files or run
+            artifacts directories
+
+    Returns:
+        Accumulator holding the combined statistics
+
+    Raises:
+        FileNotFoundError: If neither a partial summary nor findings exist
+        ValueError: If a file is not a supported partial summary
+    """
+    rollup: SummaryAccumulator | None = None
+    for path in paths:
+        if _has_partial_summary(path):
+            partial = read_partial_summary(path)
+        elif rollup is None:
+            partial = summarize_findings(path)
+        else:
+            partial = summarize_findings(path, rollup.cardinality, rollup.precision)
+        # Start from the first partial so its cardinality mode carries over
+        rollup = partial if rollup is None else rollup.merge(partial)
+    return rollup if rollup is not None else SummaryAccumulator()
+
+
+def _has_partial_summary(path: Path) -> bool:
+    """Whether a rollup input is, or is a run directory with, a partial summary."""
+    if path.is_dir():
+        return (path / PARTIAL_SUMMARY_FILE).exists()
+    return path.name not in _ARTIFACT_FILES.values()
@@ -0,0 +1,154 @@
+"""Approximate distinct counting with HyperLogLog sketches.
+
+A sketch with precision ``p`` uses ``2**p`` one-byte registers regardless of how
+many values are added, estimates the number of distinct values with a relative
+standard error of about ``1.04 / sqrt(2**p)``, and can be merged with other
+sketches of the same precision. This keeps unique resource and account counts
+small and mergeable across shards and runs.
+"""
+
+import base64
+import hashlib
+import math
+from collections.abc import Iterable
+from typing import Any
+
+# Precision used when none is given: 16384 registers, ~0.8% standard error
+DEFAULT_PRECISION = 14
+
+MIN_PRECISION = 4
+MAX_PRECISION = 18
+
+_HASH_BITS = 64
+
+
+class HyperLogLog:
+    """HyperLogLog distinct-value sketch over strings."""
+
+    __slots__ = ("precision", "registers")
+
+    def __init__(self, precision: int = DEFAULT_PRECISION) -> None:
+        """Create an empty sketch.
+
+        Args:
+            precision: Number of index bits; the sketch has ``2**precision``
+                registers
+
+        Raises:
+            ValueError: If precision is outside ``MIN_PRECISION``-``MAX_PRECISION``
+        """
+        if not MIN_PRECISION <= precision <= MAX_PRECISION:
+            raise ValueError(
+                f"HyperLogLog precision must be between {MIN_PRECISION} and "
+                f"{MAX_PRECISION}, got {precision}"
+            )
+        self.precision = precision
+        self.registers = bytearray(1 << precision)
+
+    @property
+    def relative_error(self) -> float:
+        """Relative standard error of :meth:`count`."""
+        return 1.04 / math.sqrt(len(self.registers))
+
+    def add(self, value: str) -> None:
+        """Add a value to the sketch.
+
+        Args:
+            value: Value to add
+        """
+        # A stable hash, unlike hash(), so sketches merge across processes
+        digest = hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest()
+        hashed = int.from_bytes(digest, "big")
+
+        remaining_bits = _HASH_BITS - self.precision
+        index = hashed >> remaining_bits
+        rank = remaining_bits - (hashed & ((1 << remaining_bits) - 1)).bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def update(self, values: Iterable[str]) -> None:
+        """Add several values to the sketch.
+
+        Args:
+            values: Values to add
+        """
+        for value in values:
+            self.add(value)
+
+    def count(self) -> int:
+        """Estimate the number of distinct values added.
+
+        Returns:
+            Estimated distinct count
+        """
+        m = len(self.registers)
+        if m == 16:
+            alpha = 0.673
+        elif m == 32:
+            alpha = 0.697
+        elif m == 64:
+            alpha = 0.709
+        else:
+            alpha = 0.7213 / (1 + 1.079 / m)
+
+        estimate = alpha * m * m / math.fsum(2.0 ** -register for register in self.registers)
+
+        # Linear counting is more accurate while many registers are empty
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)
+
+        return round(estimate)
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        """Merge another sketch into this one.
+
+        Args:
+            other: Sketch with the same precision; it is not modified
+
+        Returns:
+            This sketch
+
+        Raises:
+            ValueError: If the precisions differ
+        """
+        if other.precision != self.precision:
+            raise ValueError(
+                f"Cannot merge HyperLogLog sketches with precision "
+                f"{self.precision} and {other.precision}"
+            )
+        self.registers = bytearray(map(max, self.registers, other.registers))
+        return self
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the sketch to a JSON-compatible dictionary.
+
+        Returns:
+            Dictionary accepted by :meth:`from_dict`
+        """
+        return {
+            "precision": self.precision,
+            "registers": base64.b64encode(self.registers).decode("ascii"),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "HyperLogLog":
+        """Deserialize a sketch written by :meth:`to_dict`.
+
+        Args:
+            data: Serialized sketch
+
+        Returns:
+            The sketch
+
+        Raises:
+            ValueError: If the registers don't match the precision
+        """
+        sketch = cls(data["precision"])
+        registers = base64.b64decode(data["registers"])
+        if len(registers) != len(sketch.registers):
+            raise ValueError(
+                f"Expected {len(sketch.registers)} HyperLogLog registers, got {len(registers)}"
+            )
+        sketch.registers = bytearray(registers)
+        return sketch
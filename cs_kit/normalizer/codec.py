@@ -0,0 +1,182 @@
+"""Pluggable JSON codec with optional fast backends.
+
+orjson and simdjson are used when installed, with the standard library ``json``
+module as the fallback. All backends produce equivalent JSON, which decodes to
+the same values as ``json.dumps(obj, default=str)`` (``indent=2`` when
+pretty-printing, no whitespace otherwise), though the exact text can differ:
+orjson doesn't escape non-ASCII characters and can format floats differently.
+Decoding errors are raised as ``json.JSONDecodeError`` by every backend.
+
+The backend can be forced with the ``CS_KIT_JSON_BACKEND`` environment variable
+or :func:`set_backend`.
+"""
+
+import json
+import os
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, NamedTuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import simdjson
+except ImportError:  # pragma: no cover - optional dependency
+    simdjson = None  # type: ignore[assignment]
+
+
+class JSONBackend(NamedTuple):
+    """Decode and encode functions for a JSON library."""
+
+    name: str
+    loads: Callable[[str | bytes], Any]
+    dumps: Callable[[Any, bool], bytes]
+
+
+def _json_loads(data: str | bytes) -> Any:
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any, indent: bool) -> bytes:
+    if indent:
+        return json.dumps(obj, indent=2, default=str).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), default=str).encode("utf-8")
+
+
+def _orjson_loads(data: str | bytes) -> Any:
+    return orjson.loads(data)
+
+
+def _orjson_dumps(obj: Any, indent: bool) -> bytes:
+    # Datetimes go through default=str, as with the stdlib encoder
+    option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    try:
+        return orjson.dumps(obj, default=str, option=option)
+    except TypeError:
+        # e.g. integers wider than 64 bits, which only the stdlib supports
+        return _json_dumps(obj, indent)
+
+
+def _simdjson_loads(data: str | bytes) -> Any:
+    try:
+        return simdjson.loads(data)
+    except ValueError as e:
+        doc = data.decode("utf-8", "replace") if isinstance(data, bytes) else data
+        raise json.JSONDecodeError(str(e), doc, 0) from e
+
+
+_BACKENDS: dict[str, JSONBackend] = {"json": JSONBackend("json", _json_loads, _json_dumps)}
+if simdjson is not None:
+    # simdjson only decodes; encoding falls back to the stdlib
+    _BACKENDS["simdjson"] = JSONBackend("simdjson", _simdjson_loads, _json_dumps)
+if orjson is not None:
+    _BACKENDS["orjson"] = JSONBackend("orjson", _orjson_loads, _orjson_dumps)
+
+# Preference order when no backend is forced
+_PREFERENCE = ("orjson", "simdjson", "json")
+
+
+def available_backends() -> list[str]:
+    """List the names of the JSON backends that can be used.
+
+    Returns:
+        Backend names in order of preference
+    """
+    return [name for name in _PREFERENCE if name in _BACKENDS]
+
+
+def set_backend(name: str | None = None) -> JSONBackend:
+    """Select the active JSON backend.
+
+    Args:
+        name: Backend name, or None to pick the fastest installed backend
+
+    Returns:
+        The selected backend
+
+    Raises:
+        ValueError: If the named backend is not installed
+    """
+    global _active
+
+    if name is None:
+        name = available_backends()[0]
+    if name not in _BACKENDS:
+        raise ValueError(
+            f"JSON backend '{name}' is not available. "
+            f"Available backends: {available_backends()}"
+        )
+
+    _active = _BACKENDS[name]
+    return _active
+
+
+def get_backend() -> JSONBackend:
+    """Get the active JSON backend.
+
+    Returns:
+        The active backend
+    """
+    return _active
+
+
+def loads(data: str | bytes) -> Any:
+    """Decode a JSON document.
+
+    Args:
+        data: JSON text or UTF-8 bytes
+
+    Returns:
+        Decoded Python object
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+    """
+    return _active.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """Encode an object as JSON text.
+
+    Args:
+        obj: Object to encode; unknown types are converted with ``str``
+        indent: Pretty-print with two-space indentation
+
+    Returns:
+        JSON text
+    """
+    return _active.dumps(obj, indent).decode("utf-8")
+
+
+def load(path: Path) -> Any:
+    """Read and decode a JSON file.
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        Decoded Python object
+
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    return _active.loads(path.read_bytes())
+
+
+def dump(obj: Any, path: Path, indent: bool = False) -> None:
+    """Encode an object and write it to a JSON file.
+
+    Args:
+        obj: Object to encode; unknown types are converted with ``str``
+        path: Output file path
+        indent: Pretty-print with two-space indentation
+    """
+    path.write_bytes(_active.dumps(obj, indent))
+
+
+_active = set_backend(os.environ.get("CS_KIT_JSON_BACKEND") or None)
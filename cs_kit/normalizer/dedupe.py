@@ -0,0 +1,98 @@
+"""Removal of duplicate findings.
+
+Prowler runs the same checks once per requested compliance framework, so a
+multi-framework scan reports the same check on the same resource several
+times. Findings are identified by ``(product, check_id, resource_id, region,
+account_id)`` and only the first occurrence is kept. Findings without a check
+or resource ID can't be told apart by that key and are never dropped. Deduplication runs before
+compliance mapping, so the dropped copies carry no framework references of
+their own.
+"""
+
+import hashlib
+from collections.abc import Iterable, Iterator
+from operator import attrgetter
+
+from cs_kit.normalizer.records import AnyFinding
+
+FindingIdentity = tuple[str, str | None, str | None, str | None, str | None]
+
+_IDENTITY = attrgetter("product", "check_id", "resource_id", "region", "account_id")
+
+
+def finding_identity(finding: AnyFinding) -> FindingIdentity:
+    """Get the key findings are deduplicated on.
+
+    Args:
+        finding: Finding model or record
+
+    Returns:
+        Tuple of (product, check_id, resource_id, region, account_id)
+    """
+    return _IDENTITY(finding)
+
+
+def identity_digest(finding: AnyFinding) -> bytes:
+    """Hash a finding's identity into a compact index key.
+
+    Args:
+        finding: Finding model or record
+
+    Returns:
+        16 byte BLAKE2b digest of the finding's identity
+    """
+    return hashlib.blake2b(repr(_IDENTITY(finding)).encode(), digest_size=16).digest()
+
+
+class FindingDeduplicator:
+    """Streaming filter dropping findings already seen.
+
+    One deduplicator can filter several streams, for example the output of
+    several scan shards, and remembers identities across them. Only the
+    identity digest of each finding is kept, not the finding itself.
+    """
+
+    def __init__(self) -> None:
+        self._seen: set[bytes] = set()
+        self.duplicates = 0
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    def filter(self, findings: Iterable[AnyFinding]) -> Iterator[AnyFinding]:
+        """Yield the first occurrence of each finding.
+
+        Findings without a check ID or resource ID can't be identified and
+        are always kept.
+
+        Args:
+            findings: Findings to filter
+
+        Returns:
+            Iterator of unique findings, in order of first occurrence
+        """
+        seen = self._seen
+        for finding in findings:
+            if finding.check_id is None or finding.resource_id is None:
+                yield finding
+                continue
+
+            digest = identity_digest(finding)
+            if digest in seen:
+                self.duplicates += 1
+            else:
+                seen.add(digest)
+                yield finding
+
+
+def dedupe_findings(findings: Iterable[AnyFinding]) -> list[AnyFinding]:
+    """Remove duplicate findings.
+
+    Args:
+        findings: Findings to deduplicate
+
+    Returns:
+        Unique findings, in order of first occurrence
+    """
+    return list(FindingDeduplicator().filter(findings))
+
@@ -0,0 +1,316 @@
+"""Comparison of two scan runs.
+
+Findings of the two runs are matched on their identity, the same
+``(product, check_id, resource_id, region, account_id)`` key findings are
+deduplicated on, so a comparison takes one pass over each run instead of
+comparing every pair of findings. Findings only in the later run are added,
+findings only in the earlier run are removed, and matched findings whose
+status or severity differ are changed.
+
+Large runs are compared in partitions: both runs are streamed once into
+temporary files by a hash of each finding's identity, and only one partition
+of the earlier run is held in memory at a time.
+"""
+
+import itertools
+import math
+import tempfile
+from collections import Counter, deque
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from operator import attrgetter
+from pathlib import Path
+from typing import Any, Literal
+
+from cs_kit.normalizer import codec
+from cs_kit.normalizer.artifacts import count_findings, iter_findings, normalized_file
+from cs_kit.normalizer.dedupe import identity_digest
+from cs_kit.normalizer.records import FindingRecord
+
+# Fields compared between matched findings
+COMPARED_FIELDS = ("status", "severity")
+_COMPARED = attrgetter(*COMPARED_FIELDS)
+
+# Target number of the earlier run's findings held in memory at a time
+PARTITION_FINDINGS = 100_000
+
+# Target size of the part of the earlier run's findings file held in memory,
+# for JSON files, which record no finding count
+PARTITION_BYTES = 64 * 1024 * 1024
+
+# Upper bound on the number of partitions, and so of temporary files
+MAX_PARTITIONS = 256
+
+# Findings buffered while spilling before they are appended to their files
+_SPILL_BUFFER = 10_000
+
+# Files written by diff_runs
+ADDED_FILE = "added.ndjson"
+REMOVED_FILE = "removed.ndjson"
+CHANGED_FILE = "changed.ndjson"
+DIFF_SUMMARY_FILE = "diff_summary.json"
+
+ChangeKind = Literal["added", "removed", "changed"]
+
+
+@dataclass(frozen=True, slots=True)
+class FindingChange:
+    """Difference of one finding between two runs."""
+
+    kind: ChangeKind
+    before: FindingRecord | None
+    after: FindingRecord | None
+    fields: tuple[str, ...] = ()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Dump the change for JSON serialization.
+
+        Returns:
+            The finding for additions and removals, or the ``before`` and
+            ``after`` findings and the differing ``fields`` for changes
+        """
+        finding = self.after or self.before
+        if self.kind != "changed" and finding is not None:
+            return finding.to_dict()
+        return {
+            "before": self.before.to_dict() if self.before else None,
+            "after": self.after.to_dict() if self.after else None,
+            "fields": list(self.fields),
+        }
+
+
+@dataclass
+class DiffSummary:
+    """Counts of the differences between two runs."""
+
+    added: int = 0
+    removed: int = 0
+    changed: int = 0
+    unchanged: int = 0
+    new_failures: int = 0
+    resolved: int = 0
+    severity_changes: Counter[str] = field(default_factory=Counter)
+
+    def record(self, change: FindingChange | None) -> None:
+        """Count one change, or one unchanged finding if ``change`` is None.
+
+        A finding failing in the later run but not in the earlier one is a
+        new failure; a finding failing in the earlier run but not in the later
+        one, including a removed finding, is resolved.
+        """
+        if change is None:
+            self.unchanged += 1
+            return
+
+        setattr(self, change.kind, getattr(self, change.kind) + 1)
+        failed_before = change.before is not None and change.before.status == "fail"
+        failed_after = change.after is not None and change.after.status == "fail"
+        if failed_after and not failed_before:
+            self.new_failures += 1
+        elif failed_before and not failed_after:
+            self.resolved += 1
+        if "severity" in change.fields and change.before and change.after:
+            self.severity_changes[f"{change.before.severity}->{change.after.severity}"] += 1
+
+    def to_dict(self) -> dict[str, Any]:
+        """Dump the summary for JSON serialization."""
+        return {
+            "added": self.added,
+            "removed": self.removed,
+            "changed": self.changed,
+            "unchanged": self.unchanged,
+            "new_failures": self.new_failures,
+            "resolved": self.resolved,
+            "severity_changes": dict(self.severity_changes.most_common()),
+        }
+
+
+def diff_findings(
+    before: Iterable[FindingRecord],
+    after: Iterable[FindingRecord],
+    summary: DiffSummary | None = None,
+    partitions: int = 1,
+    work_dir: Path | None = None,
+) -> Iterator[FindingChange]:
+    """Compare the findings of two runs.
+
+    With a single partition the earlier run's findings are indexed in
+    memory. With more, both inputs are first spilled to temporary files by
+    identity hash, and at most one partition of the earlier run is in memory.
+    Findings repeated within a run, such as those of a check that resolved no
+    resource, are matched with an identical finding first when there is one,
+    and otherwise in order of occurrence.
+
+    Args:
+        before: Findings of the earlier run
+        after: Findings of the later run
+        summary: Summary updated with every compared finding
+        partitions: Number of partitions to compare separately
+        work_dir: Directory for the temporary partition files
+
+    Yields:
+        Changes, grouped by partition; within a partition, added and changed
+        findings in the later run's order, then removed findings
+    """
+    if summary is None:
+        summary = DiffSummary()
+
+    if partitions <= 1:
+        yield from _diff_partition(before, after, summary)
+        return
+
+    with tempfile.TemporaryDirectory(dir=work_dir, prefix="cs-kit-diff-") as tmp:
+        before_files = _spill(before, Path(tmp) / "before", partitions)
+        after_files = _spill(after, Path(tmp) / "after", partitions)
+        for before_file, after_file in zip(before_files, after_files, strict=True):
+            yield from _diff_partition(
+                _read_spill(before_file), _read_spill(after_file), summary
+            )
+            before_file.unlink()
+            after_file.unlink()
+
+
+def diff_runs(before: Path, after: Path, output_dir: Path) -> DiffSummary:
+    """Compare the normalized findings of two runs and write the differences.
+
+    Writes ``added.ndjson`` and ``removed.ndjson`` with one finding per line,
+    ``changed.ndjson`` with one ``{"before", "after", "fields"}`` object per
+    line, and the counts to ``diff_summary.json``. The number of partitions
+    is chosen from the number of findings in the earlier run, which may be
+    in any artifact format.
+
+    Args:
+        before: Normalized findings file, or artifacts directory, of the
+            earlier run
+        after: Normalized findings file, or artifacts directory, of the later run
+        output_dir: Directory receiving the differences
+
+    Returns:
+        Summary of the differences
+
+    Raises:
+        FileNotFoundError: If a run has no normalized findings
+        ValueError: If a file is not a list of findings
+    """
+    partitions = _partition_count(before)
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    summary = DiffSummary()
+    changes = diff_findings(
+        iter_findings(before),
+        iter_findings(after),
+        summary,
+        partitions,
+        work_dir=output_dir,
+    )
+    with (
+        open(output_dir / ADDED_FILE, "w", encoding="utf-8") as added,
+        open(output_dir / REMOVED_FILE, "w", encoding="utf-8") as removed,
+        open(output_dir / CHANGED_FILE, "w", encoding="utf-8") as changed,
+    ):
+        files = {"added": added, "removed": removed, "changed": changed}
+        for change in changes:
+            files[change.kind].write(codec.dumps(change.to_dict()) + "\n")
+
+    codec.dump(summary.to_dict(), output_dir / DIFF_SUMMARY_FILE, indent=True)
+    return summary
+
+
+def _partition_count(before: Path) -> int:
+    """Choose how many partitions to compare a run in.
+
+    The count comes from the number of findings where the artifact format
+    records it. Compressed and Parquet files are much smaller than the
+    findings they hold, so their size is no guide; JSON files are not
+    compressed, so their size is used instead.
+    """
+    count = count_findings(before)
+    if count is not None:
+        partitions = math.ceil(count / PARTITION_FINDINGS)
+    else:
+        partitions = math.ceil(normalized_file(before).stat().st_size / PARTITION_BYTES)
+    return min(max(partitions, 1), MAX_PARTITIONS)
+
+
+def _diff_partition(
+    before: Iterable[FindingRecord],
+    after: Iterable[FindingRecord],
+    summary: DiffSummary,
+) -> Iterator[FindingChange]:
+    """Compare findings whose earlier side fits in memory."""
+    # Identity -> compared field values -> earlier findings, so a repeated
+    # identity is matched with an unchanged finding before a changed one
+    index: dict[bytes, dict[tuple[Any, ...], deque[FindingRecord]]] = {}
+    for finding in before:
+        groups = index.setdefault(identity_digest(finding), {})
+        groups.setdefault(_COMPARED(finding), deque()).append(finding)
+
+    for finding in after:
+        key = identity_digest(finding)
+        groups = index.get(key)
+        if not groups:
+            change: FindingChange | None = FindingChange("added", None, finding)
+        else:
+            values = _COMPARED(finding)
+            if values not in groups:
+                values = next(iter(groups))
+            matches = groups[values]
+            previous = matches.popleft()
+            if not matches:
+                del groups[values]
+                if not groups:
+                    del index[key]
+            changed = tuple(
+                name
+                for name in COMPARED_FIELDS
+                if getattr(previous, name) != getattr(finding, name)
+            )
+            change = FindingChange("changed", previous, finding, changed) if changed else None
+
+        summary.record(change)
+        if change is not None:
+            yield change
+
+    for groups in index.values():
+        for finding in itertools.chain.from_iterable(groups.values()):
+            change = FindingChange("removed", finding, None)
+            summary.record(change)
+            yield change
+
+
+def _spill(findings: Iterable[FindingRecord], prefix: Path, partitions: int) -> list[Path]:
+    """Write findings to one NDJSON file per partition of their identity hash.
+
+    Lines are buffered and appended to their files in batches, so only one
+    file is open at a time however many partitions there are.
+    """
+    paths = [prefix.with_name(f"{prefix.name}-{i}.ndjson") for i in range(partitions)]
+    for path in paths:
+        path.touch()
+    buffers: list[list[str]] = [[] for _ in paths]
+    buffered = 0
+    for finding in findings:
+        partition = int.from_bytes(identity_digest(finding)[:8], "big") % partitions
+        buffers[partition].append(codec.dumps(finding.to_dict()) + "\n")
+        buffered += 1
+        if buffered >= _SPILL_BUFFER:
+            _flush_spill(paths, buffers)
+            buffered = 0
+    _flush_spill(paths, buffers)
+    return paths
+
+
+def _flush_spill(paths: list[Path], buffers: list[list[str]]) -> None:
+    """Append and clear the buffered lines of every partition."""
+    for path, lines in zip(paths, buffers, strict=True):
+        if lines:
+            with open(path, "a", encoding="utf-8") as f:
+                f.writelines(lines)
+            lines.clear()
+
+
+def _read_spill(path: Path) -> Iterator[FindingRecord]:
+    """Read back the findings of one partition file."""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            yield FindingRecord.from_dict(codec.loads(line))
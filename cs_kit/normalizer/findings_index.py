@@ -0,0 +1,303 @@
+"""On-disk index of a run's normalized findings for paginated queries.
+
+Reading a whole ``normalized.json`` to show one page of findings doesn't scale
+to large scans. The findings of a run are instead loaded once into a SQLite
+database next to it, with indexes on the columns pages are filtered and sorted
+by, and pages are read with keyset (cursor) pagination, so the cost of a page
+doesn't depend on its position or on the size of the run.
+"""
+
+import base64
+import os
+import sqlite3
+import tempfile
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from cs_kit.normalizer import codec
+from cs_kit.normalizer.artifacts import iter_findings, normalized_file
+
+# Name of the findings index written to each run's artifacts directory
+FINDINGS_INDEX_FILE = "findings.db"
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+# Sort keys and the columns they sort on; severity sorts most severe first
+SORT_COLUMNS = {
+    "severity": "severity_rank",
+    "status": "status",
+    "region": "region",
+    "account_id": "account_id",
+    "check_id": "check_id",
+    "resource_id": "resource_id",
+    "title": "title",
+}
+
+_SEVERITY_RANKS = {"critical": 0, "high": 1, "medium": 2, "low": 3, "informational": 4}
+_UNKNOWN_SEVERITY_RANK = len(_SEVERITY_RANKS)
+
+_FILTER_COLUMNS = ("severity", "status", "region")
+
+_SCHEMA = """
+CREATE TABLE findings (
+    id INTEGER PRIMARY KEY,
+    severity_rank INTEGER NOT NULL,
+    severity TEXT NOT NULL,
+    status TEXT NOT NULL,
+    region TEXT NOT NULL,
+    account_id TEXT NOT NULL,
+    check_id TEXT NOT NULL,
+    resource_id TEXT NOT NULL,
+    title TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE TABLE finding_frameworks (
+    framework TEXT NOT NULL,
+    finding_id INTEGER NOT NULL,
+    PRIMARY KEY (framework, finding_id)
+) WITHOUT ROWID;
+"""
+
+_INDEXES = """
+CREATE INDEX findings_severity ON findings (severity, id);
+CREATE INDEX findings_status ON findings (status, id);
+CREATE INDEX findings_region ON findings (region, id);
+CREATE INDEX findings_severity_rank ON findings (severity_rank, id);
+CREATE INDEX findings_account_id ON findings (account_id, id);
+CREATE INDEX findings_check_id ON findings (check_id, id);
+CREATE INDEX findings_resource_id ON findings (resource_id, id);
+CREATE INDEX findings_title ON findings (title, id);
+"""
+
+# Findings inserted per executemany call while building
+_BATCH_SIZE = 5000
+
+
+@dataclass
+class FindingsPage:
+    """One page of findings matching a query."""
+
+    findings: list[dict[str, Any]]
+    total: int
+    next_cursor: str | None
+
+
+class FindingsIndex:
+    """SQLite index of one run's findings."""
+
+    def __init__(self, path: Path) -> None:
+        """Open an existing index.
+
+        Args:
+            path: Index database file
+
+        Raises:
+            FileNotFoundError: If the index doesn't exist
+        """
+        if not path.exists():
+            raise FileNotFoundError(f"Findings index not found: {path}")
+        self.path = path
+
+    @classmethod
+    def build(cls, findings_file: Path, path: Path) -> "FindingsIndex":
+        """Index normalized findings, replacing any existing index.
+
+        The findings file is streamed, and the index is written to a
+        temporary file and renamed into place, so readers never see a
+        partial index.
+
+        Args:
+            findings_file: Normalized findings file, or a run artifacts
+                directory containing one
+            path: Index database file to write
+
+        Returns:
+            The index
+        """
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+        os.close(fd)
+        try:
+            conn = sqlite3.connect(tmp_name)
+            try:
+                conn.execute("PRAGMA journal_mode=OFF")
+                conn.execute("PRAGMA synchronous=OFF")
+                conn.executescript(_SCHEMA)
+                _insert_findings(conn, findings_file)
+                conn.executescript(_INDEXES)
+                conn.commit()
+            finally:
+                conn.close()
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        return cls(path)
+
+    @classmethod
+    def for_run(cls, run_dir: Path) -> "FindingsIndex":
+        """Open a run's index, building it if missing or out of date.
+
+        Args:
+            run_dir: Run artifacts directory
+
+        Returns:
+            The index
+
+        Raises:
+            FileNotFoundError: If the run has no normalized findings
+        """
+        findings_file = normalized_file(run_dir)
+        path = run_dir / FINDINGS_INDEX_FILE
+        if path.exists() and path.stat().st_mtime >= findings_file.stat().st_mtime:
+            return cls(path)
+        return cls.build(findings_file, path)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a read-only connection."""
+        conn = sqlite3.connect(f"{self.path.as_uri()}?mode=ro", uri=True)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def query(
+        self,
+        severity: Sequence[str] = (),
+        status: Sequence[str] = (),
+        region: Sequence[str] = (),
+        framework: Sequence[str] = (),
+        sort: str | None = None,
+        descending: bool = False,
+        cursor: str | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> FindingsPage:
+        """Get a page of findings.
+
+        Each filter matches findings with any of its values; findings must
+        match every given filter.
+
+        Args:
+            severity: Severities to include
+            status: Statuses to include
+            region: Regions to include
+            framework: Frameworks, e.g. ``cis_aws_1_4``, with a control the
+                finding maps to
+            sort: Key of :data:`SORT_COLUMNS` to sort by; findings are in file
+                order by default, and in file order among equal keys
+            descending: Whether to reverse the sort order
+            cursor: ``next_cursor`` of the previous page, with the same
+                filters and sort
+            limit: Maximum number of findings, up to :data:`MAX_PAGE_SIZE`
+
+        Returns:
+            The page, with the total number of matching findings
+
+        Raises:
+            ValueError: If the sort key, cursor or limit is invalid
+        """
+        if sort is not None and sort not in SORT_COLUMNS:
+            raise ValueError(
+                f"Invalid sort key {sort!r}; use one of {', '.join(SORT_COLUMNS)}"
+            )
+        if not 1 <= limit <= MAX_PAGE_SIZE:
+            raise ValueError(f"Page size must be between 1 and {MAX_PAGE_SIZE}")
+
+        conditions = []
+        params: list[Any] = []
+        for column, values in zip(_FILTER_COLUMNS, (severity, status, region), strict=True):
+            if values:
+                conditions.append(f"{column} IN ({', '.join('?' * len(values))})")
+                params.extend(values)
+        if framework:
+            conditions.append(
+                "id IN (SELECT finding_id FROM finding_frameworks "
+                f"WHERE framework IN ({', '.join('?' * len(framework))}))"
+            )
+            params.extend(framework)
+        where = " AND ".join(conditions) or "1"
+
+        column = SORT_COLUMNS[sort] if sort else None
+        direction = "DESC" if descending else "ASC"
+        order = f"{column} {direction}, id {direction}" if column else f"id {direction}"
+        page_conditions = list(conditions)
+        page_params = list(params)
+        if cursor is not None:
+            position = _decode_cursor(cursor, keyed=column is not None)
+            comparison = "<" if descending else ">"
+            if column:
+                page_conditions.append(f"({column}, id) {comparison} (?, ?)")
+            else:
+                page_conditions.append(f"id {comparison} ?")
+            page_params.extend(position)
+        page_where = " AND ".join(page_conditions) or "1"
+
+        with self._connect() as conn:
+            total = conn.execute(f"SELECT COUNT(*) FROM findings WHERE {where}", params).fetchone()[0]
+            rows = conn.execute(
+                f"SELECT id, {column or 'id'}, data FROM findings "
+                f"WHERE {page_where} ORDER BY {order} LIMIT ?",
+                [*page_params, limit + 1],
+            ).fetchall()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last_id, last_key, _ = rows[-1]
+            next_cursor = _encode_cursor([last_key, last_id] if column else [last_id])
+        return FindingsPage([codec.loads(data) for _, _, data in rows], total, next_cursor)
+
+
+def _insert_findings(conn: sqlite3.Connection, findings_file: Path) -> None:
+    """Stream normalized findings into the index tables."""
+    findings = []
+    frameworks = []
+    for finding_id, finding in enumerate(iter_findings(findings_file), 1):
+        findings.append((
+            finding_id,
+            _SEVERITY_RANKS.get(finding.severity or "", _UNKNOWN_SEVERITY_RANK),
+            finding.severity or "",
+            finding.status or "",
+            finding.region or "",
+            finding.account_id or "",
+            finding.check_id or "",
+            finding.resource_id or "",
+            finding.title or "",
+            codec.dumps(finding.to_dict()),
+        ))
+        for name in {ref.split(":", 1)[0] for ref in finding.framework_refs if ":" in ref}:
+            frameworks.append((name, finding_id))
+
+        if len(findings) >= _BATCH_SIZE:
+            _flush(conn, findings, frameworks)
+    _flush(conn, findings, frameworks)
+
+
+def _flush(
+    conn: sqlite3.Connection, findings: list[tuple[Any, ...]], frameworks: list[tuple[str, int]]
+) -> None:
+    """Insert and clear a batch of index rows."""
+    conn.executemany("INSERT INTO findings VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", findings)
+    conn.executemany("INSERT INTO finding_frameworks VALUES (?, ?)", frameworks)
+    findings.clear()
+    frameworks.clear()
+
+
+def _encode_cursor(position: list[Any]) -> str:
+    """Encode the sort key and ID of a page's last finding."""
+    return base64.urlsafe_b64encode(codec.dumps(position).encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str, keyed: bool) -> list[Any]:
+    """Decode a cursor, checking it matches the sort of the query."""
+    try:
+        position = codec.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except ValueError as e:
+        raise ValueError(f"Invalid cursor {cursor!r}") from e
+    if not isinstance(position, list) or len(position) != (2 if keyed else 1):
+        raise ValueError(f"Invalid cursor {cursor!r}")
+    return position
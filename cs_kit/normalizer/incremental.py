@@ -0,0 +1,156 @@
+"""Incremental re-scans building on a previous run.
+
+A nightly scan mostly reproduces the previous night's results. An incremental
+scan re-runs only the checks worth repeating, namely those that failed last time
+and those covering resource types known to have changed, and carries the
+previous findings of every other check over unchanged.
+"""
+
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from cs_kit.normalizer.artifacts import iter_findings, normalized_file
+from cs_kit.normalizer.records import AnyFinding, FindingRecord
+from cs_kit.normalizer.summarize import _extract_resource_type
+
+
+@dataclass
+class IncrementalPlan:
+    """Checks to re-run and findings to carry over from a previous run.
+
+    The carried findings are not held: :meth:`iter_carried` reads them from
+    ``previous`` again each time it is called.
+    """
+
+    previous_run: str
+    rerun_checks: list[str] = field(default_factory=list)
+    previous: Iterable[FindingRecord] = ()
+    product: str = "prowler"
+    carried_count: int = 0
+
+    def iter_carried(self) -> Iterator[FindingRecord]:
+        """Stream the previous findings that are carried over.
+
+        Yields:
+            Previous findings of the checks that are not re-run, in order
+        """
+        rerun = set(self.rerun_checks)
+        for finding in self.previous:
+            if finding.product != self.product or finding.check_id not in rerun:
+                yield finding
+
+    def merge(self, findings: Iterable[AnyFinding]) -> Iterator[AnyFinding]:
+        """Combine the re-run checks' findings with the carried findings.
+
+        Args:
+            findings: Findings of the re-run checks
+
+        Yields:
+            The new findings, then the carried findings
+        """
+        yield from findings
+        yield from self.iter_carried()
+
+
+class _PreviousRun:
+    """Re-iterable stream of a previous run's findings.
+
+    Each iteration reads the run's normalized artifact from the start, and
+    fails on a finding of another provider than the new scan's.
+    """
+
+    def __init__(self, path: Path, previous_run: str, provider: str) -> None:
+        self.path = path
+        self.previous_run = previous_run
+        self.provider = provider
+
+    def __iter__(self) -> Iterator[FindingRecord]:
+        for finding in iter_findings(self.path):
+            if finding.provider != self.provider:
+                raise ValueError(
+                    f"Run {self.previous_run} scanned {finding.provider}, not {self.provider}"
+                )
+            yield finding
+
+
+def plan_incremental_scan(
+    previous: Iterable[FindingRecord],
+    previous_run: str,
+    product: str = "prowler",
+    changed_resource_types: Iterable[str] = (),
+) -> IncrementalPlan:
+    """Choose the checks an incremental scan re-runs.
+
+    A check is re-run on every resource if any of its previous findings
+    failed or concerns a changed resource type; all of its previous findings
+    are then replaced. Findings of other checks, or of other products, are
+    carried over.
+
+    The previous findings are streamed once here, keeping only per-check
+    counts, and again whenever the plan's carried findings are read, so
+    ``previous`` must be re-iterable, e.g. a list.
+
+    Args:
+        previous: Findings of the previous run
+        previous_run: Identifier of the previous run
+        product: Product whose checks are re-run
+        changed_resource_types: Resource types with recent changes, as
+            reported in summaries, e.g. ``s3`` or ``Microsoft.Storage/storageAccounts``
+
+    Returns:
+        The plan
+    """
+    changed = set(changed_resource_types)
+
+    rerun: set[str] = set()
+    # Findings of the product per check ID, the rest counted under None
+    check_counts: Counter[str | None] = Counter()
+    for finding in previous:
+        if finding.product != product or not finding.check_id:
+            check_counts[None] += 1
+            continue
+        check_counts[finding.check_id] += 1
+        if finding.status == "fail" or (
+            changed
+            and finding.resource_id
+            and _extract_resource_type(finding.resource_id) in changed
+        ):
+            rerun.add(finding.check_id)
+
+    carried_count = check_counts.total() - sum(check_counts[check] for check in rerun)
+    return IncrementalPlan(previous_run, sorted(rerun), previous, product, carried_count)
+
+
+def load_incremental_plan(
+    artifacts_dir: Path,
+    previous_run: str,
+    provider: str,
+    product: str = "prowler",
+    changed_resource_types: Iterable[str] = (),
+) -> IncrementalPlan:
+    """Plan an incremental scan from a previous run's normalized findings.
+
+    The previous run's artifact is streamed to choose the checks, and
+    streamed again when the carried findings are read, so it is never
+    loaded whole.
+
+    Args:
+        artifacts_dir: Directory holding scan runs
+        previous_run: Run ID of the previous run
+        provider: Cloud provider of the new scan
+        product: Product whose checks are re-run
+        changed_resource_types: Resource types with recent changes
+
+    Returns:
+        The plan
+
+    Raises:
+        FileNotFoundError: If the previous run has no normalized findings
+        ValueError: If the previous run scanned another provider
+    """
+    previous = _PreviousRun(
+        normalized_file(artifacts_dir / previous_run), previous_run, provider
+    )
+    return plan_incremental_scan(previous, previous_run, product, changed_resource_types)
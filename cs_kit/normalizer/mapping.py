@@ -1,11 +1,43 @@
 """Compliance framework mapping functionality."""
 
+import hashlib
+import os
+import tempfile
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
 from pathlib import Path
 
 import yaml
 from pydantic import BaseModel, ConfigDict, Field
 
+from cs_kit.normalizer import codec
 from cs_kit.normalizer.ocsf_models import OCSFEnrichedFinding, OCSFFinding
+from cs_kit.normalizer.records import FindingRecord
+
+# Severity values accepted by ``OCSFFinding.severity``
+_SEVERITIES = frozenset(("critical", "high", "medium", "low", "informational"))
+
+# Environment variable overriding the compiled mapping cache directory; set it
+# to an empty string to disable the on-disk cache
+MAPPING_CACHE_ENV = "CS_KIT_MAPPING_CACHE"
+
+# Layout version of compiled mappings stored on disk
+_MAPPING_CACHE_VERSION = 2
+
+# Number of combined indexes kept in memory
+_INDEX_CACHE_SIZE = 32
+
+# Fields OCSFEnrichedFinding adds to OCSFFinding, as (name, default factory,
+# default). Enrichment fills them in itself: model_construct inspects the
+# signature of a default factory every time it calls one.
+_ENRICHED_FIELDS = tuple(
+    (name, field.default_factory, field.default)
+    for name, field in OCSFEnrichedFinding.model_fields.items()
+    if name not in OCSFFinding.model_fields
+)
+
+# Compiled rules of one mapping file: product -> check_id -> [(control, severity override)]
+CompiledRules = dict[str, dict[str, list[tuple[str, str | None]]]]
 
 
 class MappingRule(BaseModel):
@@ -129,8 +161,29 @@ def load_mapping(map_id: str) -> ComplianceMapping:
         )
 
     try:
-        with open(mapping_file, encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        content = mapping_file.read_bytes()
+    except OSError as e:
+        raise MappingLoadError(f"Error loading mapping {map_id}: {e}") from e
+
+    return _parse_mapping(content, mapping_file, map_id)
+
+
+def _parse_mapping(content: bytes, mapping_file: Path, map_id: str) -> ComplianceMapping:
+    """Parse and validate the contents of a mapping file.
+
+    Args:
+        content: Raw YAML bytes
+        mapping_file: Path the content was read from, for error messages
+        map_id: Mapping identifier, for error messages
+
+    Returns:
+        Validated compliance mapping
+
+    Raises:
+        MappingLoadError: If the content cannot be parsed
+    """
+    try:
+        data = yaml.safe_load(content)
 
         if not isinstance(data, dict):
             raise MappingLoadError(f"Invalid YAML structure in {mapping_file}")
@@ -143,13 +196,261 @@ def load_mapping(map_id: str) -> ComplianceMapping:
         raise MappingLoadError(f"Error loading mapping {map_id}: {e}") from e
 
 
+class MappingIndex:
+    """Precompiled lookup of scanner checks to compliance control references.
+
+    Built once per combination of mapping files by :func:`load_mapping_index`.
+    Lookups return tuples shared between calls, so callers must copy them
+    before modifying.
+    """
+
+    __slots__ = ("map_ids", "_checks")
+
+    def __init__(
+        self,
+        map_ids: tuple[str, ...],
+        checks: dict[str, dict[str, tuple[tuple[str, ...], str | None]]],
+    ) -> None:
+        """Create an index from precomputed entries.
+
+        Args:
+            map_ids: Mapping identifiers the index was built from
+            checks: product -> check_id -> (``framework:control`` refs,
+                severity override)
+        """
+        self.map_ids = map_ids
+        self._checks = checks
+
+    @classmethod
+    def from_rules(cls, rules_by_map: dict[str, CompiledRules]) -> "MappingIndex":
+        """Combine the compiled rules of several mappings.
+
+        Args:
+            rules_by_map: Compiled rules keyed by mapping identifier, in the
+                order references should appear
+
+        Returns:
+            Combined index
+        """
+        refs: dict[str, dict[str, list[str]]] = {}
+        overrides: dict[tuple[str, str], str] = {}
+        for map_id, rules in rules_by_map.items():
+            for product, checks in rules.items():
+                product_refs = refs.setdefault(product, {})
+                for check_id, controls in checks.items():
+                    check_refs = product_refs.setdefault(check_id, [])
+                    for control, severity in controls:
+                        check_refs.append(f"{map_id}:{control}")
+                        # The first override wins, as it sets the severity
+                        if severity:
+                            overrides.setdefault((product, check_id), severity)
+
+        checks_index = {
+            product: {
+                check_id: (tuple(check_refs), overrides.get((product, check_id)))
+                for check_id, check_refs in product_refs.items()
+            }
+            for product, product_refs in refs.items()
+        }
+        return cls(tuple(rules_by_map), checks_index)
+
+    def __len__(self) -> int:
+        return sum(len(checks) for checks in self._checks.values())
+
+    def entry(self, product: str, check_id: str) -> tuple[tuple[str, ...], str | None] | None:
+        """Get the references and severity override of a check.
+
+        Args:
+            product: Security product that produced the finding
+            check_id: Check identifier
+
+        Returns:
+            Tuple of (refs, severity override), or None if the check is unmapped
+        """
+        checks = self._checks.get(product)
+        return checks.get(check_id) if checks is not None else None
+
+    def lookup(self, product: str, check_id: str) -> tuple[str, ...]:
+        """Get the ``framework:control`` references of a check.
+
+        Args:
+            product: Security product that produced the finding
+            check_id: Check identifier
+
+        Returns:
+            References in mapping and rule order; empty if the check is unmapped
+        """
+        entry = self.entry(product, check_id)
+        return entry[0] if entry is not None else ()
+
+
+@dataclass(slots=True)
+class _CachedRules:
+    """Compiled rules of a mapping file and the file state they came from."""
+
+    mtime_ns: int
+    size: int
+    digest: str
+    rules: CompiledRules
+
+
+# Process-wide caches: mapping file -> compiled rules, and
+# ((map_id, digest), ...) -> combined index
+_rules_cache: dict[Path, _CachedRules] = {}
+_index_cache: dict[tuple[tuple[str, str], ...], MappingIndex] = {}
+
+
+def get_mapping_cache_directory() -> Path | None:
+    """Get the directory holding compiled mappings.
+
+    Defaults to ``~/.cache/cs_kit/mappings`` and can be overridden with the
+    ``CS_KIT_MAPPING_CACHE`` environment variable.
+
+    Returns:
+        Cache directory, or None if the on-disk cache is disabled
+    """
+    configured = os.environ.get(MAPPING_CACHE_ENV)
+    if configured is not None:
+        return Path(configured) if configured else None
+    return Path.home() / ".cache" / "cs_kit" / "mappings"
+
+
+def clear_mapping_cache() -> None:
+    """Drop the in-memory mapping caches; the on-disk cache is kept."""
+    _rules_cache.clear()
+    _index_cache.clear()
+
+
+def load_mapping_index(map_ids: Iterable[str]) -> MappingIndex:
+    """Load a compiled index of several compliance mappings.
+
+    Mapping files are only re-read when their mtime or size changes and only
+    recompiled when their content hash changes. Compiled rules are also stored
+    on disk by content hash, so a new process skips YAML parsing and
+    validation for mappings it has seen before.
+
+    Args:
+        map_ids: Mapping identifiers; duplicates are ignored
+
+    Returns:
+        Index of the mappings, shared with other callers
+
+    Raises:
+        MappingNotFoundError: If a mapping is not found
+        MappingLoadError: If a mapping cannot be loaded
+    """
+    cached = {map_id: _load_compiled_rules(map_id) for map_id in dict.fromkeys(map_ids)}
+    key = tuple((map_id, entry.digest) for map_id, entry in cached.items())
+
+    index = _index_cache.get(key)
+    if index is None:
+        index = MappingIndex.from_rules({map_id: entry.rules for map_id, entry in cached.items()})
+        if len(_index_cache) >= _INDEX_CACHE_SIZE:
+            _index_cache.pop(next(iter(_index_cache)))
+        _index_cache[key] = index
+    return index
+
+
+def _load_compiled_rules(map_id: str) -> _CachedRules:
+    """Get the compiled rules of a mapping, from cache when still valid."""
+    mapping_file = get_mappings_directory() / f"{map_id}.yaml"
+    try:
+        stat = mapping_file.stat()
+    except OSError:
+        # Let load_mapping raise its usual error
+        load_mapping(map_id)
+        raise
+
+    cached = _rules_cache.get(mapping_file)
+    if cached is not None and (cached.mtime_ns, cached.size) == (stat.st_mtime_ns, stat.st_size):
+        return cached
+
+    try:
+        content = mapping_file.read_bytes()
+    except OSError as e:
+        raise MappingLoadError(f"Error loading mapping {map_id}: {e}") from e
+    digest = hashlib.sha256(content).hexdigest()
+
+    if cached is not None and cached.digest == digest:
+        rules = cached.rules
+    else:
+        rules = _read_rules_cache(digest)
+        if rules is None:
+            rules = _compile_rules(_parse_mapping(content, mapping_file, map_id))
+            _write_rules_cache(digest, rules)
+
+    cached = _rules_cache[mapping_file] = _CachedRules(
+        stat.st_mtime_ns, stat.st_size, digest, rules
+    )
+    return cached
+
+
+def _compile_rules(mapping: ComplianceMapping) -> CompiledRules:
+    """Group a mapping's rules by product and check."""
+    rules: CompiledRules = {}
+    for rule in mapping.rules:
+        product, _, check_id = rule.source.partition(":")
+        rules.setdefault(product, {}).setdefault(check_id, []).append(
+            (rule.target, rule.severity)
+        )
+    return rules
+
+
+def _read_rules_cache(digest: str) -> CompiledRules | None:
+    """Read compiled rules from the on-disk cache, if present and valid.
+
+    Entries are plain JSON, so a file planted in the cache directory can at
+    worst produce wrong mappings, never run code.
+    """
+    cache_dir = get_mapping_cache_directory()
+    if cache_dir is None:
+        return None
+
+    try:
+        data = codec.load(cache_dir / f"{digest}.json")
+        if data["version"] == _MAPPING_CACHE_VERSION and data["digest"] == digest:
+            return {
+                product: {
+                    check_id: [(control, severity) for control, severity in controls]
+                    for check_id, controls in checks.items()
+                }
+                for product, checks in data["rules"].items()
+            }
+    except Exception:
+        pass  # Missing, corrupt or outdated entries are recompiled
+    return None
+
+
+def _write_rules_cache(digest: str, rules: CompiledRules) -> None:
+    """Store compiled rules in the on-disk cache, ignoring failures."""
+    cache_dir = get_mapping_cache_directory()
+    if cache_dir is None:
+        return
+
+    data = {"version": _MAPPING_CACHE_VERSION, "digest": digest, "rules": rules}
+    try:
+        cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # Write then rename so concurrent readers never see a partial file
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=cache_dir, delete=False
+        ) as f:
+            f.write(codec.dumps(data))
+        os.replace(f.name, cache_dir / f"{digest}.json")
+    except OSError:
+        pass  # The cache is an optimization only
+
+
 def apply_mapping(
-    findings: list[OCSFFinding], map_ids: list[str]
-) -> list[OCSFEnrichedFinding]:
+    findings: Iterable[OCSFFinding | FindingRecord], map_ids: list[str]
+) -> list[OCSFEnrichedFinding | FindingRecord]:
     """Apply compliance mappings to findings.
 
+    Models are shallow-copied into ``OCSFEnrichedFinding`` instances that
+    share their field values, including ``raw``, with the originals;
+    ``FindingRecord`` instances are enriched in place and returned as they are.
+
     Args:
-        findings: List of OCSF findings
+        findings: List of OCSF findings or finding records
         map_ids: List of mapping identifiers to apply
 
     Returns:
@@ -159,57 +460,91 @@ def apply_mapping(
         MappingNotFoundError: If a mapping is not found
         MappingLoadError: If a mapping cannot be loaded
     """
-    # Load all mappings
-    mappings = {}
-    for map_id in map_ids:
-        mappings[map_id] = load_mapping(map_id)
-
-    # Build lookup table for efficient mapping
-    check_to_controls = {}
-    for map_id, mapping in mappings.items():
-        for rule in mapping.rules:
-            source_key = rule.source
-            if source_key not in check_to_controls:
-                check_to_controls[source_key] = []
-            check_to_controls[source_key].append({
-                "framework": map_id,
-                "control": rule.target,
-                "title": rule.title,
-                "description": rule.description,
-                "severity_override": rule.severity,
-            })
-
-    # Apply mappings to findings
-    enriched_findings = []
-    for finding in findings:
-        # Create enriched finding
-        enriched_data = finding.model_dump()
-        enriched_finding = OCSFEnrichedFinding(**enriched_data)
-
-        # Build source key for lookup
-        if finding.check_id:
-            source_key = f"{finding.product}:{finding.check_id}"
-
-            # Find matching controls
-            if source_key in check_to_controls:
-                framework_refs = []
-                for control_info in check_to_controls[source_key]:
-                    framework_refs.append(
-                        f"{control_info['framework']}:{control_info['control']}"
-                    )
-
-                    # Apply severity override if specified
-                    if (
-                        control_info['severity_override']
-                        and not enriched_finding.severity
-                    ):
-                        enriched_finding.severity = control_info['severity_override']  # type: ignore
-
-                enriched_finding.framework_refs = framework_refs
-
-        enriched_findings.append(enriched_finding)
-
-    return enriched_findings
+    return list(iter_apply_mapping(findings, map_ids))
+
+
+def iter_apply_mapping(
+    findings: Iterable[OCSFFinding | FindingRecord], map_ids: list[str]
+) -> Iterator[OCSFEnrichedFinding | FindingRecord]:
+    """Lazily apply compliance mappings to a stream of findings.
+
+    Mappings are loaded eagerly, so load errors are raised by this call rather
+    than on first iteration.
+
+    Args:
+        findings: Iterable of OCSF findings or finding records
+        map_ids: List of mapping identifiers to apply
+
+    Returns:
+        Iterator of enriched findings with framework references
+
+    Raises:
+        MappingNotFoundError: If a mapping is not found
+        MappingLoadError: If a mapping cannot be loaded
+    """
+    index = load_mapping_index(map_ids)
+
+    return (_enrich_finding(finding, index) for finding in findings)
+
+
+def _enrich_finding(
+    finding: OCSFFinding | FindingRecord, index: MappingIndex
+) -> OCSFEnrichedFinding | FindingRecord:
+    """Build an enriched finding with framework references.
+
+    Args:
+        finding: OCSF finding to enrich, or a finding record to enrich in place
+        index: Compiled mapping index
+
+    Returns:
+        Enriched finding
+
+    Raises:
+        ValueError: If a severity override is not a valid severity
+    """
+    enriched_finding: OCSFEnrichedFinding | FindingRecord
+    if isinstance(finding, FindingRecord):
+        enriched_finding = finding
+    else:
+        enriched_finding = _enriched_model(finding)
+
+    # Find matching controls
+    entry = index.entry(finding.product, finding.check_id) if finding.check_id else None
+    if entry is not None:
+        framework_refs, override = entry
+
+        # Apply severity override if specified
+        if override and not enriched_finding.severity:
+            # Records skip assignment validation, so check here
+            if isinstance(enriched_finding, FindingRecord) and override not in _SEVERITIES:
+                raise ValueError(f"Invalid severity override: {override}")
+            enriched_finding.severity = override  # type: ignore
+
+        enriched_finding.framework_refs = list(framework_refs)
+
+    return enriched_finding
+
+
+def _enriched_model(finding: OCSFFinding) -> OCSFEnrichedFinding:
+    """Wrap a finding model's values in an enriched finding.
+
+    The values were validated when the finding was built, so they are reused
+    as they are instead of being dumped, deep-copied and validated again.
+
+    Args:
+        finding: Finding model
+
+    Returns:
+        Enriched finding sharing the field values of ``finding``
+    """
+    values = {
+        name: factory() if factory is not None else default  # type: ignore[call-arg]
+        for name, factory, default in _ENRICHED_FIELDS
+    }
+    values.update(finding.__dict__)
+    if finding.model_extra:
+        values.update(finding.model_extra)
+    return OCSFEnrichedFinding.model_construct(set(finding.model_fields_set), **values)
 
 
 def get_framework_controls(map_id: str) -> dict[str, list[str]]:
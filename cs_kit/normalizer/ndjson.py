@@ -0,0 +1,302 @@
+"""NDJSON finding artifacts with a block offset index.
+
+Findings are written one compact JSON document per line, in blocks of
+``block_size`` lines. A sidecar index (``<file>.idx``) records the byte offset,
+byte length and finding count of every block, so any finding or range of
+findings can be read without scanning the file, and several processes can read
+disjoint byte ranges of one file in parallel.
+
+With ``zstd`` compression each block is an independent zstd frame, which keeps
+blocks randomly accessible; the file as a whole is still a valid multi-frame
+zstd stream that ``zstd -d`` decompresses to plain NDJSON. Compression needs
+the optional ``zstandard`` package.
+"""
+
+import bisect
+import io
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Literal
+
+from pydantic import BaseModel
+
+from cs_kit.normalizer import codec
+from cs_kit.normalizer.records import FindingRecord
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None  # type: ignore[assignment]
+
+# Findings per block of the offset index
+DEFAULT_BLOCK_SIZE = 1000
+
+# zstd compression level of each block
+ZSTD_LEVEL = 3
+
+# Suffix of the offset index written next to an NDJSON file
+INDEX_SUFFIX = ".idx"
+
+Compression = Literal["zstd"] | None
+
+_INDEX_VERSION = 1
+
+
+@dataclass(frozen=True, slots=True)
+class Block:
+    """Location of one block of findings in an NDJSON file."""
+
+    offset: int
+    length: int
+    count: int
+
+
+def index_path(path: Path) -> Path:
+    """Get the offset index path of an NDJSON file.
+
+    Args:
+        path: NDJSON file
+
+    Returns:
+        Path of its sidecar index
+    """
+    return path.with_name(path.name + INDEX_SUFFIX)
+
+
+def write_findings_ndjson(
+    findings: Iterable[BaseModel | FindingRecord],
+    path: Path,
+    compression: Compression = None,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+) -> int:
+    """Write findings as NDJSON with an offset index.
+
+    Args:
+        findings: Findings to serialize
+        path: Output file path; the index is written to ``<path>.idx``
+        compression: ``"zstd"`` to compress each block, or None
+        block_size: Findings per indexed block
+
+    Returns:
+        Number of findings written
+
+    Raises:
+        ValueError: If zstd compression is requested but ``zstandard`` is
+            not installed
+    """
+    compress = _compressor(compression)
+    blocks: list[Block] = []
+    lines: list[str] = []
+    offset = 0
+
+    def flush(f: io.BufferedWriter) -> None:
+        nonlocal offset
+        data = "".join(lines).encode("utf-8")
+        if compress is not None:
+            data = compress(data)
+        f.write(data)
+        blocks.append(Block(offset, len(data), len(lines)))
+        offset += len(data)
+        lines.clear()
+
+    with open(path, "wb") as f:
+        for finding in findings:
+            data = finding.to_dict() if isinstance(finding, FindingRecord) else finding.model_dump()
+            lines.append(codec.dumps(data) + "\n")
+            if len(lines) >= block_size:
+                flush(f)
+        if lines:
+            flush(f)
+
+    count = sum(block.count for block in blocks)
+    codec.dump(
+        {
+            "version": _INDEX_VERSION,
+            "compression": compression,
+            "count": count,
+            "blocks": [[block.offset, block.length, block.count] for block in blocks],
+        },
+        index_path(path),
+    )
+    return count
+
+
+class NDJSONReader:
+    """Random access reader of an indexed NDJSON findings file."""
+
+    def __init__(self, path: Path) -> None:
+        """Open an NDJSON file and its offset index.
+
+        Args:
+            path: NDJSON file
+
+        Raises:
+            FileNotFoundError: If the file or its index doesn't exist
+            ValueError: If the index is not supported, or the file is
+                compressed and ``zstandard`` is not installed
+        """
+        if not path.exists():
+            raise FileNotFoundError(f"Normalized findings not found: {path}")
+        try:
+            index = codec.load(index_path(path))
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Offset index not found: {index_path(path)}") from None
+        if index.get("version") != _INDEX_VERSION:
+            raise ValueError(f"Unsupported offset index version in {index_path(path)}")
+
+        self.path = path
+        self.compression: Compression = index["compression"]
+        self.blocks = [Block(*block) for block in index["blocks"]]
+        self._decompress = _decompressor(self.compression)
+        # Number of findings before each block, for locating a finding's block
+        self._starts = []
+        start = 0
+        for block in self.blocks:
+            self._starts.append(start)
+            start += block.count
+        self._count = start
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, i: int) -> dict[str, Any]:
+        """Read the finding at a position, reading only its block."""
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError("finding index out of range")
+        block = bisect.bisect_right(self._starts, i) - 1
+        with open(self.path, "rb") as f:
+            lines = self._read_block(f, self.blocks[block])
+        return codec.loads(lines[i - self._starts[block]])
+
+    def iter_dicts(self, start: int = 0, stop: int | None = None) -> Iterator[dict[str, Any]]:
+        """Stream a range of findings as dictionaries.
+
+        Only the blocks overlapping the range are read.
+
+        Args:
+            start: Position of the first finding
+            stop: Position after the last finding; defaults to the end
+
+        Yields:
+            Finding dictionaries, in file order
+        """
+        stop = self._count if stop is None else min(stop, self._count)
+        if start >= stop:
+            return
+        first = bisect.bisect_right(self._starts, start) - 1
+        with open(self.path, "rb") as f:
+            for number in range(first, len(self.blocks)):
+                block_start = self._starts[number]
+                if block_start >= stop:
+                    break
+                lines = self._read_block(f, self.blocks[number])
+                for line in lines[max(start - block_start, 0):stop - block_start]:
+                    yield codec.loads(line)
+
+    def iter_findings(self, start: int = 0, stop: int | None = None) -> Iterator[FindingRecord]:
+        """Stream a range of findings as records.
+
+        Args:
+            start: Position of the first finding
+            stop: Position after the last finding; defaults to the end
+
+        Yields:
+            Finding records, in file order
+        """
+        for data in self.iter_dicts(start, stop):
+            yield FindingRecord.from_dict(data)
+
+    def split(self, parts: int) -> list[tuple[int, int]]:
+        """Divide the findings into ranges of whole blocks for parallel reads.
+
+        Each range covers a contiguous byte range of the file, so readers of
+        different ranges never read the same bytes.
+
+        Args:
+            parts: Maximum number of ranges
+
+        Returns:
+            ``(start, stop)`` finding ranges of roughly equal size, in order
+        """
+        if not self.blocks:
+            return []
+        parts = max(1, min(parts, len(self.blocks)))
+        ranges = []
+        for part in range(parts):
+            first = len(self.blocks) * part // parts
+            last = len(self.blocks) * (part + 1) // parts
+            stop = self._starts[last] if last < len(self.blocks) else self._count
+            ranges.append((self._starts[first], stop))
+        return ranges
+
+    def _read_block(self, f: io.BufferedReader, block: Block) -> list[bytes]:
+        """Read and decompress one block into its lines."""
+        f.seek(block.offset)
+        data = f.read(block.length)
+        if self._decompress is not None:
+            data = self._decompress(data)
+        return data.splitlines()
+
+
+def iter_ndjson_dicts(path: Path) -> Iterator[dict[str, Any]]:
+    """Stream the findings of an NDJSON file as dictionaries.
+
+    The offset index is used when present; files without one are read line
+    by line.
+
+    Args:
+        path: NDJSON file, optionally zstd-compressed (``.zst`` suffix)
+
+    Yields:
+        Finding dictionaries, in file order
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+    """
+    if index_path(path).exists():
+        yield from NDJSONReader(path).iter_dicts()
+        return
+    if not path.exists():
+        raise FileNotFoundError(f"Normalized findings not found: {path}")
+
+    with open(path, "rb") as raw:
+        stream: io.BufferedIOBase = raw
+        if path.suffix == ".zst":
+            _require_zstandard()
+            stream = zstandard.ZstdDecompressor().stream_reader(raw, read_across_frames=True)
+        for line in io.BufferedReader(stream):  # type: ignore[arg-type]
+            if line.strip():
+                yield codec.loads(line)
+
+
+def _compressor(compression: Compression) -> Any:
+    """Get the block compression function of a compression mode."""
+    if compression is None:
+        return None
+    if compression != "zstd":
+        raise ValueError(f"Unsupported compression {compression!r}")
+    _require_zstandard()
+    return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress
+
+
+def _decompressor(compression: Compression) -> Any:
+    """Get the block decompression function of a compression mode."""
+    if compression is None:
+        return None
+    if compression != "zstd":
+        raise ValueError(f"Unsupported compression {compression!r}")
+    _require_zstandard()
+    return zstandard.ZstdDecompressor().decompress
+
+
+def _require_zstandard() -> None:
+    """Raise if zstd compression isn't available."""
+    if zstandard is None:
+        raise ValueError(
+            "zstd compression requires the zstandard package; "
+            "install the 'compression' extra"
+        )
+
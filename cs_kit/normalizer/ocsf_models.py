@@ -152,5 +152,12 @@ class FindingSummary(BaseModel):
     unique_accounts: int = Field(
         default=0, description="Number of unique accounts scanned"
     )
+    cardinality: Literal["exact", "hll"] = Field(
+        default="exact",
+        description="Whether unique counts are exact or HyperLogLog estimates",
+    )
+    cardinality_precision: int | None = Field(
+        default=None, description="HyperLogLog precision of estimated unique counts"
+    )
 
     model_config = ConfigDict(extra="forbid", validate_assignment=True)
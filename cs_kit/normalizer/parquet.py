@@ -0,0 +1,204 @@
+"""Parquet export of normalized findings for analytics.
+
+Findings are written with one column per ``OCSFEnrichedFinding`` field that
+records carry, so pandas, DuckDB or Spark can scan only the columns a query
+needs. Repetitive text columns are dictionary encoded, ``raw`` is kept as a
+JSON text column, and every row group holds the findings of a single
+provider and account, so queries filtering on an account skip the other
+accounts' row groups using the row group statistics.
+
+Writing needs the optional ``pyarrow`` package.
+"""
+
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel
+
+from cs_kit.normalizer import codec
+from cs_kit.normalizer.records import FindingRecord
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None  # type: ignore[assignment]
+    pq = None  # type: ignore[assignment]
+
+# Maximum findings per row group
+DEFAULT_ROW_GROUP_SIZE = 100_000
+
+# Findings buffered across all accounts before the largest buffer is written
+# as a (smaller) row group, bounding memory for scans of many accounts
+MAX_BUFFERED_ROWS = 4 * DEFAULT_ROW_GROUP_SIZE
+
+# Columns with few distinct values, stored dictionary encoded
+DICTIONARY_COLUMNS = (
+    "provider",
+    "product",
+    "class_name",
+    "severity",
+    "status",
+    "account_id",
+    "region",
+    "check_id",
+    "title",
+    "description",
+    "remediation",
+)
+
+_COLUMNS = (
+    "time",
+    "provider",
+    "product",
+    "class_uid",
+    "class_name",
+    "severity",
+    "status",
+    "resource_id",
+    "account_id",
+    "region",
+    "check_id",
+    "title",
+    "description",
+    "remediation",
+    "framework_refs",
+    "risk_score",
+    "raw",
+)
+
+
+def write_findings_parquet(
+    findings: Iterable[BaseModel | FindingRecord],
+    path: Path,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+) -> int:
+    """Write findings to a Parquet file.
+
+    Findings are grouped into row groups by provider and account, so the
+    file is in account order rather than in the order of ``findings``.
+
+    Args:
+        findings: Findings to export
+        path: Output file path
+        row_group_size: Maximum findings per row group
+
+    Returns:
+        Number of findings written
+
+    Raises:
+        ValueError: If ``pyarrow`` is not installed
+    """
+    _require_pyarrow()
+    schema = _schema()
+    buffers: dict[tuple[str, str | None], list[dict[str, Any]]] = {}
+    buffered = 0
+    count = 0
+
+    with pq.ParquetWriter(
+        path,
+        schema,
+        compression="zstd",
+        use_dictionary=list(DICTIONARY_COLUMNS),
+    ) as writer:
+
+        def flush(key: tuple[str, str | None]) -> None:
+            nonlocal buffered
+            rows = buffers.pop(key)
+            writer.write_table(pa.Table.from_pylist(rows, schema), row_group_size=row_group_size)
+            buffered -= len(rows)
+
+        for finding in findings:
+            row = _row(finding)
+            key = (row["provider"], row["account_id"])
+            buffers.setdefault(key, []).append(row)
+            buffered += 1
+            count += 1
+            if len(buffers[key]) >= row_group_size:
+                flush(key)
+            elif buffered >= MAX_BUFFERED_ROWS:
+                flush(max(buffers, key=lambda k: len(buffers[k])))
+
+        for key in sorted(buffers, key=lambda k: (k[0], k[1] or "")):
+            flush(key)
+
+    return count
+
+
+def iter_parquet_dicts(path: Path, batch_size: int = 10_000) -> Iterator[dict[str, Any]]:
+    """Stream the findings of a Parquet export as dictionaries.
+
+    Args:
+        path: Parquet file written by :func:`write_findings_parquet`
+        batch_size: Findings decoded at a time
+
+    Yields:
+        Finding dictionaries, in file order
+
+    Raises:
+        ValueError: If ``pyarrow`` is not installed
+    """
+    _require_pyarrow()
+    for batch in pq.ParquetFile(path).iter_batches(batch_size=batch_size):
+        for row in batch.to_pylist():
+            row["raw"] = codec.loads(row["raw"]) if row["raw"] else {}
+            row["framework_refs"] = row["framework_refs"] or []
+            yield row
+
+
+def parquet_row_count(path: Path) -> int:
+    """Count the findings of a Parquet export from its metadata.
+
+    Args:
+        path: Parquet file written by :func:`write_findings_parquet`
+
+    Returns:
+        Number of findings
+
+    Raises:
+        ValueError: If ``pyarrow`` is not installed
+    """
+    _require_pyarrow()
+    return pq.ParquetFile(path).metadata.num_rows
+
+
+def _schema() -> "pa.Schema":
+    """Arrow schema of the exported columns."""
+    string = pa.string()
+    return pa.schema([
+        ("time", pa.timestamp("us", tz="UTC")),
+        ("provider", string),
+        ("product", string),
+        ("class_uid", pa.int32()),
+        ("class_name", string),
+        ("severity", string),
+        ("status", string),
+        ("resource_id", string),
+        ("account_id", string),
+        ("region", string),
+        ("check_id", string),
+        ("title", string),
+        ("description", string),
+        ("remediation", string),
+        ("framework_refs", pa.list_(string)),
+        ("risk_score", pa.float64()),
+        ("raw", string),
+    ])
+
+
+def _row(finding: BaseModel | FindingRecord) -> dict[str, Any]:
+    """Flatten a finding into a row of the exported columns."""
+    data = finding.to_dict() if isinstance(finding, FindingRecord) else finding.model_dump()
+    row = {column: data.get(column) for column in _COLUMNS}
+    if isinstance(row["time"], str):
+        row["time"] = datetime.fromisoformat(row["time"])
+    row["raw"] = codec.dumps(row["raw"]) if row["raw"] else None
+    return row
+
+
+def _require_pyarrow() -> None:
+    """Raise if Parquet support isn't available."""
+    if pa is None:
+        raise ValueError("Parquet export requires the pyarrow package; install the 'parquet' extra")
@@ -1,26 +1,209 @@
-"""OCSF data parsing and normalization."""
+"""OCSF data parsing and normalization.
+
+Scan files are decoded through :mod:`cs_kit.normalizer.codec`, except arrays
+larger than ``STREAM_THRESHOLD_BYTES``. Those are streamed element by element
+with the standard library's ``json.JSONDecoder.raw_decode``, the only decoder
+that reports where a value ends inside a partly read buffer; orjson and
+simdjson only decode whole documents.
+"""
 
 import json
+import os
+import re
+from collections import deque
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
 from datetime import UTC, datetime
+from itertools import islice
 from pathlib import Path
 from typing import Any, Literal
 
+from cs_kit.normalizer import codec
 from cs_kit.normalizer.ocsf_models import OCSFFinding
+from cs_kit.normalizer.records import FindingRecord
+
+# Size of each read when streaming a top-level JSON array
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+# Files up to this size are decoded in one call with the fastest JSON backend;
+# larger files are streamed so memory stays bounded
+STREAM_THRESHOLD_BYTES = 64 * 1024 * 1024
+
+# Files larger than this are split into batches of findings when parsing in
+# parallel, so a single huge scan file is normalized on several cores
+PARALLEL_SPLIT_BYTES = STREAM_THRESHOLD_BYTES
+
+# Number of findings per batch sent to a worker for a split file
+PARALLEL_CHUNK_FINDINGS = 5000
+
+# Map common severity variations to standard values
+_SEVERITY_MAP = {
+    "critical": "critical",
+    "crit": "critical",
+    "high": "high",
+    "medium": "medium",
+    "med": "medium",
+    "moderate": "medium",
+    "low": "low",
+    "info": "informational",
+    "informational": "informational",
+    "information": "informational",
+    "notice": "informational",
+}
+
+# Map common status variations to standard values
+_STATUS_MAP = {
+    "pass": "pass",
+    "passed": "pass",
+    "success": "pass",
+    "ok": "pass",
+    "fail": "fail",
+    "failed": "fail",
+    "failure": "fail",
+    "error": "fail",
+    "not_applicable": "not_applicable",
+    "n/a": "not_applicable",
+    "na": "not_applicable",
+    "skip": "not_applicable",
+    "skipped": "not_applicable",
+    "info": "informational",
+    "informational": "informational",
+    "information": "informational",
+}
+
+# Field name -> (keys checked on the first entry of ``resources``, fallback
+# paths in priority order). A resources key wins even if its value is falsy;
+# a fallback path only matches a truthy value.
+FIELD_PATHS: dict[str, tuple[tuple[str, ...], tuple[tuple[str, ...], ...]]] = {
+    "resource_id": (
+        ("uid", "name"),
+        (
+            ("resource", "uid"),
+            ("resource", "id"),
+            ("resource_uid",),
+            ("resource_id",),
+            ("arn",),
+            ("resource_arn",),
+        ),
+    ),
+    "account_id": (
+        ("account_uid",),
+        (
+            ("cloud", "account", "uid"),
+            ("cloud", "account", "id"),
+            ("account_uid",),
+            ("account_id",),
+            ("account",),
+        ),
+    ),
+    "region": (
+        ("region",),
+        (
+            ("cloud", "region"),
+            ("resource", "region"),
+            ("region",),
+        ),
+    ),
+    "check_id": (
+        (),
+        (
+            ("finding", "uid"),
+            ("finding", "id"),
+            ("check_id",),
+            ("rule_id",),
+            ("uid",),
+            ("id",),
+        ),
+    ),
+    "title": (
+        (),
+        (
+            ("finding", "title"),
+            ("title",),
+            ("summary",),
+            ("name",),
+        ),
+    ),
+    "description": (
+        (),
+        (
+            ("finding", "desc"),
+            ("finding", "description"),
+            ("description",),
+            ("desc",),
+            ("message",),
+        ),
+    ),
+    "remediation": (
+        (),
+        (
+            ("finding", "remediation", "desc"),
+            ("finding", "remediation", "description"),
+            ("remediation", "desc"),
+            ("remediation", "description"),
+            ("remediation",),
+            ("recommendation",),
+            ("fix",),
+        ),
+    ),
+}
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DECODER = json.JSONDecoder()
+
+# Providers accepted by ``OCSFFinding.provider``
+_PROVIDERS = frozenset(("aws", "gcp", "azure"))
+
+# Findings as returned by the parse functions, depending on ``as_records``
+ParsedFinding = OCSFFinding | FindingRecord
 
 
 def parse_ocsf(
-    path: Path, provider: Literal["aws", "gcp", "azure"], product: str
-) -> list[OCSFFinding]:
+    path: Path,
+    provider: Literal["aws", "gcp", "azure"],
+    product: str,
+    as_records: bool = False,
+) -> list[ParsedFinding]:
     """Parse OCSF JSON data into normalized findings.
 
     Args:
         path: Path to the OCSF JSON file
         provider: Cloud provider
         product: Security product name
+        as_records: Return ``FindingRecord`` instances instead of models
 
     Returns:
         List of normalized OCSF findings
 
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        json.JSONDecodeError: If the file is not valid JSON
+        ValueError: If the data structure is invalid
+    """
+    return list(iter_ocsf(path, provider, product, as_records))
+
+
+def iter_ocsf(
+    path: Path,
+    provider: Literal["aws", "gcp", "azure"],
+    product: str,
+    as_records: bool = False,
+) -> Iterator[ParsedFinding]:
+    """Incrementally parse OCSF JSON data, yielding one finding at a time.
+
+    Files larger than ``STREAM_THRESHOLD_BYTES`` have their top-level array
+    decoded element by element, so memory use is bounded by the largest single
+    finding rather than by the size of the file.
+
+    Args:
+        path: Path to the OCSF JSON file
+        provider: Cloud provider
+        product: Security product name
+        as_records: Yield ``FindingRecord`` instances instead of models
+
+    Yields:
+        Normalized OCSF findings in file order
+
     Raises:
         FileNotFoundError: If the file doesn't exist
         json.JSONDecodeError: If the file is not valid JSON
@@ -29,34 +212,293 @@ def parse_ocsf(
     if not path.exists():
         raise FileNotFoundError(f"OCSF file not found: {path}")
 
-    try:
-        with open(path, encoding="utf-8") as f:
-            data = json.load(f)
-    except json.JSONDecodeError as e:
-        raise json.JSONDecodeError(
-            f"Invalid JSON in {path}: {e.msg}", e.doc, e.pos
-        ) from e
+    yield from _parse_raw_findings(
+        iter_raw_findings(path), path, provider, product, as_records=as_records
+    )
 
-    # Handle both single objects and arrays
-    if isinstance(data, dict):
-        data = [data]
-    elif not isinstance(data, list):
-        raise ValueError(f"Expected JSON object or array in {path}, got {type(data)}")
 
-    findings = []
-    for i, raw_finding in enumerate(data):
+def parse_ocsf_many(
+    paths: Sequence[Path],
+    provider: Literal["aws", "gcp", "azure"],
+    product: str,
+    workers: int | None = None,
+    split_bytes: int = PARALLEL_SPLIT_BYTES,
+    chunk_findings: int = PARALLEL_CHUNK_FINDINGS,
+    as_records: bool = False,
+) -> list[ParsedFinding]:
+    """Parse several OCSF JSON files in parallel worker processes.
+
+    Args:
+        paths: Paths to the OCSF JSON files
+        provider: Cloud provider
+        product: Security product name
+        workers: Number of worker processes (defaults to the CPU count)
+        split_bytes: Files larger than this are split into batches of findings
+        chunk_findings: Number of findings per batch for split files
+        as_records: Produce ``FindingRecord`` instances instead of models
+
+    Returns:
+        Normalized findings, ordered by file and then by position in the file
+
+    Raises:
+        FileNotFoundError: If a file doesn't exist
+        json.JSONDecodeError: If a file is not valid JSON
+        ValueError: If the data structure is invalid
+    """
+    return list(
+        iter_ocsf_many(
+            paths, provider, product, workers, split_bytes, chunk_findings, as_records
+        )
+    )
+
+
+def iter_ocsf_many(
+    paths: Sequence[Path],
+    provider: Literal["aws", "gcp", "azure"],
+    product: str,
+    workers: int | None = None,
+    split_bytes: int = PARALLEL_SPLIT_BYTES,
+    chunk_findings: int = PARALLEL_CHUNK_FINDINGS,
+    as_records: bool = False,
+) -> Iterator[ParsedFinding]:
+    """Parse several OCSF JSON files in parallel, yielding findings in order.
+
+    Each file is a unit of work for a ``ProcessPoolExecutor``. Files larger than
+    ``split_bytes`` are decoded incrementally in this process and normalized in
+    batches of ``chunk_findings`` by the workers. Results are yielded in the
+    order the work was submitted, and at most two tasks per worker are in flight
+    so memory stays bounded. With one worker everything runs in this process.
+
+    Args:
+        paths: Paths to the OCSF JSON files
+        provider: Cloud provider
+        product: Security product name
+        workers: Number of worker processes (defaults to the CPU count)
+        split_bytes: Files larger than this are split into batches of findings
+        chunk_findings: Number of findings per batch for split files
+        as_records: Produce ``FindingRecord`` instances instead of models
+
+    Yields:
+        Normalized findings, ordered by file and then by position in the file
+
+    Raises:
+        FileNotFoundError: If a file doesn't exist
+        json.JSONDecodeError: If a file is not valid JSON
+        ValueError: If the data structure is invalid
+    """
+    workers = workers or os.cpu_count() or 1
+    for path in paths:
+        if not path.exists():
+            raise FileNotFoundError(f"OCSF file not found: {path}")
+
+    if workers <= 1:
+        for path in paths:
+            yield from iter_ocsf(path, provider, product, as_records)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending: deque[Future[list[ParsedFinding]]] = deque()
+
+        for path in paths:
+            if path.stat().st_size <= split_bytes:
+                tasks: Iterable[Future[list[ParsedFinding]]] = [
+                    pool.submit(parse_ocsf, path, provider, product, as_records)
+                ]
+            else:
+                tasks = _submit_batches(
+                    pool, path, provider, product, chunk_findings, as_records
+                )
+
+            for task in tasks:
+                pending.append(task)
+                while len(pending) > workers * 2:
+                    yield from pending.popleft().result()
+
+        while pending:
+            yield from pending.popleft().result()
+
+
+def _submit_batches(
+    pool: ProcessPoolExecutor,
+    path: Path,
+    provider: Literal["aws", "gcp", "azure"],
+    product: str,
+    chunk_findings: int,
+    as_records: bool,
+) -> Iterator[Future[list[ParsedFinding]]]:
+    """Submit normalization of a large file's findings in batches."""
+    raw_findings = iter_raw_findings(path, stream_threshold=0)
+    start = 0
+    while batch := list(islice(raw_findings, chunk_findings)):
+        yield pool.submit(
+            _parse_batch, batch, start, path, provider, product, as_records
+        )
+        start += len(batch)
+
+
+def _parse_batch(
+    raw_findings: list[Any],
+    start: int,
+    path: Path,
+    provider: Literal["aws", "gcp", "azure"],
+    product: str,
+    as_records: bool,
+) -> list[ParsedFinding]:
+    """Normalize a batch of raw findings starting at index ``start`` of ``path``."""
+    return list(
+        _parse_raw_findings(raw_findings, path, provider, product, start, as_records)
+    )
+
+
+def _parse_raw_findings(
+    raw_findings: Iterable[Any],
+    path: Path,
+    provider: Literal["aws", "gcp", "azure"],
+    product: str,
+    start: int = 0,
+    as_records: bool = False,
+) -> Iterator[ParsedFinding]:
+    """Normalize raw findings, reporting errors with their index in ``path``."""
+    parse = _parse_single_record if as_records else _parse_single_finding
+    for i, raw_finding in enumerate(raw_findings, start):
         if not isinstance(raw_finding, dict):
             raise ValueError(
                 f"Expected JSON object at index {i} in {path}, got {type(raw_finding)}"
             )
 
         try:
-            finding = _parse_single_finding(raw_finding, provider, product)
-            findings.append(finding)
+            finding = parse(raw_finding, provider, product)
         except Exception as e:
             raise ValueError(f"Error parsing finding at index {i} in {path}: {e}") from e
 
-    return findings
+        yield finding
+
+
+def iter_raw_findings(
+    path: Path,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+    stream_threshold: int = STREAM_THRESHOLD_BYTES,
+) -> Iterator[Any]:
+    """Yield raw findings from an OCSF JSON file.
+
+    Files no larger than ``stream_threshold`` bytes are decoded at once through
+    :mod:`cs_kit.normalizer.codec`. Larger arrays are streamed in chunks of
+    ``chunk_size`` characters and decoded with the standard library, whatever
+    the codec backend; any other top-level document (a single finding object)
+    is always decoded in one go.
+
+    Args:
+        path: Path to the OCSF JSON file
+        chunk_size: Number of characters to read at a time when streaming
+        stream_threshold: File size above which arrays are streamed
+
+    Yields:
+        Decoded top-level array elements, or the single top-level object
+
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON
+        ValueError: If the top-level value is not an object or array
+    """
+    if path.stat().st_size <= stream_threshold:
+        yield from _check_document(_decode_document(path.read_bytes(), path), path)
+        return
+
+    with open(path, encoding="utf-8") as f:
+        buffer = f.read(chunk_size)
+        pos = _WHITESPACE.match(buffer).end()  # type: ignore[union-attr]
+        while pos == len(buffer):
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            buffer = chunk
+            pos = _WHITESPACE.match(buffer).end()  # type: ignore[union-attr]
+
+        if not buffer.startswith("[", pos):
+            data = _decode_document(buffer + f.read(), path)
+            yield from _check_document(data, path)
+            return
+
+        pos += 1
+        eof = False
+        expect_value = True
+        first = True
+
+        while True:
+            pos = _WHITESPACE.match(buffer, pos).end()  # type: ignore[union-attr]
+
+            if pos < len(buffer):
+                char = buffer[pos]
+                if char == "]" and (first or not expect_value):
+                    pos += 1
+                    break
+                if not expect_value:
+                    if char != ",":
+                        raise json.JSONDecodeError(
+                            f"Invalid JSON in {path}: Expecting ',' delimiter",
+                            buffer,
+                            pos,
+                        )
+                    pos += 1
+                    expect_value = True
+                    continue
+
+                try:
+                    value, end = _DECODER.raw_decode(buffer, pos)
+                except json.JSONDecodeError as e:
+                    if eof:
+                        raise json.JSONDecodeError(
+                            f"Invalid JSON in {path}: {e.msg}", e.doc, e.pos
+                        ) from e
+                else:
+                    # A scalar touching the end of the buffer may be truncated
+                    if end < len(buffer) or eof:
+                        yield value
+                        pos = end
+                        expect_value = False
+                        first = False
+                        continue
+            elif eof:
+                raise json.JSONDecodeError(
+                    f"Invalid JSON in {path}: Unterminated array", buffer, pos
+                )
+
+            # Need more input: drop consumed text and grow the buffer so that a
+            # single oversized finding is decoded in O(log n) attempts
+            remainder = buffer[pos:]
+            chunk = f.read(max(chunk_size, len(remainder)))
+            eof = not chunk
+            buffer = remainder + chunk
+            pos = 0
+
+        trailing = buffer[pos:] + f.read()
+        if trailing.strip():
+            raise json.JSONDecodeError(
+                f"Invalid JSON in {path}: Extra data", trailing, 0
+            )
+
+
+def _decode_document(data: str | bytes, path: Path) -> Any:
+    """Decode a whole JSON document, naming the file in decode errors."""
+    try:
+        return codec.loads(data)
+    except json.JSONDecodeError as e:
+        raise json.JSONDecodeError(
+            f"Invalid JSON in {path}: {e.msg}", e.doc, e.pos
+        ) from e
+
+
+def _check_document(data: Any, path: Path) -> list[Any]:
+    """Return the raw findings of a decoded document.
+
+    Raises:
+        ValueError: If the document is not a JSON object or array
+    """
+    # Handle both single objects and arrays
+    if isinstance(data, dict):
+        return [data]
+    if not isinstance(data, list):
+        raise ValueError(f"Expected JSON object or array in {path}, got {type(data)}")
+    return data
 
 
 def _parse_single_finding(
@@ -72,6 +514,54 @@ def _parse_single_finding(
     Returns:
         Normalized OCSF finding
     """
+    return OCSFFinding(**_normalize_finding(raw_finding, provider, product))
+
+
+def _parse_single_record(
+    raw_finding: dict[str, Any], provider: Literal["aws", "gcp", "azure"], product: str
+) -> FindingRecord:
+    """Parse a single raw finding into a finding record.
+
+    Normalized values already have the types ``OCSFFinding`` requires, so
+    validation is skipped unless the provider or the pass-through ``class_uid``
+    and ``class_name`` values need Pydantic's coercion or error reporting.
+
+    Args:
+        raw_finding: Raw finding data
+        provider: Cloud provider
+        product: Security product name
+
+    Returns:
+        Normalized finding record
+    """
+    fields = _normalize_finding(raw_finding, provider, product)
+    class_uid = fields["class_uid"]
+    class_name = fields["class_name"]
+    if (
+        provider in _PROVIDERS
+        and (
+            class_uid is None
+            or (isinstance(class_uid, int) and not isinstance(class_uid, bool))
+        )
+        and (class_name is None or isinstance(class_name, str))
+    ):
+        return FindingRecord(**fields)
+    return FindingRecord.from_model(OCSFFinding(**fields))
+
+
+def _normalize_finding(
+    raw_finding: dict[str, Any], provider: Literal["aws", "gcp", "azure"], product: str
+) -> dict[str, Any]:
+    """Extract and normalize the ``OCSFFinding`` fields of a raw finding.
+
+    Args:
+        raw_finding: Raw finding data
+        provider: Cloud provider
+        product: Security product name
+
+    Returns:
+        Keyword arguments for ``OCSFFinding`` or ``FindingRecord``
+    """
     # Extract timestamp
     time_str = raw_finding.get("time")
     if time_str:
@@ -95,34 +585,21 @@ def _parse_single_finding(
     severity = _normalize_severity(raw_finding.get("severity"))
     status = _normalize_status(raw_finding.get("status"))
 
-    # Extract resource information
-    resource_id = _extract_resource_id(raw_finding)
-    account_id = _extract_account_id(raw_finding)
-    region = _extract_region(raw_finding)
-
-    # Extract finding details
-    check_id = _extract_check_id(raw_finding)
-    title = _extract_title(raw_finding)
-    description = _extract_description(raw_finding)
-    remediation = _extract_remediation(raw_finding)
-
-    return OCSFFinding(
-        time=time,
-        provider=provider,
-        product=product,
-        class_uid=class_uid,
-        class_name=class_name,
-        severity=severity,
-        status=status,
-        resource_id=resource_id,
-        account_id=account_id,
-        region=region,
-        check_id=check_id,
-        title=title,
-        description=description,
-        remediation=remediation,
-        raw=raw_finding,
-    )
+    # Extract resource information and finding details
+    extractor = get_field_extractor(product, _schema_version(raw_finding))
+    fields = extractor.extract(raw_finding)
+
+    return {
+        "time": time,
+        "provider": provider,
+        "product": product,
+        "class_uid": class_uid,
+        "class_name": class_name,
+        "severity": severity,
+        "status": status,
+        **fields,
+        "raw": raw_finding,
+    }
 
 
 def _normalize_severity(
@@ -139,24 +616,7 @@ def _normalize_severity(
     if not severity:
         return None
 
-    severity_str = str(severity).lower().strip()
-
-    # Map common severity variations to standard values
-    severity_map = {
-        "critical": "critical",
-        "crit": "critical",
-        "high": "high",
-        "medium": "medium",
-        "med": "medium",
-        "moderate": "medium",
-        "low": "low",
-        "info": "informational",
-        "informational": "informational",
-        "information": "informational",
-        "notice": "informational",
-    }
-
-    return severity_map.get(severity_str)  # type: ignore
+    return _SEVERITY_MAP.get(str(severity).lower().strip())  # type: ignore
 
 
 def _normalize_status(
@@ -173,180 +633,199 @@ def _normalize_status(
     if not status:
         return None
 
-    status_str = str(status).lower().strip()
-
-    # Map common status variations to standard values
-    status_map = {
-        "pass": "pass",
-        "passed": "pass",
-        "success": "pass",
-        "ok": "pass",
-        "fail": "fail",
-        "failed": "fail",
-        "failure": "fail",
-        "error": "fail",
-        "not_applicable": "not_applicable",
-        "n/a": "not_applicable",
-        "na": "not_applicable",
-        "skip": "not_applicable",
-        "skipped": "not_applicable",
-        "info": "informational",
-        "informational": "informational",
-        "information": "informational",
-    }
+    return _STATUS_MAP.get(str(status).lower().strip())  # type: ignore
 
-    return status_map.get(status_str)  # type: ignore
 
+# Per-shape plan: (field name, resources keys, fallback paths present in the
+# shape, each split into its first key and the remaining keys)
+_ShapePlan = tuple[
+    tuple[str, tuple[str, ...], tuple[tuple[str, tuple[str, ...]], ...]], ...
+]
 
-def _extract_resource_id(raw_finding: dict[str, Any]) -> str | None:
-    """Extract resource ID from various possible locations in the raw finding."""
-    # First try to get from resources array (OCSF format)
-    resources = raw_finding.get("resources", [])
-    if resources and len(resources) > 0:
-        first_resource = resources[0]
-        if "uid" in first_resource:
-            return str(first_resource["uid"])
-        if "name" in first_resource:
-            return str(first_resource["name"])
-
-    # Try different common locations for resource ID
-    locations = [
-        ["resource", "uid"],
-        ["resource", "id"],
-        ["resource_uid"],
-        ["resource_id"],
-        ["arn"],
-        ["resource_arn"],
-    ]
-
-    for location in locations:
-        value = _get_nested_value(raw_finding, location)
-        if value:
-            return str(value)
 
-    return None
+class FieldExtractor:
+    """Precompiled field-extraction plan for one product and schema version.
 
+    The first time a document shape (its sequence of top-level keys) is seen,
+    the path table is specialized to that shape by dropping every path whose
+    first key is absent, and the result is cached. Extraction then only probes
+    paths that can exist, in the same order and with the same truthiness rules
+    as the ``_extract_*`` fallback chain, so results are identical.
+    """
 
-def _extract_account_id(raw_finding: dict[str, Any]) -> str | None:
-    """Extract account ID from various possible locations in the raw finding."""
-    # First try to get from resources array (OCSF format)
-    resources = raw_finding.get("resources", [])
-    if resources and len(resources) > 0:
-        first_resource = resources[0]
-        if "account_uid" in first_resource:
-            return str(first_resource["account_uid"])
-
-    locations = [
-        ["cloud", "account", "uid"],
-        ["cloud", "account", "id"],
-        ["account_uid"],
-        ["account_id"],
-        ["account"],
-    ]
-
-    for location in locations:
-        value = _get_nested_value(raw_finding, location)
-        if value:
-            return str(value)
+    # Upper bound on cached shapes, for inputs with highly irregular documents
+    MAX_SHAPES = 1024
+
+    def __init__(
+        self,
+        product: str,
+        schema_version: str | None,
+        field_paths: (
+            dict[str, tuple[tuple[str, ...], tuple[tuple[str, ...], ...]]] | None
+        ) = None,
+    ) -> None:
+        """Initialize the extractor.
+
+        Args:
+            product: Security product name
+            schema_version: OCSF schema version of the documents
+            field_paths: Path table, defaults to ``FIELD_PATHS``
+        """
+        self.product = product
+        self.schema_version = schema_version
+        self._field_paths = tuple((field_paths or FIELD_PATHS).items())
+        self._plans: dict[tuple[str, ...], _ShapePlan] = {}
+
+    def extract(self, raw_finding: dict[str, Any]) -> dict[str, str | None]:
+        """Extract all table fields from a raw finding.
+
+        Args:
+            raw_finding: Raw finding data
+
+        Returns:
+            Mapping of field name to extracted value or None
+        """
+        shape = tuple(raw_finding)
+        plan = self._plans.get(shape)
+        if plan is None:
+            plan = self._compile(shape)
+
+        values: dict[str, str | None] = {}
+        for name, resource_keys, paths in plan:
+            value = None
+            if resource_keys:
+                value = _from_first_resource(raw_finding, resource_keys)
+
+            if value is None:
+                for first, rest in paths:
+                    current = raw_finding[first]
+                    for key in rest:
+                        if isinstance(current, dict) and key in current:
+                            current = current[key]
+                        else:
+                            current = None
+                            break
+                    if current:
+                        value = str(current)
+                        break
+
+            values[name] = value
+
+        return values
+
+    def _compile(self, shape: tuple[str, ...]) -> _ShapePlan:
+        """Specialize the path table to a document shape and cache it."""
+        keys = set(shape)
+        plan = tuple(
+            (
+                name,
+                resource_keys if "resources" in keys else (),
+                tuple((path[0], path[1:]) for path in paths if path[0] in keys),
+            )
+            for name, (resource_keys, paths) in self._field_paths
+        )
+
+        if len(self._plans) < self.MAX_SHAPES:
+            self._plans[shape] = plan
+        return plan
+
+
+_EXTRACTORS: dict[tuple[str, str | None], FieldExtractor] = {}
+
+
+def get_field_extractor(product: str, schema_version: str | None) -> FieldExtractor:
+    """Get the cached field extractor for a product and schema version.
 
+    Args:
+        product: Security product name
+        schema_version: OCSF schema version of the documents
+
+    Returns:
+        Field extractor shared by all findings with this product and version
+    """
+    key = (product, schema_version)
+    extractor = _EXTRACTORS.get(key)
+    if extractor is None:
+        extractor = _EXTRACTORS[key] = FieldExtractor(product, schema_version)
+    return extractor
+
+
+def _schema_version(raw_finding: dict[str, Any]) -> str | None:
+    """Get the OCSF schema version declared in a raw finding's metadata."""
+    metadata = raw_finding.get("metadata")
+    if isinstance(metadata, dict):
+        version = metadata.get("version")
+        return str(version) if version is not None else None
     return None
 
 
-def _extract_region(raw_finding: dict[str, Any]) -> str | None:
-    """Extract region from various possible locations in the raw finding."""
-    # First try to get from resources array (OCSF format)
+def _from_first_resource(
+    raw_finding: dict[str, Any], keys: tuple[str, ...]
+) -> str | None:
+    """Get the first of ``keys`` present on the first entry of ``resources``."""
     resources = raw_finding.get("resources", [])
     if resources and len(resources) > 0:
         first_resource = resources[0]
-        if "region" in first_resource:
-            return str(first_resource["region"])
+        for key in keys:
+            if key in first_resource:
+                return str(first_resource[key])
+    return None
 
-    locations = [
-        ["cloud", "region"],
-        ["resource", "region"],
-        ["region"],
-    ]
 
-    for location in locations:
-        value = _get_nested_value(raw_finding, location)
+def _extract_field(raw_finding: dict[str, Any], field: str) -> str | None:
+    """Extract a field by probing every location in ``FIELD_PATHS`` in order.
+
+    This is the reference fallback chain that ``FieldExtractor`` compiles.
+    """
+    resource_keys, paths = FIELD_PATHS[field]
+
+    # First try to get from resources array (OCSF format)
+    if resource_keys:
+        value = _from_first_resource(raw_finding, resource_keys)
+        if value is not None:
+            return value
+
+    for location in paths:
+        value = _get_nested_value(raw_finding, list(location))
         if value:
             return str(value)
 
     return None
 
 
+def _extract_resource_id(raw_finding: dict[str, Any]) -> str | None:
+    """Extract resource ID from various possible locations in the raw finding."""
+    return _extract_field(raw_finding, "resource_id")
+
+
+def _extract_account_id(raw_finding: dict[str, Any]) -> str | None:
+    """Extract account ID from various possible locations in the raw finding."""
+    return _extract_field(raw_finding, "account_id")
+
+
+def _extract_region(raw_finding: dict[str, Any]) -> str | None:
+    """Extract region from various possible locations in the raw finding."""
+    return _extract_field(raw_finding, "region")
+
+
 def _extract_check_id(raw_finding: dict[str, Any]) -> str | None:
     """Extract check/rule ID from various possible locations in the raw finding."""
-    locations = [
-        ["finding", "uid"],
-        ["finding", "id"],
-        ["check_id"],
-        ["rule_id"],
-        ["uid"],
-        ["id"],
-    ]
-
-    for location in locations:
-        value = _get_nested_value(raw_finding, location)
-        if value:
-            return str(value)
-
-    return None
+    return _extract_field(raw_finding, "check_id")
 
 
 def _extract_title(raw_finding: dict[str, Any]) -> str | None:
     """Extract title from various possible locations in the raw finding."""
-    locations = [
-        ["finding", "title"],
-        ["title"],
-        ["summary"],
-        ["name"],
-    ]
-
-    for location in locations:
-        value = _get_nested_value(raw_finding, location)
-        if value:
-            return str(value)
-
-    return None
+    return _extract_field(raw_finding, "title")
 
 
 def _extract_description(raw_finding: dict[str, Any]) -> str | None:
     """Extract description from various possible locations in the raw finding."""
-    locations = [
-        ["finding", "desc"],
-        ["finding", "description"],
-        ["description"],
-        ["desc"],
-        ["message"],
-    ]
-
-    for location in locations:
-        value = _get_nested_value(raw_finding, location)
-        if value:
-            return str(value)
-
-    return None
+    return _extract_field(raw_finding, "description")
 
 
 def _extract_remediation(raw_finding: dict[str, Any]) -> str | None:
     """Extract remediation from various possible locations in the raw finding."""
-    locations = [
-        ["finding", "remediation", "desc"],
-        ["finding", "remediation", "description"],
-        ["remediation", "desc"],
-        ["remediation", "description"],
-        ["remediation"],
-        ["recommendation"],
-        ["fix"],
-    ]
-
-    for location in locations:
-        value = _get_nested_value(raw_finding, location)
-        if value:
-            return str(value)
-
-    return None
+    return _extract_field(raw_finding, "remediation")
 
 
 def _get_nested_value(data: dict[str, Any], keys: list[str]) -> Any:
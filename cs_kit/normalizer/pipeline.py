@@ -0,0 +1,217 @@
+"""Normalization of scan output while scans are still running.
+
+A scan made of several prowler runs can hand each run's output files to a
+``NormalizationPipeline`` as soon as that run finishes. The files are parsed,
+deduplicated, mapped and folded into the summary aggregate on a background
+thread while the other runs keep going, so a scan ends shortly after its
+slowest run instead of after every run and then all of the normalization.
+Normalized findings are streamed to a sink, such as an artifact writer, as
+each submission completes, rather than collected until the scan ends.
+"""
+
+import asyncio
+import queue
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Literal
+
+from cs_kit.normalizer.cardinality import DEFAULT_PRECISION
+from cs_kit.normalizer.dedupe import FindingDeduplicator
+from cs_kit.normalizer.mapping import iter_apply_mapping, load_mapping_index
+from cs_kit.normalizer.parser import iter_ocsf_many
+from cs_kit.normalizer.records import AnyFinding
+from cs_kit.normalizer.summarize import SummaryAccumulator
+
+# Findings normalized between updates of the summary aggregate
+_BATCH_SIZE = 10000
+
+# Batches of normalized findings waiting for the sink
+_SINK_QUEUE_BATCHES = 4
+
+# Seconds between checks that the sink is still consuming, while the queue
+# is full
+_SINK_POLL_SECONDS = 0.1
+
+# Queue markers ending the stream of findings handed to the sink
+_FINISHED = object()
+_CLOSED = object()
+
+
+class NormalizationPipeline:
+    """Parse, deduplicate, map and summarize scan files as they arrive.
+
+    Files are processed one submission at a time, in submission order, on a
+    single background thread, so findings, the deduplicator and the summary
+    aggregate are never updated concurrently. Mappings give every copy of a
+    finding the same framework references, so duplicates dropped after their
+    first occurrence was summarized don't change the summary.
+
+    Normalized findings are handed to the sink, which runs on a thread of
+    its own and consumes them as a single stream; a few batches are queued
+    for it at most. Close the pipeline, or use it as a context manager, to
+    stop its threads when a scan fails before :meth:`finish`.
+    """
+
+    def __init__(
+        self,
+        provider: Literal["aws", "gcp", "azure"],
+        product: str,
+        map_ids: Sequence[str] = (),
+        parse_workers: int = 1,
+        cardinality: Literal["exact", "hll"] = "exact",
+        precision: int = DEFAULT_PRECISION,
+        sink: Callable[[Iterator[AnyFinding]], Any] = list,
+        dedupe: bool = True,
+    ) -> None:
+        """Create a pipeline.
+
+        Args:
+            provider: Cloud provider of the scan
+            product: Security product that produced the files
+            map_ids: Compliance mappings to apply; loaded here, so load errors
+                are raised before any scan starts
+            parse_workers: Worker processes for parsing each submission
+            cardinality: Unique resource counting mode of the summary
+            precision: HyperLogLog precision when cardinality is "hll"
+            sink: Called once with an iterator over the normalized findings,
+                in submission order; its result is returned by
+                :meth:`finish`. Collects the findings in a list by default
+            dedupe: Drop findings repeated across submissions, for scans
+                whose prowler runs overlap
+
+        Raises:
+            MappingNotFoundError: If a mapping is not found
+            MappingLoadError: If a mapping cannot be loaded
+        """
+        self.provider = provider
+        self.product = product
+        self.map_ids = list(map_ids)
+        self.parse_workers = parse_workers
+        if self.map_ids:
+            load_mapping_index(self.map_ids)
+
+        self.deduplicator = FindingDeduplicator() if dedupe else None
+        self.accumulator = SummaryAccumulator(cardinality, precision)
+        self.files: list[Path] = []
+
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="normalize")
+        self._pending: list[Future[None]] = []
+        self._closed = False
+
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=_SINK_QUEUE_BATCHES)
+        self._sink_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="normalize-sink")
+        self._sink: Future[Any] = self._sink_executor.submit(sink, self._drain())
+
+    def __enter__(self) -> "NormalizationPipeline":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def submit(self, paths: Sequence[Path]) -> None:
+        """Queue scan files for normalization and return immediately.
+
+        Args:
+            paths: Output files of one finished scan run
+        """
+        self.files.extend(paths)
+        self._pending.append(self._executor.submit(self._normalize, list(paths)))
+
+    def submit_findings(self, findings: Iterable[AnyFinding]) -> None:
+        """Queue already normalized findings, such as those carried over from
+        a previous run, to be deduplicated, mapped and summarized.
+
+        The findings are iterated later on the pipeline's thread, so a lazy
+        stream, e.g. one reading an artifact, is consumed without being held.
+
+        Args:
+            findings: Normalized findings
+        """
+        self._pending.append(self._executor.submit(self._fold, findings))
+
+    async def finish(self) -> Any:
+        """Wait for every submission to be normalized and for the sink.
+
+        Returns:
+            Result of the sink; by default the normalized findings, in the
+            order their files were submitted
+
+        Raises:
+            Exception: The first error raised while normalizing a submission,
+                or the error raised by the sink
+        """
+        try:
+            for future in self._pending:
+                await asyncio.wrap_future(future)
+            self._put(_FINISHED)
+            return await asyncio.wrap_future(self._sink)
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Stop normalizing and release the pipeline's threads.
+
+        Queued submissions are cancelled. A sink still waiting for findings
+        has its iterator raise ``RuntimeError``, so e.g. an artifact writer
+        doesn't finish a partial artifact as if it were complete. Closing a
+        closed pipeline does nothing.
+        """
+        if self._closed:
+            return
+        self._closed = True
+
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        if not self._sink.done():
+            self._put(_CLOSED)
+        self._sink_executor.shutdown(wait=True)
+
+    def _normalize(self, paths: list[Path]) -> None:
+        """Normalize one submission into the sink and summary."""
+        self._fold(iter_ocsf_many(
+            paths, self.provider, self.product, workers=self.parse_workers, as_records=True
+        ))
+
+    def _fold(self, findings: Iterable[AnyFinding]) -> None:
+        """Deduplicate, map and summarize normalized findings."""
+        stream: Iterator[AnyFinding] = iter(findings)
+        if self.deduplicator is not None:
+            stream = self.deduplicator.filter(stream)
+        if self.map_ids:
+            stream = iter_apply_mapping(stream, self.map_ids)
+
+        while not self._closed and (batch := list(islice(stream, _BATCH_SIZE))):
+            self.accumulator.update(batch)
+            self._put(batch)
+
+    def _put(self, item: Any) -> None:
+        """Queue a batch or marker for the sink, unless the sink has stopped.
+
+        Raises:
+            Exception: The error the sink stopped with
+            RuntimeError: If the sink returned before the findings ended
+        """
+        while not self._sink.done():
+            try:
+                self._queue.put(item, timeout=_SINK_POLL_SECONDS)
+                return
+            except queue.Full:
+                continue
+        if item is _CLOSED:
+            return
+        self._sink.result()
+        raise RuntimeError("Findings sink returned before the pipeline finished")
+
+    def _drain(self) -> Iterator[AnyFinding]:
+        """Yield queued findings to the sink until the pipeline finishes."""
+        while (batch := self._queue.get()) is not _FINISHED:
+            if batch is _CLOSED:
+                raise RuntimeError("Normalization pipeline closed before it finished")
+            yield from batch
@@ -0,0 +1,137 @@
+"""Compact slotted finding records for the internal processing pipeline.
+
+``OCSFFinding`` and ``OCSFEnrichedFinding`` validate every field on creation
+and assignment, which dominates parse and mapping time for large scans. The
+pipeline can instead carry ``FindingRecord`` instances, which are populated
+from already-normalized values, and convert to the Pydantic models only at API
+boundaries with :meth:`FindingRecord.to_model`.
+"""
+
+from dataclasses import dataclass, field, fields
+from datetime import datetime
+from typing import Any
+
+from cs_kit.normalizer.ocsf_models import OCSFEnrichedFinding, OCSFFinding
+
+
+@dataclass(slots=True, eq=True)
+class FindingRecord:
+    """Unvalidated finding with the fields of ``OCSFEnrichedFinding``.
+
+    Only the fields the pipeline reads and writes are stored; the nested
+    ``resource``, ``cloud``, ``compliance`` and ``tags`` enrichment fields are
+    always empty and are filled with their defaults when converting.
+    """
+
+    time: datetime
+    provider: str
+    product: str
+    class_uid: int | None = None
+    class_name: str | None = None
+    severity: str | None = None
+    status: str | None = None
+    resource_id: str | None = None
+    account_id: str | None = None
+    region: str | None = None
+    check_id: str | None = None
+    title: str | None = None
+    description: str | None = None
+    remediation: str | None = None
+    raw: dict[str, Any] = field(default_factory=dict)
+    framework_refs: list[str] = field(default_factory=list)
+    risk_score: float | None = None
+
+    @classmethod
+    def from_model(cls, finding: OCSFFinding) -> "FindingRecord":
+        """Create a record from a Pydantic finding without copying ``raw``.
+
+        Args:
+            finding: Finding model to convert
+
+        Returns:
+            Equivalent finding record
+        """
+        return cls(
+            time=finding.time,
+            provider=finding.provider,
+            product=finding.product,
+            class_uid=finding.class_uid,
+            class_name=finding.class_name,
+            severity=finding.severity,
+            status=finding.status,
+            resource_id=finding.resource_id,
+            account_id=finding.account_id,
+            region=finding.region,
+            check_id=finding.check_id,
+            title=finding.title,
+            description=finding.description,
+            remediation=finding.remediation,
+            raw=finding.raw,
+            framework_refs=list(getattr(finding, "framework_refs", None) or []),
+            risk_score=getattr(finding, "risk_score", None),
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "FindingRecord":
+        """Create a record from a dictionary written by :meth:`to_dict`.
+
+        Keys that records don't store are ignored, and a ``time`` string in
+        ISO 8601 form (as serialized to JSON) is parsed.
+
+        Args:
+            data: Finding dictionary, e.g. decoded from ``normalized.json``
+
+        Returns:
+            Finding record
+        """
+        values = {key: value for key, value in data.items() if key in _FIELD_NAMES}
+        if isinstance(values.get("time"), str):
+            values["time"] = datetime.fromisoformat(values["time"])
+        return cls(**values)
+
+    def to_model(self) -> OCSFEnrichedFinding:
+        """Validate the record into an enriched finding model.
+
+        Returns:
+            Equivalent ``OCSFEnrichedFinding``
+
+        Raises:
+            pydantic.ValidationError: If a field holds an invalid value
+        """
+        return OCSFEnrichedFinding(**self.to_dict())
+
+    def to_dict(self) -> dict[str, Any]:
+        """Dump the record in the layout of ``OCSFEnrichedFinding.model_dump()``.
+
+        Returns:
+            Dictionary with the same keys, in the same order, as the model dump
+        """
+        return {
+            "time": self.time,
+            "provider": self.provider,
+            "product": self.product,
+            "class_uid": self.class_uid,
+            "class_name": self.class_name,
+            "severity": self.severity,
+            "status": self.status,
+            "resource_id": self.resource_id,
+            "account_id": self.account_id,
+            "region": self.region,
+            "check_id": self.check_id,
+            "title": self.title,
+            "description": self.description,
+            "remediation": self.remediation,
+            "raw": self.raw,
+            "resource": None,
+            "cloud": None,
+            "compliance": None,
+            "framework_refs": self.framework_refs,
+            "risk_score": self.risk_score,
+            "tags": {},
+        }
+
+
+_FIELD_NAMES = frozenset(f.name for f in fields(FindingRecord))
+
+# Any finding representation accepted by the mapping, summary and render stages
+AnyFinding = OCSFFinding | OCSFEnrichedFinding | FindingRecord
@@ -1,17 +1,48 @@
-"""Rollups and summaries for security findings analysis."""
+"""Rollups and summaries for security findings analysis.
 
+Every function accepts a list of findings or a columnar ``FindingsTable``; the
+table versions aggregate dictionary-encoded columns instead of looping over
+finding objects.
+"""
+
+from array import array
 from collections import Counter, defaultdict
+from collections.abc import Iterable, Iterator
 from datetime import datetime
-from typing import Any
-
-from cs_kit.normalizer.ocsf_models import (
-    FindingSummary,
-    OCSFEnrichedFinding,
-    OCSFFinding,
+from itertools import islice
+from operator import attrgetter
+from typing import Any, Literal
+
+from cs_kit.normalizer.cardinality import DEFAULT_PRECISION, HyperLogLog
+from cs_kit.normalizer.ocsf_models import FindingSummary, OCSFEnrichedFinding
+from cs_kit.normalizer.records import AnyFinding, FindingRecord
+from cs_kit.normalizer.table import FindingsTable, cross_counts
+
+# Format version of ``SummaryAccumulator.to_dict`` output
+PARTIAL_SUMMARY_VERSION = 1
+
+# Findings consumed per batch by ``SummaryAccumulator.update``
+_ACCUMULATOR_BATCH_SIZE = 10000
+
+# Field combinations ``SummaryAccumulator`` counts findings by
+_GROUP_KEY = attrgetter("provider", "product", "severity", "status")
+_RESOURCE_KEY = attrgetter("provider", "resource_id")
+_ACCOUNT_KEY = attrgetter("provider", "account_id")
+_RESOURCE_ID = attrgetter("resource_id")
+_TIME = attrgetter("time")
+
+# Ranges reported by ``risk_score_distribution``, in report order
+_RISK_SCORE_RANGES = (
+    "critical (9-10)",
+    "high (7-8.9)",
+    "medium (4-6.9)",
+    "low (1-3.9)",
+    "info (0-0.9)",
+    "unknown",
 )
 
 
-def severity_counts(findings: list[OCSFFinding | OCSFEnrichedFinding]) -> dict[str, int]:
+def severity_counts(findings: list[AnyFinding] | FindingsTable) -> dict[str, int]:
     """Count findings by severity level.
 
     Args:
@@ -20,6 +51,9 @@ def severity_counts(findings: list[OCSFFinding | OCSFEnrichedFinding]) -> dict[s
     Returns:
         Dictionary mapping severity levels to counts
     """
+    if isinstance(findings, FindingsTable):
+        return _table_severity_counts(findings)
+
     severity_counter = Counter()
 
     for finding in findings:
@@ -29,7 +63,7 @@ def severity_counts(findings: list[OCSFFinding | OCSFEnrichedFinding]) -> dict[s
     return dict(severity_counter)
 
 
-def status_counts(findings: list[OCSFFinding | OCSFEnrichedFinding]) -> dict[str, int]:
+def status_counts(findings: list[AnyFinding] | FindingsTable) -> dict[str, int]:
     """Count findings by status.
 
     Args:
@@ -38,6 +72,9 @@ def status_counts(findings: list[OCSFFinding | OCSFEnrichedFinding]) -> dict[str
     Returns:
         Dictionary mapping status values to counts
     """
+    if isinstance(findings, FindingsTable):
+        return _table_status_counts(findings)
+
     status_counter = Counter()
 
     for finding in findings:
@@ -47,7 +84,7 @@ def status_counts(findings: list[OCSFFinding | OCSFEnrichedFinding]) -> dict[str
     return dict(status_counter)
 
 
-def provider_counts(findings: list[OCSFFinding | OCSFEnrichedFinding]) -> dict[str, int]:
+def provider_counts(findings: list[AnyFinding] | FindingsTable) -> dict[str, int]:
     """Count findings by cloud provider.
 
     Args:
@@ -56,6 +93,9 @@ def provider_counts(findings: list[OCSFFinding | OCSFEnrichedFinding]) -> dict[s
     Returns:
         Dictionary mapping providers to counts
     """
+    if isinstance(findings, FindingsTable):
+        return findings.column("provider").value_counts()
+
     provider_counter = Counter()
 
     for finding in findings:
@@ -64,7 +104,7 @@ def provider_counts(findings: list[OCSFFinding | OCSFEnrichedFinding]) -> dict[s
     return dict(provider_counter)
 
 
-def product_counts(findings: list[OCSFFinding | OCSFEnrichedFinding]) -> dict[str, int]:
+def product_counts(findings: list[AnyFinding] | FindingsTable) -> dict[str, int]:
     """Count findings by security product.
 
     Args:
@@ -73,6 +113,9 @@ def product_counts(findings: list[OCSFFinding | OCSFEnrichedFinding]) -> dict[st
     Returns:
         Dictionary mapping products to counts
     """
+    if isinstance(findings, FindingsTable):
+        return findings.column("product").value_counts()
+
     product_counter = Counter()
 
     for finding in findings:
@@ -82,7 +125,7 @@ def product_counts(findings: list[OCSFFinding | OCSFEnrichedFinding]) -> dict[st
 
 
 def framework_score(
-    findings: list[OCSFEnrichedFinding], framework_prefix: str
+    findings: list[OCSFEnrichedFinding | FindingRecord] | FindingsTable, framework_prefix: str
 ) -> dict[str, int]:
     """Calculate framework compliance score.
 
@@ -93,6 +136,9 @@ def framework_score(
     Returns:
         Dictionary with pass/fail/warn counts for the framework
     """
+    if isinstance(findings, FindingsTable):
+        return _table_framework_score(findings, framework_prefix)
+
     framework_findings = []
 
     # Filter findings that belong to the specified framework
@@ -118,15 +164,27 @@ def framework_score(
     }
 
 
-def by_provider(findings: list[OCSFFinding | OCSFEnrichedFinding]) -> dict[str, dict[str, Any]]:
+def by_provider(
+    findings: list[AnyFinding] | FindingsTable,
+    cardinality: Literal["exact", "hll"] = "exact",
+    precision: int = DEFAULT_PRECISION,
+) -> dict[str, dict[str, Any]]:
     """Group findings by provider with detailed breakdown.
 
     Args:
         findings: List of findings to analyze
+        cardinality: ``"hll"`` to estimate unique resources and accounts with
+            HyperLogLog sketches; tables are always counted exactly
+        precision: HyperLogLog precision when ``cardinality`` is ``"hll"``
 
     Returns:
         Dictionary mapping providers to their finding breakdowns
     """
+    if isinstance(findings, FindingsTable):
+        return _table_by_provider(findings)
+    if cardinality != "exact":
+        return SummaryAccumulator.from_findings(findings, cardinality, precision).by_provider()
+
     provider_data = defaultdict(lambda: {
         "total": 0,
         "by_severity": defaultdict(int),
@@ -165,7 +223,9 @@ def by_provider(findings: list[OCSFFinding | OCSFEnrichedFinding]) -> dict[str,
     return result
 
 
-def by_framework(findings: list[OCSFEnrichedFinding]) -> dict[str, dict[str, Any]]:
+def by_framework(
+    findings: list[OCSFEnrichedFinding | FindingRecord] | FindingsTable,
+) -> dict[str, dict[str, Any]]:
     """Group findings by compliance framework.
 
     Args:
@@ -174,6 +234,9 @@ def by_framework(findings: list[OCSFEnrichedFinding]) -> dict[str, dict[str, Any
     Returns:
         Dictionary mapping frameworks to their finding breakdowns
     """
+    if isinstance(findings, FindingsTable):
+        return _table_by_framework(findings)
+
     framework_data = defaultdict(lambda: {
         "total": 0,
         "by_severity": defaultdict(int),
@@ -210,7 +273,9 @@ def by_framework(findings: list[OCSFEnrichedFinding]) -> dict[str, dict[str, Any
     return result
 
 
-def risk_score_distribution(findings: list[OCSFEnrichedFinding]) -> dict[str, int]:
+def risk_score_distribution(
+    findings: list[OCSFEnrichedFinding | FindingRecord] | FindingsTable,
+) -> dict[str, int]:
     """Calculate distribution of risk scores.
 
     Args:
@@ -219,37 +284,34 @@ def risk_score_distribution(findings: list[OCSFEnrichedFinding]) -> dict[str, in
     Returns:
         Dictionary mapping risk score ranges to counts
     """
-    score_ranges = {
-        "critical (9-10)": 0,
-        "high (7-8.9)": 0,
-        "medium (4-6.9)": 0,
-        "low (1-3.9)": 0,
-        "info (0-0.9)": 0,
-        "unknown": 0,
-    }
+    if isinstance(findings, FindingsTable):
+        return _table_risk_score_distribution(findings)
 
+    score_ranges = dict.fromkeys(_RISK_SCORE_RANGES, 0)
     for finding in findings:
-        if hasattr(finding, 'risk_score') and finding.risk_score is not None:
-            score = finding.risk_score
-            if 9 <= score <= 10:
-                score_ranges["critical (9-10)"] += 1
-            elif 7 <= score < 9:
-                score_ranges["high (7-8.9)"] += 1
-            elif 4 <= score < 7:
-                score_ranges["medium (4-6.9)"] += 1
-            elif 1 <= score < 4:
-                score_ranges["low (1-3.9)"] += 1
-            elif 0 <= score < 1:
-                score_ranges["info (0-0.9)"] += 1
-            else:
-                score_ranges["unknown"] += 1
-        else:
-            score_ranges["unknown"] += 1
+        score_ranges[_risk_score_range(getattr(finding, "risk_score", None))] += 1
 
     return score_ranges
 
 
-def time_range_analysis(findings: list[OCSFFinding | OCSFEnrichedFinding]) -> dict[str, datetime | None]:
+def _risk_score_range(score: float | None) -> str:
+    """Get the ``risk_score_distribution`` range a risk score falls in."""
+    if score is None:
+        return "unknown"
+    if 9 <= score <= 10:
+        return "critical (9-10)"
+    if 7 <= score < 9:
+        return "high (7-8.9)"
+    if 4 <= score < 7:
+        return "medium (4-6.9)"
+    if 1 <= score < 4:
+        return "low (1-3.9)"
+    if 0 <= score < 1:
+        return "info (0-0.9)"
+    return "unknown"
+
+
+def time_range_analysis(findings: list[AnyFinding] | FindingsTable) -> dict[str, datetime | None]:
     """Analyze the time range of findings.
 
     Args:
@@ -258,6 +320,9 @@ def time_range_analysis(findings: list[OCSFFinding | OCSFEnrichedFinding]) -> di
     Returns:
         Dictionary with start and end timestamps
     """
+    if isinstance(findings, FindingsTable):
+        return _table_time_range_analysis(findings)
+
     if not findings:
         return {"start": None, "end": None}
 
@@ -272,15 +337,28 @@ def time_range_analysis(findings: list[OCSFFinding | OCSFEnrichedFinding]) -> di
     }
 
 
-def unique_resource_analysis(findings: list[OCSFFinding | OCSFEnrichedFinding]) -> dict[str, Any]:
+def unique_resource_analysis(
+    findings: list[AnyFinding] | FindingsTable,
+    cardinality: Literal["exact", "hll"] = "exact",
+    precision: int = DEFAULT_PRECISION,
+) -> dict[str, Any]:
     """Analyze unique resources in findings.
 
     Args:
         findings: List of findings to analyze
+        cardinality: ``"hll"`` to estimate unique resources and accounts with
+            HyperLogLog sketches; tables are always counted exactly
+        precision: HyperLogLog precision when ``cardinality`` is ``"hll"``
 
     Returns:
         Dictionary with unique resource statistics
     """
+    if isinstance(findings, FindingsTable):
+        return _table_unique_resource_analysis(findings)
+    if cardinality != "exact":
+        accumulator = SummaryAccumulator.from_findings(findings, cardinality, precision)
+        return accumulator.unique_resource_analysis()
+
     unique_resources = set()
     unique_accounts = set()
     resource_types = defaultdict(int)
@@ -305,46 +383,672 @@ def unique_resource_analysis(findings: list[OCSFFinding | OCSFEnrichedFinding])
     }
 
 
+class SummaryAccumulator:
+    """Single-pass accumulator for every summary statistic.
+
+    Findings are fed in with :meth:`add` or :meth:`update`; the results of
+    ``generate_finding_summary``, ``by_provider``, ``by_framework``,
+    ``framework_score``, ``risk_score_distribution``, ``time_range_analysis`` and
+    ``unique_resource_analysis`` are then available without another pass.
+
+    Findings are consumed in batches: each batch updates a few counters keyed on
+    combinations of fields with C-level ``attrgetter`` and ``Counter.update``
+    calls, and the individual breakdowns are derived from those counters when
+    requested.
+
+    Unique resources and accounts are counted exactly by default. With
+    ``cardinality="hll"`` they are estimated with per-provider HyperLogLog
+    sketches instead, so memory and serialized size no longer grow with the
+    number of distinct resources.
+
+    Only counts are kept by default. With ``keep_findings=True`` the findings
+    of each framework are also kept, for :meth:`by_framework` results that list
+    them, as needed to render a report's findings section.
+    """
+
+    def __init__(
+        self,
+        cardinality: Literal["exact", "hll"] = "exact",
+        precision: int = DEFAULT_PRECISION,
+        keep_findings: bool = False,
+    ) -> None:
+        """Create an empty accumulator.
+
+        Args:
+            cardinality: How to count unique resources and accounts
+            precision: HyperLogLog precision when ``cardinality`` is ``"hll"``
+            keep_findings: Keep each framework's findings, which makes memory
+                grow with the number of findings
+
+        Raises:
+            ValueError: If the cardinality mode or precision is invalid
+        """
+        if cardinality not in ("exact", "hll"):
+            raise ValueError(f"Unknown cardinality mode: {cardinality}")
+        if cardinality == "hll":
+            HyperLogLog(precision)  # validates the precision
+
+        self.cardinality = cardinality
+        self.precision = precision
+        self.keep_findings = keep_findings
+        self.total = 0
+        self.start: datetime | None = None
+        self.end: datetime | None = None
+        # (provider, product, severity, status) -> findings
+        self._groups: Counter[tuple[str, str, str | None, str | None]] = Counter()
+        # (provider, resource_id) -> findings
+        self._resources: Counter[tuple[str, str | None]] = Counter()
+        # (provider, account_id) -> findings
+        self._accounts: Counter[tuple[str, str | None]] = Counter()
+        # HyperLogLog mode: provider -> sketch, and resource type -> findings
+        self._resource_sketches: dict[str, HyperLogLog] = {}
+        self._account_sketches: dict[str, HyperLogLog] = {}
+        self._resource_types: Counter[str] = Counter()
+        # risk score -> findings
+        self._risk_scores: Counter[float | None] = Counter()
+        self._frameworks: dict[str, dict[str, Any]] = {}
+        # Status counts per framework, counting each finding once
+        self._framework_status: dict[str, dict[str, int]] = defaultdict(
+            lambda: defaultdict(int)
+        )
+
+    @classmethod
+    def from_findings(
+        cls,
+        findings: Iterable[AnyFinding],
+        cardinality: Literal["exact", "hll"] = "exact",
+        precision: int = DEFAULT_PRECISION,
+        keep_findings: bool = False,
+    ) -> "SummaryAccumulator":
+        """Accumulate statistics for findings.
+
+        Args:
+            findings: Findings to analyze
+            cardinality: How to count unique resources and accounts
+            precision: HyperLogLog precision when ``cardinality`` is ``"hll"``
+            keep_findings: Keep each framework's findings
+
+        Returns:
+            Accumulator holding the statistics
+        """
+        accumulator = cls(cardinality, precision, keep_findings)
+        accumulator.update(findings)
+        return accumulator
+
+    def update(self, findings: Iterable[AnyFinding]) -> None:
+        """Add several findings.
+
+        Args:
+            findings: Findings to add
+        """
+        iterator = iter(findings)
+        while batch := list(islice(iterator, _ACCUMULATOR_BATCH_SIZE)):
+            self._add_batch(batch)
+
+    def observe(self, findings: Iterable[AnyFinding]) -> Iterator[AnyFinding]:
+        """Add findings as they pass through to another consumer.
+
+        Lets a stream of findings be summarized while it is written out, in
+        one pass and without holding more than a batch of findings.
+
+        Args:
+            findings: Findings to add
+
+        Yields:
+            The findings, unchanged and in order
+        """
+        iterator = iter(findings)
+        while batch := list(islice(iterator, _ACCUMULATOR_BATCH_SIZE)):
+            self._add_batch(batch)
+            yield from batch
+
+    def update_table(self, table: FindingsTable) -> None:
+        """Add the findings of a columnar table.
+
+        The counters are filled from the table's code columns, so no finding
+        records are created unless findings are kept.
+
+        Args:
+            table: Findings to add
+        """
+        if self.keep_findings:
+            self.update(table)
+            return
+        if not len(table):
+            return
+
+        columns = table.columns
+        provider = columns["provider"]
+        self.total += len(table)
+        self._groups.update(cross_counts(
+            provider, columns["product"], columns["severity"], columns["status"]
+        ))
+        if self.cardinality == "exact":
+            self._resources.update(cross_counts(provider, columns["resource_id"]))
+            self._accounts.update(cross_counts(provider, columns["account_id"]))
+        else:
+            self._add_table_sketches(table)
+
+        times = list(filter(None, table.time))
+        if times:
+            start, end = min(times), max(times)
+            if self.start is None or start < self.start:
+                self.start = start
+            if self.end is None or end > self.end:
+                self.end = end
+
+        risk_scores = table.risk_score_counts()
+        self._risk_scores.update(risk_scores)
+        # Missing scores are not counted by the table
+        missing = len(table) - sum(risk_scores.values())
+        if missing:
+            self._risk_scores[None] += missing
+
+        if len(table.framework_refs):
+            self._add_table_framework_refs(table)
+
+    def _add_table_sketches(self, table: FindingsTable) -> None:
+        """Add a table's resources and accounts to the HyperLogLog sketches."""
+        provider = table.columns["provider"]
+        for sketches, name in (
+            (self._resource_sketches, "resource_id"),
+            (self._account_sketches, "account_id"),
+        ):
+            for provider_name, value in cross_counts(provider, table.columns[name]):
+                if value:
+                    self._sketch(sketches, provider_name).add(value)
+
+        # Each distinct resource is classified once
+        for resource_id, count in table.columns["resource_id"].value_counts().items():
+            resource_type = _extract_resource_type(resource_id) if resource_id else None
+            if resource_type:
+                self._resource_types[resource_type] += count
+
+    def _add_table_framework_refs(self, table: FindingsTable) -> None:
+        """Add a table's framework references to the framework statistics."""
+        refs = table.framework_refs
+        severity = table.columns["severity"]
+        status = table.columns["status"]
+        severity_codes = [severity.codes[row] for row in table.framework_rows]
+        status_codes = [status.codes[row] for row in table.framework_rows]
+        frameworks = [ref.partition(":") for ref in refs.values]
+
+        for (ref_code, severity_code, status_code), count in Counter(
+            zip(refs.codes, severity_codes, status_codes, strict=True)
+        ).items():
+            framework, separator, control = frameworks[ref_code]
+            if not separator:
+                continue
+
+            data = self._frameworks.get(framework)
+            if data is None:
+                data = self._frameworks[framework] = {
+                    "total": 0,
+                    "by_severity": defaultdict(int),
+                    "by_status": defaultdict(int),
+                    "controls": set(),
+                    "findings": [],
+                }
+            data["total"] += count
+            data["by_severity"][severity.values[severity_code] or "unknown"] += count
+            data["by_status"][status.values[status_code] or "unknown"] += count
+            data["controls"].add(control)
+
+        # A finding counts once per framework however many of its references match
+        scored = {
+            (row, frameworks[ref_code][0], status_code)
+            for row, ref_code, status_code in zip(
+                table.framework_rows, refs.codes, status_codes, strict=True
+            )
+            if frameworks[ref_code][1]
+        }
+        for _, framework, status_code in scored:
+            self._framework_status[framework][status.values[status_code] or "unknown"] += 1
+
+    def add(self, finding: AnyFinding) -> None:
+        """Add one finding.
+
+        Args:
+            finding: Finding to add
+        """
+        self._add_batch([finding])
+
+    def _add_batch(self, batch: list[AnyFinding]) -> None:
+        """Add a batch of findings to every statistic."""
+        self.total += len(batch)
+        self._groups.update(map(_GROUP_KEY, batch))
+        if self.cardinality == "exact":
+            self._resources.update(map(_RESOURCE_KEY, batch))
+            self._accounts.update(map(_ACCOUNT_KEY, batch))
+        else:
+            self._add_sketches(batch)
+
+        times = list(filter(None, map(_TIME, batch)))
+        if times:
+            start, end = min(times), max(times)
+            if self.start is None or start < self.start:
+                self.start = start
+            if self.end is None or end > self.end:
+                self.end = end
+
+        self._risk_scores.update(_optional_attribute(batch, "risk_score"))
+        for finding, framework_refs in zip(
+            batch, _optional_attribute(batch, "framework_refs"), strict=True
+        ):
+            if framework_refs:
+                self._add_framework_refs(finding, framework_refs)
+
+    def _add_sketches(self, batch: list[AnyFinding]) -> None:
+        """Add a batch's resources and accounts to the HyperLogLog sketches."""
+        # Only distinct pairs need hashing
+        for provider, resource_id in set(map(_RESOURCE_KEY, batch)):
+            if resource_id:
+                self._sketch(self._resource_sketches, provider).add(resource_id)
+        for provider, account_id in set(map(_ACCOUNT_KEY, batch)):
+            if account_id:
+                self._sketch(self._account_sketches, provider).add(account_id)
+
+        resource_ids = filter(None, map(_RESOURCE_ID, batch))
+        self._resource_types.update(filter(None, map(_extract_resource_type, resource_ids)))
+
+    def _sketch(self, sketches: dict[str, HyperLogLog], provider: str) -> HyperLogLog:
+        """Get a provider's sketch, creating it if needed."""
+        sketch = sketches.get(provider)
+        if sketch is None:
+            sketch = sketches[provider] = HyperLogLog(self.precision)
+        return sketch
+
+    def _add_framework_refs(self, finding: AnyFinding, framework_refs: list[str]) -> None:
+        """Add a finding's framework references to the framework statistics."""
+        severity = finding.severity or "unknown"
+        status = finding.status or "unknown"
+        counted = set()
+        for ref in framework_refs:
+            framework, separator, control = ref.partition(":")
+            if not separator:
+                continue
+
+            data = self._frameworks.get(framework)
+            if data is None:
+                data = self._frameworks[framework] = {
+                    "total": 0,
+                    "by_severity": defaultdict(int),
+                    "by_status": defaultdict(int),
+                    "controls": set(),
+                    "findings": [],
+                }
+            data["total"] += 1
+            data["by_severity"][severity] += 1
+            data["by_status"][status] += 1
+            data["controls"].add(control)
+            if self.keep_findings:
+                data["findings"].append(finding)
+
+            if framework not in counted:
+                counted.add(framework)
+                self._framework_status[framework][status] += 1
+
+    def summary(self) -> FindingSummary:
+        """Build the finding summary.
+
+        Returns:
+            Same result as ``generate_finding_summary``
+        """
+        by_severity: Counter[str] = Counter()
+        by_status: Counter[str] = Counter()
+        by_provider: Counter[str] = Counter()
+        by_product: Counter[str] = Counter()
+        for (provider, product, severity, status), count in self._groups.items():
+            by_severity[severity or "unknown"] += count
+            by_status[status or "unknown"] += count
+            by_provider[provider] += count
+            by_product[product] += count
+
+        resource_analysis = self.unique_resource_analysis()
+        return FindingSummary(
+            total_findings=self.total,
+            by_severity=dict(by_severity),
+            by_status=dict(by_status),
+            by_provider=dict(by_provider),
+            by_product=dict(by_product),
+            frameworks_covered=sorted(self._frameworks),
+            scan_time_range=self.time_range(),
+            unique_resources=resource_analysis["unique_resources"],
+            unique_accounts=resource_analysis["unique_accounts"],
+            cardinality=self.cardinality,
+            cardinality_precision=self.precision if self.cardinality == "hll" else None,
+        )
+
+    def time_range(self) -> dict[str, datetime | None]:
+        """Get the time range of the findings.
+
+        Returns:
+            Same result as ``time_range_analysis``
+        """
+        return {"start": self.start, "end": self.end}
+
+    def unique_resource_analysis(self) -> dict[str, Any]:
+        """Get unique resource statistics.
+
+        Returns:
+            Same result as ``unique_resource_analysis``
+        """
+        if self.cardinality == "hll":
+            unique_resources = _union(self._resource_sketches.values(), self.precision).count()
+            unique_accounts = _union(self._account_sketches.values(), self.precision).count()
+            return {
+                "unique_resources": unique_resources,
+                "unique_accounts": unique_accounts,
+                "resource_types": dict(self._resource_types),
+                "resources_per_account": unique_resources / max(unique_accounts, 1),
+            }
+
+        resource_counts: Counter[str] = Counter()
+        for (_, resource_id), count in self._resources.items():
+            if resource_id:
+                resource_counts[resource_id] += count
+        accounts = {account_id for _, account_id in self._accounts if account_id}
+
+        # Each distinct resource is classified once
+        resource_types: Counter[str] = Counter()
+        for resource_id, count in resource_counts.items():
+            resource_type = _extract_resource_type(resource_id)
+            if resource_type:
+                resource_types[resource_type] += count
+
+        return {
+            "unique_resources": len(resource_counts),
+            "unique_accounts": len(accounts),
+            "resource_types": dict(resource_types),
+            "resources_per_account": len(resource_counts) / max(len(accounts), 1),
+        }
+
+    def risk_score_distribution(self) -> dict[str, int]:
+        """Get the distribution of risk scores.
+
+        Returns:
+            Same result as ``risk_score_distribution``
+        """
+        score_ranges = dict.fromkeys(_RISK_SCORE_RANGES, 0)
+        for score, count in self._risk_scores.items():
+            score_ranges[_risk_score_range(score)] += count
+        return score_ranges
+
+    def by_provider(self) -> dict[str, dict[str, Any]]:
+        """Get the per-provider breakdown.
+
+        Returns:
+            Same result as ``by_provider``
+        """
+        result: dict[str, dict[str, Any]] = {}
+        for (provider, product, severity, status), count in self._groups.items():
+            data = result.get(provider)
+            if data is None:
+                data = result[provider] = {
+                    "total": 0,
+                    "by_severity": Counter(),
+                    "by_status": Counter(),
+                    "by_product": Counter(),
+                    "unique_resources": 0,
+                    "unique_accounts": 0,
+                }
+            data["total"] += count
+            data["by_severity"][severity or "unknown"] += count
+            data["by_status"][status or "unknown"] += count
+            data["by_product"][product] += count
+
+        for provider, resource_id in self._resources:
+            if resource_id:
+                result[provider]["unique_resources"] += 1
+        for provider, account_id in self._accounts:
+            if account_id:
+                result[provider]["unique_accounts"] += 1
+        for provider, sketch in self._resource_sketches.items():
+            result[provider]["unique_resources"] = sketch.count()
+        for provider, sketch in self._account_sketches.items():
+            result[provider]["unique_accounts"] = sketch.count()
+
+        for data in result.values():
+            for key in ("by_severity", "by_status", "by_product"):
+                data[key] = dict(data[key])
+
+        return result
+
+    def by_framework(self) -> dict[str, dict[str, Any]]:
+        """Get the per-framework breakdown.
+
+        Returns:
+            Same result as ``by_framework``, with empty ``findings`` lists
+            unless findings are kept
+        """
+        return {
+            framework: {
+                "total": data["total"],
+                "by_severity": dict(data["by_severity"]),
+                "by_status": dict(data["by_status"]),
+                "controls_count": len(data["controls"]),
+                "controls": sorted(data["controls"]),
+                "findings": data["findings"],
+            }
+            for framework, data in self._frameworks.items()
+        }
+
+    def framework_score(self, framework: str) -> dict[str, int]:
+        """Get the compliance score of a framework.
+
+        Args:
+            framework: Framework identifier, the part of a reference before ":"
+
+        Returns:
+            Same result as ``framework_score``
+        """
+        status_counter = self._framework_status.get(framework, {})
+        return {
+            "pass": status_counter.get("pass", 0),
+            "fail": status_counter.get("fail", 0),
+            "warn": status_counter.get("informational", 0) + status_counter.get("not_applicable", 0),
+            "unknown": status_counter.get("unknown", 0),
+            "total": sum(status_counter.values()),
+        }
+
+    def merge(self, other: "SummaryAccumulator") -> "SummaryAccumulator":
+        """Merge another accumulator's statistics into this one.
+
+        Merging is associative and commutative, so partial summaries of shards
+        or runs can be combined in any grouping and order. Findings of the
+        other accumulator are only merged if both keep findings.
+
+        Args:
+            other: Accumulator to merge in; it is not modified
+
+        Returns:
+            This accumulator
+
+        Raises:
+            ValueError: If the accumulators count distinct values differently
+        """
+        if (other.cardinality, other.precision) != (self.cardinality, self.precision) and (
+            self.cardinality == "hll" or other.cardinality == "hll"
+        ):
+            raise ValueError(
+                f"Cannot merge {other.cardinality} summary (precision {other.precision}) "
+                f"into {self.cardinality} summary (precision {self.precision})"
+            )
+
+        self.total += other.total
+        if other.start is not None and (self.start is None or other.start < self.start):
+            self.start = other.start
+        if other.end is not None and (self.end is None or other.end > self.end):
+            self.end = other.end
+
+        self._groups.update(other._groups)
+        self._resources.update(other._resources)
+        self._accounts.update(other._accounts)
+        self._risk_scores.update(other._risk_scores)
+        self._resource_types.update(other._resource_types)
+        for sketches, other_sketches in (
+            (self._resource_sketches, other._resource_sketches),
+            (self._account_sketches, other._account_sketches),
+        ):
+            for provider, sketch in other_sketches.items():
+                self._sketch(sketches, provider).merge(sketch)
+
+        for framework, other_data in other._frameworks.items():
+            data = self._frameworks.get(framework)
+            if data is None:
+                data = self._frameworks[framework] = {
+                    "total": 0,
+                    "by_severity": defaultdict(int),
+                    "by_status": defaultdict(int),
+                    "controls": set(),
+                    "findings": [],
+                }
+            data["total"] += other_data["total"]
+            for key in ("by_severity", "by_status"):
+                for value, count in other_data[key].items():
+                    data[key][value] += count
+            data["controls"].update(other_data["controls"])
+            if self.keep_findings:
+                data["findings"].extend(other_data["findings"])
+
+        for framework, statuses in other._framework_status.items():
+            for status, count in statuses.items():
+                self._framework_status[framework][status] += count
+
+        return self
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the statistics to a JSON-compatible dictionary.
+
+        The per-framework finding lists are not serialized; a deserialized
+        accumulator reports empty ``findings`` in :meth:`by_framework`.
+
+        In exact cardinality mode every (provider, resource_id) and
+        (provider, account_id) pair is written out, so the output grows with
+        the number of resources. HyperLogLog mode keeps it to a fixed size
+        per provider, which suits partial summaries of large estates.
+
+        Returns:
+            Dictionary accepted by :meth:`from_dict`
+        """
+        return {
+            "version": PARTIAL_SUMMARY_VERSION,
+            "cardinality": self.cardinality,
+            "precision": self.precision,
+            "total": self.total,
+            "start": self.start.isoformat() if self.start else None,
+            "end": self.end.isoformat() if self.end else None,
+            "groups": [[*key, count] for key, count in self._groups.items()],
+            "resources": [[*key, count] for key, count in self._resources.items()],
+            "accounts": [[*key, count] for key, count in self._accounts.items()],
+            "risk_scores": [[score, count] for score, count in self._risk_scores.items()],
+            "resource_sketches": {
+                provider: sketch.to_dict() for provider, sketch in self._resource_sketches.items()
+            },
+            "account_sketches": {
+                provider: sketch.to_dict() for provider, sketch in self._account_sketches.items()
+            },
+            "resource_types": dict(self._resource_types),
+            "frameworks": {
+                framework: {
+                    "total": data["total"],
+                    "by_severity": dict(data["by_severity"]),
+                    "by_status": dict(data["by_status"]),
+                    "controls": sorted(data["controls"]),
+                    "scored_status": dict(self._framework_status[framework]),
+                }
+                for framework, data in self._frameworks.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "SummaryAccumulator":
+        """Deserialize statistics written by :meth:`to_dict`.
+
+        Args:
+            data: Serialized accumulator
+
+        Returns:
+            Accumulator holding the statistics
+
+        Raises:
+            ValueError: If the data has an unsupported version
+        """
+        version = data.get("version")
+        if version != PARTIAL_SUMMARY_VERSION:
+            raise ValueError(f"Unsupported partial summary version: {version}")
+
+        accumulator = cls(
+            data.get("cardinality", "exact"), data.get("precision", DEFAULT_PRECISION)
+        )
+        accumulator.total = data["total"]
+        accumulator.start = datetime.fromisoformat(data["start"]) if data["start"] else None
+        accumulator.end = datetime.fromisoformat(data["end"]) if data["end"] else None
+        accumulator._groups.update({tuple(row[:-1]): row[-1] for row in data["groups"]})
+        accumulator._resources.update({tuple(row[:-1]): row[-1] for row in data["resources"]})
+        accumulator._accounts.update({tuple(row[:-1]): row[-1] for row in data["accounts"]})
+        accumulator._risk_scores.update(dict(data["risk_scores"]))
+        for key, sketches in (
+            ("resource_sketches", accumulator._resource_sketches),
+            ("account_sketches", accumulator._account_sketches),
+        ):
+            for provider, sketch in data.get(key, {}).items():
+                sketches[provider] = HyperLogLog.from_dict(sketch)
+        accumulator._resource_types.update(data.get("resource_types", {}))
+
+        for framework, framework_data in data["frameworks"].items():
+            accumulator._frameworks[framework] = {
+                "total": framework_data["total"],
+                "by_severity": defaultdict(int, framework_data["by_severity"]),
+                "by_status": defaultdict(int, framework_data["by_status"]),
+                "controls": set(framework_data["controls"]),
+                "findings": [],
+            }
+            accumulator._framework_status[framework].update(framework_data["scored_status"])
+
+        return accumulator
+
+
+def _union(sketches: Iterable[HyperLogLog], precision: int) -> HyperLogLog:
+    """Merge sketches into a new sketch."""
+    union = HyperLogLog(precision)
+    for sketch in sketches:
+        union.merge(sketch)
+    return union
+
+
+def _optional_attribute(batch: list[AnyFinding], name: str) -> list[Any]:
+    """Get an attribute that plain ``OCSFFinding`` instances may not have."""
+    try:
+        return list(map(attrgetter(name), batch))
+    except AttributeError:
+        return [getattr(finding, name, None) for finding in batch]
+
+
 def generate_finding_summary(
-    findings: list[OCSFFinding | OCSFEnrichedFinding]
+    findings: list[AnyFinding] | FindingsTable | SummaryAccumulator,
+    cardinality: Literal["exact", "hll"] = "exact",
+    precision: int = DEFAULT_PRECISION,
 ) -> FindingSummary:
     """Generate a comprehensive summary of findings.
 
     Args:
-        findings: List of findings to summarize
+        findings: List of findings to summarize, or an accumulator that has
+            already consumed them
+        cardinality: ``"hll"`` to estimate unique resources and accounts with
+            HyperLogLog sketches instead of counting them exactly; ignored for
+            tables and accumulators, which use their own mode
+        precision: HyperLogLog precision when ``cardinality`` is ``"hll"``
 
     Returns:
         FindingSummary object with comprehensive statistics
     """
-    # Get framework coverage if we have enriched findings
-    frameworks_covered = []
-    if findings and hasattr(findings[0], 'framework_refs'):
-        framework_refs = set()
-        for finding in findings:
-            if hasattr(finding, 'framework_refs') and finding.framework_refs:
-                for ref in finding.framework_refs:
-                    if ":" in ref:
-                        framework = ref.split(":", 1)[0]
-                        framework_refs.add(framework)
-        frameworks_covered = sorted(framework_refs)
-
-    # Analyze time range
-    time_range = time_range_analysis(findings)
-
-    # Analyze unique resources
-    resource_analysis = unique_resource_analysis(findings)
+    if isinstance(findings, FindingsTable):
+        return _table_finding_summary(findings)
+    if isinstance(findings, SummaryAccumulator):
+        return findings.summary()
 
-    return FindingSummary(
-        total_findings=len(findings),
-        by_severity=severity_counts(findings),
-        by_status=status_counts(findings),
-        by_provider=provider_counts(findings),
-        by_product=product_counts(findings),
-        frameworks_covered=frameworks_covered,
-        scan_time_range=time_range,
-        unique_resources=resource_analysis["unique_resources"],
-        unique_accounts=resource_analysis["unique_accounts"],
-    )
+    return SummaryAccumulator.from_findings(findings, cardinality, precision).summary()
 
 
 def _extract_resource_type(resource_id: str) -> str | None:
@@ -382,3 +1086,156 @@ def _extract_resource_type(resource_id: str) -> str | None:
                 return provider
 
     return None
+
+
+def _unknown_counts(counts: dict[Any, int]) -> dict[str, int]:
+    """Merge the counts of missing values under ``"unknown"``."""
+    result: dict[str, int] = defaultdict(int)
+    for value, count in counts.items():
+        result[value or "unknown"] += count
+    return dict(result)
+
+
+def _table_severity_counts(table: FindingsTable) -> dict[str, int]:
+    """Vectorized ``severity_counts``."""
+    return _unknown_counts(table.column("severity").value_counts())
+
+
+def _table_status_counts(table: FindingsTable) -> dict[str, int]:
+    """Vectorized ``status_counts``."""
+    return _unknown_counts(table.column("status").value_counts())
+
+
+def _table_framework_score(table: FindingsTable, framework_prefix: str) -> dict[str, int]:
+    """Vectorized ``framework_score``."""
+    prefix = framework_prefix + ":"
+    groups = table.ref_groups(lambda ref: True if ref.startswith(prefix) else None)
+    # A finding counts once however many of its references match
+    rows = array("I", sorted(set(groups.get(True, ()))))
+    status_counter = _unknown_counts(table.column("status").value_counts(rows))
+
+    return {
+        "pass": status_counter.get("pass", 0),
+        "fail": status_counter.get("fail", 0),
+        "warn": status_counter.get("informational", 0) + status_counter.get("not_applicable", 0),
+        "unknown": status_counter.get("unknown", 0),
+        "total": len(rows),
+    }
+
+
+def _table_by_provider(table: FindingsTable) -> dict[str, dict[str, Any]]:
+    """Vectorized ``by_provider``."""
+    provider = table.column("provider")
+    result: dict[str, dict[str, Any]] = {
+        name: {
+            "total": total,
+            "by_severity": defaultdict(int),
+            "by_status": defaultdict(int),
+            "by_product": defaultdict(int),
+            "unique_resources": 0,
+            "unique_accounts": 0,
+        }
+        for name, total in provider.value_counts().items()
+    }
+
+    for (name, severity), count in cross_counts(provider, table.column("severity")).items():
+        result[name]["by_severity"][severity or "unknown"] += count
+    for (name, status), count in cross_counts(provider, table.column("status")).items():
+        result[name]["by_status"][status or "unknown"] += count
+    for (name, product), count in cross_counts(provider, table.column("product")).items():
+        result[name]["by_product"][product] += count
+
+    for column, key in (("resource_id", "unique_resources"), ("account_id", "unique_accounts")):
+        for name, value in cross_counts(provider, table.column(column)):
+            if value:
+                result[name][key] += 1
+
+    for data in result.values():
+        for key in ("by_severity", "by_status", "by_product"):
+            data[key] = dict(data[key])
+
+    return result
+
+
+def _table_by_framework(table: FindingsTable) -> dict[str, dict[str, Any]]:
+    """Vectorized ``by_framework``."""
+    groups = table.ref_groups(lambda ref: ref.split(":", 1)[0] if ":" in ref else None)
+
+    result = {}
+    for framework, rows in groups.items():
+        controls = {
+            ref.split(":", 1)[1]
+            for ref in table.framework_refs.values
+            if ref.startswith(framework + ":")
+        }
+        result[framework] = {
+            "total": len(rows),
+            "by_severity": _unknown_counts(table.column("severity").value_counts(rows)),
+            "by_status": _unknown_counts(table.column("status").value_counts(rows)),
+            "controls_count": len(controls),
+            "controls": sorted(controls),
+            "findings": table.records(rows),
+        }
+
+    return result
+
+
+def _table_risk_score_distribution(table: FindingsTable) -> dict[str, int]:
+    """Vectorized ``risk_score_distribution``."""
+    score_ranges = dict.fromkeys(_RISK_SCORE_RANGES, 0)
+    for score, count in table.risk_score_counts().items():
+        score_ranges[_risk_score_range(score)] += count
+
+    # Missing and non-finite scores are not counted by the table
+    score_ranges["unknown"] += len(table) - sum(score_ranges.values())
+    return score_ranges
+
+
+def _table_time_range_analysis(table: FindingsTable) -> dict[str, datetime | None]:
+    """Vectorized ``time_range_analysis``."""
+    if not table.time:
+        return {"start": None, "end": None}
+
+    return {"start": min(table.time), "end": max(table.time)}
+
+
+def _table_unique_resource_analysis(table: FindingsTable) -> dict[str, Any]:
+    """Vectorized ``unique_resource_analysis``."""
+    resource_types: dict[str, int] = defaultdict(int)
+    unique_resources = 0
+    for resource_id, count in table.column("resource_id").value_counts().items():
+        if resource_id:
+            unique_resources += 1
+            # Each distinct resource is classified once
+            resource_type = _extract_resource_type(resource_id)
+            if resource_type:
+                resource_types[resource_type] += count
+
+    unique_accounts = sum(1 for account in table.column("account_id").values if account)
+
+    return {
+        "unique_resources": unique_resources,
+        "unique_accounts": unique_accounts,
+        "resource_types": dict(resource_types),
+        "resources_per_account": unique_resources / max(unique_accounts, 1),
+    }
+
+
+def _table_finding_summary(table: FindingsTable) -> FindingSummary:
+    """Vectorized ``generate_finding_summary``."""
+    frameworks_covered = sorted({
+        ref.split(":", 1)[0] for ref in table.framework_refs.values if ":" in ref
+    })
+    resource_analysis = _table_unique_resource_analysis(table)
+
+    return FindingSummary(
+        total_findings=len(table),
+        by_severity=_table_severity_counts(table),
+        by_status=_table_status_counts(table),
+        by_provider=table.column("provider").value_counts(),
+        by_product=table.column("product").value_counts(),
+        frameworks_covered=frameworks_covered,
+        scan_time_range=_table_time_range_analysis(table),
+        unique_resources=resource_analysis["unique_resources"],
+        unique_accounts=resource_analysis["unique_accounts"],
+    )
@@ -0,0 +1,432 @@
+"""Columnar storage of findings for fast aggregation.
+
+``FindingsTable`` stores the low-cardinality finding fields as dictionary-encoded
+columns: each distinct value is stored once and every row holds a small integer
+code. Counting and grouping then operate on the code arrays instead of on
+Python objects, using NumPy when it is installed and ``collections.Counter``
+over ``array.array`` buffers otherwise. Free-text fields and ``raw`` are kept in
+plain lists off to the side and only touched when rows are materialized.
+"""
+
+import math
+from array import array
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from datetime import datetime
+from itertools import islice, repeat
+from typing import Any
+
+from cs_kit.normalizer.records import AnyFinding, FindingRecord
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None  # type: ignore[assignment]
+
+# Finding dictionaries appended per batch by ``FindingsTable.from_dicts``
+_DICT_BATCH_SIZE = 10000
+
+# Fields stored as dictionary-encoded columns
+CATEGORICAL_COLUMNS = (
+    "severity",
+    "status",
+    "provider",
+    "product",
+    "region",
+    "account_id",
+    "check_id",
+    "resource_id",
+)
+
+
+class _CodeLookup(dict[Any, int]):
+    """Mapping of value to code that gives new values the next code."""
+
+    def __init__(self, values: list[Any]) -> None:
+        super().__init__()
+        self.values = values
+
+    def __missing__(self, value: Any) -> int:
+        code = self[value] = len(self.values)
+        self.values.append(value)
+        return code
+
+
+class DictColumn:
+    """Dictionary-encoded column of hashable values.
+
+    ``values`` holds each distinct value once, in order of first appearance, and
+    ``codes`` holds one index into ``values`` per row.
+    """
+
+    __slots__ = ("values", "codes", "_lookup")
+
+    def __init__(self) -> None:
+        self.values: list[Any] = []
+        self.codes = array("I")
+        self._lookup = _CodeLookup(self.values)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, row: int) -> Any:
+        return self.values[self.codes[row]]
+
+    def append(self, value: Any) -> None:
+        """Append a value, adding it to the dictionary if it is new.
+
+        Args:
+            value: Value to append
+        """
+        self.codes.append(self._lookup[value])
+
+    def extend(self, values: Iterable[Any]) -> None:
+        """Append several values.
+
+        Args:
+            values: Values to append
+        """
+        # Known values are looked up without leaving C
+        self.codes.extend(map(self._lookup.__getitem__, values))
+
+    def code_counts(self, rows: Sequence[int] | None = None) -> list[int]:
+        """Count rows per dictionary code.
+
+        Args:
+            rows: Row indices to count, or None for all rows
+
+        Returns:
+            Count for each index of ``values``
+        """
+        if np is not None:
+            codes = np.frombuffer(self.codes, dtype=np.uint32)
+            if rows is not None:
+                codes = codes[np.frombuffer(rows, dtype=np.uint32)]
+            return np.bincount(codes, minlength=len(self.values)).tolist()
+
+        codes_iter = self.codes if rows is None else map(self.codes.__getitem__, rows)
+        counts = [0] * len(self.values)
+        for code, count in Counter(codes_iter).items():
+            counts[code] = count
+        return counts
+
+    def value_counts(self, rows: Sequence[int] | None = None) -> dict[Any, int]:
+        """Count rows per distinct value.
+
+        Args:
+            rows: Row indices to count, or None for all rows
+
+        Returns:
+            Mapping of value to row count, omitting values with no rows
+        """
+        return {
+            self.values[code]: count
+            for code, count in enumerate(self.code_counts(rows))
+            if count
+        }
+
+
+def cross_counts(*columns: DictColumn) -> dict[tuple[Any, ...], int]:
+    """Count rows per combination of values of columns of the same table.
+
+    Args:
+        columns: Columns to combine
+
+    Returns:
+        Mapping of the tuple of column values to row count
+    """
+    if np is not None:
+        # Mixed-radix code of each row's combination of values
+        combined = np.zeros(len(columns[0]), dtype=np.int64)
+        widths = []
+        for column in columns:
+            width = max(len(column.values), 1)
+            widths.append(width)
+            combined = combined * width + np.frombuffer(column.codes, dtype=np.uint32)
+        keys, counts = np.unique(combined, return_counts=True)
+
+        result = {}
+        for key, count in zip(keys.tolist(), counts.tolist(), strict=True):
+            values = []
+            for column, width in zip(reversed(columns), reversed(widths), strict=True):
+                key, code = divmod(key, width)
+                values.append(column.values[code])
+            result[tuple(reversed(values))] = count
+        return result
+
+    return {
+        tuple(column.values[code] for column, code in zip(columns, codes, strict=True)): count
+        for codes, count in Counter(
+            zip(*(column.codes for column in columns), strict=True)
+        ).items()
+    }
+
+
+class FindingsTable:
+    """Columnar container of findings.
+
+    Rows are appended from finding models or records and can be materialized
+    back into ``FindingRecord`` instances with :meth:`record`, :meth:`records`
+    or by iterating.
+    """
+
+    def __init__(self) -> None:
+        self.columns: dict[str, DictColumn] = {name: DictColumn() for name in CATEGORICAL_COLUMNS}
+        self.time: list[datetime] = []
+        self.risk_score = array("d")
+        # Framework references, flattened: ``framework_refs`` holds one entry
+        # per (row, ref) pair, ``framework_rows`` the row of each entry and
+        # ``ref_offsets`` the first entry of each row
+        self.framework_refs = DictColumn()
+        self.framework_rows = array("I")
+        self.ref_offsets = array("I", [0])
+        # Fields that are never aggregated
+        self.class_uid: list[int | None] = []
+        self.class_name: list[str | None] = []
+        self.title: list[str | None] = []
+        self.description: list[str | None] = []
+        self.remediation: list[str | None] = []
+        self.raw: list[dict[str, Any]] = []
+
+    @classmethod
+    def from_findings(cls, findings: Iterable[AnyFinding]) -> "FindingsTable":
+        """Build a table from findings.
+
+        Args:
+            findings: Finding models or records
+
+        Returns:
+            Table holding every finding
+        """
+        table = cls()
+        table.extend(findings)
+        return table
+
+    def __len__(self) -> int:
+        return len(self.time)
+
+    def __iter__(self) -> Iterator[FindingRecord]:
+        return iter(self.records())
+
+    def column(self, name: str) -> DictColumn:
+        """Get a dictionary-encoded column.
+
+        Args:
+            name: Column name, one of ``CATEGORICAL_COLUMNS``
+
+        Returns:
+            The column
+
+        Raises:
+            KeyError: If the column does not exist
+        """
+        return self.columns[name]
+
+    @classmethod
+    def from_dicts(cls, findings: Iterable[dict[str, Any]]) -> "FindingsTable":
+        """Build a table from finding dictionaries, without creating records.
+
+        Args:
+            findings: Finding dictionaries, e.g. read from a normalized
+                findings artifact; ``time`` may be an ISO 8601 string
+
+        Returns:
+            Table holding every finding
+        """
+        table = cls()
+        iterator = iter(findings)
+        while batch := list(islice(iterator, _DICT_BATCH_SIZE)):
+            table._extend_dicts(batch)
+        return table
+
+    def append(self, finding: AnyFinding) -> None:
+        """Append one finding.
+
+        Args:
+            finding: Finding model or record
+        """
+        self._append_row(lambda name: getattr(finding, name, None))
+
+    def extend(self, findings: Iterable[AnyFinding]) -> None:
+        """Append several findings.
+
+        Args:
+            findings: Finding models or records
+        """
+        for finding in findings:
+            self.append(finding)
+
+    def _extend_dicts(self, batch: list[dict[str, Any]]) -> None:
+        """Append a batch of finding dictionaries one column at a time."""
+        for name, column in self.columns.items():
+            column.extend(map(dict.get, batch, repeat(name)))
+
+        self.time.extend([
+            datetime.fromisoformat(time) if isinstance(time, str) else time
+            for time in (data.get("time") for data in batch)
+        ])
+        self.risk_score.extend([
+            math.nan if score is None else score
+            for score in (data.get("risk_score") for data in batch)
+        ])
+
+        for row, data in enumerate(batch, len(self.ref_offsets) - 1):
+            for ref in data.get("framework_refs") or ():
+                self.framework_refs.append(ref)
+                self.framework_rows.append(row)
+            self.ref_offsets.append(len(self.framework_rows))
+
+        for name in ("class_uid", "class_name", "title", "description", "remediation"):
+            getattr(self, name).extend(map(dict.get, batch, repeat(name)))
+        self.raw.extend([data.get("raw") or {} for data in batch])
+
+    def _append_row(self, get: Callable[[str], Any]) -> None:
+        """Append one row, reading each field with ``get``."""
+        row = len(self.time)
+        for name, column in self.columns.items():
+            column.append(get(name))
+
+        time = get("time")
+        self.time.append(datetime.fromisoformat(time) if isinstance(time, str) else time)
+        risk_score = get("risk_score")
+        self.risk_score.append(math.nan if risk_score is None else risk_score)
+
+        for ref in get("framework_refs") or ():
+            self.framework_refs.append(ref)
+            self.framework_rows.append(row)
+        self.ref_offsets.append(len(self.framework_rows))
+
+        self.class_uid.append(get("class_uid"))
+        self.class_name.append(get("class_name"))
+        self.title.append(get("title"))
+        self.description.append(get("description"))
+        self.remediation.append(get("remediation"))
+        self.raw.append(get("raw") or {})
+
+    def risk_score_counts(self) -> dict[float, int]:
+        """Count rows per finite risk score.
+
+        Returns:
+            Mapping of risk score to row count; missing scores are omitted
+        """
+        if np is not None:
+            scores = np.frombuffer(self.risk_score, dtype=np.float64)
+            values, counts = np.unique(scores[np.isfinite(scores)], return_counts=True)
+            return dict(zip(values.tolist(), counts.tolist(), strict=True))
+
+        return dict(Counter(filter(math.isfinite, self.risk_score)))
+
+    def ref_groups(self, key: Callable[[str], Any]) -> dict[Any, array]:
+        """Group framework reference entries by a key of the reference.
+
+        ``key`` is called once per distinct reference; entries whose key is None
+        are skipped. A row with several matching references appears once per
+        reference.
+
+        Args:
+            key: Function mapping a reference string to its group key or None
+
+        Returns:
+            Mapping of group key to the rows of its entries, in entry order
+        """
+        keys = [key(ref) for ref in self.framework_refs.values]
+        groups: dict[Any, array] = {}
+
+        if np is not None:
+            codes = np.frombuffer(self.framework_refs.codes, dtype=np.uint32)
+            rows = np.frombuffer(self.framework_rows, dtype=np.uint32)
+            for group in dict.fromkeys(k for k in keys if k is not None):
+                matching = [code for code, k in enumerate(keys) if k == group]
+                selected = rows[np.isin(codes, matching)]
+                groups[group] = array("I", selected.tobytes())
+            return groups
+
+        for code, row in zip(self.framework_refs.codes, self.framework_rows, strict=True):
+            group = keys[code]
+            if group is not None:
+                groups.setdefault(group, array("I")).append(row)
+        return groups
+
+    def record(self, row: int) -> FindingRecord:
+        """Materialize one row.
+
+        Args:
+            row: Row index
+
+        Returns:
+            Finding record for the row
+        """
+        columns = self.columns
+        risk_score = self.risk_score[row]
+        refs = self.framework_refs
+        return FindingRecord(
+            time=self.time[row],
+            provider=columns["provider"][row],
+            product=columns["product"][row],
+            class_uid=self.class_uid[row],
+            class_name=self.class_name[row],
+            severity=columns["severity"][row],
+            status=columns["status"][row],
+            resource_id=columns["resource_id"][row],
+            account_id=columns["account_id"][row],
+            region=columns["region"][row],
+            check_id=columns["check_id"][row],
+            title=self.title[row],
+            description=self.description[row],
+            remediation=self.remediation[row],
+            raw=self.raw[row],
+            framework_refs=[
+                refs[i] for i in range(self.ref_offsets[row], self.ref_offsets[row + 1])
+            ],
+            risk_score=None if math.isnan(risk_score) else risk_score,
+        )
+
+    def records(self, rows: Sequence[int] | None = None) -> list[FindingRecord]:
+        """Materialize several rows, gathering one column at a time.
+
+        Args:
+            rows: Row indices, or None for all rows
+
+        Returns:
+            Finding records in the order of ``rows``
+        """
+        if rows is None:
+            rows = range(len(self))
+
+        def take(values: Sequence[Any]) -> list[Any]:
+            return [values[row] for row in rows]
+
+        def decode(name: str) -> list[Any]:
+            column = self.columns[name]
+            return [column.values[code] for code in take(column.codes)]
+
+        ref_values = self.framework_refs.values
+        ref_codes = self.framework_refs.codes
+        offsets = self.ref_offsets
+        framework_refs = [
+            [ref_values[code] for code in ref_codes[offsets[row]:offsets[row + 1]]]
+            for row in rows
+        ]
+        risk_scores = [None if math.isnan(score) else score for score in take(self.risk_score)]
+
+        # Positional arguments follow the FindingRecord field order
+        return list(map(
+            FindingRecord,
+            take(self.time),
+            decode("provider"),
+            decode("product"),
+            take(self.class_uid),
+            take(self.class_name),
+            decode("severity"),
+            decode("status"),
+            decode("resource_id"),
+            decode("account_id"),
+            decode("region"),
+            decode("check_id"),
+            take(self.title),
+            take(self.description),
+            take(self.remediation),
+            take(self.raw),
+            framework_refs,
+            risk_scores,
+        ))
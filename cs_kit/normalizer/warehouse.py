@@ -0,0 +1,280 @@
+"""Local findings warehouse across scan runs.
+
+Every run's artifacts live in their own directory, so questions spanning
+runs, such as the number of open critical findings per account over the last
+90 days, would otherwise re-read every run. Runs are instead ingested once
+into a SQLite database holding each run's summary and normalized findings,
+indexed by finding identity, run, account and check, and historical queries
+read only the rows they need.
+
+Ingesting a run again replaces its rows, so ingestion can be repeated after
+a run's artifacts are rewritten.
+"""
+
+import sqlite3
+from collections.abc import Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from cs_kit.normalizer import codec
+from cs_kit.normalizer.artifacts import iter_findings, normalized_file
+from cs_kit.normalizer.dedupe import identity_digest
+
+# Name of the warehouse database in an artifacts directory
+WAREHOUSE_FILE = "warehouse.db"
+
+# Finding columns trend counts can be grouped by
+GROUP_COLUMNS = ("account_id", "region", "check_id", "severity", "status", "provider")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    provider TEXT,
+    scanned_at TEXT NOT NULL,
+    ingested_at TEXT NOT NULL,
+    total_findings INTEGER NOT NULL,
+    summary TEXT
+);
+CREATE TABLE IF NOT EXISTS findings (
+    run_id TEXT NOT NULL,
+    identity BLOB NOT NULL,
+    time TEXT NOT NULL,
+    provider TEXT NOT NULL,
+    product TEXT NOT NULL,
+    severity TEXT,
+    status TEXT,
+    account_id TEXT,
+    region TEXT,
+    check_id TEXT,
+    resource_id TEXT,
+    title TEXT,
+    risk_score REAL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (run_id, identity)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS runs_scanned_at ON runs (scanned_at);
+CREATE INDEX IF NOT EXISTS findings_identity ON findings (identity, run_id);
+CREATE INDEX IF NOT EXISTS findings_account_id ON findings (account_id, run_id);
+CREATE INDEX IF NOT EXISTS findings_check_id ON findings (check_id, run_id);
+"""
+
+# Findings inserted per executemany call while ingesting
+_BATCH_SIZE = 5000
+
+
+class Warehouse:
+    """SQLite warehouse of the findings of many runs."""
+
+    def __init__(self, path: Path) -> None:
+        """Open a warehouse, creating it if it doesn't exist.
+
+        Args:
+            path: Warehouse database file
+        """
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(path)
+        try:
+            # WAL lets queries read while a run is being ingested
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+        finally:
+            conn.close()
+
+    @classmethod
+    def for_artifacts(cls, artifacts_dir: Path) -> "Warehouse":
+        """Open the warehouse of an artifacts directory.
+
+        Args:
+            artifacts_dir: Directory holding scan runs
+
+        Returns:
+            The warehouse in ``<artifacts_dir>/warehouse.db``
+        """
+        return cls(artifacts_dir / WAREHOUSE_FILE)
+
+    @contextmanager
+    def _connect(self, read_only: bool = False) -> Iterator[sqlite3.Connection]:
+        """Open a connection, read-only for queries."""
+        if read_only:
+            conn = sqlite3.connect(f"{self.path.as_uri()}?mode=ro", uri=True)
+        else:
+            conn = sqlite3.connect(self.path)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def ingest_run(self, run_dir: Path, run_id: str | None = None) -> int:
+        """Insert or replace a run's summary and findings.
+
+        The run's findings are streamed in one transaction, so queries see
+        either all or none of them. Findings repeated within a run are
+        stored once, keeping the last.
+
+        Args:
+            run_dir: Run artifacts directory
+            run_id: ID to store the run under; defaults to the directory name
+
+        Returns:
+            Number of findings ingested
+
+        Raises:
+            FileNotFoundError: If the run has no normalized findings
+        """
+        findings_file = normalized_file(run_dir)
+        run_id = run_id or run_dir.name
+        summary_file = run_dir / "summary.json"
+        summary = codec.load(summary_file) if summary_file.exists() else None
+
+        count = 0
+        provider = None
+        with self._connect() as conn, conn:
+            conn.execute("DELETE FROM findings WHERE run_id = ?", (run_id,))
+            rows = []
+            for finding in iter_findings(findings_file):
+                provider = provider or finding.provider
+                rows.append((
+                    run_id,
+                    identity_digest(finding),
+                    _timestamp(finding.time),
+                    finding.provider,
+                    finding.product,
+                    finding.severity,
+                    finding.status,
+                    finding.account_id,
+                    finding.region,
+                    finding.check_id,
+                    finding.resource_id,
+                    finding.title,
+                    finding.risk_score,
+                    codec.dumps(finding.to_dict()),
+                ))
+                count += 1
+                if len(rows) >= _BATCH_SIZE:
+                    _insert_findings(conn, rows)
+            _insert_findings(conn, rows)
+
+            conn.execute(
+                "INSERT OR REPLACE INTO runs VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    run_id,
+                    provider,
+                    _scanned_at(summary, findings_file),
+                    _timestamp(datetime.now(UTC)),
+                    count,
+                    codec.dumps(summary) if summary is not None else None,
+                ),
+            )
+        return count
+
+    def runs(self) -> list[dict[str, Any]]:
+        """List ingested runs, oldest first.
+
+        Returns:
+            Runs with their ID, provider, scan time, finding count and
+            summary
+        """
+        runs = self.query("SELECT * FROM runs ORDER BY scanned_at, run_id")
+        for run in runs:
+            run["summary"] = codec.loads(run["summary"]) if run["summary"] else None
+        return runs
+
+    def query(
+        self, sql: str, params: Sequence[Any] | Mapping[str, Any] = ()
+    ) -> list[dict[str, Any]]:
+        """Run a read-only SQL query.
+
+        The ``runs`` table has one row per run and the ``findings`` table one
+        row per finding of each run, with the finding's JSON in ``data``.
+
+        Args:
+            sql: SQL statement
+            params: Statement parameters
+
+        Returns:
+            Result rows as dictionaries of column values
+
+        Raises:
+            sqlite3.Error: If the statement is invalid or writes
+        """
+        with self._connect(read_only=True) as conn:
+            cursor = conn.execute(sql, params)
+            columns = [column[0] for column in cursor.description or ()]
+            return [dict(zip(columns, row, strict=True)) for row in cursor]
+
+    def trend(
+        self,
+        group_by: str = "account_id",
+        severity: Sequence[str] = (),
+        status: Sequence[str] = (),
+        since: datetime | None = None,
+    ) -> list[dict[str, Any]]:
+        """Count findings of each run by a finding column.
+
+        For example, ``trend(severity=["critical"], status=["fail"],
+        since=now - timedelta(days=90))`` counts open critical findings per
+        account in every run of the last 90 days.
+
+        Args:
+            group_by: Column of :data:`GROUP_COLUMNS` to count by
+            severity: Severities to include; all by default
+            status: Statuses to include; all by default
+            since: Earliest scan time of the runs to include
+
+        Returns:
+            ``run_id``, ``scanned_at``, ``group_by`` value and ``count`` rows,
+            ordered by scan time
+
+        Raises:
+            ValueError: If ``group_by`` is not a known column
+        """
+        if group_by not in GROUP_COLUMNS:
+            raise ValueError(
+                f"Invalid group column {group_by!r}; use one of {', '.join(GROUP_COLUMNS)}"
+            )
+
+        conditions = []
+        params: list[Any] = []
+        for column, values in (("severity", severity), ("status", status)):
+            if values:
+                conditions.append(f"findings.{column} IN ({', '.join('?' * len(values))})")
+                params.extend(values)
+        if since is not None:
+            conditions.append("runs.scanned_at >= ?")
+            params.append(_timestamp(since))
+        where = " AND ".join(conditions) or "1"
+
+        return self.query(
+            f"SELECT runs.run_id, runs.scanned_at, findings.{group_by}, COUNT(*) AS count "
+            "FROM findings JOIN runs ON runs.run_id = findings.run_id "
+            f"WHERE {where} "
+            f"GROUP BY runs.run_id, findings.{group_by} "
+            f"ORDER BY runs.scanned_at, runs.run_id, findings.{group_by}",
+            params,
+        )
+
+
+def _insert_findings(conn: sqlite3.Connection, rows: list[tuple[Any, ...]]) -> None:
+    """Insert and clear a batch of finding rows."""
+    conn.executemany(
+        "INSERT OR REPLACE INTO findings VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows
+    )
+    rows.clear()
+
+
+def _timestamp(value: datetime) -> str:
+    """Format a time as UTC ISO 8601 text, which sorts chronologically."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return value.astimezone(UTC).isoformat()
+
+
+def _scanned_at(summary: dict[str, Any] | None, findings_file: Path) -> str:
+    """Get when a run scanned, from its latest finding or its findings file."""
+    end = (summary or {}).get("scan_time_range", {}).get("end")
+    if end:
+        return _timestamp(datetime.fromisoformat(end))
+    return _timestamp(datetime.fromtimestamp(findings_file.stat().st_mtime, UTC))
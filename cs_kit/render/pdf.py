@@ -1,5 +1,9 @@
 """PDF rendering functionality using Jinja2 templates and WeasyPrint."""
 
+import tempfile
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -30,16 +34,29 @@ def _check_weasyprint() -> bool:
         return False
 
 from cs_kit.cli.config import RendererConfig  # noqa: E402
+from cs_kit.normalizer import codec  # noqa: E402
 from cs_kit.normalizer.ocsf_models import (  # noqa: E402
     FindingSummary,
     OCSFEnrichedFinding,
 )
-from cs_kit.normalizer.summarize import (  # noqa: E402
-    by_framework,
-    by_provider,
-    framework_score,
-    unique_resource_analysis,
-)
+from cs_kit.normalizer.records import FindingRecord  # noqa: E402
+from cs_kit.normalizer.summarize import SummaryAccumulator  # noqa: E402
+
+try:
+    import pypdf
+except ImportError:  # pragma: no cover - optional dependency
+    pypdf = None  # type: ignore[assignment]
+
+# Finding table rows per findings part of a chunked report
+DEFAULT_FINDINGS_BATCH_SIZE = 1000
+
+# Findings buffered in memory before they're appended to spill files
+_SPILL_BUFFER = 10_000
+
+# Stylesheet added to each part of a chunked report. Parts are laid out
+# separately, so footer page counters would restart in every part; the
+# footer is dropped and PDF viewers number the pages of the merged report.
+_PART_CSS = "@page { @bottom-center { content: none; } }"
 
 
 class RenderError(Exception):
@@ -153,13 +170,74 @@ def render_html(context: dict[str, Any], config: RendererConfig | None = None) -
         raise RenderError(f"Failed to render HTML: {e}") from e
 
 
-def html_to_pdf(html: str, out_pdf: Path, config: RendererConfig | None = None) -> None:
+def render_html_parts(
+    context: dict[str, Any],
+    config: RendererConfig | None = None,
+    batch_size: int = DEFAULT_FINDINGS_BATCH_SIZE,
+    batches: Iterable[dict[str, Any]] | None = None,
+) -> Iterator[str]:
+    """Render a report as separate HTML documents, one at a time.
+
+    The cover and executive summary are the first part and the appendix
+    the last. The detailed findings in between are split into parts of at
+    most ``batch_size`` finding table rows, so laying out any one part takes
+    memory for one batch of findings rather than for all of them. Each
+    batch is produced just before its part is rendered.
+
+    Args:
+        context: Template context data
+        config: Renderer configuration
+        batch_size: Maximum finding table rows per findings part
+        batches: Context overrides of each findings part, produced lazily;
+            split from the context's findings when not given
+
+    Yields:
+        Rendered HTML of each part, in report order
+
+    Raises:
+        TemplateNotFoundError: If template files are not found
+        RenderError: If rendering fails
+    """
+    if config is None:
+        config = RendererConfig()
+
+    template_dir = Path(config.template_dir) if config.template_dir else None
+
+    try:
+        env = create_jinja_environment(template_dir)
+        render_context = _prepare_render_context(context, config)
+
+        yield '\n'.join(
+            env.get_template(name).render(**render_context)
+            for name in ('cover.html', 'exec_summary.html')
+        )
+
+        if batches is None:
+            batches = _findings_batches(render_context, batch_size)
+
+        findings_template = env.get_template('findings.html')
+        for batch in batches:
+            yield findings_template.render(**{**render_context, **batch})
+
+        yield env.get_template('appendix.html').render(**render_context)
+
+    except Exception as e:
+        raise RenderError(f"Failed to render HTML: {e}") from e
+
+
+def html_to_pdf(
+    html: str,
+    out_pdf: Path,
+    config: RendererConfig | None = None,
+    extra_css: str | None = None,
+) -> None:
     """Convert HTML string to PDF file using WeasyPrint.
 
     Args:
         html: HTML content to convert
         out_pdf: Output PDF file path
         config: Renderer configuration
+        extra_css: Stylesheet applied after the template's custom CSS
 
     Raises:
         PDFGenerationError: If PDF generation fails
@@ -184,12 +262,15 @@ def html_to_pdf(html: str, out_pdf: Path, config: RendererConfig | None = None)
             if css_path.exists():
                 css_string = css_path.read_text()
 
+        stylesheets = [
+            weasyprint.CSS(string=css) for css in (css_string, extra_css) if css
+        ]
+
         # Generate PDF
         document = weasyprint.HTML(string=html)
 
-        if css_string:
-            css = weasyprint.CSS(string=css_string)
-            document.write_pdf(str(out_pdf), stylesheets=[css])
+        if stylesheets:
+            document.write_pdf(str(out_pdf), stylesheets=stylesheets)
         else:
             document.write_pdf(str(out_pdf))
 
@@ -198,7 +279,7 @@ def html_to_pdf(html: str, out_pdf: Path, config: RendererConfig | None = None)
 
 
 def generate_report(
-    findings: list[OCSFEnrichedFinding],
+    findings: Iterable[OCSFEnrichedFinding | FindingRecord],
     summary: FindingSummary,
     out_pdf: Path,
     config: RendererConfig | None = None,
@@ -206,8 +287,13 @@ def generate_report(
 ) -> None:
     """Generate a complete PDF report from findings and summary data.
 
+    With ``config.findings_batch_size`` set, the report is laid out in parts
+    by up to ``config.render_workers`` processes and the parts are merged,
+    which needs the optional ``pypdf`` package. The findings are then read
+    once and spilled to temporary files rather than held in memory.
+
     Args:
-        findings: List of enriched security findings
+        findings: Enriched security findings, e.g. streamed from an artifact
         summary: Summary statistics
         out_pdf: Output PDF file path
         config: Renderer configuration
@@ -221,19 +307,314 @@ def generate_report(
         config = RendererConfig()
 
     try:
-        # Prepare comprehensive context
-        context = _build_report_context(findings, summary, config, **kwargs)
+        if config.findings_batch_size:
+            _generate_chunked_report(findings, summary, out_pdf, config, **kwargs)
+        else:
+            # Prepare comprehensive context
+            context = _build_report_context(list(findings), summary, config, **kwargs)
 
-        # Render HTML
-        html = render_html(context, config)
+            # Render HTML
+            html = render_html(context, config)
 
-        # Generate PDF
-        html_to_pdf(html, out_pdf, config)
+            # Generate PDF
+            html_to_pdf(html, out_pdf, config)
 
     except Exception as e:
         raise RenderError(f"Failed to generate report: {e}") from e
 
 
+def _generate_chunked_report(
+    findings: Iterable[OCSFEnrichedFinding | FindingRecord],
+    summary: FindingSummary,
+    out_pdf: Path,
+    config: RendererConfig,
+    **kwargs: Any
+) -> None:
+    """Lay out a report in parts and merge them into one PDF.
+
+    The findings are counted and spilled to files by the group the findings
+    section lists them under, then read back one batch at a time as each
+    part is rendered. At most two parts per worker are rendered ahead of the
+    workers, so the HTML waiting to be laid out stays bounded.
+
+    Args:
+        findings: Enriched security findings
+        summary: Summary statistics
+        out_pdf: Output PDF file path
+        config: Renderer configuration with ``findings_batch_size`` set
+        **kwargs: Additional context data
+
+    Raises:
+        PDFGenerationError: If ``pypdf`` is not installed or a part fails
+    """
+    if pypdf is None:
+        raise PDFGenerationError(
+            "Chunked reports require the pypdf package; install the 'pdf-merge' extra"
+        )
+
+    out_pdf.parent.mkdir(parents=True, exist_ok=True)
+    batch_size = config.findings_batch_size or DEFAULT_FINDINGS_BATCH_SIZE
+    workers = config.render_workers
+
+    with tempfile.TemporaryDirectory(dir=out_pdf.parent, prefix=f".{out_pdf.name}.") as tmp_dir:
+        spill = _FindingsSpill(Path(tmp_dir))
+        analytics = SummaryAccumulator()
+        analytics.update(spill.add(finding) for finding in findings)
+        spill.flush()
+
+        context = _analytics_context(analytics, summary, config, spill.sample, **kwargs)
+        context['findings'] = []
+        parts = render_html_parts(
+            context,
+            config,
+            batch_size,
+            batches=spill.batches(context['findings_by_framework'], batch_size),
+        )
+        paths: list[Path] = []
+
+        if workers <= 1:
+            for number, html in enumerate(parts):
+                paths.append(Path(tmp_dir) / f"part_{number:05d}.pdf")
+                html_to_pdf(html, paths[-1], config, _PART_CSS)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                pending: deque[Future[None]] = deque()
+                for number, html in enumerate(parts):
+                    paths.append(Path(tmp_dir) / f"part_{number:05d}.pdf")
+                    pending.append(pool.submit(html_to_pdf, html, paths[-1], config, _PART_CSS))
+                    while len(pending) > workers * 2:
+                        pending.popleft().result()
+                while pending:
+                    pending.popleft().result()
+
+        _merge_pdfs(paths, out_pdf)
+
+
+def _merge_pdfs(paths: list[Path], out_pdf: Path) -> None:
+    """Concatenate the pages of several PDF files into one file."""
+    writer = pypdf.PdfWriter()
+    for path in paths:
+        writer.append(str(path))
+    with open(out_pdf, "wb") as f:
+        writer.write(f)
+
+
+class _FindingsSpill:
+    """Findings of a chunked report, spilled to one NDJSON file per group.
+
+    A finding is spilled once under each framework it references, grouped
+    by its framework references, as the findings template lists it. Until a
+    finding with a framework turns up, findings are instead grouped by
+    severity for the template's fallback listing. Lines are buffered and
+    appended to their files in batches, so only one file is open at a time.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+        self.sample: OCSFEnrichedFinding | FindingRecord | None = None
+        self._frameworks: dict[str, dict[tuple[str, ...], Path]] = {}
+        self._severities: dict[str, Path] = {}
+        self._buffers: dict[Path, list[str]] = {}
+        self._buffered = 0
+
+    def add(
+        self, finding: OCSFEnrichedFinding | FindingRecord
+    ) -> OCSFEnrichedFinding | FindingRecord:
+        """Spill a finding and return it, for use in a generator expression."""
+        if self.sample is None:
+            self.sample = finding
+
+        refs = tuple(finding.framework_refs or ())
+        frameworks = dict.fromkeys(ref.split(":", 1)[0] for ref in refs if ":" in ref)
+        if frameworks:
+            # The fallback listing is only used when no finding has a framework
+            for path in self._severities.values():
+                self._buffers[path].clear()
+            self._severities.clear()
+            line = _spill_line(finding)
+            for framework in frameworks:
+                groups = self._frameworks.setdefault(framework, {})
+                if refs not in groups:
+                    groups[refs] = self._new_path()
+                self._append(groups[refs], line)
+        elif not self._frameworks:
+            severity = finding.severity or ''
+            if severity not in self._severities:
+                self._severities[severity] = self._new_path()
+            self._append(self._severities[severity], _spill_line(finding))
+        return finding
+
+    def flush(self) -> None:
+        """Append and clear the buffered lines of every group."""
+        for path, lines in self._buffers.items():
+            if lines:
+                with open(path, "a", encoding="utf-8") as f:
+                    f.writelines(lines)
+                lines.clear()
+        self._buffered = 0
+
+    def batches(
+        self, findings_by_framework: dict[str, dict[str, Any]], batch_size: int
+    ) -> Iterator[dict[str, Any]]:
+        """Read the spilled findings back in batches of table rows.
+
+        Args:
+            findings_by_framework: Per-framework breakdown of the report context
+            batch_size: Maximum finding table rows per batch
+
+        Yields:
+            Context overrides of each batch, as ``_findings_batches`` does
+        """
+        if not self._frameworks:
+            paths = [self._severities[severity] for severity in sorted(self._severities)]
+            batches = (
+                {'findings': batch}
+                for batch in _chunks(_read_groups(paths), batch_size)
+            )
+            return _mark_batches(batches, 'findings')
+
+        framework_findings = (
+            (framework, framework_data, _read_groups(
+                self._frameworks[framework][refs]
+                for refs in sorted(self._frameworks.get(framework, {}))
+            ))
+            for framework, framework_data in findings_by_framework.items()
+        )
+        return _mark_batches(
+            _framework_batches(framework_findings, batch_size), 'findings_by_framework'
+        )
+
+    def _new_path(self) -> Path:
+        path = self.directory / f"group_{len(self._buffers):05d}.ndjson"
+        self._buffers[path] = []
+        return path
+
+    def _append(self, path: Path, line: str) -> None:
+        self._buffers[path].append(line)
+        self._buffered += 1
+        if self._buffered >= _SPILL_BUFFER:
+            self.flush()
+
+
+def _spill_line(finding: OCSFEnrichedFinding | FindingRecord) -> str:
+    """Encode a finding as one NDJSON line."""
+    data = finding.to_dict() if isinstance(finding, FindingRecord) else finding.model_dump()
+    return codec.dumps(data) + "\n"
+
+
+def _read_groups(paths: Iterable[Path]) -> Iterator[FindingRecord]:
+    """Read back the findings of spilled group files, one file after another."""
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                yield FindingRecord.from_dict(codec.loads(line))
+
+
+def _chunks(items: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    """Split items into lists of at most ``size`` items."""
+    chunk: list[Any] = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _findings_batches(context: dict[str, Any], batch_size: int) -> Iterator[dict[str, Any]]:
+    """Split the findings section's context into batches of table rows.
+
+    Findings are ordered as the findings template groups them, so the
+    batches together list the findings in the same order as a single
+    section. A framework split across batches is marked ``continued`` after
+    its first batch.
+
+    Args:
+        context: Report context
+        batch_size: Maximum finding table rows per batch
+
+    Yields:
+        Context overrides of each batch, at least one
+    """
+    findings_by_framework = context.get('findings_by_framework') or {}
+
+    if findings_by_framework:
+        framework_findings = (
+            (framework, framework_data, sorted(
+                framework_data['findings'], key=lambda f: f.framework_refs
+            ))
+            for framework, framework_data in findings_by_framework.items()
+        )
+        yield from _mark_batches(
+            _framework_batches(framework_findings, batch_size), 'findings_by_framework'
+        )
+    else:
+        findings = sorted(context.get('findings') or [], key=lambda f: f.severity or '')
+        batches = (
+            {'findings': findings[start:start + batch_size]}
+            for start in range(0, len(findings), batch_size)
+        )
+        yield from _mark_batches(batches, 'findings')
+
+
+def _framework_batches(
+    framework_findings: Iterable[tuple[str, dict[str, Any], Iterable[Any]]],
+    batch_size: int,
+) -> Iterator[dict[str, Any]]:
+    """Split each framework's ordered findings into batches of table rows.
+
+    Args:
+        framework_findings: Framework, its breakdown and its findings in
+            listing order, per framework
+        batch_size: Maximum finding table rows per batch
+
+    Yields:
+        ``findings_by_framework`` overrides of each batch
+    """
+    current: dict[str, dict[str, Any]] = {}
+    rows = 0
+    for framework, framework_data, findings in framework_findings:
+        continued = False
+        for finding in findings:
+            if framework not in current:
+                current[framework] = {**framework_data, 'findings': [], 'continued': continued}
+                continued = True
+            current[framework]['findings'].append(finding)
+            rows += 1
+            if rows >= batch_size:
+                yield {'findings_by_framework': current}
+                current = {}
+                rows = 0
+    if current:
+        yield {'findings_by_framework': current}
+
+
+def _mark_batches(batches: Iterable[dict[str, Any]], key: str) -> Iterator[dict[str, Any]]:
+    """Mark the first batch to open the findings section and the last to close it.
+
+    Each batch is held back until the next one is produced, to know which
+    batch is the last. An empty section still gets one batch.
+
+    Args:
+        batches: Context overrides of each batch
+        key: Context key a batch holds its findings under, for the empty batch
+
+    Yields:
+        The batches, with ``findings_intro`` and ``resource_summary`` set
+    """
+    previous: dict[str, Any] | None = None
+    first = True
+    for batch in batches:
+        if previous is not None:
+            yield {**previous, 'findings_intro': first, 'resource_summary': False}
+            first = False
+        previous = batch
+    if previous is None:
+        previous = {key: {} if key == 'findings_by_framework' else []}
+    yield {**previous, 'findings_intro': first, 'resource_summary': True}
+
+
 def _prepare_render_context(
     context: dict[str, Any], config: RendererConfig
 ) -> dict[str, Any]:
@@ -264,7 +645,7 @@ def _prepare_render_context(
 
 
 def _build_report_context(
-    findings: list[OCSFEnrichedFinding],
+    findings: list[OCSFEnrichedFinding | FindingRecord],
     summary: FindingSummary,
     config: RendererConfig,
     **kwargs: Any
@@ -280,15 +661,43 @@ def _build_report_context(
     Returns:
         Complete context dictionary
     """
-    # Calculate additional analytics
-    provider_breakdowns = by_provider(findings)
-    findings_by_framework = by_framework(findings)
-    resource_analysis = unique_resource_analysis(findings)
+    # Calculate additional analytics in a single pass over the findings
+    analytics = SummaryAccumulator.from_findings(findings, keep_findings=True)
+    sample = findings[0] if findings else None
+
+    return {
+        'findings': findings,
+        **_analytics_context(analytics, summary, config, sample, **kwargs),
+    }
+
+
+def _analytics_context(
+    analytics: SummaryAccumulator,
+    summary: FindingSummary,
+    config: RendererConfig,
+    sample: OCSFEnrichedFinding | FindingRecord | None,
+    **kwargs: Any
+) -> dict[str, Any]:
+    """Build the report context derived from accumulated findings statistics.
+
+    Args:
+        analytics: Statistics of the report's findings
+        summary: Summary statistics
+        config: Renderer configuration
+        sample: First finding, shown in the appendix with raw data included
+        **kwargs: Additional context data
+
+    Returns:
+        Context dictionary, without the findings list
+    """
+    provider_breakdowns = analytics.by_provider()
+    findings_by_framework = analytics.by_framework()
+    resource_analysis = analytics.unique_resource_analysis()
 
     # Calculate framework scores
     framework_scores = {}
     for framework in summary.frameworks_covered:
-        framework_scores[framework] = framework_score(findings, framework)
+        framework_scores[framework] = analytics.framework_score(framework)
 
     # Prepare tool versions (would be populated from actual scan metadata)
     tool_versions = {}
@@ -297,14 +706,12 @@ def _build_report_context(
 
     # Prepare sample raw data if requested
     raw_sample_data = None
-    if config.include_raw_data and findings:
+    if config.include_raw_data and sample is not None:
         # Take first finding as sample, with sensitive data redacted
-        sample_finding = findings[0]
-        raw_sample_data = _redact_sensitive_data(sample_finding.raw)
+        raw_sample_data = _redact_sensitive_data(sample.raw)
 
     # Build complete context
     context = {
-        'findings': findings,
         'summary': summary,
         'provider_breakdowns': provider_breakdowns,
         'findings_by_framework': findings_by_framework,
@@ -374,6 +781,8 @@ def _safe_json_serialize(obj: Any, indent: int | None = None) -> str:
             return obj.isoformat()
         elif hasattr(obj, 'model_dump'):
             return obj.model_dump()
+        elif hasattr(obj, 'to_dict'):
+            return obj.to_dict()
         elif hasattr(obj, '__dict__'):
             return obj.__dict__
         else:
@@ -1,26 +1,126 @@
 """Flask web application for CS Kit."""
 
 import asyncio
-import json
+import math
 import os
+import threading
+import time
 import uuid
 from datetime import UTC, datetime
+from functools import cache, partial
 from pathlib import Path
 
-from flask import Flask, jsonify, render_template, request, send_file
+from flask import Flask, jsonify, render_template, request, send_file, url_for
 
-from cs_kit.adapters.prowler.run import list_supported_frameworks, run_prowler
+from cs_kit.adapters.prowler.run import (
+    ProwlerProgress,
+    list_supported_frameworks,
+    run_prowler,
+)
 from cs_kit.cli.config import RunConfig
 from cs_kit.cli.tool_registry import get_all_supported_providers, select_scanners
-from cs_kit.normalizer.mapping import apply_mapping, list_available_mappings
-from cs_kit.normalizer.parser import parse_ocsf
-from cs_kit.normalizer.summarize import generate_finding_summary
+from cs_kit.normalizer import codec
+from cs_kit.normalizer.artifacts import (
+    PARTIAL_SUMMARY_FILE,
+    write_findings,
+    write_partial_summary,
+)
+from cs_kit.normalizer.dedupe import FindingDeduplicator
+from cs_kit.normalizer.findings_index import (
+    DEFAULT_PAGE_SIZE,
+    FINDINGS_INDEX_FILE,
+    FindingsIndex,
+)
+from cs_kit.normalizer.mapping import iter_apply_mapping, list_available_mappings
+from cs_kit.normalizer.parser import iter_ocsf_many
+from cs_kit.normalizer.summarize import SummaryAccumulator, generate_finding_summary
+from cs_kit.web.jobs import DEFAULT_WORKERS, JobStore, WorkerPool
 
 app = Flask(__name__, template_folder="templates", static_folder="static")
 app.config["MAX_CONTENT_LENGTH"] = 16 * 1024 * 1024  # 16MB max file size
 
-# Store scan results in memory (in production, use a database or cache)
-scan_results: dict[str, dict] = {}
+# Scans are queued in a SQLite database shared by all web server workers and
+# run by a pool of worker processes
+app.config["JOB_DATABASE"] = os.environ.get("CS_KIT_JOB_DATABASE", "./artifacts/jobs.db")
+app.config["SCAN_WORKERS"] = int(os.environ.get("CS_KIT_SCAN_WORKERS", DEFAULT_WORKERS))
+# Format of normalized findings: json, ndjson, ndjson.zst or parquet
+app.config["ARTIFACT_FORMAT"] = os.environ.get("CS_KIT_ARTIFACT_FORMAT", "json")
+# Directory the workers write each scan's artifacts under
+app.config["ARTIFACTS_DIR"] = os.environ.get("CS_KIT_ARTIFACTS_DIR", "./artifacts")
+
+# Seconds between writes of a running scan's check counters to the job
+# database
+_PROGRESS_INTERVAL = 1.0
+
+_pool_lock = threading.Lock()
+
+
+@cache
+def get_job_store(path: str) -> JobStore:
+    """Open the job database at a path once per process."""
+    return JobStore(Path(path))
+
+
+@cache
+def _worker_pool(path: str, size: int, artifacts_dir: str) -> WorkerPool:
+    """Create the worker pool of a job database once per process."""
+    handler = partial(execute_scan_job, artifacts_dir=artifacts_dir)
+    return WorkerPool(get_job_store(path), handler, size)
+
+
+def _app_worker_pool() -> WorkerPool:
+    """Get the worker pool of the app's configuration."""
+    return _worker_pool(
+        app.config["JOB_DATABASE"], app.config["SCAN_WORKERS"], app.config["ARTIFACTS_DIR"]
+    )
+
+
+def ensure_workers() -> bool:
+    """Start the worker pool unless another process already runs it.
+
+    Returns:
+        Whether this process runs the pool
+    """
+    pool = _app_worker_pool()
+    with _pool_lock:
+        return pool.start()
+
+
+def stop_workers() -> None:
+    """Stop this process's worker pool, if it runs one."""
+    pool = _app_worker_pool()
+    with _pool_lock:
+        pool.stop()
+
+
+def create_app(**config: object) -> Flask:
+    """Configure the web app and start its scan workers.
+
+    Jobs queued before a restart are picked up as soon as the app starts,
+    rather than waiting for the next scan to be submitted. Serve the app
+    with e.g. ``gunicorn "cs_kit.web.app:create_app()"``.
+
+    Args:
+        **config: Flask config values to override, such as ``JOB_DATABASE``,
+            ``SCAN_WORKERS`` or ``ARTIFACTS_DIR``
+
+    Returns:
+        The app
+    """
+    app.config.update(config)
+    ensure_workers()
+    return app
+
+
+@app.before_request
+def _start_workers() -> None:
+    """Start the worker pool if the app wasn't built with :func:`create_app`."""
+    ensure_workers()
+
+
+def _jobs() -> JobStore:
+    """Get the job database of the app."""
+    return get_job_store(app.config["JOB_DATABASE"])
 
 
 def get_frameworks_by_provider(provider: str) -> list[str]:
@@ -102,44 +202,52 @@ def start_scan():
         # Generate scan ID
         scan_id = f"scan_{datetime.now(UTC).strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
 
-        # Store scan status
-        scan_results[scan_id] = {
-            "status": "running",
-            "provider": provider,
-            "frameworks": frameworks,
-            "regions": regions,
-            "started_at": datetime.now(UTC).isoformat(),
-        }
-
-        # Run scan asynchronously
-        asyncio.create_task(run_scan_async(
-            scan_id=scan_id,
+        # Queue the scan for the worker pool
+        _jobs().enqueue(
+            scan_id,
+            {
+                "provider": provider,
+                "access_key_id": access_key_id,
+                "secret_access_key": secret_access_key,
+                "frameworks": frameworks,
+                "regions": regions,
+                "artifact_format": app.config["ARTIFACT_FORMAT"],
+            },
             provider=provider,
-            access_key_id=access_key_id,
-            secret_access_key=secret_access_key,
             frameworks=frameworks,
             regions=regions,
-        ))
+            queued_at=datetime.now(UTC).isoformat(),
+        )
 
         return jsonify({
             "scan_id": scan_id,
-            "status": "running",
-            "message": "Scan started successfully"
+            "status": "queued",
+            "message": "Scan queued successfully"
         })
 
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 
+def execute_scan_job(
+    store: JobStore, scan_id: str, params: dict, artifacts_dir: str = "./artifacts"
+) -> None:
+    """Run a queued scan in a worker process."""
+    asyncio.run(run_scan_async(store, scan_id, **params, artifacts_dir=artifacts_dir))
+
+
 async def run_scan_async(
+    store: JobStore,
     scan_id: str,
     provider: str,
     access_key_id: str,
     secret_access_key: str,
     frameworks: list[str],
     regions: list[str],
+    artifact_format: str = "json",
+    artifacts_dir: str = "./artifacts",
 ):
-    """Run scan asynchronously."""
+    """Run scan asynchronously, recording its status in the job store."""
     try:
         # Set up environment variables
         env_vars = {
@@ -157,8 +265,7 @@ async def run_scan_async(
             env_vars["AZURE_CLIENT_SECRET"] = secret_access_key
 
         # Create output directory
-        artifacts_dir = Path("./artifacts")
-        run_artifacts_dir = artifacts_dir / scan_id
+        run_artifacts_dir = Path(artifacts_dir) / scan_id
         run_artifacts_dir.mkdir(parents=True, exist_ok=True)
 
         # Create config
@@ -166,7 +273,8 @@ async def run_scan_async(
             provider=provider,  # type: ignore
             frameworks=frameworks,
             regions=regions,
-            artifacts_dir=str(artifacts_dir),
+            artifacts_dir=artifacts_dir,
+            artifact_format=artifact_format,  # type: ignore
         )
 
         # Select scanners
@@ -176,75 +284,121 @@ async def run_scan_async(
 
         # Run scanners
         all_scan_files = []
+        progress = _ScanProgress(store, scan_id)
         for scanner in selected_scanners:
             if scanner == "prowler":
-                scan_files = await run_prowler(
-                    provider=config.provider,
-                    frameworks=config.frameworks,
-                    regions=config.regions,
-                    env=env_vars,
-                    out_dir=run_artifacts_dir,
-                )
+                try:
+                    scan_files = await run_prowler(
+                        provider=config.provider,
+                        frameworks=config.frameworks,
+                        regions=config.regions,
+                        env=env_vars,
+                        out_dir=run_artifacts_dir,
+                        max_concurrency=config.prowler_concurrency,
+                        progress=progress,
+                    )
+                finally:
+                    progress.flush()
                 all_scan_files.extend(scan_files)
 
-        # Parse findings
-        all_findings = []
-        for scan_file in all_scan_files:
-            findings = parse_ocsf(scan_file, config.provider, "prowler")
-            all_findings.extend(findings)
+        # Parse findings as a stream so whole scan files are never held in
+        # memory, as compact records rather than validated models, dropping
+        # findings repeated by the runs for different frameworks
+        findings_stream = iter_ocsf_many(
+            all_scan_files,
+            config.provider,
+            "prowler",
+            workers=config.parse_workers,
+            as_records=True,
+        )
+        if len(config.frameworks) > 1:
+            findings_stream = FindingDeduplicator().filter(findings_stream)
 
         # Apply mappings
-        enriched_findings = all_findings
+        enriched_stream = findings_stream
         if config.frameworks:
             try:
-                enriched_findings = apply_mapping(all_findings, config.frameworks)
+                enriched_stream = iter_apply_mapping(findings_stream, config.frameworks)
             except Exception:
                 pass  # Use unmapped findings if mapping fails
 
-        # Generate summary
-        summary = generate_finding_summary(enriched_findings)
-
-        # Save results
-        normalized_file = run_artifacts_dir / "normalized.json"
-        with open(normalized_file, "w") as f:
-            json.dump(
-                [finding.model_dump() for finding in enriched_findings],
-                f,
-                indent=2,
-                default=str,
-            )
+        # Summarize the findings as they are written out, so they are never
+        # all held in memory
+        accumulator = SummaryAccumulator(config.cardinality, config.hll_precision)
+        normalized_file = write_findings(
+            accumulator.observe(enriched_stream), run_artifacts_dir, config.artifact_format
+        )
+        summary = generate_finding_summary(accumulator)
+        FindingsIndex.build(normalized_file, run_artifacts_dir / FINDINGS_INDEX_FILE)
 
         summary_file = run_artifacts_dir / "summary.json"
-        with open(summary_file, "w") as f:
-            json.dump(summary.model_dump(), f, indent=2, default=str)
+        codec.dump(summary.model_dump(), summary_file, indent=True)
+        write_partial_summary(accumulator, run_artifacts_dir / PARTIAL_SUMMARY_FILE)
 
         # Update scan results
-        scan_results[scan_id].update({
-            "status": "completed",
-            "findings_count": len(enriched_findings),
-            "summary": summary.model_dump(),
-            "artifacts_dir": str(run_artifacts_dir),
-            "normalized_file": str(normalized_file),
-            "summary_file": str(summary_file),
-            "completed_at": datetime.now(UTC).isoformat(),
-        })
+        store.update(
+            scan_id,
+            status="completed",
+            findings_count=accumulator.total,
+            summary=summary.model_dump(mode="json"),
+            artifacts_dir=str(run_artifacts_dir),
+            normalized_file=str(normalized_file),
+            summary_file=str(summary_file),
+            completed_at=datetime.now(UTC).isoformat(),
+        )
 
     except Exception as e:
-        scan_results[scan_id].update({
-            "status": "failed",
-            "error": str(e),
-            "completed_at": datetime.now(UTC).isoformat(),
-        })
+        store.update(
+            scan_id,
+            status="failed",
+            error=str(e),
+            completed_at=datetime.now(UTC).isoformat(),
+        )
+
+
+class _ScanProgress:
+    """Record prowler check counters in a scan's status.
+
+    Counters change with every check prowler finishes, and each write is a
+    job database transaction. They are written when a run starts or
+    finishes, and otherwise at most once per interval; :meth:`flush` writes
+    counters still pending.
+    """
+
+    def __init__(
+        self, store: JobStore, scan_id: str, interval: float = _PROGRESS_INTERVAL
+    ) -> None:
+        self.store = store
+        self.scan_id = scan_id
+        self.interval = interval
+        self.progress: dict[str, dict[str, int | None]] = {}
+        self._written_at = -math.inf
+        self._pending = False
+
+    def __call__(self, update: ProwlerProgress) -> None:
+        started = update.label not in self.progress
+        finished = update.total is not None and update.completed >= update.total
+        self.progress[update.label] = {"completed": update.completed, "total": update.total}
+        self._pending = True
+        if started or finished or time.monotonic() - self._written_at >= self.interval:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the counters if they changed since the last write."""
+        if not self._pending:
+            return
+        self.store.update(self.scan_id, progress=self.progress)
+        self._written_at = time.monotonic()
+        self._pending = False
 
 
 @app.route("/api/scan/<scan_id>")
 def get_scan_status(scan_id: str):
     """Get scan status and results."""
-    if scan_id not in scan_results:
+    result = _jobs().get(scan_id)
+    if result is None:
         return jsonify({"error": "Scan not found"}), 404
 
-    result = scan_results[scan_id].copy()
-
     # Don't expose credentials
     result.pop("access_key_id", None)
     result.pop("secret_access_key", None)
@@ -255,11 +409,10 @@ def get_scan_status(scan_id: str):
 @app.route("/scan/<scan_id>")
 def view_scan_results(scan_id: str):
     """View scan results in pretty HTML format."""
-    if scan_id not in scan_results:
+    scan_data = _jobs().get(scan_id)
+    if scan_data is None:
         return "Scan not found", 404
 
-    scan_data = scan_results[scan_id]
-
     if scan_data["status"] != "completed":
         return render_template(
             "scan_status.html",
@@ -268,20 +421,17 @@ def view_scan_results(scan_id: str):
             error=scan_data.get("error"),
         )
 
-    # Load findings
     normalized_file = Path(scan_data["normalized_file"])
     if not normalized_file.exists():
         return "Results file not found", 404
 
-    with open(normalized_file) as f:
-        findings = json.load(f)
-
     summary = scan_data.get("summary", {})
 
+    # Findings are fetched page by page from the findings API
     return render_template(
         "results.html",
         scan_id=scan_id,
-        findings=findings,
+        findings_url=url_for("get_scan_findings", scan_id=scan_id),
         summary=summary,
         provider=scan_data["provider"],
         frameworks=scan_data["frameworks"],
@@ -289,13 +439,65 @@ def view_scan_results(scan_id: str):
     )
 
 
+@app.route("/api/scan/<scan_id>/findings")
+def get_scan_findings(scan_id: str):
+    """Get a page of a scan's findings.
+
+    Query parameters ``severity``, ``status``, ``region`` and ``framework``
+    filter findings and take comma-separated or repeated values; ``sort``,
+    ``order`` (``asc`` or ``desc``), ``limit`` and ``cursor`` select the page.
+    """
+    scan_data = _jobs().get(scan_id)
+    if scan_data is None:
+        return jsonify({"error": "Scan not found"}), 404
+    if scan_data["status"] != "completed":
+        return jsonify({"error": "Scan not completed"}), 400
+
+    try:
+        index = FindingsIndex.for_run(Path(scan_data["artifacts_dir"]))
+    except FileNotFoundError:
+        return jsonify({"error": "Results file not found"}), 404
+
+    order = request.args.get("order", "asc")
+    if order not in ("asc", "desc"):
+        return jsonify({"error": "Order must be asc or desc"}), 400
+    try:
+        page = index.query(
+            severity=_list_arg("severity"),
+            status=_list_arg("status"),
+            region=_list_arg("region"),
+            framework=_list_arg("framework"),
+            sort=request.args.get("sort"),
+            descending=order == "desc",
+            cursor=request.args.get("cursor"),
+            limit=request.args.get("limit", DEFAULT_PAGE_SIZE, type=int),
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    return jsonify({
+        "findings": page.findings,
+        "total": page.total,
+        "next_cursor": page.next_cursor,
+    })
+
+
+def _list_arg(name: str) -> list[str]:
+    """Get a query parameter given as comma-separated or repeated values."""
+    return [
+        value
+        for arg in request.args.getlist(name)
+        for value in arg.split(",")
+        if value
+    ]
+
+
 @app.route("/api/scan/<scan_id>/download")
 def download_results(scan_id: str):
-    """Download normalized JSON results."""
-    if scan_id not in scan_results:
+    """Download normalized results in the scan's artifact format."""
+    scan_data = _jobs().get(scan_id)
+    if scan_data is None:
         return jsonify({"error": "Scan not found"}), 404
-
-    scan_data = scan_results[scan_id]
     if scan_data["status"] != "completed":
         return jsonify({"error": "Scan not completed"}), 400
 
@@ -303,14 +505,23 @@ def download_results(scan_id: str):
     if not normalized_file.exists():
         return jsonify({"error": "Results file not found"}), 404
 
+    if normalized_file.suffix == ".json":
+        mimetype, suffix = "application/json", ".json"
+    elif normalized_file.suffix == ".zst":
+        mimetype, suffix = "application/zstd", ".ndjson.zst"
+    elif normalized_file.suffix == ".parquet":
+        mimetype, suffix = "application/vnd.apache.parquet", ".parquet"
+    else:
+        mimetype, suffix = "application/x-ndjson", ".ndjson"
+
     return send_file(
         normalized_file,
-        mimetype="application/json",
+        mimetype=mimetype,
         as_attachment=True,
-        download_name=f"{scan_id}_results.json",
+        download_name=f"{scan_id}_results{suffix}",
     )
 
 
 if __name__ == "__main__":
-    app.run(debug=True, host="0.0.0.0", port=5000)
+    create_app().run(debug=True, host="0.0.0.0", port=5000)
 
@@ -0,0 +1,331 @@
+"""Persistent scan jobs for the web app.
+
+Scans started from the web app are queued in a SQLite database and executed by
+a bounded pool of worker processes. Job status lives in the database rather
+than in a web process, so every web server worker sees every job, and jobs
+survive a restart of the web app.
+"""
+
+import fcntl
+import multiprocessing
+import os
+import sqlite3
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from multiprocessing.synchronize import Event
+from pathlib import Path
+from typing import Any
+
+from cs_kit.normalizer import codec
+
+# Worker processes of a pool
+DEFAULT_WORKERS = 2
+
+# Seconds an idle worker waits before checking the queue again
+POLL_INTERVAL = 1.0
+
+# Job parameters removed from the database, and scrubbed from its files, once
+# a worker has claimed the job
+SECRET_PARAMS = ("access_key_id", "secret_access_key")
+
+# Executes one job: (store, job ID, parameters); runs in a worker process, so
+# it must be a module-level function or a partial of one
+JobHandler = Callable[["JobStore", str, dict[str, Any]], None]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    params TEXT NOT NULL,
+    state TEXT NOT NULL,
+    worker_pid INTEGER,
+    created_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_queue ON jobs (status, created_at);
+"""
+
+
+class JobStore:
+    """SQLite queue of scan jobs and their status.
+
+    Every operation uses its own connection and transaction, so a store can
+    be shared by threads and opened by any number of processes.
+
+    Queued jobs hold their cloud credentials in the database, as the web
+    server process queueing a job is not necessarily the one running the
+    workers. Deleted content is zeroed (``secure_delete``) and the
+    write-ahead log is truncated once a claimed job's secrets are removed,
+    so they don't linger in freed pages or old log frames.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Open a job database, creating it if needed.
+
+        Args:
+            path: SQLite database file
+        """
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Queued jobs hold cloud credentials until a worker claims them
+        path.touch(mode=0o600, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection in autocommit mode, for explicit transactions."""
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        try:
+            conn.execute("PRAGMA secure_delete=ON")
+            yield conn
+        finally:
+            conn.close()
+
+    def enqueue(self, job_id: str, params: dict[str, Any], **state: Any) -> None:
+        """Queue a job.
+
+        Args:
+            job_id: Unique job ID
+            params: Parameters passed to the job handler
+            **state: Initial status fields, returned by :meth:`get`
+        """
+        state = {**state, "status": "queued"}
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO jobs (id, status, params, state, created_at) VALUES (?, ?, ?, ?, ?)",
+                (job_id, "queued", codec.dumps(params), codec.dumps(state), _now()),
+            )
+
+    def get(self, job_id: str) -> dict[str, Any] | None:
+        """Get a job's status fields.
+
+        Args:
+            job_id: Job ID
+
+        Returns:
+            Status fields, including ``status``, or None if there is no such job
+        """
+        with self._connect() as conn:
+            row = conn.execute("SELECT state FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return codec.loads(row[0]) if row else None
+
+    def update(self, job_id: str, **fields: Any) -> None:
+        """Merge fields into a job's status.
+
+        Args:
+            job_id: Job ID
+            **fields: Status fields to set; a ``status`` field also moves the
+                job to that state
+        """
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute("SELECT state FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            if row is None:
+                conn.execute("ROLLBACK")
+                return
+            state = {**codec.loads(row[0]), **fields}
+            conn.execute(
+                "UPDATE jobs SET status = ?, state = ? WHERE id = ?",
+                (state["status"], codec.dumps(state), job_id),
+            )
+            conn.execute("COMMIT")
+
+    def claim(self, worker_pid: int) -> tuple[str, dict[str, Any]] | None:
+        """Take the oldest queued job and mark it running.
+
+        Secret parameters are removed from the database as the job is claimed,
+        and the write-ahead log holding their earlier versions is checkpointed
+        and truncated.
+
+        Args:
+            worker_pid: Process ID of the claiming worker
+
+        Returns:
+            Job ID and parameters, or None if no job is queued
+        """
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT id, params, state FROM jobs WHERE status = 'queued' "
+                "ORDER BY created_at, rowid LIMIT 1"
+            ).fetchone()
+            if row is None:
+                conn.execute("ROLLBACK")
+                return None
+
+            job_id, params = row[0], codec.loads(row[1])
+            state = {**codec.loads(row[2]), "status": "running", "started_at": _now()}
+            stored = {key: value for key, value in params.items() if key not in SECRET_PARAMS}
+            conn.execute(
+                "UPDATE jobs SET status = 'running', params = ?, state = ?, worker_pid = ? "
+                "WHERE id = ?",
+                (codec.dumps(stored), codec.dumps(state), worker_pid, job_id),
+            )
+            conn.execute("COMMIT")
+            if len(stored) < len(params):
+                # Waits for readers through the busy timeout; a checkpoint
+                # blocked beyond it leaves the frames to the next claim's
+                conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        return job_id, params
+
+    def fail_abandoned(self) -> int:
+        """Fail running jobs whose worker process no longer exists.
+
+        Their parameters were removed when they were claimed, so they can't
+        be run again.
+
+        Returns:
+            Number of failed jobs
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT id, worker_pid FROM jobs WHERE status = 'running'"
+            ).fetchall()
+
+        abandoned = [job_id for job_id, pid in rows if not _process_exists(pid)]
+        for job_id in abandoned:
+            self.update(
+                job_id,
+                status="failed",
+                error="Worker exited before the scan finished",
+                completed_at=_now(),
+            )
+        return len(abandoned)
+
+
+class WorkerPool:
+    """Bounded pool of processes executing queued jobs.
+
+    Only one pool per job database runs at a time, held by an exclusive lock
+    next to the database; web server workers can all try to start the pool,
+    and whichever gets the lock runs it.
+    """
+
+    def __init__(
+        self,
+        store: JobStore,
+        handler: JobHandler,
+        size: int = DEFAULT_WORKERS,
+        poll_interval: float = POLL_INTERVAL,
+    ) -> None:
+        """Create a pool; call :meth:`start` to run it.
+
+        Args:
+            store: Job database
+            handler: Module-level function executing one job, or a
+                ``functools.partial`` of one
+            size: Number of worker processes
+            poll_interval: Seconds idle workers wait between queue checks
+
+        Raises:
+            ValueError: If size is less than 1
+        """
+        if size < 1:
+            raise ValueError("Worker pool size must be at least 1")
+        self.store = store
+        self.handler = handler
+        self.size = size
+        self.poll_interval = poll_interval
+
+        # Spawned rather than forked, as web servers run handlers on threads
+        self._context = multiprocessing.get_context("spawn")
+        self._stop = self._context.Event()
+        self._processes: list[multiprocessing.process.BaseProcess] = []
+        self._lock_file: int | None = None
+
+    @property
+    def running(self) -> bool:
+        """Whether this pool holds the lock and runs workers."""
+        return self._lock_file is not None
+
+    def start(self) -> bool:
+        """Start the workers unless another pool serves the database.
+
+        Running jobs left behind by a previous pool are failed first.
+
+        Returns:
+            Whether this pool is running
+        """
+        if self.running:
+            return True
+
+        lock_file = os.open(f"{self.store.path}.lock", os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(lock_file)
+            return False
+        self._lock_file = lock_file
+
+        self.store.fail_abandoned()
+        self._stop.clear()
+        for i in range(self.size):
+            process = self._context.Process(
+                target=_work,
+                args=(self.store.path, self.handler, self.poll_interval, self._stop, os.getpid()),
+                name=f"cs-kit-worker-{i}",
+                daemon=True,
+            )
+            process.start()
+            self._processes.append(process)
+        return True
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Stop the workers after their current jobs and release the lock.
+
+        Workers still busy after ``timeout`` seconds are terminated.
+
+        Args:
+            timeout: Seconds to wait for each worker
+        """
+        self._stop.set()
+        for process in self._processes:
+            process.join(timeout)
+            if process.is_alive():
+                process.terminate()
+                process.join()
+        self._processes.clear()
+
+        if self._lock_file is not None:
+            os.close(self._lock_file)
+            self._lock_file = None
+
+
+def _work(
+    path: Path, handler: JobHandler, poll_interval: float, stop: Event, parent_pid: int
+) -> None:
+    """Worker process loop: run queued jobs until stopped or orphaned."""
+    store = JobStore(path)
+    pid = os.getpid()
+    # A killed pool's workers exit rather than outnumber the next pool's
+    while not stop.is_set() and os.getppid() == parent_pid:
+        job = store.claim(pid)
+        if job is None:
+            stop.wait(poll_interval)
+            continue
+
+        job_id, params = job
+        try:
+            handler(store, job_id, params)
+        except Exception as e:
+            store.update(job_id, status="failed", error=str(e), completed_at=_now())
+
+
+def _process_exists(pid: int | None) -> bool:
+    """Check whether a process is running on this host."""
+    if pid is None:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _now() -> str:
+    """Current time in ISO 8601 format."""
+    return datetime.now(UTC).isoformat()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Benchmark comparing two runs with ``diff_runs``.
+
+Writes two synthetic ``normalized.json`` files of ``--findings`` findings that
+differ in a few percent of findings, then compares them in memory (one
+partition) and partitioned, reporting wall time and peak memory of each.
+Each mode runs in a child process so peak memory is measured separately.
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import resource
+import tempfile
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+
+from cs_kit.normalizer import diff
+from cs_kit.normalizer.artifacts import write_findings_json
+from cs_kit.normalizer.records import FindingRecord
+
+SEVERITIES = ["critical", "high", "medium", "low"]
+
+
+def _findings(count: int, run: int):
+    """Generate findings; run 1 fails, drops and adds a few of run 0's."""
+    time_ = datetime(2024, 1, 15, tzinfo=UTC)
+    for i in range(count):
+        if run == 1 and i % 50 == 0:
+            continue
+        status = "fail" if i % 3 == 0 or (run == 1 and i % 40 == 0) else "pass"
+        yield FindingRecord(
+            time=time_,
+            provider="aws",
+            product="prowler",
+            severity=SEVERITIES[(i + run * (i % 70 == 0)) % 4],
+            status=status,
+            resource_id=f"arn:aws:s3:::bucket-{i}",
+            account_id="123456789012",
+            region="us-east-1",
+            check_id=f"check_{i % 300}",
+            title=f"Check {i % 300}",
+            description="Synthetic finding " * 8,
+        )
+    if run == 1:
+        for i in range(count // 50):
+            yield FindingRecord(time=time_, provider="aws", product="prowler", check_id="new", resource_id=str(i))
+
+
+def _run(before: Path, after: Path, output_dir: Path, partition_bytes: int, queue) -> None:
+    diff.PARTITION_BYTES = partition_bytes
+    start = time.perf_counter()
+    summary = diff.diff_runs(before, after, output_dir)
+    elapsed = time.perf_counter() - start
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    queue.put((elapsed, peak_mb, summary.to_dict()))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark run comparison")
+    parser.add_argument("--findings", type=int, default=500_000, help="Findings per run")
+    parser.add_argument("--partition-mb", type=int, default=16, help="Partition size of the partitioned mode")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        work_dir = Path(tmp)
+        before, after = work_dir / "before.json", work_dir / "after.json"
+        write_findings_json(_findings(args.findings, 0), before)
+        write_findings_json(_findings(args.findings, 1), after)
+        size_mb = before.stat().st_size / 1024 / 1024
+        print(f"{args.findings} findings per run, {size_mb:.0f} MB per file")
+
+        print(f"{'mode':<12} {'seconds':>10} {'peak MB':>10}")
+        modes = [("in-memory", 1 << 62), ("partitioned", args.partition_mb * 1024 * 1024)]
+        for name, partition_bytes in modes:
+            queue: multiprocessing.Queue = multiprocessing.Queue()
+            process = multiprocessing.Process(
+                target=_run, args=(before, after, work_dir / name, partition_bytes, queue)
+            )
+            process.start()
+            elapsed, peak_mb, summary = queue.get()
+            process.join()
+            print(f"{name:<12} {elapsed:>10.2f} {peak_mb:>10.0f}")
+        print(summary)
+
+
+if __name__ == "__main__":
+    main()
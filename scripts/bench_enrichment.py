@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Measure the memory cost of compliance mapping enrichment.
+
+Builds synthetic findings with a nested ``raw`` payload, then enriches them
+the old way (``OCSFEnrichedFinding(**finding.model_dump())``), through
+``apply_mapping`` (shared values, no revalidation) and as ``FindingRecord``
+instances enriched in place. For each, reports the time and the memory
+allocated by the enrichment step (tracemalloc peak above the input).
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import Any
+
+from cs_kit.normalizer.mapping import apply_mapping, load_mapping, load_mapping_index
+from cs_kit.normalizer.ocsf_models import OCSFEnrichedFinding, OCSFFinding
+from cs_kit.normalizer.records import FindingRecord
+
+MAP_IDS = ["cis_aws_1_4"]
+
+
+def build_findings(count: int, as_records: bool) -> list[Any]:
+    """Build ``count`` findings cycling through a few mapped checks."""
+    check_ids = [rule.source.partition(":")[2] for rule in load_mapping(MAP_IDS[0]).rules]
+    check_ids.append("unmapped")
+    now = datetime.now(UTC)
+    cls = FindingRecord if as_records else OCSFFinding.model_construct
+    return [
+        cls(
+            time=now,
+            provider="aws",
+            product="prowler",
+            check_id=check_ids[i % len(check_ids)],
+            resource_id=f"arn:aws:s3:::bucket-{i}",
+            raw={
+                "finding_info": {"uid": f"finding-{i}", "title": "Synthetic finding"},
+                "resources": [{"uid": f"arn:aws:s3:::bucket-{i}", "region": "us-east-1"}],
+                "unmapped": {"check_type": ["Software and Configuration Checks"]},
+            },
+        )
+        for i in range(count)
+    ]
+
+
+def copy_enrich(findings: list[OCSFFinding]) -> list[OCSFEnrichedFinding]:
+    """Enrich by dumping and revalidating every finding, as before."""
+    index = load_mapping_index(MAP_IDS)
+    enriched = []
+    for finding in findings:
+        copy = OCSFEnrichedFinding(**finding.model_dump())
+        copy.framework_refs = list(index.lookup(finding.product, finding.check_id or ""))
+        enriched.append(copy)
+    return enriched
+
+
+def measure(name: str, findings: list[Any], enrich: Callable[[list[Any]], list[Any]]) -> None:
+    """Run one enrichment strategy and print its cost."""
+    gc.collect()
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+
+    start = time.perf_counter()
+    enriched = enrich(findings)
+    elapsed = time.perf_counter() - start
+
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del enriched
+
+    print(f"{name:<10} {elapsed:>10.2f} {(peak - baseline) / 1e6:>12.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark mapping enrichment memory")
+    parser.add_argument("--findings", type=int, default=1_000_000, help="Number of findings")
+    args = parser.parse_args()
+
+    print(f"{args.findings} findings")
+    print(f"{'strategy':<10} {'seconds':>10} {'alloc MB':>12}")
+
+    models = build_findings(args.findings, as_records=False)
+    measure("copy", models, copy_enrich)
+    measure("shared", models, lambda findings: apply_mapping(findings, MAP_IDS))
+    del models
+
+    records = build_findings(args.findings, as_records=True)
+    measure("records", records, lambda findings: apply_mapping(findings, MAP_IDS))
+
+
+if __name__ == "__main__":
+    main()
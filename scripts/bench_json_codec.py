@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark the JSON codec backends on synthetic Prowler OCSF findings.
+
+Times decoding of a scan file and pretty-printed encoding of the normalized
+findings for every installed backend (orjson, simdjson, stdlib json).
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from cs_kit.normalizer import codec
+from cs_kit.normalizer.parser import _parse_single_finding
+
+SAMPLE_FILE = Path(__file__).resolve().parent.parent / "samples/prowler/aws/sample_ocsf.json"
+
+
+def build_findings(count: int) -> list[dict[str, Any]]:
+    """Build ``count`` raw findings by cycling the bundled sample file."""
+    samples = codec.load(SAMPLE_FILE)
+    findings = []
+    for i in range(count):
+        finding = dict(samples[i % len(samples)])
+        finding["finding_info"] = {"uid": f"finding-{i}"}
+        findings.append(finding)
+    return findings
+
+
+def best_of(repeat: int, func: Callable[[], object]) -> float:
+    """Return the fastest wall-clock time of ``repeat`` calls."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark JSON codec backends")
+    parser.add_argument("--findings", type=int, default=20000, help="Number of findings")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement")
+    args = parser.parse_args()
+
+    raw_findings = build_findings(args.findings)
+    normalized = [
+        _parse_single_finding(raw, "aws", "prowler").model_dump() for raw in raw_findings
+    ]
+
+    reference = codec.set_backend("json")
+    document = reference.dumps(raw_findings, True)
+    print(
+        f"{args.findings} findings, scan file {len(document) / 1e6:.1f} MB, "
+        f"backends: {', '.join(codec.available_backends())}"
+    )
+    print(f"{'backend':<10} {'decode s':>10} {'encode s':>10} {'decode MB/s':>12}")
+
+    for name in codec.available_backends():
+        backend = codec.set_backend(name)
+        decode = best_of(args.repeat, lambda: backend.loads(document))  # noqa: B023
+        encode = best_of(args.repeat, lambda: backend.dumps(normalized, True))  # noqa: B023
+        rate = len(document) / 1e6 / decode
+        print(f"{name:<10} {decode:>10.3f} {encode:>10.3f} {rate:>12.1f}")
+
+    codec.set_backend()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Measure compliance mapping index load times.
+
+Loads an index over the bundled mappings three ways: parsing the YAML files
+(empty cache), from the on-disk compiled cache after a simulated restart, and
+from the in-process cache.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+
+from cs_kit.normalizer.mapping import (
+    MAPPING_CACHE_ENV,
+    MappingLoadError,
+    clear_mapping_cache,
+    list_available_mappings,
+    load_mapping,
+    load_mapping_index,
+)
+
+
+def timed_load(map_ids: list[str], repeat: int, cold: bool) -> float:
+    """Average seconds per load_mapping_index call."""
+    total = 0.0
+    for _ in range(repeat):
+        if cold:
+            clear_mapping_cache()
+        start = time.perf_counter()
+        load_mapping_index(map_ids)
+        total += time.perf_counter() - start
+    return total / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark mapping index loading")
+    parser.add_argument("--repeat", type=int, default=20, help="Loads per measurement")
+    args = parser.parse_args()
+
+    map_ids = []
+    for map_id in list_available_mappings():
+        try:
+            load_mapping(map_id)
+        except MappingLoadError as e:
+            print(f"skipping {map_id}: {str(e).splitlines()[0]}")
+        else:
+            map_ids.append(map_id)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        os.environ[MAPPING_CACHE_ENV] = ""
+        parse_s = timed_load(map_ids, args.repeat, cold=True)
+
+        os.environ[MAPPING_CACHE_ENV] = cache_dir
+        load_mapping_index(map_ids)
+        disk_s = timed_load(map_ids, args.repeat, cold=True)
+        process_s = timed_load(map_ids, args.repeat, cold=False)
+
+    print(f"{len(map_ids)} mappings: {', '.join(map_ids)}")
+    print(f"{'source':<10} {'ms/load':>10}")
+    for name, seconds in (("yaml", parse_s), ("disk", disk_s), ("process", process_s)):
+        print(f"{name:<10} {seconds * 1000:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
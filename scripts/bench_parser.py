@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark OCSF field extraction and finding normalization.
+
+Compares the ``_extract_*`` fallback chain, which probes every candidate path
+for every finding, with the compiled per-shape ``FieldExtractor``, and reports
+end-to-end ``_parse_single_finding`` throughput.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from cs_kit.normalizer import codec
+from cs_kit.normalizer.parser import (
+    FIELD_PATHS,
+    _extract_field,
+    _parse_single_finding,
+    get_field_extractor,
+)
+
+SAMPLE_FILE = Path(__file__).resolve().parent.parent / "samples/prowler/aws/sample_ocsf.json"
+
+
+def build_findings(count: int) -> list[dict[str, Any]]:
+    """Build ``count`` raw findings by cycling the bundled sample file."""
+    samples = codec.load(SAMPLE_FILE)
+    return [dict(samples[i % len(samples)]) for i in range(count)]
+
+
+def findings_per_second(findings: list[dict[str, Any]], func: Callable[[dict[str, Any]], object], repeat: int) -> float:
+    """Return the best throughput of ``func`` over ``findings``."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for finding in findings:
+            func(finding)
+        best = min(best, time.perf_counter() - start)
+    return len(findings) / best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark OCSF field extraction")
+    parser.add_argument("--findings", type=int, default=50000, help="Number of findings")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement")
+    args = parser.parse_args()
+
+    findings = build_findings(args.findings)
+    extractor = get_field_extractor("prowler", "1.0.0")
+
+    def fallback_chain(raw: dict[str, Any]) -> dict[str, str | None]:
+        return {field: _extract_field(raw, field) for field in FIELD_PATHS}
+
+    chain = findings_per_second(findings, fallback_chain, args.repeat)
+    compiled = findings_per_second(findings, extractor.extract, args.repeat)
+    full = findings_per_second(
+        findings, lambda raw: _parse_single_finding(raw, "aws", "prowler"), args.repeat
+    )
+
+    print(f"{args.findings} findings")
+    print(f"{'fallback chain extraction':<28} {chain:>12,.0f} findings/s")
+    print(f"{'compiled extraction':<28} {compiled:>12,.0f} findings/s ({compiled / chain:.1f}x)")
+    print(f"{'_parse_single_finding':<28} {full:>12,.0f} findings/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Compare sequential and pipelined scan normalization end to end.
+
+Puts a stand-in ``prowler`` on PATH that sleeps for a staggered time per
+framework and then copies a synthetic OCSF file of ``--findings`` findings to
+its output directory. The scan is then run the sequential way (all prowler
+runs, then parse, dedupe, map and summarize) and with a
+``NormalizationPipeline`` fed by ``run_prowler(on_output=...)``, reporting the
+wall time of each.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from cs_kit.adapters.prowler.run import run_prowler
+from cs_kit.normalizer import codec
+from cs_kit.normalizer.dedupe import FindingDeduplicator
+from cs_kit.normalizer.mapping import iter_apply_mapping
+from cs_kit.normalizer.parser import iter_ocsf_many
+from cs_kit.normalizer.pipeline import NormalizationPipeline
+from cs_kit.normalizer.summarize import SummaryAccumulator
+
+SAMPLE_FILE = Path(__file__).resolve().parent.parent / "samples/prowler/aws/sample_ocsf.json"
+
+MAP_IDS = ["cis_aws_1_4"]
+
+FAKE_PROWLER = """#!/bin/sh
+while [ $# -gt 0 ]; do
+    if [ "$1" = "-o" ]; then out="$2"; fi
+    if [ "$1" = "--compliance" ]; then compliance="$2"; fi
+    shift
+done
+sleep "$(cat "$FAKE_PROWLER_DIR/$compliance.delay")"
+cp "$FAKE_PROWLER_DIR/$compliance.json" "$out/prowler-output.ocsf.json"
+exit 3
+"""
+
+
+def setup(work_dir: Path, frameworks: list[str], findings: int, scan_seconds: float) -> None:
+    """Write the fake prowler, its per-framework output and scan delays."""
+    bin_dir = work_dir / "bin"
+    bin_dir.mkdir()
+    executable = bin_dir / "prowler"
+    executable.write_text(FAKE_PROWLER)
+    executable.chmod(0o755)
+    os.environ["PATH"] = f"{bin_dir}{os.pathsep}{os.environ['PATH']}"
+    os.environ["FAKE_PROWLER_DIR"] = str(work_dir)
+
+    samples = codec.load(SAMPLE_FILE)
+    for i, framework in enumerate(frameworks):
+        data = []
+        for j in range(findings):
+            finding = dict(samples[j % len(samples)])
+            finding["resources"] = [{"uid": f"arn:aws:s3:::{framework}-{j}", "region": "us-east-1"}]
+            data.append(finding)
+        codec.dump(data, work_dir / f"{framework}.json")
+        # Runs finish one after another, as real frameworks differ in size
+        delay = scan_seconds * (i + 1) / len(frameworks)
+        (work_dir / f"{framework}.delay").write_text(f"{delay:.2f}")
+
+
+async def sequential(frameworks: list[str], out_dir: Path) -> int:
+    """Scan, then normalize everything."""
+    files = await run_prowler("aws", frameworks, [], {}, out_dir)
+    stream = iter_apply_mapping(
+        FindingDeduplicator().filter(iter_ocsf_many(files, "aws", "prowler", workers=1, as_records=True)),
+        MAP_IDS,
+    )
+    findings = list(stream)
+    SummaryAccumulator.from_findings(findings).summary()
+    return len(findings)
+
+
+async def pipelined(frameworks: list[str], out_dir: Path) -> int:
+    """Normalize each run's output as the run finishes."""
+    pipeline = NormalizationPipeline("aws", "prowler", MAP_IDS)
+    await run_prowler("aws", frameworks, [], {}, out_dir, on_output=pipeline.submit)
+    findings = await pipeline.finish()
+    pipeline.accumulator.summary()
+    return len(findings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark pipelined scan normalization")
+    parser.add_argument("--frameworks", type=int, default=4, help="Number of prowler runs")
+    parser.add_argument("--findings", type=int, default=50_000, help="Findings per run")
+    parser.add_argument("--scan-seconds", type=float, default=8.0, help="Duration of the slowest run")
+    args = parser.parse_args()
+
+    frameworks = [f"framework{i}" for i in range(args.frameworks)]
+    with tempfile.TemporaryDirectory() as tmp:
+        work_dir = Path(tmp)
+        setup(work_dir, frameworks, args.findings, args.scan_seconds)
+
+        print(f"{args.frameworks} runs x {args.findings} findings, slowest run {args.scan_seconds}s")
+        print(f"{'mode':<10} {'seconds':>10} {'findings':>10}")
+        for name, mode in [("sequential", sequential), ("pipelined", pipelined)]:
+            start = time.perf_counter()
+            count = asyncio.run(mode(frameworks, work_dir / name))
+            print(f"{name:<10} {time.perf_counter() - start:>10.2f} {count:>10}")
+
+
+if __name__ == "__main__":
+    main()
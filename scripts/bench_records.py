@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Compare Pydantic finding models with compact finding records.
+
+Parses the same synthetic Prowler findings into ``OCSFFinding`` models and into
+``FindingRecord`` instances, applies a compliance mapping, and reports
+throughput and the peak memory (tracemalloc) of each pipeline.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+from cs_kit.normalizer import codec
+from cs_kit.normalizer.mapping import apply_mapping
+from cs_kit.normalizer.parser import _parse_raw_findings
+
+SAMPLE_FILE = Path(__file__).resolve().parent.parent / "samples/prowler/aws/sample_ocsf.json"
+
+
+def build_findings(count: int) -> list[dict[str, Any]]:
+    """Build ``count`` raw findings by cycling the bundled sample file."""
+    samples = codec.load(SAMPLE_FILE)
+    return [dict(samples[i % len(samples)]) for i in range(count)]
+
+
+def run_pipeline(raw_findings: list[dict[str, Any]], as_records: bool) -> tuple[float, float, float]:
+    """Parse and map findings, returning (parse s, mapping s, peak MB)."""
+    gc.collect()
+    tracemalloc.start()
+
+    start = time.perf_counter()
+    findings = list(
+        _parse_raw_findings(raw_findings, SAMPLE_FILE, "aws", "prowler", as_records=as_records)
+    )
+    parsed = time.perf_counter()
+    enriched = apply_mapping(findings, ["cis_aws_1_4"])
+    mapped = time.perf_counter()
+
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del findings, enriched
+
+    return parsed - start, mapped - parsed, peak / 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark finding models vs records")
+    parser.add_argument("--findings", type=int, default=100000, help="Number of findings")
+    args = parser.parse_args()
+
+    raw_findings = build_findings(args.findings)
+
+    print(f"{args.findings} findings")
+    print(f"{'pipeline':<10} {'parse/s':>12} {'map/s':>12} {'peak MB':>10}")
+    for name, as_records in (("models", False), ("records", True)):
+        parse_s, map_s, peak = run_pipeline(raw_findings, as_records)
+        print(
+            f"{name:<10} {args.findings / parse_s:>12,.0f} "
+            f"{args.findings / map_s:>12,.0f} {peak:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
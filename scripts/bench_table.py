@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Compare per-finding summaries with the columnar ``FindingsTable`` versions.
+
+Builds synthetic enriched findings, then times ``generate_finding_summary``,
+``by_provider`` and ``by_framework`` on a list of records and on a table, and
+summarizing finding dictionaries, as a rollup of runs without partial
+summaries reads them, through records and through a table.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+
+from cs_kit.normalizer import table as table_module
+from cs_kit.normalizer.records import FindingRecord
+from cs_kit.normalizer.summarize import (
+    SummaryAccumulator,
+    by_framework,
+    by_provider,
+    generate_finding_summary,
+)
+from cs_kit.normalizer.table import FindingsTable
+
+
+def build_findings(count: int) -> list[FindingRecord]:
+    """Build ``count`` synthetic enriched findings."""
+    rng = random.Random(0)
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    return [
+        FindingRecord(
+            time=start + timedelta(seconds=i),
+            provider=rng.choice(("aws", "gcp", "azure")),
+            product="prowler",
+            severity=rng.choice(("critical", "high", "medium", "low", None)),
+            status=rng.choice(("pass", "fail", "not_applicable")),
+            resource_id=f"arn:aws:s3:::bucket-{rng.randrange(count // 10 + 1)}",
+            account_id=f"{rng.randrange(50):012d}",
+            region=rng.choice(("us-east-1", "eu-west-1")),
+            check_id=f"check_{rng.randrange(300)}",
+            framework_refs=[f"cis_aws_1_4:{rng.randrange(60)}"] if rng.random() < 0.3 else [],
+        )
+        for i in range(count)
+    ]
+
+
+def timed(func: Callable[[], object]) -> float:
+    """Return the wall-clock time of one call."""
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark columnar summaries")
+    parser.add_argument("--findings", type=int, default=1000000, help="Number of findings")
+    args = parser.parse_args()
+
+    findings = build_findings(args.findings)
+    build = timed(lambda: FindingsTable.from_findings(findings))
+    table = FindingsTable.from_findings(findings)
+    numpy = "numpy" if table_module.np is not None else "pure Python"
+
+    print(f"{args.findings} findings, table built in {build:.2f}s ({numpy})")
+    print(f"{'summary':<26} {'list s':>8} {'table s':>8}")
+    for name, func in (
+        ("generate_finding_summary", generate_finding_summary),
+        ("by_provider", by_provider),
+        ("by_framework", by_framework),
+    ):
+        print(f"{name:<26} {timed(lambda: func(findings)):>8.2f} {timed(lambda: func(table)):>8.2f}")  # noqa: B023
+
+    dicts = [finding.to_dict() for finding in findings]
+    records = timed(
+        lambda: SummaryAccumulator.from_findings(map(FindingRecord.from_dict, dicts))
+    )
+    columns = timed(
+        lambda: SummaryAccumulator().update_table(FindingsTable.from_dicts(dicts))
+    )
+    print(f"{'summarize dicts':<26} {records:>8.2f} {columns:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
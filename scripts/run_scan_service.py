@@ -3,14 +3,16 @@
 Helper script to run CS Kit scans programmatically.
 
 Executes a scan using cs_kit CLI internals and outputs metadata in JSON format.
+Normalized findings are streamed from the run's artifact into the output, so
+large scans are never held in memory.
 """
 
 from __future__ import annotations
 
 import argparse
 import asyncio
-import json
 import sys
+from collections.abc import Iterator
 from datetime import UTC, datetime
 from pathlib import Path
 from uuid import uuid4
@@ -18,6 +20,8 @@ from uuid import uuid4
 from cs_kit.cli.config import RunConfig
 from cs_kit.cli.main import _run_scan  # type: ignore[attr-defined]
 from cs_kit.cli.main import console as cli_console
+from cs_kit.normalizer import codec
+from cs_kit.normalizer.artifacts import iter_finding_dicts, normalized_file
 
 
 def generate_run_id() -> str:
@@ -33,8 +37,12 @@ async def execute_scan(
     regions: list[str],
     artifacts_dir: Path,
     company_name: str,
+    artifact_format: str = "json",
 ) -> dict[str, object]:
-    """Execute the CS Kit scan and return metadata."""
+    """Execute the CS Kit scan and return metadata.
+
+    The ``normalized`` entry is an iterator streaming the run's findings.
+    """
     run_id = generate_run_id()
 
     config = RunConfig(
@@ -42,6 +50,7 @@ async def execute_scan(
         frameworks=frameworks,
         regions=regions,
         artifacts_dir=str(artifacts_dir),
+        artifact_format=artifact_format,  # type: ignore[arg-type]
     )
 
     # Suppress rich console output so JSON payload remains clean
@@ -53,35 +62,46 @@ async def execute_scan(
         cli_console.quiet = previous_quiet  # type: ignore[attr-defined]
 
     run_dir = artifacts_dir / run_id
-    normalized_file = run_dir / "normalized.json"
     summary_file = run_dir / "summary.json"
     metadata_file = run_dir / "metadata.json"
 
-    if not normalized_file.exists():
-        raise FileNotFoundError(f"Normalized results not found at {normalized_file}")
-
-    with normalized_file.open("r", encoding="utf-8") as nf:
-        normalized_data = json.load(nf)
+    try:
+        findings_file = normalized_file(run_dir)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Normalized results not found in {run_dir}") from None
 
     summary_data: dict[str, object] | None = None
     if summary_file.exists():
-        with summary_file.open("r", encoding="utf-8") as sf:
-            summary_data = json.load(sf)
+        summary_data = codec.load(summary_file)
 
     metadata: dict[str, object] | None = None
     if metadata_file.exists():
-        with metadata_file.open("r", encoding="utf-8") as mf:
-            metadata = json.load(mf)
+        metadata = codec.load(metadata_file)
 
     return {
         "run_id": run_id,
         "artifacts_dir": str(run_dir),
-        "normalized": normalized_data,
+        "normalized": iter_finding_dicts(findings_file),
         "summary": summary_data,
         "metadata": metadata,
     }
 
 
+def write_result(result: dict[str, object], out) -> None:
+    """Write the result as one JSON object, streaming the findings array."""
+    out.write("{")
+    for i, (key, value) in enumerate(result.items()):
+        out.write(("," if i else "") + codec.dumps(key) + ":")
+        if isinstance(value, Iterator):
+            out.write("[")
+            for j, item in enumerate(value):
+                out.write(("," if j else "") + codec.dumps(item))
+            out.write("]")
+        else:
+            out.write(codec.dumps(value))
+    out.write("}")
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Run CS Kit scan service")
     parser.add_argument("--provider", required=True, help="Cloud provider (aws, gcp, azure)")
@@ -105,6 +125,12 @@ def main() -> None:
         default="Security Assessment",
         help="Company name to embed in reports",
     )
+    parser.add_argument(
+        "--artifact-format",
+        default="json",
+        choices=["json", "ndjson", "ndjson.zst", "parquet"],
+        help="Format of the normalized findings artifact",
+    )
 
     args = parser.parse_args()
 
@@ -124,12 +150,13 @@ def main() -> None:
                 regions=regions,
                 artifacts_dir=artifacts_dir,
                 company_name=args.company_name,
+                artifact_format=args.artifact_format,
             )
         )
-        json.dump(result, sys.stdout)
+        write_result(result, sys.stdout)
     except Exception as exc:  # pylint: disable=broad-except
         error_payload = {"error": str(exc)}
-        json.dump(error_payload, sys.stdout)
+        sys.stdout.write(codec.dumps(error_payload))
         sys.exit(1)
 
 
@@ -0,0 +1,15 @@
+"""Shared test fixtures."""
+
+from pathlib import Path
+
+import pytest
+
+from cs_kit.normalizer.mapping import MAPPING_CACHE_ENV
+
+
+@pytest.fixture(autouse=True)
+def mapping_cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep compiled mappings out of the user's cache directory."""
+    cache_dir = tmp_path / "mapping_cache"
+    monkeypatch.setenv(MAPPING_CACHE_ENV, str(cache_dir))
+    return cache_dir
@@ -0,0 +1,224 @@
+"""Tests for normalized artifact reading and writing."""
+
+import json
+import tempfile
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from cs_kit.normalizer.artifacts import (
+    NORMALIZED_NDJSON_FILE,
+    PARTIAL_SUMMARY_FILE,
+    iter_findings,
+    normalized_file,
+    read_partial_summary,
+    rollup_partial_summaries,
+    write_findings,
+    write_findings_json,
+    write_partial_summary,
+)
+from cs_kit.normalizer.ocsf_models import OCSFEnrichedFinding
+from cs_kit.normalizer.records import FindingRecord
+from cs_kit.normalizer.summarize import SummaryAccumulator, generate_finding_summary
+
+
+class TestWriteFindingsJson:
+    """Test write_findings_json function."""
+
+    def test_matches_json_dump(self) -> None:
+        """Test streamed output is byte-identical to json.dump of the list."""
+        findings = [
+            OCSFEnrichedFinding(
+                time=datetime(2024, 1, 15, 10, 30, tzinfo=UTC),
+                provider="aws",
+                product="prowler",
+                severity="high",
+                framework_refs=["cis_aws_1_4:1.3"],
+                raw={"multi": "line\ntext", "nested": {"a": [1, 2]}},
+            ),
+            OCSFEnrichedFinding(
+                time=datetime(2024, 1, 15, 10, 31, tzinfo=UTC),
+                provider="aws",
+                product="prowler",
+            ),
+        ]
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "normalized.json"
+            count = write_findings_json(iter(findings), path)
+
+            expected = json.dumps(
+                [f.model_dump() for f in findings], indent=2, default=str
+            )
+            assert count == 2
+            assert path.read_text(encoding="utf-8") == expected
+
+    def test_empty(self) -> None:
+        """Test writing no findings produces an empty array."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "normalized.json"
+            assert write_findings_json([], path) == 0
+            assert json.loads(path.read_text(encoding="utf-8")) == []
+
+
+class TestIterFindings:
+    """Test iter_findings on JSON artifacts."""
+
+    def test_round_trip(self) -> None:
+        """Test written findings read back as equal records."""
+        findings = [
+            FindingRecord(
+                time=datetime(2024, 1, 15, 10, 30, tzinfo=UTC),
+                provider="aws",
+                product="prowler",
+                check_id="s3_encryption",
+                status="fail",
+                framework_refs=["cis_aws_1_4:2.1.1"],
+                raw={"nested": {"a": [1, 2]}},
+            ),
+        ]
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            write_findings_json(findings, Path(tmp_dir) / "normalized.json")
+
+            assert list(iter_findings(Path(tmp_dir))) == findings
+
+    def test_missing(self) -> None:
+        """Test reading a directory without normalized findings."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with pytest.raises(FileNotFoundError):
+                list(iter_findings(Path(tmp_dir)))
+
+    def test_not_a_list_of_findings(self, tmp_path: Path) -> None:
+        """Test a JSON file holding something other than findings."""
+        (tmp_path / "normalized.json").write_text("[1, 2]")
+
+        with pytest.raises(ValueError, match="Expected a list of findings"):
+            list(iter_findings(tmp_path))
+
+
+class TestWriteFindings:
+    """Test write_findings and reading runs in any artifact format."""
+
+    @pytest.mark.parametrize("artifact_format", ["json", "ndjson"])
+    def test_round_trip(self, artifact_format: str, tmp_path: Path) -> None:
+        """Test each format is found in the run directory and read back."""
+        findings = [
+            FindingRecord(
+                time=datetime(2024, 1, 15, 10, 30, tzinfo=UTC),
+                provider="aws",
+                product="prowler",
+                check_id=f"check_{i}",
+                raw={"multi": "line\ntext"},
+            )
+            for i in range(3)
+        ]
+
+        path = write_findings(findings, tmp_path, artifact_format)  # type: ignore[arg-type]
+
+        assert normalized_file(tmp_path) == path
+        assert list(iter_findings(tmp_path)) == findings
+        assert list(iter_findings(path)) == findings
+
+    def test_ndjson_file_name(self, tmp_path: Path) -> None:
+        """Test NDJSON findings are written with an offset index."""
+        path = write_findings([], tmp_path, "ndjson")
+
+        assert path == tmp_path / NORMALIZED_NDJSON_FILE
+        assert (tmp_path / f"{NORMALIZED_NDJSON_FILE}.idx").exists()
+
+    def test_missing(self, tmp_path: Path) -> None:
+        """Test a run without normalized findings in any format."""
+        with pytest.raises(FileNotFoundError, match="Normalized findings not found"):
+            normalized_file(tmp_path)
+
+
+class TestPartialSummaries:
+    """Test partial summary reading, writing and rollup."""
+
+    @staticmethod
+    def _finding(account_id: str, severity: str) -> OCSFEnrichedFinding:
+        return OCSFEnrichedFinding(
+            time=datetime(2024, 1, 15, 10, 30, tzinfo=UTC),
+            provider="aws",
+            product="prowler",
+            severity=severity,
+            account_id=account_id,
+            resource_id=f"arn:aws:s3:::{account_id}",
+        )
+
+    def test_round_trip(self) -> None:
+        """Test a written partial summary reads back from a run directory."""
+        accumulator = SummaryAccumulator.from_findings([self._finding("111", "high")])
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            write_partial_summary(accumulator, Path(tmp_dir) / PARTIAL_SUMMARY_FILE)
+
+            restored = read_partial_summary(Path(tmp_dir))
+
+        assert restored.summary() == accumulator.summary()
+
+    def test_rollup(self) -> None:
+        """Test rolling up runs equals summarizing all of their findings."""
+        runs = [
+            [self._finding("111", "high"), self._finding("111", "low")],
+            [self._finding("222", "high")],
+            [self._finding("111", "critical")],
+        ]
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            paths = []
+            for i, findings in enumerate(runs):
+                path = Path(tmp_dir) / f"run{i}.json"
+                write_partial_summary(SummaryAccumulator.from_findings(findings), path)
+                paths.append(path)
+
+            rollup = rollup_partial_summaries(paths)
+
+        all_findings = [finding for findings in runs for finding in findings]
+        assert rollup.summary() == generate_finding_summary(all_findings)
+
+    def test_rollup_hll(self) -> None:
+        """Test HyperLogLog partial summaries roll up in HyperLogLog mode."""
+        runs = [[self._finding("111", "high")], [self._finding("222", "low")]]
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            paths = []
+            for i, findings in enumerate(runs):
+                path = Path(tmp_dir) / f"run{i}.json"
+                accumulator = SummaryAccumulator.from_findings(findings, cardinality="hll")
+                write_partial_summary(accumulator, path)
+                paths.append(path)
+
+            summary = rollup_partial_summaries(paths).summary()
+
+        assert summary.cardinality == "hll"
+        assert summary.unique_resources == 2
+        assert summary.unique_accounts == 2
+
+    def test_rollup_findings(self) -> None:
+        """Test runs without a partial summary are summarized from findings."""
+        with_partial = [self._finding("111", "high")]
+        without_partial = [self._finding("222", "low"), self._finding("111", "critical")]
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            partial_path = Path(tmp_dir) / "run1.json"
+            write_partial_summary(SummaryAccumulator.from_findings(with_partial), partial_path)
+            run_dir = Path(tmp_dir) / "run2"
+            run_dir.mkdir()
+            write_findings(without_partial, run_dir, "ndjson")  # type: ignore[arg-type]
+            findings_path = write_findings(without_partial, Path(tmp_dir), "json")  # type: ignore[arg-type]
+
+            rollup = rollup_partial_summaries([partial_path, run_dir, findings_path])
+
+        all_findings = with_partial + without_partial + without_partial
+        assert rollup.summary() == generate_finding_summary(all_findings)
+
+    def test_missing(self) -> None:
+        """Test reading a directory without a partial summary."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with pytest.raises(FileNotFoundError):
+                read_partial_summary(Path(tmp_dir))
+            with pytest.raises(FileNotFoundError):
+                rollup_partial_summaries([Path(tmp_dir)])
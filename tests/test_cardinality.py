@@ -0,0 +1,73 @@
+"""Tests for HyperLogLog distinct counting."""
+
+import json
+
+import pytest
+
+from cs_kit.normalizer.cardinality import MAX_PRECISION, MIN_PRECISION, HyperLogLog
+
+
+class TestHyperLogLog:
+    """Test HyperLogLog sketches."""
+
+    @pytest.mark.parametrize("precision", [10, 14])
+    @pytest.mark.parametrize("cardinality", [100, 5000, 50000])
+    def test_error_bound(self, precision: int, cardinality: int) -> None:
+        """Test estimates stay within three standard errors of the true count."""
+        sketch = HyperLogLog(precision)
+        sketch.update(f"arn:aws:s3:::bucket-{i}" for i in range(cardinality))
+
+        relative_error = abs(sketch.count() - cardinality) / cardinality
+        assert relative_error <= 3 * sketch.relative_error
+
+    def test_duplicates_ignored(self) -> None:
+        """Test adding the same values again doesn't change the estimate."""
+        sketch = HyperLogLog(12)
+        sketch.update(str(i) for i in range(1000))
+        before = sketch.count()
+
+        sketch.update(str(i) for i in range(1000))
+
+        assert sketch.count() == before
+
+    def test_empty(self) -> None:
+        """Test an empty sketch counts zero."""
+        assert HyperLogLog().count() == 0
+
+    def test_merge_is_union(self) -> None:
+        """Test merging equals adding both value sets to one sketch."""
+        left, right, union = HyperLogLog(12), HyperLogLog(12), HyperLogLog(12)
+        left.update(str(i) for i in range(0, 3000))
+        right.update(str(i) for i in range(2000, 5000))
+        union.update(str(i) for i in range(0, 5000))
+
+        assert left.merge(right).registers == union.registers
+
+    def test_merge_precision_mismatch(self) -> None:
+        """Test sketches with different precisions can't be merged."""
+        with pytest.raises(ValueError, match="precision"):
+            HyperLogLog(10).merge(HyperLogLog(12))
+
+    def test_serialization_round_trip(self) -> None:
+        """Test to_dict output survives JSON."""
+        sketch = HyperLogLog(8)
+        sketch.update(str(i) for i in range(500))
+
+        restored = HyperLogLog.from_dict(json.loads(json.dumps(sketch.to_dict())))
+
+        assert restored.registers == sketch.registers
+        assert restored.count() == sketch.count()
+
+    def test_from_dict_register_mismatch(self) -> None:
+        """Test registers of the wrong size are rejected."""
+        data = HyperLogLog(8).to_dict()
+        data["precision"] = 9
+
+        with pytest.raises(ValueError, match="registers"):
+            HyperLogLog.from_dict(data)
+
+    @pytest.mark.parametrize("precision", [MIN_PRECISION - 1, MAX_PRECISION + 1])
+    def test_invalid_precision(self, precision: int) -> None:
+        """Test out of range precisions are rejected."""
+        with pytest.raises(ValueError, match="precision"):
+            HyperLogLog(precision)
@@ -0,0 +1,74 @@
+"""Tests for the pluggable JSON codec."""
+
+import json
+import tempfile
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from cs_kit.normalizer import codec
+
+
+@pytest.fixture(params=codec.available_backends())
+def backend(request: pytest.FixtureRequest) -> Iterator[str]:
+    """Run a test once per installed backend."""
+    previous = codec.get_backend().name
+    codec.set_backend(request.param)
+    yield request.param
+    codec.set_backend(previous)
+
+
+class TestCodec:
+    """Test codec round-tripping across backends."""
+
+    def test_json_backend_always_available(self) -> None:
+        """Test the stdlib fallback is always available."""
+        assert "json" in codec.available_backends()
+
+    def test_unknown_backend(self) -> None:
+        """Test selecting an unknown backend fails."""
+        with pytest.raises(ValueError, match="not available"):
+            codec.set_backend("nope")
+
+    def test_dumps_matches_stdlib(self, backend: str) -> None:
+        """Test encoding of ASCII data matches json.dumps(..., default=str)."""
+        data = {
+            "time": datetime(2024, 1, 15, 10, 30, tzinfo=UTC),
+            "path": Path("/tmp/x"),
+            "nested": {"list": [1, 2.5, None, True], "empty": {}},
+        }
+
+        assert codec.dumps(data) == json.dumps(
+            data, separators=(",", ":"), default=str
+        )
+        assert codec.dumps(data, indent=True) == json.dumps(data, indent=2, default=str)
+
+    def test_dumps_equivalent_json(self, backend: str) -> None:
+        """Test encoding non-ASCII text decodes to the same values as the stdlib."""
+        data = {"name": "caf\u00e9 \u2713", "ratio": 0.1 + 0.2}
+
+        assert json.loads(codec.dumps(data)) == data
+
+    def test_loads_round_trip(self, backend: str) -> None:
+        """Test decoding str and bytes input."""
+        text = '{"a": [1, 2, {"b": "c\\u00e9"}], "d": null}'
+        expected = json.loads(text)
+
+        assert codec.loads(text) == expected
+        assert codec.loads(text.encode("utf-8")) == expected
+
+    def test_loads_invalid(self, backend: str) -> None:
+        """Test decode errors are raised as json.JSONDecodeError."""
+        with pytest.raises(json.JSONDecodeError):
+            codec.loads("{invalid")
+
+    def test_file_round_trip(self, backend: str) -> None:
+        """Test dump and load through files."""
+        data = {"findings": [{"severity": "high"}], "count": 1}
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "data.json"
+            codec.dump(data, path, indent=True)
+            assert codec.load(path) == data
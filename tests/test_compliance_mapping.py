@@ -1,25 +1,32 @@
 """Tests for compliance mapping functionality."""
 
+import os
 import tempfile
+from collections.abc import Iterator
 from datetime import UTC, datetime
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 import yaml
 
 from cs_kit.normalizer.mapping import (
+    MAPPING_CACHE_ENV,
     ComplianceMapping,
+    MappingIndex,
     MappingLoadError,
     MappingNotFoundError,
     MappingRule,
     apply_mapping,
+    clear_mapping_cache,
     get_framework_controls,
     get_mappings_directory,
     list_available_mappings,
     load_mapping,
+    load_mapping_index,
     validate_mapping_file,
 )
-from cs_kit.normalizer.ocsf_models import OCSFFinding
+from cs_kit.normalizer.ocsf_models import OCSFEnrichedFinding, OCSFFinding
 
 
 class TestMappingModels:
@@ -272,6 +279,200 @@ class TestApplyMapping:
             pytest.skip("CIS AWS mapping file not found")
 
 
+class TestZeroCopyEnrichment:
+    """Test enriched models share values with the original findings."""
+
+    def test_matches_validated_copy(self) -> None:
+        """Test enrichment gives the same result as validating a full copy."""
+        finding = OCSFFinding(
+            time=datetime.now(UTC),
+            provider="aws",
+            product="prowler",
+            check_id="aws_iam_avoid_root_usage",
+            severity="low",
+            raw={"nested": {"values": [1, 2]}},
+            unexpected="extra",  # type: ignore[call-arg]
+        )
+
+        enriched = apply_mapping([finding], ["cis_aws_1_4"])[0]
+        expected = OCSFEnrichedFinding(**finding.model_dump())
+        expected.framework_refs = enriched.framework_refs
+
+        assert enriched == expected
+        assert enriched.model_dump() == expected.model_dump()
+        assert enriched.framework_refs
+
+    def test_raw_not_copied(self) -> None:
+        """Test the raw payload is shared rather than copied."""
+        finding = OCSFFinding(
+            time=datetime.now(UTC), provider="aws", product="prowler", raw={"a": {"b": 1}}
+        )
+
+        enriched = apply_mapping([finding], [])[0]
+
+        assert enriched.raw is finding.raw
+
+    def test_assignment_still_validated(self) -> None:
+        """Test enriched models keep validating assignments."""
+        finding = OCSFFinding(time=datetime.now(UTC), provider="aws", product="prowler")
+
+        enriched = apply_mapping([finding], [])[0]
+
+        with pytest.raises(ValueError):
+            enriched.severity = "bogus"  # type: ignore[assignment]
+
+
+class TestMappingIndex:
+    """Test the compiled mapping index and its caches."""
+
+    @pytest.fixture(autouse=True)
+    def cache_dir(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+        """Use an empty on-disk cache and clear the in-memory caches."""
+        cache_dir = tmp_path / "cache"
+        monkeypatch.setenv(MAPPING_CACHE_ENV, str(cache_dir))
+        clear_mapping_cache()
+        yield cache_dir
+        clear_mapping_cache()
+
+    @pytest.fixture
+    def mapping_file(self) -> Iterator[Path]:
+        """Write a small temporary mapping into the mappings directory."""
+        with tempfile.NamedTemporaryFile(
+            mode="w", suffix=".yaml", delete=False, dir=get_mappings_directory()
+        ) as f:
+            temp_file = Path(f.name)
+        self._write_mapping(temp_file, "1.1")
+        yield temp_file
+        temp_file.unlink()
+
+    @staticmethod
+    def _write_mapping(path: Path, control: str) -> None:
+        """Write a mapping with rules for two checks."""
+        rule = {"title": "t", "description": "d"}
+        data = {
+            "map_id": path.stem,
+            "name": "Test",
+            "version": "1",
+            "description": "Test mapping",
+            "framework_type": "cis",
+            "rules": [
+                {**rule, "source": "prowler:check_a", "target": control},
+                {**rule, "source": "prowler:check_a", "target": "2.1", "severity": "high"},
+                {**rule, "source": "prowler:check_b", "target": "3.1", "severity": "low"},
+            ],
+        }
+        path.write_text(yaml.dump(data), encoding="utf-8")
+
+    def test_lookup(self, mapping_file: Path) -> None:
+        """Test lookups return refs in rule order."""
+        index = load_mapping_index([mapping_file.stem])
+
+        assert index.lookup("prowler", "check_a") == (
+            f"{mapping_file.stem}:1.1",
+            f"{mapping_file.stem}:2.1",
+        )
+        assert index.entry("prowler", "check_b") == ((f"{mapping_file.stem}:3.1",), "low")
+        assert index.lookup("prowler", "missing") == ()
+        assert index.lookup("other", "check_a") == ()
+        assert len(index) == 2
+
+    def test_matches_mapping_rules(self) -> None:
+        """Test the index holds every rule of the bundled mappings."""
+        map_ids = ["cis_aws_1_4", "nist_csf"]
+        index = load_mapping_index(map_ids)
+
+        for map_id in map_ids:
+            for rule in load_mapping(map_id).rules:
+                product, _, check_id = rule.source.partition(":")
+                assert f"{map_id}:{rule.target}" in index.lookup(product, check_id)
+
+    def test_process_cache(self, mapping_file: Path) -> None:
+        """Test unchanged files reuse the index without reparsing."""
+        index = load_mapping_index([mapping_file.stem])
+
+        with patch("cs_kit.normalizer.mapping.yaml.safe_load") as safe_load:
+            assert load_mapping_index([mapping_file.stem]) is index
+            # A new mtime with the same content is recognized by its hash
+            os.utime(mapping_file, ns=(0, 0))
+            assert load_mapping_index([mapping_file.stem]) is index
+
+        safe_load.assert_not_called()
+
+    def test_file_change_invalidates(self, mapping_file: Path) -> None:
+        """Test edited mappings are recompiled."""
+        index = load_mapping_index([mapping_file.stem])
+
+        self._write_mapping(mapping_file, "9.9")
+        os.utime(mapping_file, ns=(0, 0))
+
+        updated = load_mapping_index([mapping_file.stem])
+        assert updated is not index
+        assert updated.lookup("prowler", "check_a")[0] == f"{mapping_file.stem}:9.9"
+
+    def test_disk_cache(self, mapping_file: Path, cache_dir: Path) -> None:
+        """Test a cold start reads compiled rules instead of YAML."""
+        index = load_mapping_index([mapping_file.stem])
+        assert list(cache_dir.glob("*.json"))
+        assert cache_dir.stat().st_mode & 0o777 == 0o700
+        clear_mapping_cache()
+
+        with patch("cs_kit.normalizer.mapping.yaml.safe_load") as safe_load:
+            restored = load_mapping_index([mapping_file.stem])
+
+        safe_load.assert_not_called()
+        assert restored.lookup("prowler", "check_a") == index.lookup("prowler", "check_a")
+        assert restored.entry("prowler", "check_b") == index.entry("prowler", "check_b")
+
+    def test_corrupt_disk_cache(self, mapping_file: Path, cache_dir: Path) -> None:
+        """Test unreadable cache entries are recompiled."""
+        load_mapping_index([mapping_file.stem])
+        for cached in cache_dir.glob("*.json"):
+            cached.write_bytes(b"not json")
+        clear_mapping_cache()
+
+        index = load_mapping_index([mapping_file.stem])
+
+        assert index.lookup("prowler", "check_b") == (f"{mapping_file.stem}:3.1",)
+
+    def test_disk_cache_disabled(
+        self, mapping_file: Path, cache_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test an empty cache setting disables the on-disk cache."""
+        monkeypatch.setenv(MAPPING_CACHE_ENV, "")
+
+        load_mapping_index([mapping_file.stem])
+
+        assert not cache_dir.exists()
+
+    def test_apply_mapping_uses_first_override(self, mapping_file: Path) -> None:
+        """Test enrichment applies the first severity override of a check."""
+        finding = OCSFFinding(
+            time=datetime.now(UTC), provider="aws", product="prowler", check_id="check_a"
+        )
+
+        enriched = apply_mapping([finding], [mapping_file.stem, mapping_file.stem])[0]
+
+        assert enriched.severity == "high"
+        assert enriched.framework_refs == list(
+            load_mapping_index([mapping_file.stem]).lookup("prowler", "check_a")
+        )
+
+    def test_nonexistent_mapping(self) -> None:
+        """Test missing mappings raise the usual error."""
+        with pytest.raises(MappingNotFoundError):
+            load_mapping_index(["nonexistent_mapping"])
+
+    def test_from_rules(self) -> None:
+        """Test combining rules keeps mapping order."""
+        index = MappingIndex.from_rules({
+            "a": {"prowler": {"c": [("1", None)]}},
+            "b": {"prowler": {"c": [("2", "low")]}},
+        })
+
+        assert index.map_ids == ("a", "b")
+        assert index.entry("prowler", "c") == (("a:1", "b:2"), "low")
+
+
 class TestGetFrameworkControls:
     """Test get_framework_controls function."""
 
@@ -78,6 +78,14 @@ class TestRunConfig:
         assert len(errors) == 1
         assert errors[0]["type"] == "extra_forbidden"
 
+    def test_parse_workers(self) -> None:
+        """Test parse worker count defaults to 1 and must be positive."""
+        config = RunConfig(provider="aws", artifacts_dir="/tmp/artifacts")
+        assert config.parse_workers == 1
+
+        with pytest.raises(ValidationError):
+            RunConfig(provider="aws", artifacts_dir="/tmp/artifacts", parse_workers=0)
+
     @pytest.mark.parametrize("provider", ["aws", "gcp", "azure"])
     def test_all_valid_providers(self, provider: str) -> None:
         """Test all valid provider values."""
@@ -0,0 +1,111 @@
+"""Tests for duplicate finding removal."""
+
+from datetime import UTC, datetime
+from pathlib import Path
+
+from cs_kit.normalizer.dedupe import (
+    FindingDeduplicator,
+    dedupe_findings,
+    finding_identity,
+    identity_digest,
+)
+from cs_kit.normalizer.mapping import apply_mapping
+from cs_kit.normalizer.ocsf_models import OCSFEnrichedFinding
+from cs_kit.normalizer.parser import parse_ocsf
+from cs_kit.normalizer.records import FindingRecord
+
+SAMPLE_FILE = Path(__file__).parent.parent / "samples/prowler/aws/sample_ocsf.json"
+
+
+def _record(check_id: str | None, resource_id: str | None = "r1", **kwargs: object) -> FindingRecord:
+    return FindingRecord(
+        time=datetime(2024, 1, 15, tzinfo=UTC),
+        provider="aws",
+        product="prowler",
+        check_id=check_id,
+        resource_id=resource_id,
+        region="us-east-1",
+        account_id="111",
+        **kwargs,  # type: ignore[arg-type]
+    )
+
+
+class TestDedupeFindings:
+    """Test dedupe_findings and FindingDeduplicator."""
+
+    def test_identity(self) -> None:
+        """Test the identity covers product, check, resource, region and account."""
+        assert finding_identity(_record("c1")) == ("prowler", "c1", "r1", "us-east-1", "111")
+
+    def test_keeps_first_occurrence(self) -> None:
+        """Test duplicates are dropped and order of first occurrence kept."""
+        first = _record("c1")
+        findings = [first, _record("c2"), _record("c1"), _record("c1", "r2")]
+
+        unique = dedupe_findings(findings)
+
+        assert unique[0] is first
+        assert [finding_identity(f)[1:3] for f in unique] == [
+            ("c1", "r1"), ("c2", "r1"), ("c1", "r2")
+        ]
+
+    def test_first_occurrence_unchanged(self) -> None:
+        """Test the kept finding is not modified by its duplicates."""
+        first = _record("c1", framework_refs=["cis:1.1"])
+        findings = [
+            first,
+            _record("c1", framework_refs=["nist:PR.AC-1"]),
+            OCSFEnrichedFinding(**_record("c1", framework_refs=["soc2:CC6.1"]).to_dict()),
+        ]
+
+        unique = dedupe_findings(findings)
+
+        assert unique == [first]
+        assert first.framework_refs == ["cis:1.1"]
+
+    def test_keeps_only_digests(self) -> None:
+        """Test the deduplicator holds identity digests, not findings."""
+        deduplicator = FindingDeduplicator()
+        finding = _record("c1")
+
+        list(deduplicator.filter([finding, _record("c1")]))
+
+        assert deduplicator._seen == {identity_digest(finding)}
+
+    def test_without_check_id_kept(self) -> None:
+        """Test findings that can't be identified are never dropped."""
+        findings = [_record(None), _record(None)]
+
+        assert dedupe_findings(findings) == findings
+
+    def test_without_resource_id_kept(self) -> None:
+        """Test findings of a check that resolved no resource are never dropped."""
+        findings = [_record("iam_root_mfa", None, status="fail"), _record("iam_root_mfa", None)]
+
+        assert dedupe_findings(findings) == findings
+
+    def test_across_streams(self) -> None:
+        """Test one deduplicator remembers findings across streams."""
+        deduplicator = FindingDeduplicator()
+
+        first = list(deduplicator.filter([_record("c1"), _record("c2")]))
+        second = list(deduplicator.filter([_record("c2"), _record("c3")]))
+
+        assert len(first) == 2
+        assert [f.check_id for f in second] == ["c3"]
+        assert deduplicator.duplicates == 1
+        assert len(deduplicator) == 3
+
+    def test_repeated_framework_runs(self) -> None:
+        """Test the same scan file parsed per framework dedupes to one copy."""
+        once = parse_ocsf(SAMPLE_FILE, "aws", "prowler", as_records=True)
+        repeated = [
+            finding
+            for _ in range(3)
+            for finding in parse_ocsf(SAMPLE_FILE, "aws", "prowler", as_records=True)
+        ]
+
+        unique = apply_mapping(dedupe_findings(repeated), ["cis_aws_1_4"])
+        expected = apply_mapping(dedupe_findings(once), ["cis_aws_1_4"])
+
+        assert [f.to_dict() for f in unique] == [f.to_dict() for f in expected]
@@ -0,0 +1,148 @@
+"""Tests for comparing scan runs."""
+
+import json
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from cs_kit.normalizer.artifacts import (
+    NORMALIZED_FILE,
+    write_findings,
+    write_findings_json,
+)
+from cs_kit.normalizer.diff import (
+    ADDED_FILE,
+    CHANGED_FILE,
+    DIFF_SUMMARY_FILE,
+    REMOVED_FILE,
+    DiffSummary,
+    _partition_count,
+    diff_findings,
+    diff_runs,
+)
+from cs_kit.normalizer.records import FindingRecord
+
+
+def _record(
+    check_id: str,
+    status: str = "pass",
+    severity: str = "high",
+    resource_id: str | None = "arn:aws:s3:::bucket",
+) -> FindingRecord:
+    return FindingRecord(
+        time=datetime(2024, 1, 15, tzinfo=UTC),
+        provider="aws",
+        product="prowler",
+        check_id=check_id,
+        status=status,
+        severity=severity,
+        resource_id=resource_id,
+    )
+
+
+BEFORE = [
+    _record("s3_encryption", "fail"),
+    _record("s3_versioning", "pass"),
+    _record("s3_logging", "fail", "medium"),
+    _record("s3_public", "fail"),
+]
+
+AFTER = [
+    _record("s3_encryption", "fail"),
+    _record("s3_versioning", "fail"),
+    _record("s3_logging", "fail", "critical"),
+    _record("iam_mfa", "fail", resource_id="arn:aws:iam::111:user/alice"),
+]
+
+
+class TestDiffFindings:
+    """Test diff_findings function."""
+
+    @pytest.mark.parametrize("partitions", [1, 4])
+    def test_diff(self, partitions: int, tmp_path: Path) -> None:
+        """Test added, removed and changed findings, in memory and partitioned."""
+        summary = DiffSummary()
+
+        changes = list(diff_findings(BEFORE, AFTER, summary, partitions, tmp_path))
+
+        by_kind = {kind: [c for c in changes if c.kind == kind] for kind in ("added", "removed", "changed")}
+        assert [c.after for c in by_kind["added"]] == [AFTER[3]]
+        assert [c.before for c in by_kind["removed"]] == [BEFORE[3]]
+        assert sorted((c.after.check_id, c.fields) for c in by_kind["changed"]) == [
+            ("s3_logging", ("severity",)),
+            ("s3_versioning", ("status",)),
+        ]
+        assert summary.to_dict() == {
+            "added": 1,
+            "removed": 1,
+            "changed": 2,
+            "unchanged": 1,
+            "new_failures": 2,
+            "resolved": 1,
+            "severity_changes": {"medium->critical": 1},
+        }
+        # Partition files are removed
+        assert list(tmp_path.iterdir()) == []
+
+    def test_repeated_findings(self) -> None:
+        """Test findings repeated within a run are matched one to one."""
+        before = [_record("s3_encryption"), _record("s3_encryption")]
+        after = [_record("s3_encryption")]
+
+        changes = list(diff_findings(before, after))
+
+        assert [c.kind for c in changes] == ["removed"]
+
+    def test_repeated_findings_matched_identical_first(self) -> None:
+        """Test repeated findings without a resource are matched by content."""
+        failed = _record("iam_root_mfa", "fail", resource_id=None)
+        passed = _record("iam_root_mfa", resource_id=None)
+
+        changes = list(diff_findings([failed, passed], [passed, failed]))
+
+        assert changes == []
+
+
+class TestDiffRuns:
+    """Test diff_runs function."""
+
+    def test_writes_differences(self, tmp_path: Path) -> None:
+        """Test each kind of difference and the summary are written."""
+        for name, findings in [("run1", BEFORE), ("run2", AFTER)]:
+            (tmp_path / name).mkdir()
+            write_findings_json(findings, tmp_path / name / NORMALIZED_FILE)
+        output_dir = tmp_path / "diff"
+
+        summary = diff_runs(tmp_path / "run1", tmp_path / "run2" / NORMALIZED_FILE, output_dir)
+
+        assert summary.changed == 2
+        added = [json.loads(line) for line in (output_dir / ADDED_FILE).read_text().splitlines()]
+        assert [finding["check_id"] for finding in added] == ["iam_mfa"]
+        removed = (output_dir / REMOVED_FILE).read_text().splitlines()
+        assert json.loads(removed[0])["check_id"] == "s3_public"
+        changed = [json.loads(line) for line in (output_dir / CHANGED_FILE).read_text().splitlines()]
+        assert {change["after"]["check_id"] for change in changed} == {"s3_logging", "s3_versioning"}
+        assert FindingRecord.from_dict(changed[0]["before"]) in BEFORE
+        assert json.loads((output_dir / DIFF_SUMMARY_FILE).read_text()) == summary.to_dict()
+
+    def test_partitions_from_finding_count(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test NDJSON runs are partitioned by finding count, up to a limit."""
+        for name, findings in [("run1", BEFORE), ("run2", AFTER)]:
+            (tmp_path / name).mkdir()
+            write_findings(findings, tmp_path / name, "ndjson")
+        expected = diff_runs(tmp_path / "run1", tmp_path / "run2", tmp_path / "diff1")
+        monkeypatch.setattr("cs_kit.normalizer.diff.PARTITION_FINDINGS", 1)
+        monkeypatch.setattr("cs_kit.normalizer.diff._SPILL_BUFFER", 2)
+
+        assert _partition_count(tmp_path / "run1") == len(BEFORE)
+        monkeypatch.setattr("cs_kit.normalizer.diff.MAX_PARTITIONS", 2)
+        assert _partition_count(tmp_path / "run1") == 2
+        assert diff_runs(tmp_path / "run1", tmp_path / "run2", tmp_path / "diff2") == expected
+
+    def test_missing_run(self, tmp_path: Path) -> None:
+        """Test a run without normalized findings is reported."""
+        with pytest.raises(FileNotFoundError, match="Normalized findings not found"):
+            diff_runs(tmp_path / "missing", tmp_path, tmp_path / "diff")
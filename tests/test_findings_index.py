@@ -0,0 +1,118 @@
+"""Tests for the on-disk findings index."""
+
+import os
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from cs_kit.normalizer.artifacts import NORMALIZED_FILE, write_findings_json
+from cs_kit.normalizer.findings_index import FINDINGS_INDEX_FILE, FindingsIndex
+from cs_kit.normalizer.records import FindingRecord
+
+SEVERITIES = ["low", "critical", "medium", "high", None]
+
+
+def _findings(count: int) -> list[FindingRecord]:
+    return [
+        FindingRecord(
+            time=datetime(2024, 1, 15, tzinfo=UTC),
+            provider="aws",
+            product="prowler",
+            severity=SEVERITIES[i % len(SEVERITIES)],
+            status="fail" if i % 2 else "pass",
+            region="us-east-1" if i % 3 else "eu-west-1",
+            check_id=f"check_{i}",
+            framework_refs=["cis_aws_1_4:1.1"] if i % 4 == 0 else [],
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def index(tmp_path: Path) -> FindingsIndex:
+    """Index of 25 findings."""
+    write_findings_json(_findings(25), tmp_path / NORMALIZED_FILE)
+    return FindingsIndex.build(tmp_path / NORMALIZED_FILE, tmp_path / FINDINGS_INDEX_FILE)
+
+
+def _all_pages(index: FindingsIndex, **kwargs: object) -> list[str]:
+    check_ids = []
+    cursor = None
+    while True:
+        page = index.query(cursor=cursor, limit=4, **kwargs)  # type: ignore[arg-type]
+        check_ids.extend(finding["check_id"] for finding in page.findings)
+        if page.next_cursor is None:
+            return check_ids
+        cursor = page.next_cursor
+
+
+class TestFindingsIndex:
+    """Test FindingsIndex class."""
+
+    def test_pages_in_file_order(self, index: FindingsIndex) -> None:
+        """Test cursor pagination visits every finding once, in file order."""
+        page = index.query(limit=10)
+
+        assert page.total == 25
+        assert page.findings[0]["check_id"] == "check_0"
+        assert page.findings[0]["time"] == "2024-01-15 00:00:00+00:00"
+        assert _all_pages(index) == [f"check_{i}" for i in range(25)]
+
+    def test_filters(self, index: FindingsIndex) -> None:
+        """Test filters combine with AND, and their values with OR."""
+        page = index.query(severity=["critical", "high"], status=["fail"], region=["us-east-1"])
+
+        expected = [
+            f.check_id
+            for f in _findings(25)
+            if f.severity in ("critical", "high") and f.status == "fail" and f.region == "us-east-1"
+        ]
+        assert [f["check_id"] for f in page.findings] == expected
+        assert page.total == len(expected) == 4
+
+        page = index.query(framework=["cis_aws_1_4"])
+        assert page.total == 7
+
+    @pytest.mark.parametrize("descending", [False, True])
+    def test_sort(self, index: FindingsIndex, descending: bool) -> None:
+        """Test sorting by severity, most severe first, across pages."""
+        check_ids = _all_pages(index, sort="severity", descending=descending)
+
+        ranks = ["critical", "high", "medium", "low", None]
+        expected = sorted(
+            _findings(25),
+            key=lambda f: (ranks.index(f.severity), int(f.check_id[6:])),  # type: ignore[index]
+            reverse=descending,
+        )
+        assert check_ids == [f.check_id for f in expected]
+
+    def test_invalid_query(self, index: FindingsIndex) -> None:
+        """Test invalid sort keys, cursors and page sizes are rejected."""
+        with pytest.raises(ValueError, match="Invalid sort key"):
+            index.query(sort="time")
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            index.query(cursor="not-a-cursor")
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            index.query(sort="severity", cursor=index.query(limit=1).next_cursor)
+        with pytest.raises(ValueError, match="Page size"):
+            index.query(limit=0)
+
+    def test_for_run_rebuilds_stale_index(self, tmp_path: Path) -> None:
+        """Test a run's index is built on first use and after new findings."""
+        write_findings_json(_findings(3), tmp_path / NORMALIZED_FILE)
+        assert FindingsIndex.for_run(tmp_path).query().total == 3
+
+        write_findings_json(_findings(5), tmp_path / NORMALIZED_FILE)
+        index_mtime = (tmp_path / FINDINGS_INDEX_FILE).stat().st_mtime
+        os.utime(tmp_path / NORMALIZED_FILE, (index_mtime + 1, index_mtime + 1))
+
+        assert FindingsIndex.for_run(tmp_path).query().total == 5
+        assert sorted(path.name for path in tmp_path.iterdir()) == sorted(
+            [NORMALIZED_FILE, FINDINGS_INDEX_FILE]
+        )
+
+    def test_for_run_missing_findings(self, tmp_path: Path) -> None:
+        """Test a run without normalized findings is reported."""
+        with pytest.raises(FileNotFoundError, match="Normalized findings not found"):
+            FindingsIndex.for_run(tmp_path)
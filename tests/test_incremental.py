@@ -0,0 +1,107 @@
+"""Tests for incremental re-scans."""
+
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from cs_kit.normalizer.artifacts import write_findings_json
+from cs_kit.normalizer.incremental import load_incremental_plan, plan_incremental_scan
+from cs_kit.normalizer.records import FindingRecord
+
+
+def _record(
+    check_id: str | None,
+    status: str = "pass",
+    resource_id: str = "arn:aws:s3:::bucket",
+    product: str = "prowler",
+) -> FindingRecord:
+    return FindingRecord(
+        time=datetime(2024, 1, 15, tzinfo=UTC),
+        provider="aws",
+        product=product,
+        check_id=check_id,
+        status=status,
+        resource_id=resource_id,
+    )
+
+
+class TestPlanIncrementalScan:
+    """Test plan_incremental_scan function."""
+
+    def test_reruns_failed_checks(self) -> None:
+        """Test failed checks are re-run and passing checks carried over."""
+        previous = [
+            _record("s3_encryption", "fail"),
+            _record("s3_encryption", "pass", "arn:aws:s3:::other"),
+            _record("s3_versioning", "pass"),
+        ]
+
+        plan = plan_incremental_scan(previous, "run1")
+
+        assert plan.rerun_checks == ["s3_encryption"]
+        assert list(plan.iter_carried()) == [previous[2]]
+        assert plan.carried_count == 1
+
+    def test_reruns_changed_resource_types(self) -> None:
+        """Test checks on changed resource types are re-run even if they passed."""
+        previous = [
+            _record("iam_mfa", "pass", "arn:aws:iam::111:user/alice"),
+            _record("s3_versioning", "pass"),
+        ]
+
+        plan = plan_incremental_scan(previous, "run1", changed_resource_types=["iam"])
+
+        assert plan.rerun_checks == ["iam_mfa"]
+        assert list(plan.iter_carried()) == [previous[1]]
+
+    def test_carries_other_products(self) -> None:
+        """Test findings of other products or without a check are kept."""
+        previous = [_record("c1", "fail", product="other"), _record(None, "fail")]
+
+        plan = plan_incremental_scan(previous, "run1")
+
+        assert plan.rerun_checks == []
+        assert list(plan.iter_carried()) == previous
+        assert plan.carried_count == 2
+
+    def test_merge(self) -> None:
+        """Test new findings come first, followed by carried findings."""
+        plan = plan_incremental_scan([_record("a", "fail"), _record("b")], "run1")
+        new = _record("a", "pass")
+
+        assert [f.check_id for f in plan.merge([new])] == ["a", "b"]
+
+
+class TestLoadIncrementalPlan:
+    """Test load_incremental_plan function."""
+
+    def test_from_previous_run(self, tmp_path: Path) -> None:
+        """Test the plan is built from the run's normalized findings."""
+        (tmp_path / "run1").mkdir()
+        write_findings_json(
+            [_record("a", "fail"), _record("b")], tmp_path / "run1" / "normalized.json"
+        )
+
+        plan = load_incremental_plan(tmp_path, "run1", "aws")
+
+        assert plan.previous_run == "run1"
+        assert plan.rerun_checks == ["a"]
+        assert plan.carried_count == 1
+        assert not isinstance(plan.previous, list)
+        # Read from the artifact each time rather than held
+        assert [finding.check_id for finding in plan.iter_carried()] == ["b"]
+        assert [finding.check_id for finding in plan.iter_carried()] == ["b"]
+
+    def test_other_provider(self, tmp_path: Path) -> None:
+        """Test a run of another provider can't be built on."""
+        (tmp_path / "run1").mkdir()
+        write_findings_json([_record("a")], tmp_path / "run1" / "normalized.json")
+
+        with pytest.raises(ValueError, match="not gcp"):
+            load_incremental_plan(tmp_path, "run1", "gcp")
+
+    def test_missing_run(self, tmp_path: Path) -> None:
+        """Test a run without normalized findings."""
+        with pytest.raises(FileNotFoundError):
+            load_incremental_plan(tmp_path, "missing", "aws")
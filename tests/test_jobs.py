@@ -0,0 +1,385 @@
+"""Tests for the web app's persistent scan jobs."""
+
+import json
+import sqlite3
+import time
+from collections.abc import Iterator
+from contextlib import closing
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from cs_kit.web.jobs import JobStore, WorkerPool
+
+
+def _complete_job(store: JobStore, job_id: str, params: dict[str, Any]) -> None:
+    """Job handler recording its parameters, run in worker processes."""
+    if params.get("fail"):
+        raise RuntimeError("scan failed")
+    store.update(job_id, status="completed", params=params)
+
+
+def _wait_for(store: JobStore, job_ids: list[str], timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if all(store.get(job_id)["status"] in ("completed", "failed") for job_id in job_ids):  # type: ignore[index]
+            return
+        time.sleep(0.05)
+    raise TimeoutError("Jobs didn't finish")
+
+
+class TestJobStore:
+    """Test JobStore class."""
+
+    def test_enqueue_and_get(self, tmp_path: Path) -> None:
+        """Test queued jobs are visible to other stores on the same database."""
+        JobStore(tmp_path / "jobs.db").enqueue("job1", {"provider": "aws"}, provider="aws")
+
+        store = JobStore(tmp_path / "jobs.db")
+
+        assert store.get("job1") == {"provider": "aws", "status": "queued"}
+        assert store.get("missing") is None
+
+    def test_claim(self, tmp_path: Path) -> None:
+        """Test jobs are claimed once, oldest first, and their secrets removed."""
+        store = JobStore(tmp_path / "jobs.db")
+        store.enqueue("job1", {"access_key_id": "AKIA", "secret_access_key": "secret", "regions": []})
+        store.enqueue("job2", {})
+
+        assert store.claim(1) == (
+            "job1", {"access_key_id": "AKIA", "secret_access_key": "secret", "regions": []}
+        )
+        assert store.claim(1) == ("job2", {})
+        assert store.claim(1) is None
+
+        assert store.get("job1")["status"] == "running"  # type: ignore[index]
+        with sqlite3.connect(tmp_path / "jobs.db") as conn:
+            params = conn.execute("SELECT params FROM jobs WHERE id = 'job1'").fetchone()[0]
+        assert json.loads(params) == {"regions": []}
+
+    def test_claim_scrubs_secrets_from_files(self, tmp_path: Path) -> None:
+        """Test claimed secrets are in neither the database nor its log files."""
+        marker = b"wJalrXUtnFEMI-K7MDENG-bPxRfiCYEXAMPLEKEY"
+        store = JobStore(tmp_path / "jobs.db")
+        # Long enough to spill onto overflow pages, which the scrub frees
+        secret = (marker * 200).decode()
+        store.enqueue("job1", {"secret_access_key": secret, "regions": []})
+        store.enqueue("job2", {"provider": "aws"})
+
+        def files_content() -> bytes:
+            return b"".join(path.read_bytes() for path in tmp_path.glob("jobs.db*"))
+
+        # Another process's connection keeps the log from being removed on close
+        with closing(sqlite3.connect(tmp_path / "jobs.db")) as other:
+            other.execute("SELECT count(*) FROM jobs").fetchone()
+            assert marker in files_content()
+            # The queued job may already have been copied into the database
+            other.execute("PRAGMA wal_checkpoint")
+            store.claim(1)
+
+            assert marker not in files_content()
+        # Other jobs are unaffected
+        assert store.claim(1) == ("job2", {"provider": "aws"})
+
+    def test_update(self, tmp_path: Path) -> None:
+        """Test status fields are merged."""
+        store = JobStore(tmp_path / "jobs.db")
+        store.enqueue("job1", {}, provider="aws")
+
+        store.update("job1", progress={"cis": {"completed": 1, "total": 2}})
+        store.update("job1", status="completed")
+        store.update("missing", status="completed")
+
+        assert store.get("job1") == {
+            "provider": "aws",
+            "status": "completed",
+            "progress": {"cis": {"completed": 1, "total": 2}},
+        }
+
+    def test_fail_abandoned(self, tmp_path: Path) -> None:
+        """Test running jobs of exited workers are failed."""
+        store = JobStore(tmp_path / "jobs.db")
+        store.enqueue("job1", {})
+        store.claim(1)
+
+        with patch("cs_kit.web.jobs._process_exists", return_value=False):
+            assert store.fail_abandoned() == 1
+
+        assert store.get("job1")["status"] == "failed"  # type: ignore[index]
+
+
+class TestWorkerPool:
+    """Test WorkerPool class."""
+
+    def test_runs_jobs(self, tmp_path: Path) -> None:
+        """Test workers run queued jobs and record handler errors."""
+        store = JobStore(tmp_path / "jobs.db")
+        store.enqueue("job1", {"provider": "aws"})
+        store.enqueue("job2", {"fail": True})
+        pool = WorkerPool(store, _complete_job, size=2, poll_interval=0.05)
+
+        assert pool.start()
+        try:
+            _wait_for(store, ["job1", "job2"])
+        finally:
+            pool.stop()
+
+        result = store.get("job1")
+        assert result is not None
+        assert result["status"] == "completed"
+        assert result["params"] == {"provider": "aws"}
+        assert store.get("job2")["error"] == "scan failed"  # type: ignore[index]
+
+    def test_single_pool_per_database(self, tmp_path: Path) -> None:
+        """Test only one pool runs workers for a database."""
+        store = JobStore(tmp_path / "jobs.db")
+        first = WorkerPool(store, _complete_job, size=1, poll_interval=0.05)
+        second = WorkerPool(store, _complete_job, size=1, poll_interval=0.05)
+
+        assert first.start()
+        try:
+            assert not second.start()
+        finally:
+            first.stop()
+        assert second.start()
+        second.stop()
+
+    def test_invalid_size(self, tmp_path: Path) -> None:
+        """Test a pool needs at least one worker."""
+        with pytest.raises(ValueError, match="at least 1"):
+            WorkerPool(JobStore(tmp_path / "jobs.db"), _complete_job, size=0)
+
+
+class TestScanRoutes:
+    """Test the web app's scan routes with the job store."""
+
+    @pytest.fixture(autouse=True)
+    def mock_ensure(self) -> Iterator[MagicMock]:
+        """Keep requests from starting worker processes."""
+        with patch("cs_kit.web.app.ensure_workers") as mock_ensure:
+            yield mock_ensure
+
+    def test_start_scan_queues_job(self, tmp_path: Path, mock_ensure: MagicMock) -> None:
+        """Test a started scan is queued and its status served from the store."""
+        from cs_kit.web.app import app
+
+        app.config["JOB_DATABASE"] = str(tmp_path / "jobs.db")
+        client = app.test_client()
+
+        response = client.post("/api/scan", json={
+            "provider": "aws",
+            "access_key_id": "AKIA",
+            "secret_access_key": "secret",
+            "frameworks": ["cis_1.4_aws"],
+        })
+
+        assert response.status_code == 200
+        assert response.json["status"] == "queued"
+        mock_ensure.assert_called_once()
+
+        status = client.get(f"/api/scan/{response.json['scan_id']}").json
+        assert status["status"] == "queued"
+        assert status["frameworks"] == ["cis_1.4_aws"]
+        assert "secret_access_key" not in status
+        assert client.get("/api/scan/missing").status_code == 404
+
+    def test_scan_findings(self, tmp_path: Path) -> None:
+        """Test a completed scan's findings are served a page at a time."""
+        from cs_kit.normalizer.artifacts import NORMALIZED_FILE, write_findings_json
+        from cs_kit.normalizer.records import FindingRecord
+        from cs_kit.web.app import app
+
+        app.config["JOB_DATABASE"] = str(tmp_path / "jobs.db")
+        store = JobStore(tmp_path / "jobs.db")
+        store.enqueue("scan1", {})
+        store.update("scan1", status="completed", artifacts_dir=str(tmp_path))
+        write_findings_json(
+            [
+                FindingRecord(
+                    time=datetime(2024, 1, 15, tzinfo=UTC),
+                    provider="aws",
+                    product="prowler",
+                    severity=severity,
+                    check_id=f"check_{i}",
+                )
+                for i, severity in enumerate(["low", "high", "high"])
+            ],
+            tmp_path / NORMALIZED_FILE,
+        )
+        client = app.test_client()
+
+        page = client.get("/api/scan/scan1/findings?severity=high&limit=1").json
+        assert page["total"] == 2
+        assert [f["check_id"] for f in page["findings"]] == ["check_1"]
+
+        page = client.get(
+            f"/api/scan/scan1/findings?severity=high&limit=1&cursor={page['next_cursor']}"
+        ).json
+        assert [f["check_id"] for f in page["findings"]] == ["check_2"]
+        assert page["next_cursor"] is None
+
+        assert client.get("/api/scan/scan1/findings?sort=time").status_code == 400
+        assert client.get("/api/scan/missing/findings").status_code == 404
+
+    @pytest.mark.parametrize(
+        ("artifact_format", "mimetype", "suffix"),
+        [
+            ("json", "application/json", ".json"),
+            ("ndjson", "application/x-ndjson", ".ndjson"),
+            ("parquet", "application/vnd.apache.parquet", ".parquet"),
+        ],
+    )
+    def test_download_formats(
+        self, tmp_path: Path, artifact_format: str, mimetype: str, suffix: str
+    ) -> None:
+        """Test results download with the type and name of their format."""
+        from cs_kit.normalizer.artifacts import write_findings
+        from cs_kit.web.app import app
+
+        if artifact_format == "parquet":
+            pytest.importorskip("pyarrow")
+        normalized_file = write_findings([], tmp_path, artifact_format)  # type: ignore[arg-type]
+        app.config["JOB_DATABASE"] = str(tmp_path / "jobs.db")
+        store = JobStore(tmp_path / "jobs.db")
+        store.enqueue("scan1", {})
+        store.update("scan1", status="completed", normalized_file=str(normalized_file))
+
+        response = app.test_client().get("/api/scan/scan1/download")
+
+        assert response.status_code == 200
+        assert response.mimetype == mimetype
+        assert f"scan1_results{suffix}" in response.headers["Content-Disposition"]
+        assert response.data == normalized_file.read_bytes()
+
+
+class TestAppStartup:
+    """Test the web app starts its workers when it is created."""
+
+    def test_app_startup_runs_queued_jobs(self, tmp_path: Path) -> None:
+        """Test a restarted app runs jobs queued before it started."""
+        from cs_kit.web.app import create_app, stop_workers
+
+        store = JobStore(tmp_path / "jobs.db")
+        # Left by a previous app process; the missing parameters fail the scan
+        store.enqueue("scan1", {})
+
+        create_app(JOB_DATABASE=str(tmp_path / "jobs.db"), SCAN_WORKERS=1)
+        try:
+            _wait_for(store, ["scan1"])
+        finally:
+            stop_workers()
+
+        result = store.get("scan1")
+        assert result is not None
+        assert result["status"] == "failed"
+        assert "run_scan_async" in result["error"]
+
+
+class TestScanProgress:
+    """Test a running scan's check counters are written to the job store."""
+
+    def test_updates_throttled(self) -> None:
+        """Test counters are written on start and finish, and otherwise at intervals."""
+        from cs_kit.adapters.prowler.run import ProwlerProgress
+        from cs_kit.web.app import _ScanProgress
+
+        store = MagicMock()
+        progress = _ScanProgress(store, "scan1", interval=60)
+
+        progress(ProwlerProgress("cis", 0, 3))
+        progress(ProwlerProgress("cis", 1, 3))
+        progress(ProwlerProgress("cis", 2, 3))
+        assert store.update.call_count == 1
+
+        progress(ProwlerProgress("cis", 3, 3))
+        assert store.update.call_count == 2
+        assert store.update.call_args.kwargs["progress"] == {"cis": {"completed": 3, "total": 3}}
+
+        progress.flush()
+        assert store.update.call_count == 2
+
+    def test_flush(self, tmp_path: Path) -> None:
+        """Test flushing writes the counters held back by the interval."""
+        from cs_kit.adapters.prowler.run import ProwlerProgress
+        from cs_kit.web.app import _ScanProgress
+
+        store = JobStore(tmp_path / "jobs.db")
+        store.enqueue("scan1", {})
+        progress = _ScanProgress(store, "scan1", interval=60)
+
+        progress(ProwlerProgress("cis", 1))
+        progress(ProwlerProgress("cis", 5))
+        assert store.get("scan1")["progress"] == {"cis": {"completed": 1, "total": None}}  # type: ignore[index]
+
+        progress.flush()
+        assert store.get("scan1")["progress"] == {"cis": {"completed": 5, "total": None}}  # type: ignore[index]
+
+
+class TestRunScanAsync:
+    """Test scans run by the web app's workers."""
+
+    @pytest.mark.asyncio
+    async def test_findings_written_and_counted(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a scan records the findings it wrote to its artifact."""
+        from cs_kit.normalizer.artifacts import iter_findings
+        from cs_kit.web.app import run_scan_async
+
+        sample = Path(__file__).parent.parent / "samples/prowler/aws/sample_ocsf.json"
+        monkeypatch.chdir(tmp_path)
+        store = JobStore(tmp_path / "jobs.db")
+        store.enqueue("scan1", {})
+
+        with patch("cs_kit.web.app.select_scanners", return_value=["prowler"]), \
+             patch("cs_kit.web.app.run_prowler", return_value=[sample]):
+            await run_scan_async(store, "scan1", "aws", "key", "secret", [], [], "ndjson")
+
+        result = store.get("scan1")
+        assert result is not None
+        assert result["status"] == "completed", result.get("error")
+        written = list(iter_findings(Path(result["normalized_file"])))
+        assert result["findings_count"] == len(written) > 0
+        assert result["summary"]["total_findings"] == len(written)
+
+    @pytest.mark.asyncio
+    async def test_artifacts_dir(self, tmp_path: Path) -> None:
+        """Test a scan writes its artifacts under the configured directory."""
+        from cs_kit.web.app import run_scan_async
+
+        sample = Path(__file__).parent.parent / "samples/prowler/aws/sample_ocsf.json"
+        store = JobStore(tmp_path / "jobs.db")
+        store.enqueue("scan1", {})
+
+        with patch("cs_kit.web.app.select_scanners", return_value=["prowler"]), \
+             patch("cs_kit.web.app.run_prowler", return_value=[sample]):
+            await run_scan_async(
+                store, "scan1", "aws", "key", "secret", [], [],
+                artifacts_dir=str(tmp_path / "scans"),
+            )
+
+        result = store.get("scan1")
+        assert result is not None
+        assert result["status"] == "completed", result.get("error")
+        assert result["artifacts_dir"] == str(tmp_path / "scans" / "scan1")
+        assert Path(result["normalized_file"]).parent == tmp_path / "scans" / "scan1"
+
+    def test_workers_get_artifacts_dir(self, tmp_path: Path) -> None:
+        """Test the app's worker pool runs scans with its artifacts directory."""
+        from cs_kit.web.app import _app_worker_pool, app
+
+        app.config["JOB_DATABASE"] = str(tmp_path / "jobs.db")
+        app.config["ARTIFACTS_DIR"] = str(tmp_path / "scans")
+        store = JobStore(tmp_path / "jobs.db")
+        store.enqueue("scan1", {"provider": "aws"})
+
+        with patch("cs_kit.web.app.run_scan_async") as mock_run:
+            _, params = store.claim(1)  # type: ignore[misc]
+            _app_worker_pool().handler(store, "scan1", params)
+
+        assert mock_run.call_args.kwargs == {
+            "provider": "aws", "artifacts_dir": str(tmp_path / "scans")
+        }
@@ -0,0 +1,114 @@
+"""Tests for NDJSON finding artifacts."""
+
+import json
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from cs_kit.normalizer.ndjson import (
+    NDJSONReader,
+    index_path,
+    iter_ndjson_dicts,
+    write_findings_ndjson,
+)
+from cs_kit.normalizer.ocsf_models import OCSFEnrichedFinding
+from cs_kit.normalizer.records import FindingRecord
+
+
+def _findings(count: int) -> list[FindingRecord]:
+    return [
+        FindingRecord(
+            time=datetime(2024, 1, 15, 10, 30, tzinfo=UTC),
+            provider="aws",
+            product="prowler",
+            check_id=f"check_{i}",
+            description="line\nbreak\r separator",
+        )
+        for i in range(count)
+    ]
+
+
+class TestWriteFindingsNdjson:
+    """Test write_findings_ndjson function."""
+
+    def test_one_finding_per_line(self, tmp_path: Path) -> None:
+        """Test findings are written as compact JSON lines in blocks."""
+        path = tmp_path / "normalized.ndjson"
+
+        count = write_findings_ndjson(_findings(5), path, block_size=2)
+
+        lines = path.read_bytes().split(b"\n")
+        assert count == 5
+        assert lines.pop() == b""
+        assert [json.loads(line)["check_id"] for line in lines] == [f"check_{i}" for i in range(5)]
+        index = json.loads(index_path(path).read_text())
+        assert index["count"] == 5
+        assert [block[2] for block in index["blocks"]] == [2, 2, 1]
+
+    def test_models(self, tmp_path: Path) -> None:
+        """Test Pydantic findings are written like their model dump."""
+        finding = OCSFEnrichedFinding(
+            time=datetime(2024, 1, 15, 10, 30, tzinfo=UTC), provider="aws", product="prowler"
+        )
+        path = tmp_path / "normalized.ndjson"
+
+        write_findings_ndjson([finding], path)
+
+        assert list(iter_ndjson_dicts(path)) == [json.loads(json.dumps(finding.model_dump(), default=str))]
+
+    def test_zstd_unavailable(self, tmp_path: Path) -> None:
+        """Test compression without the zstandard package is reported."""
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr("cs_kit.normalizer.ndjson.zstandard", None)
+            with pytest.raises(ValueError, match="zstandard"):
+                write_findings_ndjson([], tmp_path / "normalized.ndjson.zst", "zstd")
+
+
+class TestNDJSONReader:
+    """Test NDJSONReader class."""
+
+    @pytest.fixture(params=[None, "zstd"])
+    def reader(self, request: pytest.FixtureRequest, tmp_path: Path) -> NDJSONReader:
+        """Reader of 10 findings in blocks of 3, uncompressed and compressed."""
+        if request.param == "zstd":
+            pytest.importorskip("zstandard")
+        path = tmp_path / "normalized.ndjson"
+        write_findings_ndjson(_findings(10), path, request.param, block_size=3)
+        return NDJSONReader(path)
+
+    def test_random_access(self, reader: NDJSONReader) -> None:
+        """Test single findings are read by position."""
+        assert len(reader) == 10
+        assert reader[0]["check_id"] == "check_0"
+        assert reader[7]["check_id"] == "check_7"
+        assert reader[-1]["check_id"] == "check_9"
+        assert reader[4]["description"] == "line\nbreak\r separator"
+        with pytest.raises(IndexError):
+            reader[10]
+
+    def test_ranges(self, reader: NDJSONReader) -> None:
+        """Test ranges are read across block boundaries."""
+        assert [f["check_id"] for f in reader.iter_dicts(2, 7)] == [
+            f"check_{i}" for i in range(2, 7)
+        ]
+        assert list(reader.iter_dicts(5, 5)) == []
+        assert list(reader.iter_findings()) == _findings(10)
+
+    def test_split(self, reader: NDJSONReader) -> None:
+        """Test parallel ranges are whole blocks covering every finding once."""
+        ranges = reader.split(3)
+
+        assert ranges == [(0, 3), (3, 6), (6, 10)]
+        assert [f for start, stop in ranges for f in reader.iter_findings(start, stop)] == _findings(10)
+        assert reader.split(100) == [(0, 3), (3, 6), (6, 9), (9, 10)]
+
+    def test_missing_index(self, tmp_path: Path) -> None:
+        """Test files without an index are streamed but not randomly accessed."""
+        path = tmp_path / "normalized.ndjson"
+        write_findings_ndjson(_findings(4), path)
+        index_path(path).unlink()
+
+        with pytest.raises(FileNotFoundError, match="Offset index not found"):
+            NDJSONReader(path)
+        assert [f["check_id"] for f in iter_ndjson_dicts(path)] == [f"check_{i}" for i in range(4)]
@@ -9,9 +9,12 @@ import pytest
 
 from cs_kit.normalizer.ocsf_models import FindingSummary, OCSFFinding
 from cs_kit.normalizer.parser import (
+    FIELD_PATHS,
+    FieldExtractor,
     _extract_account_id,
     _extract_check_id,
     _extract_description,
+    _extract_field,
     _extract_region,
     _extract_remediation,
     _extract_resource_id,
@@ -20,7 +23,11 @@ from cs_kit.normalizer.parser import (
     _normalize_severity,
     _normalize_status,
     _parse_single_finding,
+    get_field_extractor,
+    iter_ocsf,
+    iter_raw_findings,
     parse_ocsf,
+    parse_ocsf_many,
 )
 
 
@@ -163,6 +170,147 @@ class TestParseOCSF:
             temp_path.unlink()
 
 
+class TestIterOCSF:
+    """Test iter_ocsf streaming parser."""
+
+    def _write(self, content: str) -> Path:
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
+            f.write(content)
+            return Path(f.name)
+
+    def test_iter_matches_parse(self) -> None:
+        """Test streaming yields the same findings as parse_ocsf."""
+        sample_path = Path("tests/samples/prowler_ocsf.json")
+        if not sample_path.exists():
+            pytest.skip("Sample file not found")
+
+        streamed = list(iter_ocsf(sample_path, "aws", "prowler"))
+        parsed = parse_ocsf(sample_path, "aws", "prowler")
+
+        assert [f.model_dump() for f in streamed] == [f.model_dump() for f in parsed]
+
+    def test_iter_is_lazy(self) -> None:
+        """Test findings are yielded before the whole file is decoded."""
+        temp_path = self._write('[{"severity": "high"}, {"severity": "low"}, oops')
+
+        try:
+            stream = iter_raw_findings(temp_path, 4, stream_threshold=0)
+            assert next(stream) == {"severity": "high"}
+            assert next(stream) == {"severity": "low"}
+            with pytest.raises(json.JSONDecodeError):
+                next(stream)
+        finally:
+            temp_path.unlink()
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, 4096])
+    def test_raw_findings_chunk_boundaries(self, chunk_size: int) -> None:
+        """Test element decoding is independent of the read chunk size."""
+        data = [
+            {"a": "x" * 50, "nested": {"list": [1, 2, {"b": "]},["}]}},
+            {"escaped": "quote \" and \\ backslash", "n": 12345},
+            {},
+            {"unicode": "\u00e9t\u00e9", "t": True, "f": None},
+        ]
+        temp_path = self._write(" \n" + json.dumps(data, indent=2) + "\n ")
+
+        try:
+            assert list(iter_raw_findings(temp_path, chunk_size, 0)) == data
+        finally:
+            temp_path.unlink()
+
+    def test_empty_array(self) -> None:
+        """Test an empty array yields nothing."""
+        temp_path = self._write("  [ ]  ")
+
+        try:
+            assert list(iter_ocsf(temp_path, "aws", "prowler")) == []
+        finally:
+            temp_path.unlink()
+
+    @pytest.mark.parametrize(
+        "content", ["[{}", "[{} {}]", "[{},]", "[{}] trailing", "[1, 2"]
+    )
+    def test_invalid_arrays(self, content: str) -> None:
+        """Test malformed arrays raise JSONDecodeError."""
+        temp_path = self._write(content)
+
+        try:
+            with pytest.raises(json.JSONDecodeError):
+                list(iter_raw_findings(temp_path, 2, 0))
+        finally:
+            temp_path.unlink()
+
+    def test_non_object_element(self) -> None:
+        """Test non-object array elements are rejected with their index."""
+        temp_path = self._write('[{"severity": "high"}, 42]')
+
+        try:
+            with pytest.raises(ValueError, match="at index 1"):
+                list(iter_ocsf(temp_path, "aws", "prowler"))
+        finally:
+            temp_path.unlink()
+
+
+class TestParseOCSFMany:
+    """Test parse_ocsf_many parallel parser."""
+
+    def _write_files(self, tmp_dir: str, count: int) -> list[Path]:
+        paths = []
+        for n in range(count):
+            path = Path(tmp_dir) / f"scan-{n}.json"
+            path.write_text(json.dumps([
+                {"time": "2024-01-15T10:30:00Z", "finding": {"uid": f"check-{n}-{i}"}}
+                for i in range(5)
+            ]))
+            paths.append(path)
+        return paths
+
+    def _check_ids(self, findings: list[OCSFFinding]) -> list[str | None]:
+        return [f.check_id for f in findings]
+
+    def test_matches_sequential_order(self) -> None:
+        """Test parallel results are merged in file order."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            paths = self._write_files(tmp_dir, 4)
+
+            sequential = parse_ocsf_many(paths, "aws", "prowler", workers=1)
+            parallel = parse_ocsf_many(paths, "aws", "prowler", workers=2)
+
+            assert len(sequential) == 20
+            assert self._check_ids(parallel) == self._check_ids(sequential)
+            assert sequential[0].check_id == "check-0-0"
+            assert sequential[-1].check_id == "check-3-4"
+
+    def test_split_large_files(self) -> None:
+        """Test large files are split into ordered batches."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            paths = self._write_files(tmp_dir, 2)
+
+            findings = parse_ocsf_many(
+                paths, "aws", "prowler", workers=2, split_bytes=0, chunk_findings=2
+            )
+
+            assert self._check_ids(findings) == [
+                f"check-{n}-{i}" for n in range(2) for i in range(5)
+            ]
+
+    def test_split_error_reports_file_index(self) -> None:
+        """Test errors in a split batch report the index within the file."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "scan.json"
+            path.write_text(json.dumps([{}, {}, {}, "bad"]))
+
+            with pytest.raises(ValueError, match="at index 3"):
+                parse_ocsf_many(
+                    [path], "aws", "prowler", workers=2, split_bytes=0, chunk_findings=2
+                )
+
+    def test_missing_file(self) -> None:
+        """Test a missing file fails before any work is submitted."""
+        with pytest.raises(FileNotFoundError):
+            parse_ocsf_many([Path("/nonexistent/file.json")], "aws", "prowler", workers=2)
+
+
 class TestParseSingleFinding:
     """Test _parse_single_finding function."""
 
@@ -399,6 +547,83 @@ class TestExtractionFunctions:
             assert result == expected
 
 
+class TestFieldExtractor:
+    """Test the compiled field extractor against the fallback chain."""
+
+    VALUES = [None, "", 0, "value", 42, {"uid": "nested"}, ["x"], {}]
+
+    def _documents(self) -> list[dict]:
+        """Build documents covering every path with varied value types."""
+        import random
+
+        rng = random.Random(1234)
+        keys = {path[0] for _, paths in FIELD_PATHS.values() for path in paths}
+        nested = {
+            path[0]: path[1:]
+            for _, paths in FIELD_PATHS.values()
+            for path in paths
+            if len(path) > 1
+        }
+
+        documents = []
+        for _ in range(500):
+            doc: dict = {}
+            for key in rng.sample(sorted(keys), rng.randint(0, len(keys))):
+                if key in nested and rng.random() < 0.7:
+                    inner: dict = {}
+                    for _, paths in FIELD_PATHS.values():
+                        for path in paths:
+                            if path[0] == key and len(path) > 1 and rng.random() < 0.6:
+                                target = inner
+                                for part in path[1:-1]:
+                                    target = target.setdefault(part, {})
+                                    if not isinstance(target, dict):
+                                        break
+                                else:
+                                    target[path[-1]] = rng.choice(self.VALUES)
+                    doc[key] = inner
+                else:
+                    doc[key] = rng.choice(self.VALUES)
+            if rng.random() < 0.5:
+                resource = {
+                    k: rng.choice(self.VALUES)
+                    for k in ("uid", "name", "account_uid", "region")
+                    if rng.random() < 0.5
+                }
+                doc["resources"] = rng.choice([[resource], [], None, [resource, {}]])
+            documents.append(doc)
+        return documents
+
+    def test_matches_fallback_chain(self) -> None:
+        """Test compiled extraction returns exactly what the chain returns."""
+        extractor = FieldExtractor("prowler", None)
+
+        for doc in self._documents():
+            expected = {field: _extract_field(doc, field) for field in FIELD_PATHS}
+            assert extractor.extract(doc) == expected, doc
+            # Second pass hits the cached plan for this shape
+            assert extractor.extract(doc) == expected, doc
+
+    def test_plan_cached_per_shape(self) -> None:
+        """Test plans are compiled once per document shape."""
+        extractor = FieldExtractor("prowler", None)
+
+        extractor.extract({"title": "a", "finding": {"uid": "x"}})
+        extractor.extract({"title": "b", "finding": {"uid": "y"}})
+        extractor.extract({"finding": {"uid": "z"}, "title": "c"})
+
+        assert len(extractor._plans) == 2
+
+    def test_extractor_shared_per_product_version(self) -> None:
+        """Test extractors are cached by product and schema version."""
+        assert get_field_extractor("prowler", "1.0.0") is get_field_extractor(
+            "prowler", "1.0.0"
+        )
+        assert get_field_extractor("prowler", "1.0.0") is not get_field_extractor(
+            "prowler", "1.1.0"
+        )
+
+
 class TestGetNestedValue:
     """Test _get_nested_value function."""
 
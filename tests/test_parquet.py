@@ -0,0 +1,96 @@
+"""Tests for Parquet export of normalized findings."""
+
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from cs_kit.normalizer import codec
+from cs_kit.normalizer.artifacts import (
+    NORMALIZED_PARQUET_FILE,
+    iter_findings,
+    write_findings,
+)
+from cs_kit.normalizer.ocsf_models import OCSFEnrichedFinding
+from cs_kit.normalizer.parquet import write_findings_parquet
+from cs_kit.normalizer.records import FindingRecord
+
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+def _finding(i: int, account_id: str | None) -> FindingRecord:
+    return FindingRecord(
+        time=datetime(2024, 1, 15, 10, 30, tzinfo=UTC),
+        provider="aws",
+        product="prowler",
+        severity="high",
+        status="fail",
+        account_id=account_id,
+        check_id=f"check_{i}",
+        framework_refs=["cis_aws_1_4:1.1"] if i % 2 else [],
+        raw={"nested": {"a": [1, i]}} if i % 3 else {},
+        risk_score=7.5,
+    )
+
+
+class TestWriteFindingsParquet:
+    """Test write_findings_parquet function."""
+
+    def test_row_groups_by_account(self, tmp_path: Path) -> None:
+        """Test each row group holds one account's findings."""
+        findings = [_finding(i, ["111", "222", None][i % 3]) for i in range(9)]
+        path = tmp_path / "findings.parquet"
+
+        assert write_findings_parquet(findings, path, row_group_size=2) == 9
+
+        metadata = pq.ParquetFile(path).metadata
+        account_column = metadata.schema.names.index("account_id")
+        groups = []
+        for i in range(metadata.num_row_groups):
+            statistics = metadata.row_group(i).column(account_column).statistics
+            groups.append((statistics.min, statistics.max, metadata.row_group(i).num_rows))
+        assert all(low == high for low, high, _ in groups if low is not None)
+        assert sum(rows for _, _, rows in groups) == 9
+        assert max(rows for _, _, rows in groups) == 2
+
+    def test_columns(self, tmp_path: Path) -> None:
+        """Test findings are flattened, with raw as JSON text."""
+        path = tmp_path / "findings.parquet"
+        model = OCSFEnrichedFinding(
+            time=datetime(2024, 1, 15, 10, 30, tzinfo=UTC),
+            provider="gcp",
+            product="prowler",
+            raw={"key": "value"},
+        )
+
+        write_findings_parquet([_finding(1, "111"), model], path)
+
+        table = pq.read_table(path)
+        assert [codec.loads(raw) for raw in table.column("raw").to_pylist()] == [
+            {"nested": {"a": [1, 1]}}, {"key": "value"}
+        ]
+        assert table.column("framework_refs").to_pylist() == [["cis_aws_1_4:1.1"], []]
+        assert str(table.schema.field("time").type) == "timestamp[us, tz=UTC]"
+        row_group = pq.ParquetFile(path).metadata.row_group(0)
+        encodings = {
+            row_group.column(i).path_in_schema: row_group.column(i).encodings
+            for i in range(row_group.num_columns)
+        }
+        assert any("DICTIONARY" in encoding for encoding in encodings["severity"])
+        assert not any("DICTIONARY" in encoding for encoding in encodings["raw"])
+
+    def test_pyarrow_unavailable(self, tmp_path: Path) -> None:
+        """Test exporting without the pyarrow package is reported."""
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr("cs_kit.normalizer.parquet.pa", None)
+            with pytest.raises(ValueError, match="pyarrow"):
+                write_findings_parquet([], tmp_path / "findings.parquet")
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """Test a run written as Parquet reads back as equal records."""
+        findings = [_finding(i, "111") for i in range(5)]
+
+        path = write_findings(findings, tmp_path, "parquet")
+
+        assert path.name == NORMALIZED_PARQUET_FILE
+        assert list(iter_findings(tmp_path)) == findings
@@ -23,10 +23,26 @@ from cs_kit.render.pdf import (
     get_templates_directory,
     html_to_pdf,
     render_html,
+    render_html_parts,
     validate_template_directory,
 )
 
 
+def _framework_findings(count: int) -> list[OCSFEnrichedFinding]:
+    return [
+        OCSFEnrichedFinding(
+            time=datetime(2024, 1, 15, tzinfo=UTC),
+            provider="aws",
+            product="prowler",
+            severity="high",
+            status="fail",
+            resource_id=f"resource-{i}",
+            framework_refs=[f"cis_aws_1_4:1.{i % 3}"],
+        )
+        for i in range(count)
+    ]
+
+
 class TestGetTemplatesDirectory:
     """Test get_templates_directory function."""
 
@@ -138,6 +154,51 @@ class TestRenderHtml:
                 render_html(context, config)
 
 
+class TestRenderHtmlParts:
+    """Test render_html_parts function."""
+
+    def _context(self, findings: list[OCSFEnrichedFinding]) -> dict:
+        summary = FindingSummary(total_findings=len(findings), frameworks_covered=["cis_aws_1_4"])
+        return _build_report_context(findings, summary, RendererConfig())
+
+    def test_findings_split_into_batches(self) -> None:
+        """Test findings are rendered in parts of at most batch_size rows."""
+        parts = list(render_html_parts(self._context(_framework_findings(7)), batch_size=3))
+
+        # Cover and executive summary, three findings batches, appendix
+        assert len(parts) == 5
+        assert "Executive Summary" in parts[0]
+        findings_parts = parts[1:-1]
+        assert [part.count("resource-") for part in findings_parts] == [3, 3, 1]
+        assert ["Detailed Findings" in part for part in findings_parts] == [True, False, False]
+        assert ["Summary by Resource Type" in part for part in findings_parts] == [False, False, True]
+        assert ["Framework (continued)" in part for part in findings_parts] == [False, True, True]
+
+    def test_batches_keep_section_order(self) -> None:
+        """Test the batches list findings in the order of a single section."""
+        context = self._context(_framework_findings(7))
+        whole = render_html(context)
+        parts = "".join(render_html_parts(context, batch_size=2))
+
+        def resources(html: str) -> list[str]:
+            return [line.strip() for line in html.splitlines() if line.strip().startswith("resource-")]
+
+        assert resources(parts) == resources(whole)
+
+    def test_without_frameworks(self) -> None:
+        """Test findings without framework mappings are batched by severity."""
+        findings = _framework_findings(5)
+        for finding in findings:
+            finding.framework_refs = []
+        context = self._context(findings)
+        context['findings_by_framework'] = {}
+
+        parts = list(render_html_parts(context, batch_size=2))
+
+        assert [part.count("resource-") for part in parts[1:-1]] == [2, 2, 1]
+        assert ["All Findings" in part for part in parts[1:-1]] == [True, False, False]
+
+
 class TestHtmlToPdf:
     """Test html_to_pdf function."""
 
@@ -263,6 +324,80 @@ class TestGenerateReport:
             mock_html_to_pdf.assert_called_once()
 
 
+class TestGenerateChunkedReport:
+    """Test generate_report with a findings batch size."""
+
+    @patch('cs_kit.render.pdf.html_to_pdf')
+    def test_parts_merged(self, mock_html_to_pdf: MagicMock) -> None:
+        """Test each part is laid out separately and merged in order."""
+        pypdf = pytest.importorskip("pypdf")
+
+        def write_part(html: str, out_pdf: Path, config: RendererConfig, extra_css: str) -> None:
+            writer = pypdf.PdfWriter()
+            writer.add_blank_page(width=100 + len(mock_html_to_pdf.call_args_list), height=100)
+            with open(out_pdf, "wb") as f:
+                writer.write(f)
+
+        mock_html_to_pdf.side_effect = write_part
+        findings = _framework_findings(5)
+        summary = FindingSummary(total_findings=5, frameworks_covered=["cis_aws_1_4"])
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            out_pdf = Path(tmp_dir) / "report.pdf"
+
+            generate_report(findings, summary, out_pdf, RendererConfig(findings_batch_size=2))
+
+            pages = pypdf.PdfReader(out_pdf).pages
+            assert [int(page.mediabox.width) for page in pages] == [101, 102, 103, 104, 105]
+            assert "@bottom-center" in mock_html_to_pdf.call_args.args[3]
+            assert list(Path(tmp_dir).iterdir()) == [out_pdf]
+
+    @pytest.mark.parametrize("with_frameworks", [True, False])
+    @patch('cs_kit.render.pdf._merge_pdfs')
+    @patch('cs_kit.render.pdf.html_to_pdf')
+    def test_findings_streamed(
+        self, mock_html_to_pdf: MagicMock, mock_merge: MagicMock, with_frameworks: bool
+    ) -> None:
+        """Test streamed findings are listed in the order of a single section."""
+        pytest.importorskip("pypdf")
+        findings = _framework_findings(7)
+        findings[2].severity = "critical"
+        findings.append(findings[0].model_copy(update={
+            "resource_id": "resource-7", "framework_refs": ["cis_aws_1_4:1.0", "soc2:cc6"],
+        }))
+        if not with_frameworks:
+            for finding in findings:
+                finding.framework_refs = []
+        summary = FindingSummary(total_findings=len(findings), frameworks_covered=["cis_aws_1_4"])
+
+        def resources(html: str) -> list[str]:
+            return [line.strip() for line in html.splitlines() if line.strip().startswith("resource-")]
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            generate_report(
+                iter(findings), summary, Path(tmp_dir) / "report.pdf",
+                RendererConfig(findings_batch_size=3),
+            )
+
+        whole = render_html(_build_report_context(findings, summary, RendererConfig()))
+        parts = [call.args[0] for call in mock_html_to_pdf.call_args_list]
+        assert resources("".join(parts)) == resources(whole)
+        assert [part.count("resource-") for part in parts[1:-1]] == (
+            [3, 3, 3] if with_frameworks else [3, 3, 2]
+        )
+
+    def test_pypdf_unavailable(self) -> None:
+        """Test chunked reports without the pypdf package are reported."""
+        summary = FindingSummary(total_findings=0)
+
+        with tempfile.TemporaryDirectory() as tmp_dir, \
+             patch('cs_kit.render.pdf.pypdf', None):
+            with pytest.raises(RenderError, match="pypdf"):
+                generate_report(
+                    [], summary, Path(tmp_dir) / "report.pdf", RendererConfig(findings_batch_size=2)
+                )
+
+
 class TestPrepareRenderContext:
     """Test _prepare_render_context function."""
 
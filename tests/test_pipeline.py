@@ -0,0 +1,148 @@
+"""Tests for normalization pipelined with scanning."""
+
+import asyncio
+import shutil
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from cs_kit.normalizer.dedupe import dedupe_findings
+from cs_kit.normalizer.mapping import apply_mapping
+from cs_kit.normalizer.parser import parse_ocsf
+from cs_kit.normalizer.pipeline import NormalizationPipeline
+from cs_kit.normalizer.records import AnyFinding
+from cs_kit.normalizer.summarize import generate_finding_summary
+
+SAMPLE_FILE = Path(__file__).parent.parent / "samples/prowler/aws/sample_ocsf.json"
+
+
+class TestNormalizationPipeline:
+    """Test NormalizationPipeline class."""
+
+    @pytest.mark.asyncio
+    async def test_matches_sequential(self, tmp_path: Path) -> None:
+        """Test submissions normalize to the same result as a sequential pass."""
+        copies = [tmp_path / f"run{i}.json" for i in range(3)]
+        for copy in copies:
+            shutil.copy(SAMPLE_FILE, copy)
+
+        pipeline = NormalizationPipeline("aws", "prowler", ["cis_aws_1_4"])
+        pipeline.submit(copies[:1])
+        pipeline.submit(copies[1:])
+        findings = await pipeline.finish()
+
+        expected = apply_mapping(
+            dedupe_findings(parse_ocsf(SAMPLE_FILE, "aws", "prowler", as_records=True)),
+            ["cis_aws_1_4"],
+        )
+        assert [f.to_dict() for f in findings] == [f.to_dict() for f in expected]
+        assert pipeline.deduplicator.duplicates == 2 * len(expected)
+        assert pipeline.files == copies
+        assert generate_finding_summary(pipeline.accumulator) == generate_finding_summary(expected)
+
+    @pytest.mark.asyncio
+    async def test_submit_does_not_block(self) -> None:
+        """Test submissions are normalized off the event loop."""
+        threads = set()
+        pipeline = NormalizationPipeline("aws", "prowler")
+        original = pipeline._normalize
+
+        def normalize(paths: list[Path]) -> None:
+            threads.add(threading.get_ident())
+            original(paths)
+
+        pipeline._normalize = normalize  # type: ignore[method-assign]
+        pipeline.submit([SAMPLE_FILE])
+        await asyncio.sleep(0)
+        findings = await pipeline.finish()
+
+        assert findings
+        assert threading.get_ident() not in threads
+
+    @pytest.mark.asyncio
+    async def test_submit_findings(self) -> None:
+        """Test normalized findings are deduplicated against parsed ones."""
+        carried = parse_ocsf(SAMPLE_FILE, "aws", "prowler", as_records=True)
+        pipeline = NormalizationPipeline("aws", "prowler")
+        pipeline.submit([SAMPLE_FILE])
+        pipeline.submit_findings(carried)
+
+        findings = await pipeline.finish()
+
+        assert len(findings) == len(carried)
+        assert pipeline.deduplicator.duplicates == len(carried)
+        assert pipeline.accumulator.summary().total_findings == len(carried)
+
+    @pytest.mark.asyncio
+    async def test_without_dedupe(self) -> None:
+        """Test findings are all kept when submissions can't overlap."""
+        carried = parse_ocsf(SAMPLE_FILE, "aws", "prowler", as_records=True)
+        pipeline = NormalizationPipeline("aws", "prowler", dedupe=False)
+        pipeline.submit([SAMPLE_FILE])
+        pipeline.submit_findings(carried)
+
+        findings = await pipeline.finish()
+
+        assert len(findings) == 2 * len(carried)
+        assert pipeline.deduplicator is None
+
+    @pytest.mark.asyncio
+    async def test_errors_raised_by_finish(self, tmp_path: Path) -> None:
+        """Test a failed submission is raised when the pipeline finishes."""
+        pipeline = NormalizationPipeline("aws", "prowler")
+        pipeline.submit([tmp_path / "missing.json"])
+
+        with pytest.raises(FileNotFoundError):
+            await pipeline.finish()
+
+    @pytest.mark.asyncio
+    async def test_sink_consumes_submissions_as_they_complete(self) -> None:
+        """Test findings reach the sink before the pipeline finishes."""
+        received = threading.Event()
+
+        def sink(findings: Iterator[AnyFinding]) -> int:
+            count = 0
+            for _ in findings:
+                count += 1
+                received.set()
+            return count
+
+        pipeline = NormalizationPipeline("aws", "prowler", sink=sink)
+        pipeline.submit([SAMPLE_FILE])
+
+        assert await asyncio.to_thread(received.wait, 5)
+        count = await pipeline.finish()
+
+        assert count == pipeline.accumulator.total > 0
+
+    def test_close_stops_sink(self) -> None:
+        """Test closing an unfinished pipeline ends the sink with an error."""
+        errors: list[Exception] = []
+
+        def sink(findings: Iterator[AnyFinding]) -> None:
+            try:
+                list(findings)
+            except RuntimeError as e:
+                errors.append(e)
+
+        with NormalizationPipeline("aws", "prowler", sink=sink) as pipeline:
+            pipeline.submit([SAMPLE_FILE])
+
+        assert pipeline._executor._shutdown
+        assert pipeline._sink.done()
+        assert [str(e) for e in errors] == ["Normalization pipeline closed before it finished"]
+        pipeline.close()
+
+    @pytest.mark.asyncio
+    async def test_sink_errors_raised_by_finish(self) -> None:
+        """Test an error of the sink is raised when the pipeline finishes."""
+        def sink(findings: Iterator[AnyFinding]) -> None:
+            raise OSError("disk full")
+
+        pipeline = NormalizationPipeline("aws", "prowler", sink=sink)
+        pipeline.submit([SAMPLE_FILE])
+
+        with pytest.raises(OSError, match="disk full"):
+            await pipeline.finish()
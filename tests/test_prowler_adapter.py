@@ -1,24 +1,65 @@
 """Tests for Prowler adapter."""
 
+import asyncio
+import os
+import subprocess
+import sys
 import tempfile
+import time
+from collections.abc import Awaitable, Callable
 from pathlib import Path
+from typing import Any
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from cs_kit.adapters.prowler.cache import ScanCache
 from cs_kit.adapters.prowler.exceptions import (
     ProwlerError,
     ProwlerNotFoundError,
 )
 from cs_kit.adapters.prowler.run import (
+    OUTPUT_TAIL_LINES,
+    ProwlerProgress,
     _build_prowler_command,
     _parse_compliance_list,
+    _run_prowler_subprocess,
     list_supported_frameworks,
     run_prowler,
     validate_prowler_installation,
 )
 
 
+def _stream(data: bytes) -> asyncio.StreamReader:
+    """Build a finished pipe holding ``data``."""
+    stream = asyncio.StreamReader()
+    stream.feed_data(data)
+    stream.feed_eof()
+    return stream
+
+
+def _mock_process(returncode: int, stdout: bytes = b"", stderr: bytes = b"") -> AsyncMock:
+    """Build an exited process whose pipes hold the given output."""
+    process = AsyncMock()
+    process.returncode = returncode
+    process.stdout = _stream(stdout)
+    process.stderr = _stream(stderr)
+    return process
+
+
+def _fake_prowler(
+    returncode: int = 0, stdout: bytes = b"success"
+) -> Callable[..., Awaitable[AsyncMock]]:
+    """Build a create_subprocess_exec stand-in that writes a file to ``-o``."""
+
+    async def create_subprocess_exec(*cmd: str, **kwargs: Any) -> AsyncMock:
+        out_dir = Path(cmd[cmd.index("-o") + 1])
+        (out_dir / "results.json").write_text('{"test": "data"}')
+        return _mock_process(returncode, stdout)
+
+    return create_subprocess_exec
+
+
 class TestRunProwler:
     """Test run_prowler function."""
 
@@ -45,18 +86,8 @@ class TestRunProwler:
 
             # Mock prowler being available
             with patch("shutil.which", return_value="/usr/bin/prowler"):
-                # Mock successful subprocess execution
-                mock_process = AsyncMock()
-                mock_process.returncode = 0
-                mock_process.communicate.return_value = (b"success", b"")
-
-                with patch("asyncio.create_subprocess_exec", return_value=mock_process):
-                    # Create a mock JSON file that would be generated by prowler
-                    provider_dir = out_dir / "scanner=prowler" / "provider=aws"
-                    provider_dir.mkdir(parents=True)
-                    json_file = provider_dir / "results-123.json"
-                    json_file.write_text('{"test": "data"}')
-
+                # Mock a successful prowler run writing one output file
+                with patch("asyncio.create_subprocess_exec", new=_fake_prowler()):
                     result = await run_prowler(
                         provider="aws",
                         frameworks=["cis_aws_1_4"],
@@ -65,8 +96,11 @@ class TestRunProwler:
                         out_dir=out_dir,
                     )
 
-                    assert len(result) == 1
-                    assert result[0] == json_file
+                    json_file = (
+                        out_dir / "scanner=prowler" / "provider=aws"
+                        / "compliance=cis_aws_1_4" / "results.json"
+                    )
+                    assert result == [json_file]
                     assert result[0].exists()
 
     @pytest.mark.asyncio
@@ -77,9 +111,7 @@ class TestRunProwler:
 
             with patch("shutil.which", return_value="/usr/bin/prowler"):
                 # Mock failed subprocess execution
-                mock_process = AsyncMock()
-                mock_process.returncode = 1
-                mock_process.communicate.return_value = (b"", b"error message")
+                mock_process = _mock_process(1, b"", b"error message")
 
                 with patch("asyncio.create_subprocess_exec", return_value=mock_process):
                     with pytest.raises(ProwlerError) as exc_info:
@@ -102,9 +134,7 @@ class TestRunProwler:
 
             with patch("shutil.which", return_value="/usr/bin/prowler"):
                 # Mock successful subprocess but no files generated
-                mock_process = AsyncMock()
-                mock_process.returncode = 0
-                mock_process.communicate.return_value = (b"success", b"")
+                mock_process = _mock_process(0, b"success", b"")
 
                 with patch("asyncio.create_subprocess_exec", return_value=mock_process):
                     with pytest.raises(ProwlerError) as exc_info:
@@ -126,17 +156,7 @@ class TestRunProwler:
             out_dir = Path(tmp_dir)
 
             with patch("shutil.which", return_value="/usr/bin/prowler"):
-                mock_process = AsyncMock()
-                mock_process.returncode = 0
-                mock_process.communicate.return_value = (b"success", b"")
-
-                with patch("asyncio.create_subprocess_exec", return_value=mock_process):
-                    # Create expected output file
-                    provider_dir = out_dir / "scanner=prowler" / f"provider={provider}"
-                    provider_dir.mkdir(parents=True)
-                    json_file = provider_dir / "results.json"
-                    json_file.write_text('{"test": "data"}')
-
+                with patch("asyncio.create_subprocess_exec", new=_fake_prowler()):
                     result = await run_prowler(
                         provider=provider,  # type: ignore
                         frameworks=[],
@@ -149,6 +169,304 @@ class TestRunProwler:
                     assert result[0].exists()
 
 
+FAKE_PROWLER = """#!/bin/sh
+# Stand-in for prowler: sleep, then write one OCSF file to the -o directory
+if [ "$1" = "--version" ]; then echo "Prowler 4.0.0"; exit 0; fi
+while [ $# -gt 0 ]; do
+    if [ "$1" = "-o" ]; then out="$2"; fi
+    if [ "$1" = "--compliance" ]; then compliance="$2"; fi
+    shift
+done
+echo "Executing 2 checks, please wait..."
+sleep 0.5
+printf '|##  | 1/2 [50%%] in 0s\r|####| 2/2 [100%%] in 1s\n'
+echo '[]' > "$out/prowler-output-$compliance.ocsf.json"
+exit 3
+"""
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="fake prowler is a shell script")
+class TestConcurrentRuns:
+    """Test prowler runs for several frameworks proceed concurrently."""
+
+    frameworks = ["cis_aws_1_4", "nist_csf", "soc2", "pci_dss"]
+
+    @pytest.fixture
+    def fake_prowler(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+        """Put a fake prowler executable first on PATH."""
+        bin_dir = tmp_path / "bin"
+        bin_dir.mkdir()
+        executable = bin_dir / "prowler"
+        executable.write_text(FAKE_PROWLER)
+        executable.chmod(0o755)
+        aws = bin_dir / "aws"
+        aws.write_text("#!/bin/sh\necho 123456789012\n")
+        aws.chmod(0o755)
+        monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+        return tmp_path
+
+    async def _timed_run(self, out_dir: Path, max_concurrency: int) -> tuple[float, list[Path]]:
+        """Run prowler for every framework, returning (seconds, files)."""
+        start = time.perf_counter()
+        files = await run_prowler(
+            provider="aws",
+            frameworks=self.frameworks,
+            regions=[],
+            env={},
+            out_dir=out_dir,
+            max_concurrency=max_concurrency,
+        )
+        return time.perf_counter() - start, files
+
+    @pytest.mark.asyncio
+    async def test_speedup(self, fake_prowler: Path) -> None:
+        """Test concurrent runs finish well before sequential ones."""
+        serial_s, serial_files = await self._timed_run(fake_prowler / "serial", 1)
+        concurrent_s, concurrent_files = await self._timed_run(fake_prowler / "concurrent", 4)
+
+        assert serial_s >= 0.5 * len(self.frameworks)
+        assert concurrent_s < serial_s / 2
+        assert len(serial_files) == len(concurrent_files) == len(self.frameworks)
+
+    @pytest.mark.asyncio
+    async def test_outputs_separated(self, fake_prowler: Path) -> None:
+        """Test each framework's output lands in its own subdirectory."""
+        _, files = await self._timed_run(fake_prowler, 4)
+
+        assert [path.parent.name for path in files] == [
+            f"compliance={framework}" for framework in self.frameworks
+        ]
+        assert [path.name for path in files] == [
+            f"prowler-output-{framework}.ocsf.json" for framework in self.frameworks
+        ]
+
+    @pytest.mark.asyncio
+    async def test_progress(self, fake_prowler: Path) -> None:
+        """Test check counters printed by prowler are reported per run."""
+        updates: list[ProwlerProgress] = []
+
+        await run_prowler(
+            provider="aws",
+            frameworks=self.frameworks[:2],
+            regions=[],
+            env={},
+            out_dir=fake_prowler,
+            progress=updates.append,
+        )
+
+        for framework in self.frameworks[:2]:
+            assert [
+                (update.completed, update.total) for update in updates if update.label == framework
+            ] == [(0, 2), (1, 2), (2, 2)]
+
+    @pytest.mark.asyncio
+    async def test_cache(self, fake_prowler: Path) -> None:
+        """Test a repeated run is served from the cache without prowler."""
+        cache = ScanCache.for_artifacts(fake_prowler, max_age=3600)
+        await run_prowler("aws", self.frameworks, [], {}, fake_prowler / "run1", cache=cache)
+
+        start = time.perf_counter()
+        files = await run_prowler("aws", self.frameworks, [], {}, fake_prowler / "run2", cache=cache)
+
+        assert time.perf_counter() - start < 0.5
+        assert [key.compliance for key in cache.hits] == [(f,) for f in self.frameworks]
+        assert [key.compliance for key in cache.misses] == [(f,) for f in self.frameworks]
+        assert {key.prowler_version for key in cache.hits} == {"Prowler 4.0.0"}
+        assert {key.account for key in cache.hits} == {"123456789012"}
+        assert all(path.is_relative_to(fake_prowler / "run2") for path in files)
+        assert [path.read_text() for path in files] == ["[]\n"] * len(self.frameworks)
+
+    @pytest.mark.asyncio
+    async def test_cache_keyed_by_account(
+        self, fake_prowler: Path, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test runs are cached under the account their credentials resolve to."""
+        cache = ScanCache.for_artifacts(fake_prowler, max_age=3600)
+        role_arn = "arn:aws:iam::210987654321:role/Audit"
+        await run_prowler("aws", self.frameworks[:1], [], {}, fake_prowler / "run1", cache=cache)
+        await run_prowler(
+            "aws", self.frameworks[:1], [], {}, fake_prowler / "run2", role_arn=role_arn,
+            cache=cache,
+        )
+
+        assert cache.hits == []
+        assert [key.account for key in cache.misses] == ["123456789012", "210987654321"]
+        assert caplog.records == []
+
+    @pytest.mark.asyncio
+    async def test_cache_skipped_for_unknown_account(
+        self, fake_prowler: Path, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test runs whose account can't be resolved bypass the cache with a warning."""
+        (fake_prowler / "bin" / "aws").write_text("#!/bin/sh\nexit 255\n")
+        cache = ScanCache.for_artifacts(fake_prowler, max_age=3600)
+
+        await run_prowler("aws", self.frameworks[:1], [], {}, fake_prowler / "run1", cache=cache)
+        await run_prowler("aws", self.frameworks[:1], [], {}, fake_prowler / "run2", cache=cache)
+
+        assert cache.hits == cache.misses == []
+        assert not cache.directory.exists()
+        assert [record.levelname for record in caplog.records] == ["WARNING"] * 2
+        assert "will not be cached" in caplog.records[0].getMessage()
+
+    @pytest.mark.asyncio
+    async def test_checks(self, fake_prowler: Path) -> None:
+        """Test explicit checks run once, whatever the frameworks."""
+        files = await run_prowler(
+            "aws", self.frameworks, [], {}, fake_prowler, checks=["s3_encryption"]
+        )
+
+        assert len(files) == 1
+        assert files[0].parent.name == "checks"
+
+    @pytest.mark.asyncio
+    async def test_combine_frameworks(self, fake_prowler: Path) -> None:
+        """Test combined frameworks run as one prowler process."""
+        start = time.perf_counter()
+        files = await run_prowler(
+            provider="aws",
+            frameworks=self.frameworks,
+            regions=[],
+            env={},
+            out_dir=fake_prowler,
+            combine_frameworks=True,
+        )
+
+        assert len(files) == 1
+        assert files[0].parent.name == f"compliance={'+'.join(self.frameworks)}"
+        assert time.perf_counter() - start < 0.5 * len(self.frameworks)
+
+    @pytest.mark.asyncio
+    async def test_semaphore_limits_concurrency(self, tmp_path: Path) -> None:
+        """Test no more than max_concurrency runs are active at once."""
+        active = 0
+        peak = 0
+
+        async def fake_subprocess(
+            cmd: list[str], env: dict[str, str], on_line: Any = None
+        ) -> Any:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.05)
+            active -= 1
+            out_dir = Path(cmd[cmd.index("-o") + 1])
+            (out_dir / "results.json").write_text("[]")
+            return subprocess.CompletedProcess(cmd, 0, "", "")
+
+        with patch("shutil.which", return_value="/usr/bin/prowler"):
+            with patch(
+                "cs_kit.adapters.prowler.run._run_prowler_subprocess", new=fake_subprocess
+            ):
+                files = await run_prowler(
+                    provider="aws",
+                    frameworks=self.frameworks,
+                    regions=[],
+                    env={},
+                    out_dir=tmp_path,
+                    max_concurrency=2,
+                )
+
+        assert peak == 2
+        assert len(files) == len(self.frameworks)
+
+    @pytest.mark.asyncio
+    async def test_output_reported_per_run(self, tmp_path: Path) -> None:
+        """Test each run's files are handed on as soon as that run finishes."""
+        reported: list[tuple[str, bool]] = []
+        finished = False
+
+        async def fake_subprocess(
+            cmd: list[str], env: dict[str, str], on_line: Any = None
+        ) -> Any:
+            await asyncio.sleep(0.01 if "nist_csf" in cmd else 0.2)
+            out_dir = Path(cmd[cmd.index("-o") + 1])
+            (out_dir / "results.json").write_text("[]")
+            return subprocess.CompletedProcess(cmd, 0, "", "")
+
+        def on_output(files: list[Path]) -> None:
+            reported.append((files[0].parent.name, finished))
+
+        with patch("shutil.which", return_value="/usr/bin/prowler"):
+            with patch(
+                "cs_kit.adapters.prowler.run._run_prowler_subprocess", new=fake_subprocess
+            ):
+                scan = asyncio.create_task(run_prowler(
+                    provider="aws",
+                    frameworks=self.frameworks,
+                    regions=[],
+                    env={},
+                    out_dir=tmp_path,
+                    on_output=on_output,
+                ))
+                await asyncio.sleep(0.1)
+                assert reported == [("compliance=nist_csf", False)]
+                files = await scan
+
+        assert sorted(name for name, _ in reported) == sorted(path.parent.name for path in files)
+
+    @pytest.mark.asyncio
+    async def test_failure_cancels_other_runs(self, tmp_path: Path) -> None:
+        """Test one failing run raises ProwlerError and cancels the rest."""
+        cancelled = []
+
+        async def fake_subprocess(
+            cmd: list[str], env: dict[str, str], on_line: Any = None
+        ) -> Any:
+            if "nist_csf" in cmd:
+                return subprocess.CompletedProcess(cmd, 1, "", "boom")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(cmd)
+                raise
+            return subprocess.CompletedProcess(cmd, 0, "", "")
+
+        with patch("shutil.which", return_value="/usr/bin/prowler"):
+            with patch(
+                "cs_kit.adapters.prowler.run._run_prowler_subprocess", new=fake_subprocess
+            ):
+                with pytest.raises(ProwlerError, match="return code 1"):
+                    await run_prowler(
+                        provider="aws",
+                        frameworks=self.frameworks,
+                        regions=[],
+                        env={},
+                        out_dir=tmp_path,
+                    )
+
+        assert len(cancelled) == len(self.frameworks) - 1
+
+
+class TestRunProwlerSubprocess:
+    """Test streaming of prowler output."""
+
+    @pytest.mark.asyncio
+    async def test_output_tail_bounded(self) -> None:
+        """Test only the last lines of long output are kept."""
+        stderr = "".join(f"line {i}\n" for i in range(OUTPUT_TAIL_LINES * 5)).encode()
+
+        with patch("asyncio.create_subprocess_exec", return_value=_mock_process(1, b"", stderr)):
+            result = await _run_prowler_subprocess(["prowler"], {})
+
+        lines = result.stderr.splitlines()
+        assert len(lines) == OUTPUT_TAIL_LINES
+        assert lines[-1] == f"line {OUTPUT_TAIL_LINES * 5 - 1}"
+        assert result.returncode == 1
+
+    @pytest.mark.asyncio
+    async def test_lines_streamed(self) -> None:
+        """Test carriage returns split progress bar redraws into lines."""
+        stdout = "Executing 3 checks\r 1/3 [33%]\r 3/3 [100%]\ndone ✓".encode()
+        lines: list[str] = []
+
+        with patch("asyncio.create_subprocess_exec", return_value=_mock_process(0, stdout)):
+            result = await _run_prowler_subprocess(["prowler"], {}, on_line=lines.append)
+
+        assert lines == ["Executing 3 checks", " 1/3 [33%]", " 3/3 [100%]", "done ✓"]
+        assert result.stdout == "\n".join(lines)
+
+
 class TestBuildProwlerCommand:
     """Test _build_prowler_command function."""
 
@@ -210,6 +528,29 @@ class TestBuildProwlerCommand:
         ]
         assert cmd == expected
 
+    def test_checks(self) -> None:
+        """Test explicit checks replace the compliance selection."""
+        cmd = _build_prowler_command(
+            "aws", None, ["us-east-1"], Path("/tmp/output"), checks=["s3_encryption", "iam_mfa"]
+        )
+
+        assert cmd[-3:] == ["--checks", "s3_encryption", "iam_mfa"]
+        assert "--compliance" not in cmd
+
+    def test_combined_frameworks(self) -> None:
+        """Test several frameworks are passed to a single --compliance."""
+        cmd = _build_prowler_command("gcp", ["cis_gcp_1_3", "nist_csf"], [], Path("/tmp/output"))
+
+        assert cmd[-3:] == ["--compliance", "cis_gcp_1_3", "nist_csf"]
+
+    def test_aws_role(self) -> None:
+        """Test an AWS role to assume is passed to prowler."""
+        cmd = _build_prowler_command(
+            "aws", None, [], Path("/tmp/output"), "arn:aws:iam::123456789012:role/Audit"
+        )
+
+        assert cmd[-2:] == ["--role", "arn:aws:iam::123456789012:role/Audit"]
+
     @pytest.mark.parametrize("provider", ["aws", "gcp", "azure"])
     def test_all_providers_basic(self, provider: str) -> None:
         """Test basic command building for all providers."""
@@ -249,9 +590,7 @@ nist_csf: NIST Cybersecurity Framework
 """
 
         with patch("shutil.which", return_value="/usr/bin/prowler"):
-            mock_process = AsyncMock()
-            mock_process.returncode = 0
-            mock_process.communicate.return_value = (mock_output.encode(), b"")
+            mock_process = _mock_process(0, mock_output.encode(), b"")
 
             with patch("asyncio.create_subprocess_exec", return_value=mock_process):
                 frameworks = await list_supported_frameworks()
@@ -263,9 +602,7 @@ nist_csf: NIST Cybersecurity Framework
     async def test_prowler_execution_failure(self) -> None:
         """Test prowler execution failure."""
         with patch("shutil.which", return_value="/usr/bin/prowler"):
-            mock_process = AsyncMock()
-            mock_process.returncode = 1
-            mock_process.communicate.return_value = (b"", b"error")
+            mock_process = _mock_process(1, b"", b"error")
 
             with patch("asyncio.create_subprocess_exec", return_value=mock_process):
                 with pytest.raises(ProwlerError) as exc_info:
@@ -273,6 +610,20 @@ nist_csf: NIST Cybersecurity Framework
 
                 assert "Failed to list compliance frameworks" in str(exc_info.value)
 
+    @pytest.mark.asyncio
+    async def test_long_list_not_truncated(self) -> None:
+        """Test every framework is listed when output exceeds the scan tail."""
+        expected = [f"framework_{i}" for i in range(OUTPUT_TAIL_LINES * 2)]
+        mock_output = "".join(f"{framework}: Description\n" for framework in expected)
+
+        with patch("shutil.which", return_value="/usr/bin/prowler"):
+            mock_process = _mock_process(0, mock_output.encode(), b"")
+
+            with patch("asyncio.create_subprocess_exec", return_value=mock_process):
+                frameworks = await list_supported_frameworks()
+
+        assert frameworks == expected
+
 
 class TestParseComplianceList:
     """Test _parse_compliance_list function."""
@@ -333,9 +684,7 @@ class TestValidateProwlerInstallation:
     async def test_successful_validation(self) -> None:
         """Test successful prowler validation."""
         with patch("shutil.which", return_value="/usr/local/bin/prowler"):
-            mock_process = AsyncMock()
-            mock_process.returncode = 0
-            mock_process.communicate.return_value = (b"prowler 3.5.0", b"")
+            mock_process = _mock_process(0, b"prowler 3.5.0", b"")
 
             with patch("asyncio.create_subprocess_exec", return_value=mock_process):
                 info = await validate_prowler_installation()
@@ -0,0 +1,146 @@
+"""Tests for compact finding records."""
+
+import json
+import tempfile
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from cs_kit.normalizer.artifacts import write_findings_json
+from cs_kit.normalizer.mapping import apply_mapping
+from cs_kit.normalizer.ocsf_models import OCSFEnrichedFinding
+from cs_kit.normalizer.parser import (
+    _parse_single_finding,
+    _parse_single_record,
+    iter_ocsf_many,
+    parse_ocsf,
+)
+from cs_kit.normalizer.records import FindingRecord
+from cs_kit.normalizer.summarize import generate_finding_summary
+
+SAMPLE_FILE = Path(__file__).parent.parent / "samples/prowler/aws/sample_ocsf.json"
+
+
+class TestFindingRecord:
+    """Test FindingRecord conversions."""
+
+    def test_slots(self) -> None:
+        """Test records don't carry a per-instance __dict__."""
+        record = FindingRecord(time=datetime.now(UTC), provider="aws", product="prowler")
+
+        assert not hasattr(record, "__dict__")
+
+    def test_to_dict_matches_model_dump(self) -> None:
+        """Test to_dict has the layout of OCSFEnrichedFinding.model_dump()."""
+        record = FindingRecord(
+            time=datetime(2024, 1, 15, 10, 30, tzinfo=UTC),
+            provider="aws",
+            product="prowler",
+            severity="high",
+            check_id="iam_root_mfa_enabled",
+            raw={"a": 1},
+            framework_refs=["cis_aws_1_4:1.5"],
+        )
+
+        dumped = record.to_dict()
+        expected = record.to_model().model_dump()
+        assert list(dumped) == list(expected)
+        assert dumped == expected
+
+    def test_model_round_trip(self) -> None:
+        """Test from_model and to_model preserve every field."""
+        model = OCSFEnrichedFinding(
+            time=datetime(2024, 1, 15, 10, 30, tzinfo=UTC),
+            provider="gcp",
+            product="prowler",
+            status="fail",
+            resource_id="projects/p/buckets/b",
+            framework_refs=["cis_gcp:5.1"],
+            risk_score=7.5,
+        )
+
+        assert FindingRecord.from_model(model).to_model() == model
+
+
+class TestParseRecords:
+    """Test parsing findings as records."""
+
+    def test_records_match_models(self) -> None:
+        """Test records hold the same values as the validated models."""
+        models = parse_ocsf(SAMPLE_FILE, "aws", "prowler")
+        records = parse_ocsf(SAMPLE_FILE, "aws", "prowler", as_records=True)
+
+        assert all(isinstance(record, FindingRecord) for record in records)
+        assert [r.to_model().model_dump(exclude={"time"}) for r in records] == [
+            OCSFEnrichedFinding(**m.model_dump()).model_dump(exclude={"time"})
+            for m in models
+        ]
+
+    def test_coerces_like_model(self) -> None:
+        """Test values needing coercion go through the model."""
+        raw = {"time": "2024-01-15T10:30:00Z", "class_uid": "2003"}
+
+        record = _parse_single_record(raw, "aws", "prowler")
+
+        assert record.class_uid == 2003
+        assert record.class_uid == _parse_single_finding(raw, "aws", "prowler").class_uid
+
+    def test_invalid_values_raise(self) -> None:
+        """Test invalid values are rejected like the model rejects them."""
+        with pytest.raises(ValueError):
+            _parse_single_record({"class_uid": "not-a-number"}, "aws", "prowler")
+        with pytest.raises(ValueError):
+            _parse_single_record({}, "other", "prowler")  # type: ignore[arg-type]
+
+    def test_parallel_records(self) -> None:
+        """Test records survive the trip through worker processes."""
+        records = list(
+            iter_ocsf_many([SAMPLE_FILE, SAMPLE_FILE], "aws", "prowler", workers=2, as_records=True)
+        )
+        expected = parse_ocsf(SAMPLE_FILE, "aws", "prowler", as_records=True) * 2
+
+        assert [r.to_dict() for r in records] == [r.to_dict() for r in expected]
+
+
+class TestRecordPipeline:
+    """Test records through mapping, summary and artifact stages."""
+
+    def test_mapping_enriches_in_place(self) -> None:
+        """Test apply_mapping enriches records without copying them."""
+        records = parse_ocsf(SAMPLE_FILE, "aws", "prowler", as_records=True)
+        models = parse_ocsf(SAMPLE_FILE, "aws", "prowler")
+
+        enriched = apply_mapping(records, ["cis_aws_1_4"])
+        enriched_models = apply_mapping(models, ["cis_aws_1_4"])
+
+        assert all(a is b for a, b in zip(enriched, records, strict=True))
+        assert [r.framework_refs for r in enriched] == [
+            m.framework_refs for m in enriched_models
+        ]
+        assert [r.severity for r in enriched] == [m.severity for m in enriched_models]
+
+    def test_summary_matches_models(self) -> None:
+        """Test summaries of records and of models are identical."""
+        records = apply_mapping(
+            parse_ocsf(SAMPLE_FILE, "aws", "prowler", as_records=True), ["cis_aws_1_4"]
+        )
+        models = [record.to_model() for record in records]
+
+        assert generate_finding_summary(records) == generate_finding_summary(models)
+
+    def test_artifact_matches_models(self) -> None:
+        """Test normalized.json is the same for records and models."""
+        records = parse_ocsf(SAMPLE_FILE, "aws", "prowler", as_records=True)
+        models = [record.to_model() for record in records]
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            record_path = Path(tmp_dir) / "records.json"
+            model_path = Path(tmp_dir) / "models.json"
+            write_findings_json(records, record_path)
+            write_findings_json(models, model_path)
+
+            assert record_path.read_text(encoding="utf-8") == model_path.read_text(
+                encoding="utf-8"
+            )
+            assert len(json.loads(record_path.read_text(encoding="utf-8"))) == len(records)
@@ -0,0 +1,136 @@
+"""Tests for the prowler output cache."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from cs_kit.adapters.prowler.cache import (
+    CACHE_DIRECTORY,
+    ScanCache,
+    ScanCacheKey,
+    parse_duration,
+)
+from cs_kit.cli.config import RunConfig
+
+
+def _key(**kwargs: object) -> ScanCacheKey:
+    values: dict[str, object] = {
+        "provider": "aws",
+        "account": "111111111111",
+        "regions": ("us-east-1",),
+        "compliance": ("cis_aws_1_4",),
+        "prowler_version": "4.0.0",
+    }
+    values.update(kwargs)
+    return ScanCacheKey(**values)  # type: ignore[arg-type]
+
+
+class TestParseDuration:
+    """Test parse_duration function."""
+
+    @pytest.mark.parametrize(
+        ("value", "seconds"),
+        [("90", 90), ("90s", 90), ("30m", 1800), ("12h", 43200), ("7d", 604800), (1.5, 1.5)],
+    )
+    def test_valid(self, value: str | float, seconds: float) -> None:
+        """Test numbers with and without unit suffixes."""
+        assert parse_duration(value) == seconds
+
+    def test_invalid(self) -> None:
+        """Test an unknown unit is rejected."""
+        with pytest.raises(ValueError, match="Invalid duration"):
+            parse_duration("3 weeks")
+
+    def test_run_config(self) -> None:
+        """Test the run configuration accepts durations."""
+        config = RunConfig(provider="aws", artifacts_dir="/tmp", scan_max_age="30m")
+
+        assert config.scan_max_age == 1800
+
+
+class TestScanCacheKey:
+    """Test ScanCacheKey class."""
+
+    def test_digest_covers_every_input(self) -> None:
+        """Test changing any input addresses a different entry."""
+        variants = [
+            _key(),
+            _key(provider="gcp"),
+            _key(account="222222222222"),
+            _key(regions=("eu-west-1",)),
+            _key(compliance=("nist_csf",)),
+            _key(prowler_version="4.1.0"),
+        ]
+
+        assert len({key.digest for key in variants}) == len(variants)
+        assert _key().digest == _key().digest
+
+    def test_name(self) -> None:
+        """Test the readable name of a run."""
+        assert _key().name == "account=111111111111/region=us-east-1/compliance=cis_aws_1_4"
+        assert _key(account=None, regions=(), compliance=()).name == (
+            "account=default/region=all/compliance=all"
+        )
+
+
+class TestScanCache:
+    """Test ScanCache class."""
+
+    @staticmethod
+    def _output(tmp_path: Path) -> list[Path]:
+        out_dir = tmp_path / "scan"
+        out_dir.mkdir()
+        path = out_dir / "prowler-output.ocsf.json"
+        path.write_text("[]")
+        return [path]
+
+    def test_hit(self, tmp_path: Path) -> None:
+        """Test a stored run is copied into a new output directory."""
+        cache = ScanCache.for_artifacts(tmp_path, max_age=60)
+        cache.store(_key(), self._output(tmp_path))
+        out_dir = tmp_path / "rerun"
+        out_dir.mkdir()
+
+        files = cache.lookup(_key(), out_dir)
+
+        assert files == [out_dir / "prowler-output.ocsf.json"]
+        assert files[0].read_text() == "[]"
+        assert cache.hits == [_key()]
+        assert (tmp_path / CACHE_DIRECTORY / _key().digest).is_dir()
+
+    def test_miss(self, tmp_path: Path) -> None:
+        """Test runs that were never stored are misses, recorded once."""
+        cache = ScanCache.for_artifacts(tmp_path, max_age=60)
+
+        assert cache.lookup(_key(), tmp_path) is None
+        assert cache.lookup(_key(), tmp_path) is None
+        assert cache.misses == [_key()]
+
+    def test_expired(self, tmp_path: Path) -> None:
+        """Test entries older than max_age are not reused."""
+        cache = ScanCache.for_artifacts(tmp_path, max_age=60)
+        cache.store(_key(), self._output(tmp_path))
+        entry_file = tmp_path / CACHE_DIRECTORY / _key().digest / "entry.json"
+        entry = json.loads(entry_file.read_text())
+        entry["created_at"] -= 120
+        entry_file.write_text(json.dumps(entry))
+
+        assert cache.lookup(_key(), tmp_path) is None
+        assert cache.misses == [_key()]
+
+    def test_store_replaces(self, tmp_path: Path) -> None:
+        """Test storing a run again replaces its entry."""
+        cache = ScanCache.for_artifacts(tmp_path, max_age=60)
+        files = self._output(tmp_path)
+        cache.store(_key(), files)
+        files[0].unlink()
+        files[0].write_text('[{"new": true}]')
+        cache.store(_key(), files)
+        out_dir = tmp_path / "rerun"
+        out_dir.mkdir()
+
+        cached = cache.lookup(_key(), out_dir)
+
+        assert cached is not None
+        assert cached[0].read_text() == '[{"new": true}]'
@@ -0,0 +1,220 @@
+"""Tests for sharded prowler scan scheduling."""
+
+import asyncio
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from cs_kit.adapters.prowler.exceptions import ProwlerError, ProwlerNotFoundError
+from cs_kit.adapters.prowler.run import ProwlerProgress
+from cs_kit.adapters.prowler.scheduler import (
+    ScanShard,
+    plan_shards,
+    run_sharded_scan,
+)
+
+
+class TestPlanShards:
+    """Test plan_shards function."""
+
+    def test_cartesian_product(self) -> None:
+        """Test every account, region and framework combination is planned."""
+        shards = plan_shards("aws", ["a1", "a2", "a3"], ["us-east-1", "eu-west-1"], ["cis", "nist"])
+
+        assert len(shards) == 12
+        assert shards[:3] == [
+            ScanShard("a1", "us-east-1", "cis"),
+            ScanShard("a1", "us-east-1", "nist"),
+            ScanShard("a1", "eu-west-1", "cis"),
+        ]
+        assert len(set(shards)) == 12
+
+    def test_unsplit_dimensions(self) -> None:
+        """Test empty dimensions give a single unsplit shard."""
+        assert plan_shards("aws", [], [], []) == [ScanShard()]
+        assert plan_shards("aws", [], ["us-east-1", "eu-west-1"], ["cis"], shard_regions=False) == [
+            ScanShard(framework="cis")
+        ]
+
+    def test_regions_only_split_for_aws(self) -> None:
+        """Test providers without a region filter are not split by region."""
+        assert plan_shards("gcp", [], ["us-central1", "europe-west1"], ["cis"]) == [
+            ScanShard(framework="cis")
+        ]
+
+    def test_combine_frameworks(self) -> None:
+        """Test combined frameworks share one shard per account and region."""
+        shards = plan_shards("aws", ["a1"], ["r1", "r2"], ["cis", "nist"], combine_frameworks=True)
+
+        assert shards == [
+            ScanShard("a1", "r1", ("cis", "nist")),
+            ScanShard("a1", "r2", ("cis", "nist")),
+        ]
+        assert shards[0].name == "account=a1/region=r1/compliance=cis+nist"
+        assert plan_shards("aws", [], [], ["cis"], combine_frameworks=True) == [
+            ScanShard(framework="cis")
+        ]
+
+    def test_accounts_require_aws(self) -> None:
+        """Test account sharding is rejected for other providers."""
+        with pytest.raises(ValueError, match="only supported for AWS"):
+            plan_shards("azure", ["sub"], [], [])
+
+    def test_name(self) -> None:
+        """Test shard names identify every dimension."""
+        assert ScanShard("123", "us-east-1", "cis").name == (
+            "account=123/region=us-east-1/compliance=cis"
+        )
+        assert ScanShard().name == "account=default/region=all/compliance=all"
+
+
+class TestRunShardedScan:
+    """Test run_sharded_scan function."""
+
+    @staticmethod
+    def _fake_run_prowler(failures: dict[str | None, int], calls: list[dict[str, Any]]) -> Any:
+        """Fake run_prowler failing each region the given number of times."""
+
+        async def run_prowler(**kwargs: Any) -> list[Path]:
+            calls.append(kwargs)
+            region = kwargs["regions"][0] if kwargs["regions"] else None
+            await asyncio.sleep(0.01)
+            if failures.get(region, 0) > 0:
+                failures[region] -= 1
+                raise ProwlerError(f"{region} failed")
+            return [kwargs["out_dir"] / "results.json"]
+
+        return run_prowler
+
+    async def _run(self, shards: list[ScanShard], fake: Any, **kwargs: Any) -> Any:
+        with patch("cs_kit.adapters.prowler.scheduler.run_prowler", new=fake):
+            return await run_sharded_scan(
+                provider="aws",
+                shards=shards,
+                regions=[],
+                env={"BASE": "1"},
+                out_dir=Path("/out"),
+                retry_delay=0,
+                **kwargs,
+            )
+
+    @pytest.mark.asyncio
+    async def test_merges_outputs_in_shard_order(self) -> None:
+        """Test outputs of every shard are returned in plan order."""
+        shards = plan_shards("aws", ["a1", "a2"], ["r1", "r2"], [])
+        calls: list[dict[str, Any]] = []
+
+        result = await self._run(shards, self._fake_run_prowler({}, calls))
+
+        assert result.files == [Path("/out") / shard.name / "results.json" for shard in shards]
+        assert result.failed == []
+        assert len(calls) == 4
+
+    @pytest.mark.asyncio
+    async def test_retries_failed_shards(self) -> None:
+        """Test a shard failing transiently succeeds on retry."""
+        calls: list[dict[str, Any]] = []
+        fake = self._fake_run_prowler({"r1": 2}, calls)
+
+        result = await self._run([ScanShard(region="r1"), ScanShard(region="r2")], fake)
+
+        assert [r.attempts for r in result.results] == [3, 1]
+        assert result.failed == []
+        assert len(result.files) == 2
+
+    @pytest.mark.asyncio
+    async def test_records_exhausted_shards(self) -> None:
+        """Test a shard failing every attempt is reported, not raised."""
+        calls: list[dict[str, Any]] = []
+        fake = self._fake_run_prowler({"r1": 5}, calls)
+
+        result = await self._run(
+            [ScanShard(region="r1"), ScanShard(region="r2")], fake, max_attempts=2
+        )
+
+        assert [failed.shard for failed in result.failed] == [ScanShard(region="r1")]
+        assert result.failed[0].attempts == 2
+        assert result.failed[0].error == "r1 failed"
+        assert result.files == [Path("/out") / ScanShard(region="r2").name / "results.json"]
+
+    @pytest.mark.asyncio
+    async def test_bounded_concurrency(self) -> None:
+        """Test no more than max_concurrency shards run at once."""
+        active = 0
+        peak = 0
+
+        async def run_prowler(**kwargs: Any) -> list[Path]:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.02)
+            active -= 1
+            return []
+
+        shards = plan_shards("aws", [], [f"r{i}" for i in range(10)], [])
+        await self._run(shards, run_prowler, max_concurrency=3)
+
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_account_credentials(self) -> None:
+        """Test accounts map to profiles, or to roles when a role name is given."""
+        calls: list[dict[str, Any]] = []
+        fake = self._fake_run_prowler({}, calls)
+
+        await self._run([ScanShard(account="dev")], fake)
+        await self._run([ScanShard(account="123456789012")], fake, role_name="Audit")
+
+        assert calls[0]["env"] == {"BASE": "1", "AWS_PROFILE": "dev"}
+        assert calls[0]["role_arn"] is None
+        assert calls[1]["env"] == {"BASE": "1"}
+        assert calls[1]["role_arn"] == "arn:aws:iam::123456789012:role/Audit"
+
+    @pytest.mark.asyncio
+    async def test_combined_frameworks_run_once(self) -> None:
+        """Test a combined shard runs all its frameworks in one prowler run."""
+        calls: list[dict[str, Any]] = []
+        fake = self._fake_run_prowler({}, calls)
+
+        await self._run([ScanShard(framework=("cis", "nist")), ScanShard(framework="cis")], fake)
+
+        assert [(call["frameworks"], call["combine_frameworks"]) for call in calls] == [
+            (["cis", "nist"], True),
+            (["cis"], False),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_progress_labelled_by_shard(self) -> None:
+        """Test progress of each shard's run is labelled with the shard name."""
+        updates: list[ProwlerProgress] = []
+
+        async def run_prowler(**kwargs: Any) -> list[Path]:
+            kwargs["progress"](ProwlerProgress("all", 1, 2))
+            return []
+
+        shards = plan_shards("aws", [], ["r1", "r2"], [])
+        await self._run(shards, run_prowler, progress=updates.append)
+
+        assert updates == [ProwlerProgress(shard.name, 1, 2) for shard in shards]
+
+    @pytest.mark.asyncio
+    async def test_prowler_not_found_is_fatal(self) -> None:
+        """Test a missing prowler install is raised rather than retried."""
+        calls = 0
+
+        async def run_prowler(**kwargs: Any) -> list[Path]:
+            nonlocal calls
+            calls += 1
+            raise ProwlerNotFoundError("prowler not found on PATH")
+
+        with pytest.raises(ProwlerNotFoundError):
+            await self._run([ScanShard()], run_prowler)
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_invalid_limits(self) -> None:
+        """Test limits below one are rejected."""
+        with pytest.raises(ValueError):
+            await self._run([ScanShard()], self._fake_run_prowler({}, []), max_attempts=0)
@@ -1,9 +1,14 @@
 """Tests for findings summarization functionality."""
 
-from datetime import UTC, datetime
+import json
+from datetime import UTC, datetime, timedelta
 
+import pytest
+
+from cs_kit.normalizer.cardinality import HyperLogLog
 from cs_kit.normalizer.ocsf_models import OCSFEnrichedFinding, OCSFFinding
 from cs_kit.normalizer.summarize import (
+    SummaryAccumulator,
     _extract_resource_type,
     by_framework,
     by_provider,
@@ -592,3 +597,201 @@ class TestExtractResourceType:
         for unknown_format in unknown_formats:
             result = _extract_resource_type(unknown_format)
             assert result is None
+
+
+class TestSummaryAccumulator:
+    """Test SummaryAccumulator single-pass statistics."""
+
+    @staticmethod
+    def _findings() -> list[OCSFEnrichedFinding]:
+        """Build findings mixing providers, missing values and framework refs."""
+        start = datetime(2024, 1, 1, tzinfo=UTC)
+        combos = [
+            ("aws", "high", "fail", "arn:aws:s3:::bucket", "111", ["cis_aws_1_4:1.1", "cis_aws_1_4:1.2"], 9.5),
+            ("aws", None, "pass", "arn:aws:iam::111:role/r", "111", ["cis_aws_1_4:1.1"], 5.0),
+            ("gcp", "low", None, "//storage.googleapis.com/b", None, ["cis_gcp:2.1", "bad"], None),
+            ("azure", "critical", "not_applicable", None, "sub", [], 11.0),
+            ("aws", "high", "informational", "arn:aws:s3:::bucket", "222", ["cis_gcp:2.2"], 0.5),
+        ]
+        return [
+            OCSFEnrichedFinding(
+                time=start + timedelta(hours=-i if i % 2 else i),
+                provider=provider,
+                product="prowler",
+                severity=severity,
+                status=status,
+                resource_id=resource_id,
+                account_id=account_id,
+                framework_refs=refs,
+                risk_score=risk_score,
+            )
+            for i, (provider, severity, status, resource_id, account_id, refs, risk_score) in enumerate(combos * 3)
+        ]
+
+    def test_matches_functions(self) -> None:
+        """Test every statistic equals the per-function result."""
+        findings = self._findings()
+        accumulator = SummaryAccumulator.from_findings(findings, keep_findings=True)
+
+        assert accumulator.by_provider() == by_provider(findings)
+        assert accumulator.by_framework() == by_framework(findings)
+        assert accumulator.risk_score_distribution() == risk_score_distribution(findings)
+        assert accumulator.time_range() == time_range_analysis(findings)
+        assert accumulator.unique_resource_analysis() == unique_resource_analysis(findings)
+        for framework in ["cis_aws_1_4", "cis_gcp", "missing"]:
+            assert accumulator.framework_score(framework) == framework_score(findings, framework)
+
+    def test_summary(self) -> None:
+        """Test the summary matches the individual counting functions."""
+        findings = self._findings()
+        summary = SummaryAccumulator.from_findings(findings).summary()
+
+        assert summary.total_findings == len(findings)
+        assert summary.by_severity == severity_counts(findings)
+        assert summary.by_status == status_counts(findings)
+        assert summary.by_provider == provider_counts(findings)
+        assert summary.by_product == product_counts(findings)
+        assert summary.frameworks_covered == ["cis_aws_1_4", "cis_gcp"]
+        assert summary.unique_resources == 3
+        assert summary.unique_accounts == 3
+
+    def test_single_pass(self) -> None:
+        """Test findings are only iterated once."""
+        accumulator = SummaryAccumulator()
+        accumulator.update(iter(self._findings()))
+
+        assert accumulator.summary().total_findings == 15
+
+    def test_observe(self) -> None:
+        """Test findings passed through are summarized as they are consumed."""
+        findings = self._findings()
+        accumulator = SummaryAccumulator()
+
+        passed = list(accumulator.observe(iter(findings)))
+
+        assert passed == findings
+        assert accumulator.summary() == SummaryAccumulator.from_findings(findings).summary()
+
+    def test_empty(self) -> None:
+        """Test an accumulator with no findings."""
+        accumulator = SummaryAccumulator()
+
+        assert accumulator.summary().total_findings == 0
+        assert accumulator.time_range() == {"start": None, "end": None}
+        assert accumulator.by_framework() == {}
+
+    def test_counts_only_by_default(self) -> None:
+        """Test framework findings are only kept when requested."""
+        findings = self._findings()
+        accumulator = SummaryAccumulator.from_findings(findings)
+        expected = by_framework(findings)
+        for data in expected.values():
+            data["findings"] = []
+
+        assert accumulator.by_framework() == expected
+        merged = SummaryAccumulator(keep_findings=True).merge(accumulator)
+        assert all(not data["findings"] for data in merged.by_framework().values())
+
+    def test_merge_matches_single_pass(self) -> None:
+        """Test merging shard accumulators equals accumulating everything."""
+        findings = self._findings()
+        whole = SummaryAccumulator.from_findings(findings)
+        shards = [SummaryAccumulator.from_findings(findings[i::3]) for i in range(3)]
+
+        left = SummaryAccumulator().merge(shards[0]).merge(shards[1]).merge(shards[2])
+        right = SummaryAccumulator().merge(shards[2]).merge(
+            SummaryAccumulator().merge(shards[1]).merge(shards[0])
+        )
+
+        for merged in (left, right):
+            assert merged.summary() == whole.summary()
+            assert merged.by_provider() == whole.by_provider()
+            assert merged.risk_score_distribution() == whole.risk_score_distribution()
+            assert merged.unique_resource_analysis() == whole.unique_resource_analysis()
+            for framework in ["cis_aws_1_4", "cis_gcp"]:
+                assert merged.framework_score(framework) == whole.framework_score(framework)
+
+    def test_serialization_round_trip(self) -> None:
+        """Test to_dict output survives JSON and restores the statistics."""
+        accumulator = SummaryAccumulator.from_findings(self._findings())
+
+        restored = SummaryAccumulator.from_dict(json.loads(json.dumps(accumulator.to_dict())))
+
+        assert restored.summary() == accumulator.summary()
+        assert restored.by_provider() == accumulator.by_provider()
+        assert restored.risk_score_distribution() == accumulator.risk_score_distribution()
+        assert restored.framework_score("cis_aws_1_4") == accumulator.framework_score("cis_aws_1_4")
+        assert restored.by_framework() == accumulator.by_framework()
+
+    def test_from_dict_version(self) -> None:
+        """Test unsupported partial summary versions are rejected."""
+        with pytest.raises(ValueError, match="Unsupported partial summary version"):
+            SummaryAccumulator.from_dict({"version": 99})
+
+    def test_hll_mode(self) -> None:
+        """Test HyperLogLog mode matches exact counts on small inputs."""
+        findings = self._findings()
+        exact = SummaryAccumulator.from_findings(findings)
+        hll = SummaryAccumulator.from_findings(findings, cardinality="hll", precision=10)
+
+        assert hll.unique_resource_analysis() == exact.unique_resource_analysis()
+        assert hll.by_provider() == exact.by_provider()
+
+        summary = hll.summary()
+        assert summary.cardinality == "hll"
+        assert summary.cardinality_precision == 10
+        assert summary.model_dump(exclude={"cardinality", "cardinality_precision"}) == (
+            exact.summary().model_dump(exclude={"cardinality", "cardinality_precision"})
+        )
+        assert exact.summary().cardinality == "exact"
+        assert exact.summary().cardinality_precision is None
+
+    def test_hll_error_bound(self) -> None:
+        """Test estimated unique resources stay within the sketch's error bound."""
+        start = datetime(2024, 1, 1, tzinfo=UTC)
+        findings = [
+            OCSFFinding(
+                time=start,
+                provider="aws",
+                product="prowler",
+                resource_id=f"arn:aws:s3:::bucket-{i % 20000}",
+                account_id=str(i % 50),
+            )
+            for i in range(30000)
+        ]
+
+        summary = generate_finding_summary(findings, cardinality="hll", precision=12)
+        relative_error = abs(summary.unique_resources - 20000) / 20000
+
+        assert relative_error <= 3 * HyperLogLog(12).relative_error
+        assert summary.unique_accounts == 50
+
+    def test_hll_merge_and_serialization(self) -> None:
+        """Test HyperLogLog partials merge and survive JSON."""
+        findings = self._findings()
+        whole = SummaryAccumulator.from_findings(findings, cardinality="hll")
+        merged = SummaryAccumulator(cardinality="hll")
+        for i in range(3):
+            shard = SummaryAccumulator.from_findings(findings[i::3], cardinality="hll")
+            merged.merge(SummaryAccumulator.from_dict(json.loads(json.dumps(shard.to_dict()))))
+
+        assert merged.summary() == whole.summary()
+        assert merged.by_provider() == whole.by_provider()
+
+    def test_hll_merge_requires_same_mode(self) -> None:
+        """Test exact and HyperLogLog accumulators can't be mixed."""
+        hll = SummaryAccumulator(cardinality="hll", precision=12)
+
+        with pytest.raises(ValueError, match="Cannot merge"):
+            hll.merge(SummaryAccumulator())
+        with pytest.raises(ValueError, match="Cannot merge"):
+            SummaryAccumulator().merge(hll)
+        with pytest.raises(ValueError, match="Cannot merge"):
+            hll.merge(SummaryAccumulator(cardinality="hll", precision=14))
+
+    def test_invalid_cardinality(self) -> None:
+        """Test unknown modes and out of range precisions are rejected."""
+        with pytest.raises(ValueError, match="Unknown cardinality mode"):
+            SummaryAccumulator(cardinality="approx")  # type: ignore[arg-type]
+        with pytest.raises(ValueError, match="precision"):
+            SummaryAccumulator(cardinality="hll", precision=30)
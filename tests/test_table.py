@@ -0,0 +1,189 @@
+"""Tests for the columnar findings table."""
+
+import json
+import random
+from collections import Counter
+from collections.abc import Callable, Iterator
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from cs_kit.normalizer.records import FindingRecord
+from cs_kit.normalizer.summarize import (
+    SummaryAccumulator,
+    by_framework,
+    by_provider,
+    framework_score,
+    generate_finding_summary,
+    product_counts,
+    provider_counts,
+    risk_score_distribution,
+    severity_counts,
+    status_counts,
+    time_range_analysis,
+    unique_resource_analysis,
+)
+from cs_kit.normalizer.table import FindingsTable, cross_counts
+
+
+def _random_findings(count: int, seed: int = 7) -> list[FindingRecord]:
+    """Build findings covering missing values, several providers and refs."""
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    resources = [
+        "arn:aws:s3:::bucket",
+        "arn:aws:iam::123:role/r",
+        "//storage.googleapis.com/projects/p/buckets/b",
+        "/subscriptions/s/resourceGroups/g/providers/Microsoft.Storage/storageAccounts/a",
+        "plain-id",
+        "",
+        None,
+    ]
+    refs = ["cis_aws_1_4:1.1", "cis_aws_1_4:1.2", "cis_gcp:2.1", "nocolon"]
+    return [
+        FindingRecord(
+            time=start + timedelta(minutes=rng.randrange(10000)),
+            provider=rng.choice(["aws", "gcp", "azure"]),
+            product=rng.choice(["prowler", "scout"]),
+            severity=rng.choice(["critical", "high", "low", None]),
+            status=rng.choice(["pass", "fail", "informational", "not_applicable", None]),
+            resource_id=rng.choice(resources),
+            account_id=rng.choice(["111", "222", None]),
+            region=rng.choice(["us-east-1", None]),
+            check_id=rng.choice(["a", "b", "c"]),
+            framework_refs=rng.sample(refs, rng.randrange(3)),
+            risk_score=rng.choice([None, 0.5, 2.0, 5.0, 8.0, 9.5, 11.0, -1.0]),
+        )
+        for _ in range(count)
+    ]
+
+
+@pytest.fixture(params=["numpy", "fallback"])
+def backend(request: pytest.FixtureRequest) -> Iterator[None]:
+    """Run a test with NumPy, when installed, and with the pure Python fallback."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+        yield
+    else:
+        with patch("cs_kit.normalizer.table.np", None):
+            yield
+
+
+class TestFindingsTable:
+    """Test FindingsTable storage."""
+
+    def test_round_trip(self) -> None:
+        """Test rows materialize back into the original records."""
+        findings = _random_findings(200)
+        table = FindingsTable.from_findings(findings)
+
+        assert len(table) == 200
+        assert list(table) == findings
+
+    def test_dictionary_encoding(self) -> None:
+        """Test each distinct value is stored once."""
+        table = FindingsTable.from_findings(_random_findings(500))
+
+        severity = table.column("severity")
+        assert len(severity) == 500
+        assert sorted(severity.values, key=str) == sorted(
+            ["critical", "high", "low", None], key=str
+        )
+
+    def test_from_dicts(self) -> None:
+        """Test a table built from serialized finding dictionaries."""
+        findings = _random_findings(200)
+        dicts = json.loads(json.dumps([f.to_dict() for f in findings], default=str))
+
+        assert list(FindingsTable.from_dicts(dicts)) == findings
+
+    @pytest.mark.usefixtures("backend")
+    def test_cross_counts(self) -> None:
+        """Test rows are counted per combination of several columns."""
+        findings = _random_findings(500)
+        table = FindingsTable.from_findings(findings)
+        names = ("provider", "severity", "status")
+
+        counts = cross_counts(*(table.column(name) for name in names))
+
+        assert counts == Counter(
+            tuple(getattr(finding, name) for name in names) for finding in findings
+        )
+
+    def test_empty(self) -> None:
+        """Test aggregating an empty table."""
+        table = FindingsTable()
+
+        assert severity_counts(table) == {}
+        assert time_range_analysis(table) == {"start": None, "end": None}
+        assert generate_finding_summary(table).total_findings == 0
+
+
+@pytest.mark.usefixtures("backend")
+class TestTableSummaries:
+    """Test vectorized summaries match the per-finding implementations."""
+
+    findings = _random_findings(2000)
+
+    @pytest.mark.parametrize(
+        "func",
+        [
+            severity_counts,
+            status_counts,
+            provider_counts,
+            product_counts,
+            by_provider,
+            by_framework,
+            risk_score_distribution,
+            time_range_analysis,
+            unique_resource_analysis,
+            generate_finding_summary,
+        ],
+    )
+    def test_matches_list(self, func: Callable[..., Any]) -> None:
+        """Test each summary gives the same result for a table and a list."""
+        table = FindingsTable.from_findings(self.findings)
+
+        assert func(table) == func(self.findings)
+
+    @pytest.mark.parametrize("framework", ["cis_aws_1_4", "cis_gcp", "missing"])
+    def test_framework_score(self, framework: str) -> None:
+        """Test framework scores count each finding once."""
+        table = FindingsTable.from_findings(self.findings)
+
+        assert framework_score(table, framework) == framework_score(self.findings, framework)
+
+
+@pytest.mark.usefixtures("backend")
+class TestUpdateTable:
+    """Test SummaryAccumulator.update_table matches adding the findings."""
+
+    findings = _random_findings(2000)
+
+    @pytest.mark.parametrize("cardinality", ["exact", "hll"])
+    def test_matches_update(self, cardinality: str) -> None:
+        """Test every statistic matches an accumulator fed the records."""
+        expected = SummaryAccumulator.from_findings(self.findings, cardinality)  # type: ignore[arg-type]
+        accumulator = SummaryAccumulator(cardinality)  # type: ignore[arg-type]
+
+        accumulator.update_table(FindingsTable.from_findings(self.findings[:500]))
+        accumulator.update_table(FindingsTable.from_findings(self.findings[500:]))
+
+        assert accumulator.summary() == expected.summary()
+        assert accumulator.by_provider() == expected.by_provider()
+        assert accumulator.by_framework() == expected.by_framework()
+        assert accumulator.risk_score_distribution() == expected.risk_score_distribution()
+        assert accumulator.unique_resource_analysis() == expected.unique_resource_analysis()
+        for framework in ("cis_aws_1_4", "cis_gcp", "missing"):
+            assert accumulator.framework_score(framework) == expected.framework_score(framework)
+
+    def test_keep_findings(self) -> None:
+        """Test kept framework findings are materialized from the table."""
+        expected = SummaryAccumulator.from_findings(self.findings, keep_findings=True)
+        accumulator = SummaryAccumulator(keep_findings=True)
+
+        accumulator.update_table(FindingsTable.from_findings(self.findings))
+
+        assert accumulator.by_framework() == expected.by_framework()
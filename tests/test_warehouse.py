@@ -0,0 +1,124 @@
+"""Tests for the findings warehouse."""
+
+import sqlite3
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from cs_kit.normalizer import codec
+from cs_kit.normalizer.artifacts import (
+    NORMALIZED_FILE,
+    write_findings,
+    write_findings_json,
+)
+from cs_kit.normalizer.records import FindingRecord
+from cs_kit.normalizer.warehouse import WAREHOUSE_FILE, Warehouse
+
+
+def _finding(check_id: str, account_id: str, severity: str, status: str) -> FindingRecord:
+    return FindingRecord(
+        time=datetime(2024, 1, 15, 10, 30, tzinfo=UTC),
+        provider="aws",
+        product="prowler",
+        severity=severity,
+        status=status,
+        account_id=account_id,
+        check_id=check_id,
+    )
+
+
+def _write_run(
+    artifacts_dir: Path, run_id: str, findings: list[FindingRecord], end: str | None = None
+) -> Path:
+    run_dir = artifacts_dir / run_id
+    run_dir.mkdir(parents=True)
+    write_findings_json(findings, run_dir / NORMALIZED_FILE)
+    if end is not None:
+        codec.dump({"total_findings": len(findings), "scan_time_range": {"end": end}}, run_dir / "summary.json")
+    return run_dir
+
+
+@pytest.fixture
+def warehouse(tmp_path: Path) -> Warehouse:
+    """Warehouse of two runs, a month apart."""
+    warehouse = Warehouse.for_artifacts(tmp_path)
+    warehouse.ingest_run(_write_run(tmp_path, "run1", [
+        _finding("iam_mfa", "111", "critical", "fail"),
+        _finding("s3_public", "111", "critical", "fail"),
+        _finding("s3_public", "222", "critical", "fail"),
+        _finding("ec2_ebs", "222", "low", "fail"),
+    ], end="2024-01-01 00:00:00+00:00"))
+    warehouse.ingest_run(_write_run(tmp_path, "run2", [
+        _finding("iam_mfa", "111", "critical", "pass"),
+        _finding("s3_public", "111", "critical", "fail"),
+        _finding("s3_public", "222", "critical", "fail"),
+    ], end="2024-02-01 00:00:00+00:00"))
+    return warehouse
+
+
+class TestWarehouse:
+    """Test Warehouse class."""
+
+    def test_ingest_runs(self, warehouse: Warehouse, tmp_path: Path) -> None:
+        """Test runs are stored with their summary and findings."""
+        runs = warehouse.runs()
+
+        assert warehouse.path == tmp_path / WAREHOUSE_FILE
+        assert [run["run_id"] for run in runs] == ["run1", "run2"]
+        assert runs[0]["scanned_at"] == "2024-01-01T00:00:00+00:00"
+        assert runs[0]["total_findings"] == 4
+        assert runs[0]["provider"] == "aws"
+        assert runs[0]["summary"]["total_findings"] == 4
+        rows = warehouse.query(
+            "SELECT run_id, COUNT(*) AS count FROM findings GROUP BY run_id ORDER BY run_id"
+        )
+        assert rows == [{"run_id": "run1", "count": 4}, {"run_id": "run2", "count": 3}]
+
+    def test_reingest_replaces_run(self, warehouse: Warehouse, tmp_path: Path) -> None:
+        """Test ingesting a run again replaces its findings."""
+        run_dir = tmp_path / "run1"
+        write_findings([_finding("iam_mfa", "111", "critical", "pass")], run_dir)
+
+        assert warehouse.ingest_run(run_dir) == 1
+        rows = warehouse.query("SELECT check_id, status FROM findings WHERE run_id = ?", ["run1"])
+        assert rows == [{"check_id": "iam_mfa", "status": "pass"}]
+        assert len(warehouse.runs()) == 2
+
+    def test_finding_history(self, warehouse: Warehouse) -> None:
+        """Test a finding's identity matches it across runs."""
+        rows = warehouse.query(
+            "SELECT later.run_id, later.status FROM findings AS earlier "
+            "JOIN findings AS later ON later.identity = earlier.identity "
+            "WHERE earlier.run_id = 'run1' AND earlier.check_id = 'iam_mfa' ORDER BY later.run_id"
+        )
+
+        assert rows == [{"run_id": "run1", "status": "fail"}, {"run_id": "run2", "status": "pass"}]
+
+    def test_trend(self, warehouse: Warehouse) -> None:
+        """Test open critical findings are counted per account and run."""
+        rows = warehouse.trend(severity=["critical"], status=["fail"])
+
+        assert [(row["run_id"], row["account_id"], row["count"]) for row in rows] == [
+            ("run1", "111", 2),
+            ("run1", "222", 1),
+            ("run2", "111", 1),
+            ("run2", "222", 1),
+        ]
+        recent = warehouse.trend("check_id", since=datetime(2024, 1, 15, tzinfo=UTC))
+        assert {row["run_id"] for row in recent} == {"run2"}
+        with pytest.raises(ValueError, match="Invalid group column"):
+            warehouse.trend("data")
+
+    def test_query_is_read_only(self, warehouse: Warehouse) -> None:
+        """Test queries can't modify the warehouse."""
+        with pytest.raises(sqlite3.OperationalError):
+            warehouse.query("DELETE FROM findings")
+        assert warehouse.query("SELECT COUNT(*) AS count FROM findings") == [{"count": 7}]
+
+    def test_missing_findings(self, tmp_path: Path) -> None:
+        """Test ingesting a run without normalized findings fails."""
+        (tmp_path / "run1").mkdir()
+
+        with pytest.raises(FileNotFoundError):
+            Warehouse.for_artifacts(tmp_path).ingest_run(tmp_path / "run1")